@@ -0,0 +1,15 @@
+#!/bin/sh
+# Apply pending schema migrations, then run the given command.
+#
+# Startup only checks the schema (`apply_on_startup` is off outside
+# development) and exits when migrations are pending, so the image migrates
+# first. Replicas starting together are serialized by the migrator's advisory
+# lock. Set SACKMESSER_SKIP_MIGRATE=1 when a separate job runs
+# `sackmesser migrate` before the rollout.
+set -e
+
+if [ "${SACKMESSER_SKIP_MIGRATE:-0}" != "1" ]; then
+    python -m sackmesser.main migrate
+fi
+
+exec "$@"
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Microbenchmark for bus dispatch overhead with and without middlewares.
+
+Run from the repository root:
+
+    uv run python scripts/bench_bus_dispatch.py --iterations 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from pydantic import BaseModel, ConfigDict
+
+from sackmesser.application.bus import CommandBus, Middleware
+from sackmesser.application.middleware import (
+    ConcurrencyLimitMiddleware,
+    LatencyHistogramMiddleware,
+    TimeoutMiddleware,
+)
+
+
+class _PingCommand(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    value: int = 0
+
+
+class _PingHandler:
+    async def handle(self, request: _PingCommand) -> int:
+        return request.value
+
+
+def _build_bus(middlewares: list[Middleware]) -> CommandBus:
+    bus = CommandBus()
+    for middleware in middlewares:
+        bus.use(middleware)
+    bus.register(_PingCommand, _PingHandler())
+    return bus
+
+
+async def _measure(bus: CommandBus, iterations: int) -> float:
+    request = _PingCommand(value=1)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await bus.dispatch(request)
+    return (time.perf_counter() - started) / iterations * 1e9
+
+
+async def _run(iterations: int) -> None:
+    scenarios: dict[str, list[Middleware]] = {
+        "bare": [],
+        "unmatched timeout+limit": [
+            TimeoutMiddleware({"Other": 1.0}),
+            ConcurrencyLimitMiddleware({"Other": 1}),
+        ],
+        "latency": [LatencyHistogramMiddleware()],
+        "latency+timeout+limit": [
+            LatencyHistogramMiddleware(),
+            TimeoutMiddleware(default_seconds=30.0),
+            ConcurrencyLimitMiddleware(default_limit=64),
+        ],
+    }
+    baseline: float | None = None
+    for name, middlewares in scenarios.items():
+        bus = _build_bus(middlewares)
+        await _measure(bus, min(iterations, 10_000))
+        nanoseconds = await _measure(bus, iterations)
+        baseline = nanoseconds if baseline is None else baseline
+        print(f"{name:<26} {nanoseconds:9.1f} ns/dispatch  (+{nanoseconds - baseline:7.1f} ns)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
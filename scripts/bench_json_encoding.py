@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark JSON encoding of large `ListWorkflowsResult` payloads.
+
+Compares the previous paths (FastAPI's `jsonable_encoder` for routes,
+`json.dumps(model_dump())` for MCP tools) with the shared fast encoder, and
+the REST listing path that splices payload JSON text from Postgres instead
+of decoding it into dicts and encoding it again.
+
+Run from the repository root:
+
+    uv run python scripts/bench_json_encoding.py --sizes 100 1000 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from sackmesser.adapters.serialization import json_encoder, orjson
+from sackmesser.application.requests.workflows import (
+    ListWorkflowsJsonQuery,
+    ListWorkflowsQuery,
+    ListWorkflowsResult,
+    WorkflowDto,
+)
+from sackmesser.application.use_cases.workflows import (
+    ListWorkflowsJsonUseCase,
+    ListWorkflowsUseCase,
+)
+from sackmesser.domain.workflows import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCursor,
+    WorkflowTimeRange,
+)
+
+_PAGE_SIZE = 100
+
+
+def _result(size: int) -> ListWorkflowsResult:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    return ListWorkflowsResult(
+        workflows=[
+            WorkflowDto(
+                id=f"wf-{index}",
+                title=f"workflow {index}",
+                payload={"kind": "bench", "steps": list(range(10)), "meta": {"owner": "ops"}},
+                created_at=created_at,
+            )
+            for index in range(size)
+        ],
+        next_cursor="token",
+    )
+
+
+class _RowTextRepository:
+    """Serves rows the way Postgres returns them: payloads as JSON text."""
+
+    def __init__(self, result: ListWorkflowsResult) -> None:
+        self._rows = [
+            EncodedWorkflow(
+                id=item.id,
+                title=item.title,
+                payload_json=json.dumps(item.payload),
+                created_at=item.created_at,
+            )
+            for item in result.workflows
+        ]
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
+        return [
+            Workflow(
+                id=row.id,
+                title=row.title,
+                payload=json.loads(row.payload_json),
+                created_at=row.created_at,
+            )
+            for row in self._rows[offset : offset + limit]
+        ]
+
+    async def list_encoded(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[EncodedWorkflow]:
+        return self._rows[offset : offset + limit]
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> list[Workflow]:
+        return await self.list(limit=limit, offset=0)
+
+    async def list_encoded_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> list[EncodedWorkflow]:
+        return await self.list_encoded(limit=limit, offset=0)
+
+
+def _listing_scenarios(
+    loop: asyncio.AbstractEventLoop, result: ListWorkflowsResult
+) -> dict[str, Callable[[], object]]:
+    repository = _RowTextRepository(result)
+    structured = ListWorkflowsUseCase(repository)  # type: ignore[arg-type]
+    spliced = ListWorkflowsJsonUseCase(repository)
+    # Listings are capped at 100 per page, so read every row page by page.
+    offsets = range(0, len(result.workflows), _PAGE_SIZE)
+
+    def decode_and_encode() -> list[bytes]:
+        return [
+            json_encoder()(
+                loop.run_until_complete(
+                    structured.execute(ListWorkflowsQuery(limit=_PAGE_SIZE, offset=offset))
+                )
+            )
+            for offset in offsets
+        ]
+
+    def splice() -> list[bytes]:
+        return [
+            loop.run_until_complete(
+                spliced.execute(ListWorkflowsJsonQuery(limit=_PAGE_SIZE, offset=offset))
+            ).content.encode()
+            for offset in offsets
+        ]
+
+    return {
+        "rows: decode payloads + model -> bytes": decode_and_encode,
+        "rows: splice payload text": splice,
+    }
+
+
+def _per_call_ms(fn: Callable[[], object], repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = ["pydantic", "stdlib", *(["orjson"] if orjson is not None else [])]
+    for size in args.sizes:
+        result = _result(size)
+        scenarios: dict[str, Callable[[], object]] = {
+            "route: jsonable_encoder + json.dumps": lambda result=result: json.dumps(
+                jsonable_encoder(result.model_dump())
+            ).encode(),
+            "mcp: json.dumps(model_dump())": lambda result=result: json.dumps(
+                result.model_dump(), default=str
+            ),
+            "fast: model -> bytes": lambda result=result: json_encoder()(result),
+        }
+        dumped = result.model_dump()
+        for backend in backends:
+            encoder = json_encoder(backend)  # type: ignore[arg-type]
+            scenarios[f"fast: dict -> bytes ({backend})"] = lambda encoder=encoder, dumped=dumped: (
+                encoder(dumped)
+            )
+
+        loop = asyncio.new_event_loop()
+        scenarios.update(_listing_scenarios(loop, result))
+
+        print(f"ListWorkflowsResult with {size} workflows")
+        for name, fn in scenarios.items():
+            print(f"  {name:<40} {_per_call_ms(fn, args.repeat):9.3f} ms")
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
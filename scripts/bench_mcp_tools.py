@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Microbenchmark for per-tool MCP list/call overhead.
+
+Compares rebuilding `Tool` objects per `tools/list` with the list built once
+at server creation, and per-call `jsonschema.validate` (what the SDK does
+when input validation is left on) with the precompiled validators.
+
+Run from the repository root:
+
+    uv run python scripts/bench_mcp_tools.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+from mcp.types import Tool
+
+from sackmesser.adapters.mcp.tools import TOOL_MODULES, load_tool_specs
+from sackmesser.adapters.mcp.validation import ToolArgumentsValidator
+
+SAMPLE_ARGUMENTS: dict[str, dict[str, Any]] = {
+    "cache_set": {"key": "alpha", "value": "1", "ttl_seconds": 60},
+    "cache_get": {"key": "alpha"},
+    "cache_delete": {"key": "alpha"},
+    "cache_set_many": {"entries": [{"key": f"k{i}", "value": "v"} for i in range(100)]},
+    "cache_get_many": {"keys": [f"k{i}" for i in range(100)]},
+    "cache_delete_many": {"keys": [f"k{i}" for i in range(100)]},
+    "create_workflow": {"title": "demo", "payload": {"kind": "bench"}},
+    "create_workflows_batch": {"workflows": [{"title": f"wf-{i}"} for i in range(100)]},
+    "list_workflows": {"limit": 50, "offset": 0},
+}
+
+
+def _per_call_ns(fn: Callable[[], object], iterations: int) -> float:
+    for _ in range(min(iterations, 1_000)):
+        fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    specs = load_tool_specs(TOOL_MODULES)
+    tools = [
+        Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+        for spec in specs
+    ]
+
+    def rebuild() -> list[Tool]:
+        return [
+            Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+            for spec in specs
+        ]
+
+    def cached() -> list[Tool]:
+        return tools
+
+    print(f"tools/list ({len(specs)} tools)")
+    print(f"  rebuilt per call   {_per_call_ns(rebuild, args.iterations):12.1f} ns")
+    print(f"  built once         {_per_call_ns(cached, args.iterations):12.1f} ns")
+
+    print("tools/call argument validation (ns per call)")
+    print(f"  {'tool':<24} {'jsonschema.validate':>20} {'precompiled':>12}")
+    for spec in specs:
+        arguments = SAMPLE_ARGUMENTS.get(spec.name, {})
+        validator = ToolArgumentsValidator(spec.name, spec.input_schema)
+        schema = spec.input_schema
+        per_call = _per_call_ns(
+            lambda arguments=arguments, schema=schema: jsonschema.validate(arguments, schema),
+            args.iterations // 10,
+        )
+        compiled = _per_call_ns(
+            lambda arguments=arguments, validator=validator: validator.validate(arguments),
+            args.iterations,
+        )
+        print(f"  {spec.name:<24} {per_call:20.1f} {compiled:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,12 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from sackmesser.application.errors import ApplicationError
+from sackmesser.application.errors import ApplicationError, OverloadedError
 
 logger = logging.getLogger(__name__)
 
+_OVERLOADED_RETRY_AFTER_SECONDS = "1"
+
 
 def _validation_details(exc: RequestValidationError) -> list[dict[str, str]]:
     return [
@@ -34,6 +36,13 @@ def register_exception_handlers(app: FastAPI) -> None:
         _request: Request,
         exc: ApplicationError,
     ) -> JSONResponse:
+        if isinstance(exc, OverloadedError):
+            logger.warning("Shedding load: %s", exc.message)
+            return JSONResponse(
+                status_code=exc.status_code,
+                content=exc.to_dict(),
+                headers={"Retry-After": _OVERLOADED_RETRY_AFTER_SECONDS},
+            )
         if exc.status_code >= 500:
             logger.error("Application error: %s", exc.message)
         else:
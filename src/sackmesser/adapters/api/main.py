@@ -3,41 +3,65 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from orchid_commons import create_fastapi_observability_middleware, load_config
 
 from sackmesser.adapters.api.error_handler import register_exception_handlers
+from sackmesser.adapters.api.responses import FastJSONResponse
 from sackmesser.adapters.api.routes import load_routers
+from sackmesser.adapters.api.session import session_middleware
 from sackmesser.adapters.dependencies import init_services, shutdown_services
+from sackmesser.adapters.mcp.http import MCPHttpApp, MCPHttpSettings, mount_mcp_http
 from sackmesser.infrastructure.runtime.modules import (
     load_enabled_modules,
     load_module_manifest,
     resolve_enabled_modules,
 )
+from sackmesser.infrastructure.runtime.options import load_app_options, option_section
 from sackmesser.infrastructure.runtime.state import resolve_environment
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Initialize runtime resources on startup and close them on shutdown."""
     await init_services()
-    yield
-    await shutdown_services()
+    try:
+        async with AsyncExitStack() as stack:
+            mcp_http: MCPHttpApp | None = getattr(app.state, "mcp_http", None)
+            if mcp_http is not None:
+                await stack.enter_async_context(mcp_http.lifespan())
+            yield
+    finally:
+        await shutdown_services()
 
 
-def create_app() -> FastAPI:
-    """Create configured FastAPI application."""
+def create_app(*, mount_mcp: bool | None = None) -> FastAPI:
+    """Create configured FastAPI application.
+
+    With `mount_mcp` (default: `sackmesser.mcp.http.enabled`), the MCP server is
+    also served over streamable HTTP from the same runtime.
+    """
     environment = resolve_environment()
     settings = load_config(config_dir="config", env=environment)
+    mcp_http_settings = MCPHttpSettings.from_mapping(
+        option_section(
+            load_app_options(config_dir=Path("config"), env=environment),
+            "sackmesser",
+            "mcp",
+            "http",
+        )
+    )
 
     app = FastAPI(
         title=settings.service.name,
         version=settings.service.version,
         description="Orchid MCP template with strict hexagonal modules",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     register_exception_handlers(app)
 
@@ -49,13 +73,24 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.middleware("http")(create_fastapi_observability_middleware())
+    app.middleware("http")(session_middleware)
 
     manifest = load_module_manifest()
     enabled_modules = resolve_enabled_modules(load_enabled_modules(), manifest)
     for router in load_routers(enabled_modules):
         app.include_router(router)
 
+    if mount_mcp is None:
+        mount_mcp = mcp_http_settings.enabled
+    if mount_mcp:
+        mount_mcp_http(app, mcp_http_settings)
+
     return app
 
 
+def create_mcp_http_app() -> FastAPI:
+    """Create the API application with the MCP HTTP transport mounted."""
+    return create_app(mount_mcp=True)
+
+
 app = create_app()
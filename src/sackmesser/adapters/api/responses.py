@@ -0,0 +1,20 @@
+"""API response classes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from sackmesser.adapters.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with the shared fast encoder.
+
+    Routes may pass a pydantic result as `content` and return the response
+    directly, which skips FastAPI's `jsonable_encoder` pass entirely.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -7,7 +7,11 @@ from typing import Any, cast
 from fastapi import APIRouter
 
 from sackmesser.adapters.dependencies import ContainerDep
-from sackmesser.application.requests.core import GetCapabilitiesQuery, GetHealthQuery
+from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
+    GetCapabilitiesQuery,
+    GetHealthQuery,
+)
 
 router = APIRouter()
 
@@ -24,3 +28,10 @@ async def capabilities(container: ContainerDep) -> dict[str, Any]:
     """List available and enabled template capabilities."""
     result = await container.query_bus.dispatch(GetCapabilitiesQuery())
     return cast("dict[str, Any]", result.model_dump())
+
+
+@router.get("/api/v1/metrics/bus")
+async def bus_metrics(container: ContainerDep) -> dict[str, Any]:
+    """Per-request-type latency histograms recorded by the bus middleware."""
+    result = await container.query_bus.dispatch(GetBusMetricsQuery())
+    return cast("dict[str, Any]", result.model_dump())
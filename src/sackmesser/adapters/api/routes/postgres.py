@@ -2,26 +2,51 @@
 
 from __future__ import annotations
 
-from typing import cast
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Path, Query, Response, status
+from fastapi.responses import StreamingResponse
 
-from sackmesser.adapters.api.schemas.postgres import CreateWorkflowRequest
+from sackmesser.adapters.api.responses import FastJSONResponse
+from sackmesser.adapters.api.schemas.postgres import (
+    CreateWorkflowRequest,
+    CreateWorkflowsBatchRequest,
+    GetWorkflowsRequest,
+    SearchWorkflowsRequest,
+    UpdateWorkflowPayloadRequest,
+)
 from sackmesser.adapters.dependencies import ContainerDep
+from sackmesser.application.bus import QueryBus
 from sackmesser.application.errors import DisabledModuleError
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
-    ListWorkflowsQuery,
+    CreateWorkflowResult,
+    CreateWorkflowsBatchCommand,
+    CreateWorkflowsBatchResult,
+    ExportWorkflowsQuery,
+    ExportWorkflowsResult,
+    GetWorkflowQuery,
+    GetWorkflowResult,
+    GetWorkflowsQuery,
+    GetWorkflowsResult,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    UpdateWorkflowPayloadResult,
+    WorkflowPayloadSetOperation,
 )
 
 router = APIRouter(prefix="/api/v1/workflows")
 
 
-@router.post("", status_code=status.HTTP_201_CREATED)
+@router.post("", status_code=status.HTTP_201_CREATED, response_model=CreateWorkflowResult)
 async def create_workflow(
     body: CreateWorkflowRequest,
     container: ContainerDep,
-) -> dict[str, object]:
+) -> FastJSONResponse:
     """Create a workflow in Postgres."""
     if "postgres" not in container.enabled_modules:
         raise DisabledModuleError("postgres")
@@ -29,20 +54,173 @@ async def create_workflow(
     result = await container.command_bus.dispatch(
         CreateWorkflowCommand(title=body.title, payload=body.payload)
     )
-    return cast("dict[str, object]", result.model_dump())
+    return FastJSONResponse(result, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("")
+@router.post(
+    ":batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=CreateWorkflowsBatchResult,
+)
+async def create_workflows_batch(
+    body: CreateWorkflowsBatchRequest,
+    container: ContainerDep,
+) -> FastJSONResponse:
+    """Create many workflows in Postgres with a single insert."""
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    result = await container.command_bus.dispatch(
+        CreateWorkflowsBatchCommand(
+            workflows=[
+                CreateWorkflowCommand(title=item.title, payload=item.payload)
+                for item in body.workflows
+            ]
+        )
+    )
+    return FastJSONResponse(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("", response_model=ListWorkflowsResult)
 async def list_workflows(
     container: ContainerDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-) -> dict[str, object]:
-    """List workflows from Postgres."""
+    cursor: Annotated[str | None, Query(min_length=1, max_length=512)] = None,
+    include_total: Annotated[bool, Query()] = False,
+    created_from: Annotated[datetime | None, Query()] = None,
+    created_to: Annotated[datetime | None, Query()] = None,
+) -> Response:
+    """List workflows from Postgres, by offset or by `next_cursor` token.
+
+    `include_total` adds the table row count; above a few thousand rows it is
+    the planner estimate, flagged by `total_estimated`. `created_from`
+    (inclusive) and `created_to` (exclusive) restrict the listing in time and
+    cannot be combined with `include_total`.
+
+    The body is produced pre-encoded, with payloads copied verbatim from the
+    JSONB text Postgres returns.
+    """
     if "postgres" not in container.enabled_modules:
         raise DisabledModuleError("postgres")
 
     result = await container.query_bus.dispatch(
-        ListWorkflowsQuery(limit=limit, offset=offset)
+        ListWorkflowsJsonQuery(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    )
+    return Response(content=result.content, media_type="application/json")
+
+
+@router.post(":search", response_model=ListWorkflowsResult)
+async def search_workflows(
+    body: SearchWorkflowsRequest,
+    container: ContainerDep,
+) -> FastJSONResponse:
+    """Search workflows by title substring and payload containment."""
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    result = await container.query_bus.dispatch(
+        SearchWorkflowsQuery(
+            title=body.title,
+            payload_contains=body.payload_contains,
+            limit=body.limit,
+            cursor=body.cursor,
+        )
+    )
+    return FastJSONResponse(result)
+
+
+@router.post(":get-many", response_model=GetWorkflowsResult)
+async def get_workflows(
+    body: GetWorkflowsRequest,
+    container: ContainerDep,
+) -> FastJSONResponse:
+    """Fetch up to 1000 workflows by id in one read; unknown ids are listed in `missing`."""
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    result = await container.query_bus.dispatch(GetWorkflowsQuery(ids=tuple(body.ids)))
+    return FastJSONResponse(result)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_workflows(
+    container: ContainerDep,
+    batch_size: int = Query(default=500, ge=1, le=1000),
+    cursor: Annotated[str | None, Query(min_length=1, max_length=512)] = None,
+) -> StreamingResponse:
+    """Stream every workflow as NDJSON, newest first, one keyset chunk at a time.
+
+    Memory stays bounded by `batch_size` whatever the table size. Pass a
+    `next_cursor` from the chunked MCP export as `cursor` to resume from it.
+    """
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    query_bus = container.query_bus
+    # Read the first chunk up front so a bad cursor fails with a normal error
+    # response instead of a truncated stream.
+    first = await query_bus.dispatch(ExportWorkflowsQuery(limit=batch_size, cursor=cursor))
+    return StreamingResponse(
+        _export_chunks(query_bus, first, batch_size),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _export_chunks(
+    query_bus: QueryBus,
+    chunk: ExportWorkflowsResult,
+    batch_size: int,
+) -> AsyncIterator[str]:
+    while True:
+        if chunk.ndjson:
+            yield chunk.ndjson
+        if chunk.next_cursor is None:
+            return
+        chunk = await query_bus.dispatch(
+            ExportWorkflowsQuery(limit=batch_size, cursor=chunk.next_cursor)
+        )
+
+
+# Declared after every fixed path under /api/v1/workflows (such as /export),
+# which would otherwise be captured as an id.
+@router.get("/{workflow_id}", response_model=GetWorkflowResult)
+async def get_workflow(
+    workflow_id: Annotated[str, Path(min_length=1, max_length=64)],
+    container: ContainerDep,
+) -> FastJSONResponse:
+    """Fetch one workflow by id."""
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    result = await container.query_bus.dispatch(GetWorkflowQuery(id=workflow_id))
+    return FastJSONResponse(result)
+
+
+@router.patch("/{workflow_id}", response_model=UpdateWorkflowPayloadResult)
+async def update_workflow_payload(
+    workflow_id: Annotated[str, Path(min_length=1, max_length=64)],
+    body: UpdateWorkflowPayloadRequest,
+    container: ContainerDep,
+) -> FastJSONResponse:
+    """Patch a workflow payload in storage and return the updated workflow."""
+    if "postgres" not in container.enabled_modules:
+        raise DisabledModuleError("postgres")
+
+    command = UpdateWorkflowPayloadCommand(
+        id=workflow_id,
+        merge=body.merge,
+        sets=tuple(
+            WorkflowPayloadSetOperation(path=tuple(item.path), value=item.value)
+            for item in body.sets
+        ),
     )
-    return cast("dict[str, object]", result.model_dump())
+    result = await container.command_bus.dispatch(command)
+    return FastJSONResponse(result)
@@ -4,18 +4,86 @@ from typing import cast
 
 from fastapi import APIRouter, Path
 
-from sackmesser.adapters.api.schemas.redis import SetCacheRequest
+from sackmesser.adapters.api.schemas.redis import (
+    CacheKeysRequest,
+    SetCacheEntriesRequest,
+    SetCacheRequest,
+)
 from sackmesser.adapters.dependencies import ContainerDep
 from sackmesser.application.errors import DisabledModuleError, NotFoundError
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
     DeleteCacheEntryCommand,
+    GetCacheEntriesQuery,
     GetCacheEntryQuery,
+    GetCacheStatsQuery,
+    SetCacheEntriesCommand,
     SetCacheEntryCommand,
 )
 
 router = APIRouter(prefix="/api/v1/cache")
 
 
+@router.post(":batch-set")
+async def set_cache_entries(
+    body: SetCacheEntriesRequest,
+    container: ContainerDep,
+) -> dict[str, object]:
+    """Set many cache entries in Redis with one request."""
+    if "redis" not in container.enabled_modules:
+        raise DisabledModuleError("redis")
+
+    result = await container.command_bus.dispatch(
+        SetCacheEntriesCommand(
+            entries=[
+                SetCacheEntryCommand(
+                    key=entry.key,
+                    value=entry.value,
+                    ttl_seconds=entry.ttl_seconds,
+                )
+                for entry in body.entries
+            ]
+        )
+    )
+    return cast("dict[str, object]", result.model_dump())
+
+
+@router.post(":batch-get")
+async def get_cache_entries(
+    body: CacheKeysRequest,
+    container: ContainerDep,
+) -> dict[str, object]:
+    """Get many cache entries from Redis; missing keys are reported with found=false."""
+    if "redis" not in container.enabled_modules:
+        raise DisabledModuleError("redis")
+
+    result = await container.query_bus.dispatch(GetCacheEntriesQuery(keys=tuple(body.keys)))
+    return cast("dict[str, object]", result.model_dump())
+
+
+@router.post(":batch-delete")
+async def delete_cache_entries(
+    body: CacheKeysRequest,
+    container: ContainerDep,
+) -> dict[str, object]:
+    """Delete many cache entries from Redis with one request."""
+    if "redis" not in container.enabled_modules:
+        raise DisabledModuleError("redis")
+
+    result = await container.command_bus.dispatch(DeleteCacheEntriesCommand(keys=body.keys))
+    return cast("dict[str, object]", result.model_dump())
+
+
+@router.get(":stats")
+async def get_cache_stats(container: ContainerDep) -> dict[str, object]:
+    """Get hit/miss/eviction counters of the in-process cache tier."""
+    if "redis" not in container.enabled_modules:
+        raise DisabledModuleError("redis")
+
+    result = await container.query_bus.dispatch(GetCacheStatsQuery())
+    return cast("dict[str, object]", result.model_dump())
+
+
 @router.put("/{key}")
 async def set_cache(
     body: SetCacheRequest,
@@ -5,8 +5,20 @@ from importlib import import_module
 __all__: list[str] = []
 
 _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
-    "sackmesser.adapters.api.schemas.postgres": ("CreateWorkflowRequest",),
-    "sackmesser.adapters.api.schemas.redis": ("SetCacheRequest",),
+    "sackmesser.adapters.api.schemas.postgres": (
+        "CreateWorkflowRequest",
+        "CreateWorkflowsBatchRequest",
+        "GetWorkflowsRequest",
+        "SearchWorkflowsRequest",
+        "UpdateWorkflowPayloadRequest",
+        "WorkflowPayloadSetRequest",
+    ),
+    "sackmesser.adapters.api.schemas.redis": (
+        "CacheEntryRequest",
+        "CacheKeysRequest",
+        "SetCacheEntriesRequest",
+        "SetCacheRequest",
+    ),
 }
 
 for module_name, export_names in _OPTIONAL_EXPORTS.items():
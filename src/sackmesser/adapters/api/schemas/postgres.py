@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
@@ -12,3 +12,40 @@ class CreateWorkflowRequest(BaseModel):
 
     title: str = Field(min_length=1, max_length=200)
     payload: dict[str, Any] = Field(default_factory=dict)
+
+
+class CreateWorkflowsBatchRequest(BaseModel):
+    """Request payload for creating many workflows at once."""
+
+    workflows: list[CreateWorkflowRequest] = Field(min_length=1, max_length=1000)
+
+
+class SearchWorkflowsRequest(BaseModel):
+    """Request payload for searching workflows."""
+
+    title: str | None = Field(default=None, min_length=1, max_length=200)
+    payload_contains: dict[str, Any] | None = None
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = Field(default=None, min_length=1, max_length=512)
+
+
+class WorkflowPayloadSetRequest(BaseModel):
+    """One `value` to put at `path` inside a workflow payload."""
+
+    path: list[Annotated[str, Field(min_length=1, max_length=200)]] = Field(
+        min_length=1, max_length=32
+    )
+    value: Any = None
+
+
+class UpdateWorkflowPayloadRequest(BaseModel):
+    """Request payload for patching a workflow payload in place."""
+
+    merge: dict[str, Any] | None = None
+    sets: list[WorkflowPayloadSetRequest] = Field(default_factory=list, max_length=32)
+
+
+class GetWorkflowsRequest(BaseModel):
+    """Request payload for fetching many workflows by id."""
+
+    ids: list[str] = Field(min_length=1, max_length=1000)
@@ -1,10 +1,32 @@
 """Schemas for Redis cache routes."""
 
+from typing import Annotated
+
 from pydantic import BaseModel, Field
 
+CacheKey = Annotated[str, Field(min_length=1, max_length=200)]
+
 
 class SetCacheRequest(BaseModel):
     """Request body for cache set operation."""
 
     value: str = Field(min_length=1)
     ttl_seconds: int | None = Field(default=None, ge=1)
+
+
+class CacheEntryRequest(SetCacheRequest):
+    """One entry of a batch cache set operation."""
+
+    key: CacheKey
+
+
+class SetCacheEntriesRequest(BaseModel):
+    """Request body for batch cache set operation."""
+
+    entries: list[CacheEntryRequest] = Field(min_length=1, max_length=1000)
+
+
+class CacheKeysRequest(BaseModel):
+    """Request body for batch cache get/delete operations."""
+
+    keys: list[CacheKey] = Field(min_length=1, max_length=1000)
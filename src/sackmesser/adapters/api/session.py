@@ -0,0 +1,20 @@
+"""Per-request session identity for HTTP callers."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from sackmesser.application.session import session_scope
+
+SESSION_HEADER = "X-Session-Id"
+
+
+async def session_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """Scope the request to the caller's `X-Session-Id`, if it sent one."""
+    with session_scope(request.headers.get(SESSION_HEADER)):
+        return await call_next(request)
@@ -1,5 +1,6 @@
 """MCP adapter exports."""
 
+from sackmesser.adapters.mcp.http import MCPHttpApp, MCPHttpSettings, mount_mcp_http
 from sackmesser.adapters.mcp.server import create_mcp_server, run_mcp_server
 
-__all__ = ["create_mcp_server", "run_mcp_server"]
+__all__ = ["MCPHttpApp", "MCPHttpSettings", "create_mcp_server", "mount_mcp_http", "run_mcp_server"]
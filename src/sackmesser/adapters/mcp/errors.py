@@ -15,7 +15,7 @@ class MCPToolError(Exception):
     details: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        super().__init__(self.message)
+        Exception.__init__(self, self.message)
 
     def to_payload(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
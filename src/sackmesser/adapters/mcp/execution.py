@@ -0,0 +1,201 @@
+"""Bounded, time-limited execution of MCP tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from sackmesser.adapters.mcp.errors import MCPToolError
+from sackmesser.adapters.mcp.tools.common import ToolResult, ToolSpec
+from sackmesser.infrastructure.runtime.container import ApplicationContainer
+
+
+@dataclass(frozen=True, slots=True)
+class ToolExecutionSettings:
+    """Limits applied to tool calls, read from `sackmesser.mcp` in appsettings.
+
+    `max_concurrency` caps tool calls running at once across the session and
+    `max_queue` bounds how many may wait for a slot; both are unlimited when
+    None. Timeouts cover queueing and execution, keyed by tool name.
+    """
+
+    max_concurrency: int | None = None
+    max_queue: int | None = None
+    default_timeout_seconds: float | None = None
+    timeout_seconds: Mapping[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> ToolExecutionSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        max_concurrency = raw.get("max_concurrency")
+        max_queue = raw.get("max_queue")
+        default_timeout = raw.get("default_timeout_seconds")
+        return cls(
+            max_concurrency=None if max_concurrency is None else int(max_concurrency),
+            max_queue=None if max_queue is None else int(max_queue),
+            default_timeout_seconds=None if default_timeout is None else float(default_timeout),
+            timeout_seconds={
+                str(name): float(seconds)
+                for name, seconds in dict(raw.get("timeout_seconds") or {}).items()
+            },
+        )
+
+    def timeout_for(self, tool_name: str) -> float | None:
+        seconds = self.timeout_seconds.get(tool_name, self.default_timeout_seconds)
+        return seconds if seconds is not None and seconds > 0 else None
+
+
+@dataclass(slots=True)
+class _ToolCounters:
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class ToolExecutor:
+    """Run tool calls under a shared concurrency limit, queue bound and timeouts.
+
+    MCP clients may pipeline many `tools/call` requests on one session and the
+    server handles each in its own task, so without a limit one slow tool can
+    pile up unbounded work. Calls beyond `max_concurrency` wait for a slot;
+    once `max_queue` calls are waiting, new ones fail with an `overloaded`
+    tool error, and calls exceeding their time budget fail with
+    `tool_timeout`.
+    """
+
+    def __init__(self, settings: ToolExecutionSettings | None = None) -> None:
+        self._settings = settings or ToolExecutionSettings()
+        limit = self._settings.max_concurrency
+        self._semaphore = asyncio.Semaphore(limit) if limit and limit > 0 else None
+        self._in_flight = 0
+        self._queued = 0
+        self._peak_in_flight = 0
+        self._peak_queued = 0
+        self._rejected = 0
+        self._tools: dict[str, _ToolCounters] = {}
+
+    async def run(
+        self,
+        tool_name: str,
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """Run `call` for `tool_name`, raising `MCPToolError` when shed or timed out."""
+        counters = self._tools.setdefault(tool_name, _ToolCounters())
+        seconds = self._settings.timeout_for(tool_name)
+        started = time.perf_counter()
+        deadline = asyncio.timeout(seconds)
+        try:
+            async with deadline:
+                return await self._admit(tool_name, call)
+        except TimeoutError as exc:
+            if not deadline.expired():
+                counters.failures += 1
+                raise
+            counters.timeouts += 1
+            raise MCPToolError(
+                code="tool_timeout",
+                message=f"Tool '{tool_name}' timed out after {seconds:g}s",
+                details={"tool": tool_name, "timeout_seconds": seconds},
+            ) from exc
+        except MCPToolError as exc:
+            if exc.code != "overloaded":
+                counters.failures += 1
+            raise
+        except Exception:
+            counters.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            counters.calls += 1
+            counters.total_seconds += elapsed
+            counters.max_seconds = max(counters.max_seconds, elapsed)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, in-flight counts and per-tool call counters."""
+        return {
+            "max_concurrency": self._settings.max_concurrency,
+            "max_queue": self._settings.max_queue,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "peak_in_flight": self._peak_in_flight,
+            "peak_queued": self._peak_queued,
+            "rejected": self._rejected,
+            "tools": {
+                name: {
+                    "calls": counters.calls,
+                    "failures": counters.failures,
+                    "timeouts": counters.timeouts,
+                    "mean_seconds": counters.total_seconds / counters.calls
+                    if counters.calls
+                    else 0.0,
+                    "max_seconds": counters.max_seconds,
+                }
+                for name, counters in sorted(self._tools.items())
+            },
+        }
+
+    def stats_tool_spec(self) -> ToolSpec:
+        """Return a tool spec exposing `stats()` to MCP clients."""
+
+        async def execution_stats_tool(
+            _container: ApplicationContainer,
+            _arguments: dict[str, Any],
+        ) -> dict[str, Any]:
+            return self.stats()
+
+        return ToolSpec(
+            name="mcp_execution_stats",
+            description="Get MCP tool queue depth, in-flight calls and per-tool latency.",
+            input_schema={"type": "object", "properties": {}},
+            handler=execution_stats_tool,
+        )
+
+    async def _admit(
+        self,
+        tool_name: str,
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        semaphore = self._semaphore
+        if semaphore is None:
+            return await self._execute(call)
+
+        if semaphore.locked():
+            max_queue = self._settings.max_queue
+            if max_queue is not None and self._queued >= max_queue:
+                self._rejected += 1
+                raise MCPToolError(
+                    code="overloaded",
+                    message=f"Too many pending tool calls, retry '{tool_name}' later",
+                    details={
+                        "tool": tool_name,
+                        "max_concurrency": self._settings.max_concurrency,
+                        "max_queue": max_queue,
+                    },
+                )
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+            try:
+                await semaphore.acquire()
+            finally:
+                self._queued -= 1
+        else:
+            await semaphore.acquire()
+        try:
+            return await self._execute(call)
+        finally:
+            semaphore.release()
+
+    async def _execute(self, call: Callable[[], Awaitable[ToolResult]]) -> ToolResult:
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            return await call()
+        finally:
+            self._in_flight -= 1
@@ -0,0 +1,99 @@
+"""Streamable HTTP transport for the MCP server, mountable in the FastAPI app."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from sackmesser.adapters.mcp.server import create_mcp_server
+
+
+@dataclass(frozen=True, slots=True)
+class MCPHttpSettings:
+    """HTTP transport options, read from `sackmesser.mcp.http` in appsettings."""
+
+    enabled: bool = False
+    path: str = "/mcp"
+    stateless: bool = False
+    json_response: bool = False
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> MCPHttpSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            path=str(raw.get("path", defaults.path)),
+            stateless=bool(raw.get("stateless", defaults.stateless)),
+            json_response=bool(raw.get("json_response", defaults.json_response)),
+        )
+
+
+class MCPHttpApp:
+    """ASGI endpoint serving many MCP sessions from the process-wide runtime.
+
+    The MCP server and its session manager are created in `lifespan()`, after
+    the runtime has started, so every session shares one container, one set of
+    connection pools and one tool concurrency limit. Requests arriving outside
+    the lifespan get a 503.
+    """
+
+    def __init__(self, settings: MCPHttpSettings | None = None) -> None:
+        self._settings = settings or MCPHttpSettings()
+        self._session_manager: StreamableHTTPSessionManager | None = None
+
+    @property
+    def settings(self) -> MCPHttpSettings:
+        return self._settings
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """Run the session manager; requires an initialized runtime."""
+        session_manager = StreamableHTTPSessionManager(
+            app=create_mcp_server(),
+            json_response=self._settings.json_response,
+            stateless=self._settings.stateless,
+        )
+        async with session_manager.run():
+            self._session_manager = session_manager
+            try:
+                yield
+            finally:
+                self._session_manager = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        session_manager = self._session_manager
+        if session_manager is None:
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "error": "ServiceUnavailable",
+                    "message": "MCP transport is not running",
+                    "code": "mcp_unavailable",
+                },
+            )
+            await response(scope, receive, send)
+            return
+        await session_manager.handle_request(scope, receive, send)
+
+
+def mount_mcp_http(app: FastAPI, settings: MCPHttpSettings | None = None) -> MCPHttpApp:
+    """Serve MCP over streamable HTTP at `settings.path`.
+
+    The returned endpoint is stored on `app.state.mcp_http`; the app lifespan
+    must enter its `lifespan()` once the runtime is up.
+    """
+    mcp_app = MCPHttpApp(settings)
+    app.router.routes.append(Route(mcp_app.settings.path, endpoint=mcp_app))
+    app.state.mcp_http = mcp_app
+    return mcp_app
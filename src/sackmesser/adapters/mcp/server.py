@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Sequence
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
+from pydantic import ValidationError as PydanticValidationError
 
 from sackmesser.adapters.mcp.errors import MCPToolError
+from sackmesser.adapters.mcp.execution import ToolExecutionSettings, ToolExecutor
 from sackmesser.adapters.mcp.tools import load_tool_specs
+from sackmesser.adapters.mcp.tools.common import EncodedToolResult
+from sackmesser.adapters.mcp.validation import ToolArgumentsValidator, request_validation_error
+from sackmesser.adapters.serialization import dumps
+from sackmesser.application.errors import ApplicationError
+from sackmesser.application.session import session_scope
 from sackmesser.infrastructure.runtime import (
     get_runtime_container,
     get_runtime_state,
     shutdown_runtime,
     startup_runtime,
 )
+from sackmesser.infrastructure.runtime.options import option_section
 
 
 def _unknown_tool_payload(name: str) -> dict[str, Any]:
@@ -30,27 +37,46 @@ def _unknown_tool_payload(name: str) -> dict[str, Any]:
     }
 
 
+def _text_content(payload: Any) -> list[TextContent]:
+    if isinstance(payload, EncodedToolResult):
+        return [TextContent(type="text", text=payload.content)]
+    return [TextContent(type="text", text=dumps(payload).decode("utf-8"))]
+
+
+def _session_id(server: Any) -> str | None:
+    # Session objects live as long as their MCP session, so their id is unique
+    # among sessions that are still connected.
+    try:
+        return f"mcp:{id(server.request_context.session)}"
+    except LookupError:
+        return None
+
+
 def create_mcp_server() -> Server:
     """Create MCP server using runtime enabled modules."""
     state = get_runtime_state()
-    tool_specs = load_tool_specs(state.enabled_modules)
+    executor = ToolExecutor(
+        ToolExecutionSettings.from_mapping(option_section(state.options, "sackmesser", "mcp"))
+    )
+    tool_specs = [*load_tool_specs(state.enabled_modules), executor.stats_tool_spec()]
     tool_map = {spec.name: spec for spec in tool_specs}
+    validators = {
+        spec.name: ToolArgumentsValidator(spec.name, spec.input_schema) for spec in tool_specs
+    }
+    tools = [
+        Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+        for spec in tool_specs
+    ]
 
     server = Server(state.settings.service.name)
     server_any: Any = server
 
     @server_any.list_tools()  # type: ignore[untyped-decorator]
     async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name=tool.name,
-                description=tool.description,
-                inputSchema=tool.input_schema,
-            )
-            for tool in tool_specs
-        ]
+        return tools
 
-    @server_any.call_tool()  # type: ignore[untyped-decorator]
+    # Arguments are checked below with validators compiled once per tool.
+    @server_any.call_tool(validate_input=False)  # type: ignore[untyped-decorator]
     async def call_tool(
         name: str,
         arguments: dict[str, Any],
@@ -58,13 +84,22 @@ def create_mcp_server() -> Server:
         container = get_runtime_container()
         tool = tool_map.get(name)
         if tool is None:
-            payload = _unknown_tool_payload(name)
-            return [TextContent(type="text", text=json.dumps(payload))]
+            return _text_content(_unknown_tool_payload(name))
 
         try:
-            result = await tool.handler(container, arguments)
+            validators[name].validate(arguments)
+            with session_scope(_session_id(server_any)):
+                result = await executor.run(name, lambda: tool.handler(container, arguments))
+            return _text_content(result)
         except MCPToolError as exc:
             result = exc.to_payload()
+        except PydanticValidationError as exc:
+            # Constraints the input schema does not express, such as cross-field checks.
+            result = request_validation_error(name, exc).to_payload()
+        except ApplicationError as exc:
+            result = MCPToolError(
+                code=exc.code, message=exc.message, details=exc.details
+            ).to_payload()
         except Exception as exc:
             result = {
                 "error": {
@@ -74,7 +109,7 @@ def create_mcp_server() -> Server:
                 }
             }
 
-        return [TextContent(type="text", text=json.dumps(result, default=str))]
+        return _text_content(result)
 
     return server
 
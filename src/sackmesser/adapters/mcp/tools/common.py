@@ -8,7 +8,16 @@ from typing import Any
 
 from sackmesser.infrastructure.runtime.container import ApplicationContainer
 
-ToolHandler = Callable[[ApplicationContainer, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+@dataclass(frozen=True, slots=True)
+class EncodedToolResult:
+    """Tool result already rendered as a JSON document, sent to the client as is."""
+
+    content: str
+
+
+ToolResult = dict[str, Any] | EncodedToolResult
+ToolHandler = Callable[[ApplicationContainer, dict[str, Any]], Awaitable[ToolResult]]
 
 
 @dataclass(frozen=True, slots=True)
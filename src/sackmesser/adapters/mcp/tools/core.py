@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import cast
 
-from sackmesser.application.requests.core import GetCapabilitiesQuery, GetHealthQuery
+from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
+    GetCapabilitiesQuery,
+    GetHealthQuery,
+)
 from sackmesser.infrastructure.runtime.container import ApplicationContainer
 
 from .common import ToolSpec
@@ -28,6 +32,15 @@ async def list_capabilities_tool(
     return cast("dict[str, object]", result.model_dump())
 
 
+async def bus_metrics_tool(
+    container: ApplicationContainer,
+    _arguments: dict[str, object],
+) -> dict[str, object]:
+    """Return per-request-type bus latency histograms."""
+    result = await container.query_bus.dispatch(GetBusMetricsQuery())
+    return cast("dict[str, object]", result.model_dump())
+
+
 def get_tool_specs() -> list[ToolSpec]:
     """Return MCP tool specs for core module."""
     return [
@@ -43,4 +56,10 @@ def get_tool_specs() -> list[ToolSpec]:
             input_schema={"type": "object", "properties": {}},
             handler=list_capabilities_tool,
         ),
+        ToolSpec(
+            name="bus_metrics",
+            description="Get per-request-type latency histograms of the command and query buses.",
+            input_schema={"type": "object", "properties": {}},
+            handler=bus_metrics_tool,
+        ),
     ]
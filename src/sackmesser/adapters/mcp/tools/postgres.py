@@ -7,11 +7,18 @@ from typing import Any, cast
 from sackmesser.adapters.mcp.errors import MCPToolError
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
-    ListWorkflowsQuery,
+    CreateWorkflowsBatchCommand,
+    ExportWorkflowsQuery,
+    GetWorkflowQuery,
+    GetWorkflowsQuery,
+    ListWorkflowsJsonQuery,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    WorkflowPayloadSetOperation,
 )
 from sackmesser.infrastructure.runtime.container import ApplicationContainer
 
-from .common import ToolSpec
+from .common import EncodedToolResult, ToolSpec
 
 
 async def create_workflow_tool(
@@ -34,11 +41,11 @@ async def create_workflow_tool(
     return cast("dict[str, Any]", result.model_dump())
 
 
-async def list_workflows_tool(
+async def create_workflows_batch_tool(
     container: ApplicationContainer,
     arguments: dict[str, Any],
 ) -> dict[str, Any]:
-    """List Postgres workflows."""
+    """Create many Postgres workflows in one call."""
     if "postgres" not in container.enabled_modules:
         raise MCPToolError(
             code="module_disabled",
@@ -46,14 +53,138 @@ async def list_workflows_tool(
             details={"module": "postgres"},
         )
 
-    query = ListWorkflowsQuery(
+    command = CreateWorkflowsBatchCommand(
+        workflows=[
+            CreateWorkflowCommand(title=item["title"], payload=item.get("payload", {}))
+            for item in arguments["workflows"]
+        ]
+    )
+    result = await container.command_bus.dispatch(command)
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def list_workflows_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> EncodedToolResult:
+    """List Postgres workflows; stored payloads reach the client without re-encoding."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    query = ListWorkflowsJsonQuery(
         limit=arguments.get("limit", 20),
         offset=arguments.get("offset", 0),
+        cursor=arguments.get("cursor"),
+        include_total=arguments.get("include_total", False),
+        created_from=arguments.get("created_from"),
+        created_to=arguments.get("created_to"),
+    )
+    result = await container.query_bus.dispatch(query)
+    return EncodedToolResult(content=result.content)
+
+
+async def search_workflows_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Search Postgres workflows by title and payload."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    query = SearchWorkflowsQuery(
+        title=arguments.get("title"),
+        payload_contains=arguments.get("payload_contains"),
+        limit=arguments.get("limit", 20),
+        cursor=arguments.get("cursor"),
+    )
+    result = await container.query_bus.dispatch(query)
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def export_workflows_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Read one NDJSON chunk of a full Postgres workflow export."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    query = ExportWorkflowsQuery(
+        limit=arguments.get("limit", 500),
+        cursor=arguments.get("cursor"),
     )
     result = await container.query_bus.dispatch(query)
     return cast("dict[str, Any]", result.model_dump())
 
 
+async def get_workflow_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Fetch one Postgres workflow by id."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    result = await container.query_bus.dispatch(GetWorkflowQuery(id=arguments["id"]))
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def get_workflows_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Fetch many Postgres workflows by id."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    result = await container.query_bus.dispatch(GetWorkflowsQuery(ids=tuple(arguments["ids"])))
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def update_workflow_payload_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Patch a Postgres workflow payload in place."""
+    if "postgres" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'postgres' is disabled",
+            details={"module": "postgres"},
+        )
+
+    command = UpdateWorkflowPayloadCommand(
+        id=arguments["id"],
+        merge=arguments.get("merge"),
+        sets=tuple(
+            WorkflowPayloadSetOperation(path=tuple(item["path"]), value=item.get("value"))
+            for item in arguments.get("sets", [])
+        ),
+    )
+    result = await container.command_bus.dispatch(command)
+    return cast("dict[str, Any]", result.model_dump())
+
+
 def get_tool_specs() -> list[ToolSpec]:
     """Return MCP tool specs for postgres module."""
     return [
@@ -63,23 +194,155 @@ def get_tool_specs() -> list[ToolSpec]:
             input_schema={
                 "type": "object",
                 "properties": {
-                    "title": {"type": "string"},
+                    "title": {"type": "string", "minLength": 1, "maxLength": 200},
                     "payload": {"type": "object"},
                 },
                 "required": ["title"],
             },
             handler=create_workflow_tool,
         ),
+        ToolSpec(
+            name="create_workflows_batch",
+            description="Create up to 1000 workflows in Postgres with a single insert.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "workflows": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string", "minLength": 1, "maxLength": 200},
+                                "payload": {"type": "object"},
+                            },
+                            "required": ["title"],
+                        },
+                    },
+                },
+                "required": ["workflows"],
+            },
+            handler=create_workflows_batch_tool,
+        ),
         ToolSpec(
             name="list_workflows",
-            description="List workflows from Postgres.",
+            description=(
+                "List workflows from Postgres. Pass the returned next_cursor back as "
+                "cursor to fetch the following page. include_total adds a total count, "
+                "estimated on large tables (total_estimated). created_from (inclusive) "
+                "and created_to (exclusive) are ISO 8601 timestamps bounding created_at; "
+                "they cannot be combined with include_total."
+            ),
             input_schema={
                 "type": "object",
                 "properties": {
                     "limit": {"type": "integer", "minimum": 1, "maximum": 100},
                     "offset": {"type": "integer", "minimum": 0},
+                    "cursor": {"type": "string", "minLength": 1, "maxLength": 512},
+                    "include_total": {"type": "boolean"},
+                    "created_from": {"type": "string", "format": "date-time"},
+                    "created_to": {"type": "string", "format": "date-time"},
                 },
             },
             handler=list_workflows_tool,
         ),
+        ToolSpec(
+            name="search_workflows",
+            description=(
+                "Search workflows in Postgres by case-insensitive title substring and/or "
+                "payload_contains, an object the stored payload must contain. Pass the "
+                "returned next_cursor back as cursor to fetch the following page."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string", "minLength": 1, "maxLength": 200},
+                    "payload_contains": {"type": "object"},
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+                    "cursor": {"type": "string", "minLength": 1, "maxLength": 512},
+                },
+            },
+            handler=search_workflows_tool,
+        ),
+        ToolSpec(
+            name="export_workflows",
+            description=(
+                "Export every workflow as NDJSON in chunks of up to 1000 rows. Pass the "
+                "returned next_cursor back as cursor until it is null."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 1000},
+                    "cursor": {"type": "string", "minLength": 1, "maxLength": 512},
+                },
+            },
+            handler=export_workflows_tool,
+        ),
+        ToolSpec(
+            name="get_workflow",
+            description="Fetch one workflow from Postgres by id.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "minLength": 1, "maxLength": 64},
+                },
+                "required": ["id"],
+            },
+            handler=get_workflow_tool,
+        ),
+        ToolSpec(
+            name="get_workflows",
+            description=(
+                "Fetch up to 1000 workflows from Postgres by id in one read. Ids that do "
+                "not exist are returned in missing."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "ids": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "items": {"type": "string", "minLength": 1, "maxLength": 64},
+                    },
+                },
+                "required": ["ids"],
+            },
+            handler=get_workflows_tool,
+        ),
+        ToolSpec(
+            name="update_workflow_payload",
+            description=(
+                "Patch a workflow payload in Postgres without sending it back whole. merge "
+                "is a JSON Merge Patch (null removes a key); sets put values at key paths."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "minLength": 1, "maxLength": 64},
+                    "merge": {"type": "object"},
+                    "sets": {
+                        "type": "array",
+                        "maxItems": 32,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "path": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "maxItems": 32,
+                                    "items": {"type": "string", "minLength": 1, "maxLength": 200},
+                                },
+                                "value": {},
+                            },
+                            "required": ["path", "value"],
+                        },
+                    },
+                },
+                "required": ["id"],
+            },
+            handler=update_workflow_payload_tool,
+        ),
     ]
@@ -6,8 +6,12 @@ from typing import Any, cast
 
 from sackmesser.adapters.mcp.errors import MCPToolError
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
     DeleteCacheEntryCommand,
+    GetCacheEntriesQuery,
     GetCacheEntryQuery,
+    GetCacheStatsQuery,
+    SetCacheEntriesCommand,
     SetCacheEntryCommand,
 )
 from sackmesser.infrastructure.runtime.container import ApplicationContainer
@@ -76,6 +80,82 @@ async def cache_delete_tool(
     return cast("dict[str, Any]", result.model_dump())
 
 
+async def cache_set_many_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Set many cache entries in Redis."""
+    if "redis" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'redis' is disabled",
+            details={"module": "redis"},
+        )
+
+    command = SetCacheEntriesCommand(
+        entries=[
+            SetCacheEntryCommand(
+                key=entry["key"],
+                value=entry["value"],
+                ttl_seconds=entry.get("ttl_seconds"),
+            )
+            for entry in arguments["entries"]
+        ]
+    )
+    result = await container.command_bus.dispatch(command)
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def cache_get_many_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Get many cache entries in Redis; missing keys are returned with found=false."""
+    if "redis" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'redis' is disabled",
+            details={"module": "redis"},
+        )
+
+    query = GetCacheEntriesQuery(keys=tuple(arguments["keys"]))
+    result = await container.query_bus.dispatch(query)
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def cache_delete_many_tool(
+    container: ApplicationContainer,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Delete many cache entries in Redis."""
+    if "redis" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'redis' is disabled",
+            details={"module": "redis"},
+        )
+
+    command = DeleteCacheEntriesCommand(keys=arguments["keys"])
+    result = await container.command_bus.dispatch(command)
+    return cast("dict[str, Any]", result.model_dump())
+
+
+async def cache_stats_tool(
+    container: ApplicationContainer,
+    _arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Return hit/miss/eviction counters of the in-process cache tier."""
+    if "redis" not in container.enabled_modules:
+        raise MCPToolError(
+            code="module_disabled",
+            message="Module 'redis' is disabled",
+            details={"module": "redis"},
+        )
+
+    result = await container.query_bus.dispatch(GetCacheStatsQuery())
+    return cast("dict[str, Any]", result.model_dump())
+
+
 def get_tool_specs() -> list[ToolSpec]:
     """Return MCP tool specs for redis module."""
     return [
@@ -85,8 +165,8 @@ def get_tool_specs() -> list[ToolSpec]:
             input_schema={
                 "type": "object",
                 "properties": {
-                    "key": {"type": "string"},
-                    "value": {"type": "string"},
+                    "key": {"type": "string", "minLength": 1, "maxLength": 200},
+                    "value": {"type": "string", "minLength": 1},
                     "ttl_seconds": {"type": "integer", "minimum": 1},
                 },
                 "required": ["key", "value"],
@@ -98,7 +178,7 @@ def get_tool_specs() -> list[ToolSpec]:
             description="Get a cache key from Redis.",
             input_schema={
                 "type": "object",
-                "properties": {"key": {"type": "string"}},
+                "properties": {"key": {"type": "string", "minLength": 1, "maxLength": 200}},
                 "required": ["key"],
             },
             handler=cache_get_tool,
@@ -108,9 +188,74 @@ def get_tool_specs() -> list[ToolSpec]:
             description="Delete a cache key from Redis.",
             input_schema={
                 "type": "object",
-                "properties": {"key": {"type": "string"}},
+                "properties": {"key": {"type": "string", "minLength": 1, "maxLength": 200}},
                 "required": ["key"],
             },
             handler=cache_delete_tool,
         ),
+        ToolSpec(
+            name="cache_set_many",
+            description="Set up to 1000 cache keys in Redis in one call.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "entries": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "key": {"type": "string", "minLength": 1, "maxLength": 200},
+                                "value": {"type": "string", "minLength": 1},
+                                "ttl_seconds": {"type": "integer", "minimum": 1},
+                            },
+                            "required": ["key", "value"],
+                        },
+                    },
+                },
+                "required": ["entries"],
+            },
+            handler=cache_set_many_tool,
+        ),
+        ToolSpec(
+            name="cache_get_many",
+            description="Get up to 1000 cache keys from Redis in one call.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "keys": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "items": {"type": "string", "minLength": 1, "maxLength": 200},
+                    },
+                },
+                "required": ["keys"],
+            },
+            handler=cache_get_many_tool,
+        ),
+        ToolSpec(
+            name="cache_delete_many",
+            description="Delete up to 1000 cache keys from Redis in one call.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "keys": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "items": {"type": "string", "minLength": 1, "maxLength": 200},
+                    },
+                },
+                "required": ["keys"],
+            },
+            handler=cache_delete_many_tool,
+        ),
+        ToolSpec(
+            name="cache_stats",
+            description="Get hit/miss/eviction counters of the in-process cache tier.",
+            input_schema={"type": "object", "properties": {}},
+            handler=cache_stats_tool,
+        ),
     ]
@@ -0,0 +1,78 @@
+"""Precompiled JSON Schema validation of MCP tool arguments."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from jsonschema import FormatChecker
+from jsonschema.validators import validator_for
+from pydantic import ValidationError as PydanticValidationError
+
+from sackmesser.adapters.mcp.errors import MCPToolError
+
+_MAX_REPORTED_ERRORS = 10
+
+# jsonschema only checks `date-time` when an optional RFC 3339 package is
+# installed; this checker accepts what the request models parse.
+_FORMAT_CHECKER = FormatChecker()
+
+
+@_FORMAT_CHECKER.checks("date-time", raises=ValueError)  # type: ignore[untyped-decorator]
+def _is_date_time(value: object) -> bool:
+    if isinstance(value, str):
+        datetime.fromisoformat(value)
+    return True
+
+
+class ToolArgumentsValidator:
+    """Validate tool arguments against a `ToolSpec.input_schema` compiled once.
+
+    The schema itself is checked at construction, so a broken tool spec fails
+    server startup instead of the first call. `format` keywords are enforced.
+    """
+
+    __slots__ = ("_validator", "tool_name")
+
+    def __init__(self, tool_name: str, schema: dict[str, Any]) -> None:
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.tool_name = tool_name
+        self._validator = validator_cls(schema, format_checker=_FORMAT_CHECKER)
+
+    def validate(self, arguments: dict[str, Any]) -> None:
+        """Raise `MCPToolError` with code `invalid_arguments` if `arguments` do not match."""
+        if self._validator.is_valid(arguments):
+            return
+        errors = sorted(self._validator.iter_errors(arguments), key=lambda error: error.path)
+        raise invalid_arguments(
+            self.tool_name,
+            ((error.absolute_path, error.message) for error in errors),
+        )
+
+
+def invalid_arguments(
+    tool_name: str,
+    errors: Iterable[tuple[Iterable[str | int], str]],
+) -> MCPToolError:
+    """Build the `invalid_arguments` error reporting `(path, message)` pairs."""
+    return MCPToolError(
+        code="invalid_arguments",
+        message=f"Invalid arguments for tool '{tool_name}'",
+        details={
+            "tool": tool_name,
+            "errors": [
+                {"field": ".".join(str(part) for part in path), "message": message}
+                for path, message in list(errors)[:_MAX_REPORTED_ERRORS]
+            ],
+        },
+    )
+
+
+def request_validation_error(tool_name: str, exc: PydanticValidationError) -> MCPToolError:
+    """Map a request model rejecting tool arguments to `invalid_arguments`."""
+    return invalid_arguments(
+        tool_name,
+        ((error["loc"], error["msg"]) for error in exc.errors(include_url=False)),
+    )
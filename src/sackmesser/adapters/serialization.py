@@ -0,0 +1,73 @@
+"""Fast JSON encoding shared by the API and MCP adapters."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, Literal
+
+import pydantic_core
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional backend
+    orjson = None  # type: ignore[assignment]
+
+JsonEncoder = Callable[[Any], bytes]
+JsonBackend = Literal["auto", "orjson", "pydantic", "stdlib"]
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def _encode_pydantic(value: Any) -> bytes:
+    return pydantic_core.to_json(value, fallback=str)
+
+
+def _encode_orjson(value: Any) -> bytes:
+    try:
+        return orjson.dumps(value, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits, which JSONB payloads may hold.
+        return _encode_pydantic(value)
+
+
+def _encode_stdlib(value: Any) -> bytes:
+    return json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def json_encoder(backend: JsonBackend = "auto") -> JsonEncoder:
+    """Return an encoder producing compact UTF-8 JSON bytes.
+
+    Pydantic models always go straight through their compiled serializer, so a
+    result never takes a `model_dump()` detour. Other values use `backend`;
+    `auto` picks orjson when it is installed and pydantic-core otherwise.
+    Values a backend cannot encode fall back to `str()`, like the previous
+    `json.dumps(..., default=str)`; documents orjson rejects outright, such as
+    integers beyond 64 bits, are re-encoded with pydantic-core.
+    """
+    if backend == "auto":
+        backend = "orjson" if orjson is not None else "pydantic"
+    if backend == "orjson" and orjson is None:
+        msg = "orjson backend requested but orjson is not installed"
+        raise RuntimeError(msg)
+    encode = {
+        "orjson": _encode_orjson,
+        "pydantic": _encode_pydantic,
+        "stdlib": _encode_stdlib,
+    }[backend]
+
+    def encoder(value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return pydantic_core.to_json(value)
+        return encode(value)
+
+    return encoder
+
+
+dumps: JsonEncoder = json_encoder()
+"""Default encoder used by the API response class and MCP tool results."""
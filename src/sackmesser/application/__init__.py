@@ -2,27 +2,49 @@
 
 from importlib import import_module
 
-from sackmesser.application.bus import CommandBus, Handler, HandlerNotRegisteredError, QueryBus
+from sackmesser.application.bus import (
+    CoalescingHandler,
+    CommandBus,
+    Handler,
+    HandlerNotRegisteredError,
+    Middleware,
+    QueryBus,
+)
 from sackmesser.application.errors import (
     ApplicationError,
     ConflictError,
     DisabledModuleError,
     NotFoundError,
+    OverloadedError,
+    RequestTimeoutError,
     ValidationError,
 )
 from sackmesser.application.handlers.core import (
+    GetBusMetricsQueryHandler,
     GetCapabilitiesQueryHandler,
     GetHealthQueryHandler,
 )
+from sackmesser.application.middleware import (
+    Bulkhead,
+    ConcurrencyLimitMiddleware,
+    LatencyHistogramMiddleware,
+    TimeoutMiddleware,
+)
 from sackmesser.application.requests.core import (
     CapabilityDto,
+    GetBusMetricsQuery,
+    GetBusMetricsResult,
     GetCapabilitiesQuery,
     GetCapabilitiesResult,
     GetHealthQuery,
     GetHealthResult,
 )
 from sackmesser.application.use_cases.base import BaseUseCase, UseCase
-from sackmesser.application.use_cases.core import GetCapabilitiesUseCase, GetHealthUseCase
+from sackmesser.application.use_cases.core import (
+    GetBusMetricsUseCase,
+    GetCapabilitiesUseCase,
+    GetHealthUseCase,
+)
 
 # Backward-compatible aliases
 GetCapabilitiesHandler = GetCapabilitiesQueryHandler
@@ -31,10 +53,17 @@ GetHealthHandler = GetHealthQueryHandler
 __all__ = [
     "ApplicationError",
     "BaseUseCase",
+    "Bulkhead",
     "CapabilityDto",
+    "CoalescingHandler",
     "CommandBus",
+    "ConcurrencyLimitMiddleware",
     "ConflictError",
     "DisabledModuleError",
+    "GetBusMetricsQuery",
+    "GetBusMetricsQueryHandler",
+    "GetBusMetricsResult",
+    "GetBusMetricsUseCase",
     "GetCapabilitiesHandler",
     "GetCapabilitiesQuery",
     "GetCapabilitiesQueryHandler",
@@ -47,8 +76,13 @@ __all__ = [
     "GetHealthUseCase",
     "Handler",
     "HandlerNotRegisteredError",
+    "LatencyHistogramMiddleware",
+    "Middleware",
     "NotFoundError",
+    "OverloadedError",
     "QueryBus",
+    "RequestTimeoutError",
+    "TimeoutMiddleware",
     "UseCase",
     "ValidationError",
 ]
@@ -57,35 +91,79 @@ _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
     "sackmesser.application.requests.workflows": (
         "CreateWorkflowCommand",
         "CreateWorkflowResult",
+        "CreateWorkflowsBatchCommand",
+        "CreateWorkflowsBatchResult",
+        "ExportWorkflowsQuery",
+        "ExportWorkflowsResult",
+        "GetWorkflowQuery",
+        "GetWorkflowResult",
+        "GetWorkflowsQuery",
+        "GetWorkflowsResult",
+        "ListWorkflowsJsonQuery",
+        "ListWorkflowsJsonResult",
         "ListWorkflowsQuery",
         "ListWorkflowsResult",
+        "SearchWorkflowsQuery",
+        "UpdateWorkflowPayloadCommand",
+        "UpdateWorkflowPayloadResult",
         "WorkflowDto",
+        "WorkflowPayloadSetOperation",
     ),
     "sackmesser.application.handlers.workflows": (
         "CreateWorkflowCommandHandler",
+        "CreateWorkflowsBatchCommandHandler",
+        "ExportWorkflowsQueryHandler",
+        "GetWorkflowQueryHandler",
+        "GetWorkflowsQueryHandler",
+        "ListWorkflowsJsonQueryHandler",
         "ListWorkflowsQueryHandler",
+        "SearchWorkflowsQueryHandler",
+        "UpdateWorkflowPayloadCommandHandler",
     ),
     "sackmesser.application.use_cases.workflows": (
         "CreateWorkflowUseCase",
+        "CreateWorkflowsBatchUseCase",
+        "ExportWorkflowsUseCase",
+        "GetWorkflowUseCase",
+        "GetWorkflowsUseCase",
+        "ListWorkflowsJsonUseCase",
         "ListWorkflowsUseCase",
+        "SearchWorkflowsUseCase",
+        "UpdateWorkflowPayloadUseCase",
     ),
     "sackmesser.application.requests.cache": (
         "CacheEntryDto",
+        "DeleteCacheEntriesCommand",
+        "DeleteCacheEntriesResult",
         "DeleteCacheEntryCommand",
         "DeleteCacheEntryResult",
+        "GetCacheEntriesQuery",
+        "GetCacheEntriesResult",
         "GetCacheEntryQuery",
         "GetCacheEntryResult",
+        "GetCacheStatsQuery",
+        "GetCacheStatsResult",
+        "SetCacheEntriesCommand",
+        "SetCacheEntriesResult",
         "SetCacheEntryCommand",
         "SetCacheEntryResult",
     ),
     "sackmesser.application.handlers.cache": (
+        "DeleteCacheEntriesCommandHandler",
         "DeleteCacheEntryCommandHandler",
+        "GetCacheEntriesQueryHandler",
         "GetCacheEntryQueryHandler",
+        "GetCacheStatsQueryHandler",
+        "SetCacheEntriesCommandHandler",
         "SetCacheEntryCommandHandler",
     ),
     "sackmesser.application.use_cases.cache": (
+        "DeleteCacheEntriesUseCase",
         "DeleteCacheEntryUseCase",
+        "GetCacheEntriesUseCase",
         "GetCacheEntryUseCase",
+        "GetCacheStatsUseCase",
+        "SetCacheEntriesUseCase",
         "SetCacheEntryUseCase",
     ),
 }
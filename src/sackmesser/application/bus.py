@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Protocol, TypeVar
+from typing import Any, Generic, Protocol, TypeVar
 
 from pydantic import BaseModel
 
+from sackmesser.application.session import SessionPins
+
 RequestT = TypeVar("RequestT", bound=BaseModel, contravariant=True)
 ResultT = TypeVar("ResultT", covariant=True)
 
@@ -18,6 +21,13 @@ class Handler(Protocol[RequestT, ResultT]):
         """Handle a validated request model."""
 
 
+class Middleware(Protocol):
+    """Cross-cutting behavior composed around handlers when they are registered."""
+
+    def wrap(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> Handler[Any, Any]:
+        """Return a handler decorating `handler`, or `handler` itself to opt out."""
+
+
 class HandlerNotRegisteredError(LookupError):
     """Raised when dispatching a request without a registered handler."""
 
@@ -28,10 +38,42 @@ class HandlerNotRegisteredError(LookupError):
 
 @dataclass(slots=True)
 class _Bus:
+    """Request dispatcher with an ordered middleware chain.
+
+    Middlewares are composed around each handler once, when it is registered
+    (or when a middleware is added later), so `dispatch` stays a dict lookup
+    plus one call and a bus without middlewares pays nothing for the feature.
+    The first middleware added is the outermost. A result cache set with
+    `set_cache` wraps the whole chain, so hits take no concurrency slot and
+    are never shed. Coalescing, where enabled, wraps both, so callers joining
+    an in-flight call take no slot or queue position of their own either.
+    """
+
     _handlers: dict[type[BaseModel], Handler[Any, Any]] = field(default_factory=dict)
+    _registered: dict[type[BaseModel], Handler[Any, Any]] = field(default_factory=dict)
+    _middlewares: list[Middleware] = field(default_factory=list)
+    _coalesced: set[type[BaseModel]] = field(default_factory=set)
+    _session_pins: SessionPins | None = None
+    _cache: Middleware | None = None
+
+    def use(self, middleware: Middleware) -> None:
+        """Append `middleware` to the chain and recompose registered handlers."""
+        self._middlewares.append(middleware)
+        self._recompose()
+
+    def set_session_pins(self, pins: SessionPins | None) -> None:
+        """Keep pinned sessions out of calls coalesced for other sessions."""
+        self._session_pins = pins
+        self._recompose()
+
+    def set_cache(self, cache: Middleware | None) -> None:
+        """Wrap `cache` around the middleware chain of every handler."""
+        self._cache = cache
+        self._recompose()
 
     def register(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> None:
-        self._handlers[request_type] = handler
+        self._registered[request_type] = handler
+        self._handlers[request_type] = self._compose(request_type, handler)
 
     def has_handler(self, request_type: type[BaseModel]) -> bool:
         return request_type in self._handlers
@@ -42,6 +84,61 @@ class _Bus:
             raise HandlerNotRegisteredError(type(request))
         return await handler.handle(request)
 
+    def _recompose(self) -> None:
+        for request_type, handler in self._registered.items():
+            self._handlers[request_type] = self._compose(request_type, handler)
+
+    def _compose(
+        self, request_type: type[BaseModel], handler: Handler[Any, Any]
+    ) -> Handler[Any, Any]:
+        for middleware in reversed(self._middlewares):
+            handler = middleware.wrap(request_type, handler)
+        if self._cache is not None:
+            handler = self._cache.wrap(request_type, handler)
+        if request_type in self._coalesced:
+            handler = CoalescingHandler(handler, pins=self._session_pins)
+        return handler
+
+
+class CoalescingHandler(Generic[RequestT, ResultT]):
+    """Share one in-flight `handle` call between concurrent equal requests.
+
+    Requests are keyed by value, which frozen pydantic models support out of the
+    box; unhashable requests (e.g. with dict fields) bypass coalescing. The shared
+    call is shielded so one caller being cancelled does not fail the others.
+    While `pins` reports the caller's session as pinned, its key includes the
+    session, so it only shares calls with itself.
+    """
+
+    __slots__ = ("_handler", "_in_flight", "_pins")
+
+    def __init__(
+        self, handler: Handler[RequestT, ResultT], *, pins: SessionPins | None = None
+    ) -> None:
+        self._handler = handler
+        self._pins = pins
+        self._in_flight: dict[Any, asyncio.Future[ResultT]] = {}
+
+    async def handle(self, request: RequestT) -> ResultT:
+        pinned = None if self._pins is None else self._pins.pinned_session()
+        key: Any = request if pinned is None else (request, pinned)
+        try:
+            future = self._in_flight.get(key)
+        except TypeError:
+            return await self._handler.handle(request)
+
+        if future is None:
+            future = asyncio.ensure_future(self._handler.handle(request))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(future)
+
+    def _release(self, key: Any, future: asyncio.Future[ResultT]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()
+
 
 class CommandBus(_Bus):
     """Dispatcher for command requests (state-changing)."""
@@ -49,3 +146,23 @@ class CommandBus(_Bus):
 
 class QueryBus(_Bus):
     """Dispatcher for query requests (read-only)."""
+
+    def register(
+        self,
+        request_type: type[BaseModel],
+        handler: Handler[Any, Any],
+        *,
+        coalesce: bool = False,
+    ) -> None:
+        """Register a query handler.
+
+        With `coalesce=True`, concurrent dispatches of equal queries share a
+        single call through the middleware chain instead of each reaching the
+        backing store; latency histograms and time budgets then apply to that
+        shared call.
+        """
+        if coalesce:
+            self._coalesced.add(request_type)
+        else:
+            self._coalesced.discard(request_type)
+        super().register(request_type, handler)
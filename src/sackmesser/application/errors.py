@@ -16,7 +16,7 @@ class ApplicationError(Exception):
     status_code: int = 500
 
     def __post_init__(self) -> None:
-        super().__init__(self.message)
+        Exception.__init__(self, self.message)
 
     def to_dict(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
@@ -83,6 +83,42 @@ class ConflictError(ApplicationError):
         )
 
 
+class RequestTimeoutError(ApplicationError):
+    """Raised when a request exceeds its configured time budget."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        code: str = "request_timeout",
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            code=code,
+            details={} if details is None else details,
+            status_code=504,
+        )
+
+
+class OverloadedError(ApplicationError):
+    """Raised when a request is shed because its bulkhead queue is full."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        code: str = "overloaded",
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            code=code,
+            details={} if details is None else details,
+            status_code=503,
+        )
+
+
 class DisabledModuleError(NotFoundError):
     """Raised when trying to use a disabled module endpoint/tool."""
 
@@ -3,20 +3,32 @@
 from importlib import import_module
 
 from sackmesser.application.handlers.core import (
+    GetBusMetricsQueryHandler,
     GetCapabilitiesQueryHandler,
     GetHealthQueryHandler,
 )
 
-__all__ = ["GetCapabilitiesQueryHandler", "GetHealthQueryHandler"]
+__all__ = ["GetBusMetricsQueryHandler", "GetCapabilitiesQueryHandler", "GetHealthQueryHandler"]
 
 _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
     "sackmesser.application.handlers.workflows": (
         "CreateWorkflowCommandHandler",
+        "CreateWorkflowsBatchCommandHandler",
+        "ExportWorkflowsQueryHandler",
+        "GetWorkflowQueryHandler",
+        "GetWorkflowsQueryHandler",
+        "ListWorkflowsJsonQueryHandler",
         "ListWorkflowsQueryHandler",
+        "SearchWorkflowsQueryHandler",
+        "UpdateWorkflowPayloadCommandHandler",
     ),
     "sackmesser.application.handlers.cache": (
+        "DeleteCacheEntriesCommandHandler",
         "DeleteCacheEntryCommandHandler",
+        "GetCacheEntriesQueryHandler",
         "GetCacheEntryQueryHandler",
+        "GetCacheStatsQueryHandler",
+        "SetCacheEntriesCommandHandler",
         "SetCacheEntryCommandHandler",
     ),
 }
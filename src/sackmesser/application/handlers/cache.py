@@ -1,19 +1,31 @@
 """Cache command/query handlers."""
 
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
+    DeleteCacheEntriesResult,
     DeleteCacheEntryCommand,
     DeleteCacheEntryResult,
+    GetCacheEntriesQuery,
+    GetCacheEntriesResult,
     GetCacheEntryQuery,
     GetCacheEntryResult,
+    GetCacheStatsQuery,
+    GetCacheStatsResult,
+    SetCacheEntriesCommand,
+    SetCacheEntriesResult,
     SetCacheEntryCommand,
     SetCacheEntryResult,
 )
 from sackmesser.application.use_cases.cache import (
+    DeleteCacheEntriesUseCase,
     DeleteCacheEntryUseCase,
+    GetCacheEntriesUseCase,
     GetCacheEntryUseCase,
+    GetCacheStatsUseCase,
+    SetCacheEntriesUseCase,
     SetCacheEntryUseCase,
 )
-from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort, CacheStatsPort
 
 
 class SetCacheEntryCommandHandler:
@@ -74,3 +86,80 @@ class DeleteCacheEntryCommandHandler:
 
     async def handle(self, command: DeleteCacheEntryCommand) -> DeleteCacheEntryResult:
         return await self._use_case.execute(command)
+
+
+class SetCacheEntriesCommandHandler:
+    """Thin adapter for batch cache set use case."""
+
+    def __init__(
+        self,
+        repository: CacheRepositoryPort | None = None,
+        *,
+        use_case: SetCacheEntriesUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = SetCacheEntriesUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, command: SetCacheEntriesCommand) -> SetCacheEntriesResult:
+        return await self._use_case.execute(command)
+
+
+class GetCacheEntriesQueryHandler:
+    """Thin adapter for batch cache get use case."""
+
+    def __init__(
+        self,
+        repository: CacheRepositoryPort | None = None,
+        *,
+        use_case: GetCacheEntriesUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = GetCacheEntriesUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, query: GetCacheEntriesQuery) -> GetCacheEntriesResult:
+        return await self._use_case.execute(query)
+
+
+class DeleteCacheEntriesCommandHandler:
+    """Thin adapter for batch cache delete use case."""
+
+    def __init__(
+        self,
+        repository: CacheRepositoryPort | None = None,
+        *,
+        use_case: DeleteCacheEntriesUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = DeleteCacheEntriesUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, command: DeleteCacheEntriesCommand) -> DeleteCacheEntriesResult:
+        return await self._use_case.execute(command)
+
+
+class GetCacheStatsQueryHandler:
+    """Thin adapter for cache stats use case."""
+
+    def __init__(
+        self,
+        stats_port: CacheStatsPort | None = None,
+        *,
+        use_case: GetCacheStatsUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            use_case = GetCacheStatsUseCase(stats_port)
+        self._use_case = use_case
+
+    async def handle(self, query: GetCacheStatsQuery) -> GetCacheStatsResult:
+        return await self._use_case.execute(query)
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from sackmesser.application.middleware import LatencyHistogramMiddleware
 from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
+    GetBusMetricsResult,
     GetCapabilitiesQuery,
     GetCapabilitiesResult,
     GetHealthQuery,
     GetHealthResult,
 )
-from sackmesser.application.use_cases.core import GetCapabilitiesUseCase, GetHealthUseCase
-from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort
+from sackmesser.application.use_cases.core import (
+    GetBusMetricsUseCase,
+    GetCapabilitiesUseCase,
+    GetHealthUseCase,
+)
+from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort, StatementMetricsPort
 
 
 class GetCapabilitiesQueryHandler:
@@ -50,3 +57,21 @@ class GetHealthQueryHandler:
 
     async def handle(self, query: GetHealthQuery) -> GetHealthResult:
         return await self._use_case.execute(query)
+
+
+class GetBusMetricsQueryHandler:
+    """Thin adapter for bus metrics use case."""
+
+    def __init__(
+        self,
+        latency: LatencyHistogramMiddleware | None = None,
+        *,
+        statements: StatementMetricsPort | None = None,
+        use_case: GetBusMetricsUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            use_case = GetBusMetricsUseCase(latency, statements=statements)
+        self._use_case = use_case
+
+    async def handle(self, query: GetBusMetricsQuery) -> GetBusMetricsResult:
+        return await self._use_case.execute(query)
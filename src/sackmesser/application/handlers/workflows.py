@@ -5,14 +5,42 @@ from __future__ import annotations
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
     CreateWorkflowResult,
+    CreateWorkflowsBatchCommand,
+    CreateWorkflowsBatchResult,
+    ExportWorkflowsQuery,
+    ExportWorkflowsResult,
+    GetWorkflowQuery,
+    GetWorkflowResult,
+    GetWorkflowsQuery,
+    GetWorkflowsResult,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsJsonResult,
     ListWorkflowsQuery,
     ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    UpdateWorkflowPayloadResult,
 )
 from sackmesser.application.use_cases.workflows import (
+    CreateWorkflowsBatchUseCase,
     CreateWorkflowUseCase,
+    ExportWorkflowsUseCase,
+    GetWorkflowsUseCase,
+    GetWorkflowUseCase,
+    ListWorkflowsJsonUseCase,
     ListWorkflowsUseCase,
+    SearchWorkflowsUseCase,
+    UpdateWorkflowPayloadUseCase,
+)
+from sackmesser.domain.ports.workflow_ports import (
+    EncodedWorkflowReadPort,
+    WorkflowCountPort,
+    WorkflowIdPort,
+    WorkflowLookupPort,
+    WorkflowPayloadUpdatePort,
+    WorkflowRepositoryPort,
+    WorkflowSearchPort,
 )
-from sackmesser.domain.ports.workflow_ports import WorkflowRepositoryPort
 
 
 class CreateWorkflowCommandHandler:
@@ -35,6 +63,86 @@ class CreateWorkflowCommandHandler:
         return await self._use_case.execute(command)
 
 
+class CreateWorkflowsBatchCommandHandler:
+    """Thin adapter for batch workflow creation use case."""
+
+    def __init__(
+        self,
+        repository: WorkflowRepositoryPort | None = None,
+        *,
+        use_case: CreateWorkflowsBatchUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = CreateWorkflowsBatchUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, command: CreateWorkflowsBatchCommand) -> CreateWorkflowsBatchResult:
+        return await self._use_case.execute(command)
+
+
+class UpdateWorkflowPayloadCommandHandler:
+    """Thin adapter for workflow payload update use case."""
+
+    def __init__(
+        self,
+        repository: WorkflowPayloadUpdatePort | None = None,
+        *,
+        use_case: UpdateWorkflowPayloadUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = UpdateWorkflowPayloadUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, command: UpdateWorkflowPayloadCommand) -> UpdateWorkflowPayloadResult:
+        return await self._use_case.execute(command)
+
+
+class GetWorkflowQueryHandler:
+    """Thin adapter for workflow lookup use case."""
+
+    def __init__(
+        self,
+        repository: WorkflowLookupPort | None = None,
+        *,
+        use_case: GetWorkflowUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = GetWorkflowUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, query: GetWorkflowQuery) -> GetWorkflowResult:
+        return await self._use_case.execute(query)
+
+
+class GetWorkflowsQueryHandler:
+    """Thin adapter for multi-id workflow lookup use case."""
+
+    def __init__(
+        self,
+        repository: WorkflowLookupPort | None = None,
+        *,
+        use_case: GetWorkflowsUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = GetWorkflowsUseCase(repository)
+        self._use_case = use_case
+
+    async def handle(self, query: GetWorkflowsQuery) -> GetWorkflowsResult:
+        return await self._use_case.execute(query)
+
+
 class ListWorkflowsQueryHandler:
     """Thin adapter for workflow listing use case."""
 
@@ -42,14 +150,80 @@ class ListWorkflowsQueryHandler:
         self,
         repository: WorkflowRepositoryPort | None = None,
         *,
+        counter: WorkflowCountPort | None = None,
+        ids: WorkflowIdPort | None = None,
         use_case: ListWorkflowsUseCase | None = None,
     ) -> None:
         if use_case is None:
             if repository is None:
                 msg = "repository is required when use_case is not provided"
                 raise ValueError(msg)
-            use_case = ListWorkflowsUseCase(repository)
+            use_case = ListWorkflowsUseCase(repository, counter=counter, ids=ids)
         self._use_case = use_case
 
     async def handle(self, query: ListWorkflowsQuery) -> ListWorkflowsResult:
         return await self._use_case.execute(query)
+
+
+class ListWorkflowsJsonQueryHandler:
+    """Thin adapter for the pre-encoded workflow listing use case."""
+
+    def __init__(
+        self,
+        repository: EncodedWorkflowReadPort | None = None,
+        *,
+        counter: WorkflowCountPort | None = None,
+        ids: WorkflowIdPort | None = None,
+        use_case: ListWorkflowsJsonUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = ListWorkflowsJsonUseCase(repository, counter=counter, ids=ids)
+        self._use_case = use_case
+
+    async def handle(self, query: ListWorkflowsJsonQuery) -> ListWorkflowsJsonResult:
+        return await self._use_case.execute(query)
+
+
+class ExportWorkflowsQueryHandler:
+    """Thin adapter for the chunked workflow export use case."""
+
+    def __init__(
+        self,
+        repository: EncodedWorkflowReadPort | None = None,
+        *,
+        ids: WorkflowIdPort | None = None,
+        use_case: ExportWorkflowsUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = ExportWorkflowsUseCase(repository, ids=ids)
+        self._use_case = use_case
+
+    async def handle(self, query: ExportWorkflowsQuery) -> ExportWorkflowsResult:
+        return await self._use_case.execute(query)
+
+
+class SearchWorkflowsQueryHandler:
+    """Thin adapter for the workflow search use case."""
+
+    def __init__(
+        self,
+        repository: WorkflowSearchPort | None = None,
+        *,
+        ids: WorkflowIdPort | None = None,
+        use_case: SearchWorkflowsUseCase | None = None,
+    ) -> None:
+        if use_case is None:
+            if repository is None:
+                msg = "repository is required when use_case is not provided"
+                raise ValueError(msg)
+            use_case = SearchWorkflowsUseCase(repository, ids=ids)
+        self._use_case = use_case
+
+    async def handle(self, query: SearchWorkflowsQuery) -> ListWorkflowsResult:
+        return await self._use_case.execute(query)
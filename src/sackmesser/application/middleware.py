@@ -0,0 +1,242 @@
+"""Built-in bus middlewares: latency histograms, timeouts and concurrency limits."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+from sackmesser.application.bus import Handler
+from sackmesser.application.errors import OverloadedError, RequestTimeoutError
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one request type."""
+
+    __slots__ = ("bounds", "bucket_counts", "count", "errors", "max_seconds", "total_seconds")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float, *, failed: bool = False) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        if failed:
+            self.errors += 1
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Return `(upper_bound, count <= bound)` pairs, ending with `+inf`."""
+        running = 0
+        buckets: list[tuple[float, int]] = []
+        for bound, count in zip((*self.bounds, float("inf")), self.bucket_counts, strict=True):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+
+class LatencyHistogramMiddleware:
+    """Record per-request-type latency histograms, including failed requests.
+
+    One instance can be installed on several buses; histograms are keyed by
+    request class name.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def wrap(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> Handler[Any, Any]:
+        histogram = self._histograms.setdefault(
+            request_type.__name__,
+            LatencyHistogram(self._buckets),
+        )
+        return _TimedHandler(handler, histogram)
+
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        """Return live histograms keyed by request class name."""
+        return dict(self._histograms)
+
+
+class _TimedHandler:
+    __slots__ = ("_handler", "_histogram")
+
+    def __init__(self, handler: Handler[Any, Any], histogram: LatencyHistogram) -> None:
+        self._handler = handler
+        self._histogram = histogram
+
+    async def handle(self, request: BaseModel) -> Any:
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await self._handler.handle(request)
+            failed = False
+            return result
+        finally:
+            self._histogram.observe(time.perf_counter() - started, failed=failed)
+
+
+class TimeoutMiddleware:
+    """Fail requests that exceed a per-type time budget with `RequestTimeoutError`.
+
+    `timeouts` is keyed by request class name; types without an entry use
+    `default_seconds`, and are left unwrapped when that is None.
+    """
+
+    def __init__(
+        self,
+        timeouts: Mapping[str, float] | None = None,
+        *,
+        default_seconds: float | None = None,
+    ) -> None:
+        self._timeouts = dict(timeouts or {})
+        self._default_seconds = default_seconds
+
+    def wrap(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> Handler[Any, Any]:
+        seconds = self._timeouts.get(request_type.__name__, self._default_seconds)
+        if seconds is None or seconds <= 0:
+            return handler
+        return _TimeoutHandler(handler, request_type.__name__, seconds)
+
+
+class _TimeoutHandler:
+    __slots__ = ("_handler", "_request_name", "_seconds")
+
+    def __init__(self, handler: Handler[Any, Any], request_name: str, seconds: float) -> None:
+        self._handler = handler
+        self._request_name = request_name
+        self._seconds = seconds
+
+    async def handle(self, request: BaseModel) -> Any:
+        deadline = asyncio.timeout(self._seconds)
+        try:
+            async with deadline:
+                return await self._handler.handle(request)
+        except TimeoutError as exc:
+            if not deadline.expired():
+                raise
+            raise RequestTimeoutError(
+                f"{self._request_name} exceeded its {self._seconds:g}s time budget",
+                details={"request_type": self._request_name, "timeout_seconds": self._seconds},
+            ) from exc
+
+
+class ConcurrencyLimitMiddleware:
+    """Per-request-type bulkheads: a concurrency cap plus a bounded wait queue.
+
+    `limits` is keyed by request class name; types without an entry use
+    `default_limit`, and are left unwrapped when that is None. Requests beyond
+    the limit wait for a slot; once `max_queue` of them are already waiting
+    (`default_max_queue` for unlisted types, unbounded when None) further
+    requests fail fast with `OverloadedError` instead of queueing, so one slow
+    handler cannot absorb every task on the event loop.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int] | None = None,
+        *,
+        default_limit: int | None = None,
+        max_queue: Mapping[str, int] | None = None,
+        default_max_queue: int | None = None,
+    ) -> None:
+        self._limits = dict(limits or {})
+        self._default_limit = default_limit
+        self._max_queue = dict(max_queue or {})
+        self._default_max_queue = default_max_queue
+        self._bulkheads: dict[str, Bulkhead] = {}
+
+    def wrap(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> Handler[Any, Any]:
+        name = request_type.__name__
+        limit = self._limits.get(name, self._default_limit)
+        if limit is None or limit <= 0:
+            return handler
+        bulkhead = self._bulkheads.get(name)
+        if bulkhead is None:
+            bulkhead = Bulkhead(name, limit, self._max_queue.get(name, self._default_max_queue))
+            self._bulkheads[name] = bulkhead
+        return _LimitedHandler(handler, bulkhead)
+
+    def bulkheads(self) -> dict[str, Bulkhead]:
+        """Return live bulkheads keyed by request class name."""
+        return dict(self._bulkheads)
+
+
+class Bulkhead:
+    """Concurrency slots and admission counters for one request type."""
+
+    __slots__ = ("_semaphore", "capacity", "limit", "max_queue", "name", "pending", "rejected")
+
+    def __init__(self, name: str, limit: int, max_queue: int | None) -> None:
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.capacity = None if max_queue is None else limit + max(max_queue, 0)
+        self.pending = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @property
+    def in_flight(self) -> int:
+        return min(self.pending, self.limit)
+
+    @property
+    def queued(self) -> int:
+        return max(self.pending - self.limit, 0)
+
+    async def run(self, handler: Handler[Any, Any], request: BaseModel) -> Any:
+        """Run `handler` in a slot, queueing or raising `OverloadedError` when full."""
+        if self.capacity is not None and self.pending >= self.capacity:
+            self.rejected += 1
+            raise OverloadedError(
+                f"{self.name} is overloaded, retry later",
+                details={
+                    "request_type": self.name,
+                    "max_concurrency": self.limit,
+                    "max_queue": self.max_queue,
+                },
+            )
+        self.pending += 1
+        try:
+            async with self._semaphore:
+                return await handler.handle(request)
+        finally:
+            self.pending -= 1
+
+
+class _LimitedHandler:
+    __slots__ = ("_bulkhead", "_handler")
+
+    def __init__(self, handler: Handler[Any, Any], bulkhead: Bulkhead) -> None:
+        self._handler = handler
+        self._bulkhead = bulkhead
+
+    async def handle(self, request: BaseModel) -> Any:
+        return await self._bulkhead.run(self._handler, request)
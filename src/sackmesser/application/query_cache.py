@@ -0,0 +1,200 @@
+"""Query result caching with per-type TTLs and tag-based invalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from sackmesser.application.bus import Handler
+from sackmesser.application.session import SessionPins
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+_TAG_TOKEN_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class QueryCachePolicy:
+    """How results of one query type are cached."""
+
+    result_type: type[BaseModel]
+    ttl_seconds: int
+    tags: tuple[str, ...] = ()
+
+
+class QueryResultCache:
+    """Cache query results in a `CacheRepositoryPort` store, keyed by request value.
+
+    Queries are cached only when registered with `cache_query`; commands
+    registered with `invalidate_on` evict every cached query sharing a tag.
+    Eviction is done by tag tokens: each cache key embeds the current random
+    token of the query's tags, and invalidating a tag mints a new token, so
+    stale keys are never read again and simply expire. A result computed while
+    a tag was being invalidated is stored under the old token and is therefore
+    never served. A missing token (never set, or expired) is replaced by a new
+    one, so tokens are never reused. Store failures are logged and fall back
+    to the handler. Sessions reported pinned by `pins` bypass the cache, since
+    entries may have been filled from a lagging replica.
+    """
+
+    def __init__(
+        self,
+        store: CacheRepositoryPort,
+        *,
+        namespace: str = "query-cache",
+        pins: SessionPins | None = None,
+    ) -> None:
+        self._store = store
+        self._namespace = namespace
+        self.pins = pins
+        self._policies: dict[type[BaseModel], QueryCachePolicy] = {}
+        self._invalidations: dict[type[BaseModel], tuple[str, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cache_query(
+        self,
+        query_type: type[BaseModel],
+        result_type: type[BaseModel],
+        *,
+        ttl_seconds: int,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Cache results of `query_type` for `ttl_seconds`, invalidated by `tags`."""
+        if ttl_seconds < 1:
+            msg = f"ttl_seconds for {query_type.__name__} must be positive"
+            raise ValueError(msg)
+        self._policies[query_type] = QueryCachePolicy(
+            result_type=result_type,
+            ttl_seconds=ttl_seconds,
+            tags=tuple(tags),
+        )
+
+    def invalidate_on(self, command_type: type[BaseModel], *tags: str) -> None:
+        """Invalidate cached queries tagged with `tags` whenever `command_type` runs."""
+        self._invalidations[command_type] = (*self._invalidations.get(command_type, ()), *tags)
+
+    def policy_for(self, query_type: type[BaseModel]) -> QueryCachePolicy | None:
+        """Return the cache policy registered for `query_type`, if any."""
+        return self._policies.get(query_type)
+
+    def wrap(self, request_type: type[BaseModel], handler: Handler[Any, Any]) -> Handler[Any, Any]:
+        """Return `handler` with caching or invalidation applied, per registration."""
+        policy = self._policies.get(request_type)
+        if policy is not None:
+            return _CachedQueryHandler(self, request_type, policy, handler)
+        tags = self._invalidations.get(request_type)
+        if tags:
+            return _InvalidatingCommandHandler(self, tags, handler)
+        return handler
+
+    async def invalidate(self, tags: Sequence[str]) -> None:
+        """Mint new tokens for `tags`, orphaning every result cached under them."""
+        if not tags:
+            return
+        try:
+            await self._store.set_many(
+                [(self._tag_key(tag), uuid4().hex, _TAG_TOKEN_TTL_SECONDS) for tag in tags]
+            )
+        except Exception:
+            logger.warning("Failed to invalidate query cache tags %s", list(tags), exc_info=True)
+
+    async def _cache_key(
+        self,
+        request_type: type[BaseModel],
+        request: BaseModel,
+        policy: QueryCachePolicy,
+    ) -> str:
+        digest = hashlib.blake2b(request.model_dump_json().encode("utf-8"), digest_size=16)
+        if policy.tags:
+            for tag, token in zip(policy.tags, await self._tag_tokens(policy.tags), strict=True):
+                digest.update(f"\0{tag}={token}".encode())
+        return f"{self._namespace}:{request_type.__name__}:{digest.hexdigest()}"
+
+    async def _tag_tokens(self, tags: Sequence[str]) -> list[str]:
+        entries = await self._store.get_many([self._tag_key(tag) for tag in tags])
+        tokens = [entry.value for entry in entries]
+        minted = [
+            (self._tag_key(tag), uuid4().hex, _TAG_TOKEN_TTL_SECONDS)
+            for tag, token in zip(tags, tokens, strict=True)
+            if token is None
+        ]
+        if not minted:
+            return [token for token in tokens if token is not None]
+        await self._store.set_many(minted)
+        fresh = iter(token for _key, token, _ttl in minted)
+        return [token if token is not None else next(fresh) for token in tokens]
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._namespace}:tag:{tag}"
+
+
+class _CachedQueryHandler:
+    __slots__ = ("_cache", "_handler", "_policy", "_request_type")
+
+    def __init__(
+        self,
+        cache: QueryResultCache,
+        request_type: type[BaseModel],
+        policy: QueryCachePolicy,
+        handler: Handler[Any, Any],
+    ) -> None:
+        self._cache = cache
+        self._request_type = request_type
+        self._policy = policy
+        self._handler = handler
+
+    async def handle(self, request: BaseModel) -> Any:
+        pins = self._cache.pins
+        if pins is not None and pins.pinned_session() is not None:
+            return await self._handler.handle(request)
+        store = self._cache._store
+        key: str | None = None
+        try:
+            key = await self._cache._cache_key(self._request_type, request, self._policy)
+            cached = await store.get(key)
+            if cached.value is not None:
+                result = self._policy.result_type.model_validate_json(cached.value)
+                self._cache.hits += 1
+                return result
+        except PydanticValidationError:
+            logger.warning("Discarding undecodable cached %s", self._request_type.__name__)
+        except Exception:
+            logger.warning("Query cache lookup failed", exc_info=True)
+
+        self._cache.misses += 1
+        result = await self._handler.handle(request)
+        if key is not None:
+            try:
+                await store.set(key, result.model_dump_json(), self._policy.ttl_seconds)
+            except Exception:
+                logger.warning("Query cache store failed", exc_info=True)
+        return result
+
+
+class _InvalidatingCommandHandler:
+    __slots__ = ("_cache", "_handler", "_tags")
+
+    def __init__(
+        self,
+        cache: QueryResultCache,
+        tags: tuple[str, ...],
+        handler: Handler[Any, Any],
+    ) -> None:
+        self._cache = cache
+        self._tags = tags
+        self._handler = handler
+
+    async def handle(self, request: BaseModel) -> Any:
+        try:
+            return await self._handler.handle(request)
+        finally:
+            await self._cache.invalidate(self._tags)
@@ -4,34 +4,66 @@ from importlib import import_module
 
 from sackmesser.application.requests.core import (
     CapabilityDto,
+    GetBusMetricsQuery,
+    GetBusMetricsResult,
     GetCapabilitiesQuery,
     GetCapabilitiesResult,
     GetHealthQuery,
     GetHealthResult,
+    LatencyBucketDto,
+    RequestLatencyDto,
+    StatementTimingDto,
 )
 
 __all__ = [
     "CapabilityDto",
+    "GetBusMetricsQuery",
+    "GetBusMetricsResult",
     "GetCapabilitiesQuery",
     "GetCapabilitiesResult",
     "GetHealthQuery",
     "GetHealthResult",
+    "LatencyBucketDto",
+    "RequestLatencyDto",
+    "StatementTimingDto",
 ]
 
 _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
     "sackmesser.application.requests.workflows": (
         "CreateWorkflowCommand",
         "CreateWorkflowResult",
+        "CreateWorkflowsBatchCommand",
+        "CreateWorkflowsBatchResult",
+        "ExportWorkflowsQuery",
+        "ExportWorkflowsResult",
+        "GetWorkflowQuery",
+        "GetWorkflowResult",
+        "GetWorkflowsQuery",
+        "GetWorkflowsResult",
+        "ListWorkflowsJsonQuery",
+        "ListWorkflowsJsonResult",
         "ListWorkflowsQuery",
         "ListWorkflowsResult",
+        "SearchWorkflowsQuery",
+        "UpdateWorkflowPayloadCommand",
+        "UpdateWorkflowPayloadResult",
         "WorkflowDto",
+        "WorkflowPayloadSetOperation",
     ),
     "sackmesser.application.requests.cache": (
         "CacheEntryDto",
+        "DeleteCacheEntriesCommand",
+        "DeleteCacheEntriesResult",
         "DeleteCacheEntryCommand",
         "DeleteCacheEntryResult",
+        "GetCacheEntriesQuery",
+        "GetCacheEntriesResult",
         "GetCacheEntryQuery",
         "GetCacheEntryResult",
+        "GetCacheStatsQuery",
+        "GetCacheStatsResult",
+        "SetCacheEntriesCommand",
+        "SetCacheEntriesResult",
         "SetCacheEntryCommand",
         "SetCacheEntryResult",
     ),
@@ -1,7 +1,11 @@
 """Cache request/response models."""
 
+from typing import Annotated
+
 from pydantic import BaseModel, ConfigDict, Field
 
+CacheKey = Annotated[str, Field(min_length=1, max_length=200)]
+
 
 class SetCacheEntryCommand(BaseModel):
     """Write cache value."""
@@ -29,6 +33,36 @@ class GetCacheEntryQuery(BaseModel):
     key: str = Field(min_length=1, max_length=200)
 
 
+class SetCacheEntriesCommand(BaseModel):
+    """Write many cache values in one round-trip."""
+
+    model_config = ConfigDict(frozen=True)
+
+    entries: list[SetCacheEntryCommand] = Field(min_length=1, max_length=1000)
+
+
+class DeleteCacheEntriesCommand(BaseModel):
+    """Delete many cache values in one round-trip."""
+
+    model_config = ConfigDict(frozen=True)
+
+    keys: list[CacheKey] = Field(min_length=1, max_length=1000)
+
+
+class GetCacheEntriesQuery(BaseModel):
+    """Fetch many cache values in one round-trip."""
+
+    model_config = ConfigDict(frozen=True)
+
+    keys: tuple[CacheKey, ...] = Field(min_length=1, max_length=1000)
+
+
+class GetCacheStatsQuery(BaseModel):
+    """Fetch counters of the in-process cache tier."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class CacheEntryDto(BaseModel):
     """Cache key/value projection for adapters."""
 
@@ -63,3 +97,47 @@ class GetCacheEntryResult(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     entry: CacheEntryDto
+
+
+class SetCacheEntriesResult(BaseModel):
+    """Result wrapper for batch cache set."""
+
+    model_config = ConfigDict(frozen=True)
+
+    success: bool
+    keys: list[str]
+
+
+class DeleteCacheEntriesResult(BaseModel):
+    """Result wrapper for batch cache delete."""
+
+    model_config = ConfigDict(frozen=True)
+
+    deleted: int
+    keys: list[str]
+
+
+class GetCacheEntriesResult(BaseModel):
+    """Result wrapper for batch cache get, in request key order."""
+
+    model_config = ConfigDict(frozen=True)
+
+    entries: list[CacheEntryDto]
+
+
+class GetCacheStatsResult(BaseModel):
+    """Counters of the in-process cache tier; all zero when it is disabled."""
+
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
@@ -21,6 +21,12 @@ class GetCapabilitiesQuery(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+class GetBusMetricsQuery(BaseModel):
+    """Request per-request-type latency metrics recorded by the buses."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class CapabilityDto(BaseModel):
     """Capability data for API/MCP outputs."""
 
@@ -47,3 +53,53 @@ class GetHealthResult(BaseModel):
 
     status: str
     payload: dict[str, Any]
+
+
+class LatencyBucketDto(BaseModel):
+    """Cumulative histogram bucket; `le` is the upper bound, `+Inf` for the last one."""
+
+    model_config = ConfigDict(frozen=True)
+
+    le: str
+    count: int
+
+
+class RequestLatencyDto(BaseModel):
+    """Latency summary for one request type."""
+
+    model_config = ConfigDict(frozen=True)
+
+    request_type: str
+    count: int
+    errors: int
+    total_seconds: float
+    mean_seconds: float
+    max_seconds: float
+    buckets: list[LatencyBucketDto]
+
+
+class StatementTimingDto(BaseModel):
+    """Timing and row count summary for one named database statement."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    calls: int
+    errors: int
+    rows: int
+    total_seconds: float
+    mean_seconds: float
+    max_seconds: float
+
+
+class GetBusMetricsResult(BaseModel):
+    """Result for bus metrics endpoint/tool; empty when histograms are disabled.
+
+    `statements` carries database statement timings when a module records them.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool
+    requests: list[RequestLatencyDto]
+    statements: list[StatementTimingDto] = Field(default_factory=list)
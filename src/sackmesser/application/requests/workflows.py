@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+WorkflowId = Annotated[str, Field(min_length=1, max_length=64)]
+
 
 class CreateWorkflowCommand(BaseModel):
     """Create a workflow aggregate."""
@@ -17,13 +19,92 @@ class CreateWorkflowCommand(BaseModel):
     payload: dict[str, Any] = Field(default_factory=dict)
 
 
+class CreateWorkflowsBatchCommand(BaseModel):
+    """Create many workflow aggregates in a single write."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workflows: list[CreateWorkflowCommand] = Field(min_length=1, max_length=1000)
+
+
 class ListWorkflowsQuery(BaseModel):
-    """List workflow aggregates."""
+    """List workflow aggregates.
+
+    `created_from` (inclusive) and `created_to` (exclusive) bound the listing
+    in time; with a partitioned table only the overlapping partitions are read.
+    `include_total` counts the whole table, so it cannot be combined with them.
+    """
 
     model_config = ConfigDict(frozen=True)
 
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: str | None = Field(default=None, min_length=1, max_length=512)
+    include_total: bool = False
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+class SearchWorkflowsQuery(BaseModel):
+    """Find workflow aggregates by title substring and payload containment."""
+
+    model_config = ConfigDict(frozen=True)
+
+    title: str | None = Field(default=None, min_length=1, max_length=200)
+    payload_contains: dict[str, Any] | None = None
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = Field(default=None, min_length=1, max_length=512)
+
+
+class GetWorkflowQuery(BaseModel):
+    """Fetch one workflow aggregate by id."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: WorkflowId
+
+
+class GetWorkflowsQuery(BaseModel):
+    """Fetch many workflow aggregates by id in one read."""
+
+    model_config = ConfigDict(frozen=True)
+
+    ids: tuple[WorkflowId, ...] = Field(min_length=1, max_length=1000)
+
+
+class WorkflowPayloadSetOperation(BaseModel):
+    """Put `value` at `path` inside the payload; only the last key is created."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: tuple[Annotated[str, Field(min_length=1, max_length=200)], ...] = Field(
+        min_length=1, max_length=32
+    )
+    value: Any = None
+
+
+class UpdateWorkflowPayloadCommand(BaseModel):
+    """Patch a stored workflow payload in place.
+
+    `merge` is an RFC 7396 JSON Merge Patch (nested objects merge, null removes
+    a key); `sets` then put values at explicit paths, in order. At least one of
+    them must be given.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: WorkflowId
+    merge: dict[str, Any] | None = None
+    sets: tuple[WorkflowPayloadSetOperation, ...] = Field(default=(), max_length=32)
+
+
+class ExportWorkflowsQuery(BaseModel):
+    """Read one chunk of a full workflow export, newest first."""
+
+    model_config = ConfigDict(frozen=True)
+
+    limit: int = Field(default=500, ge=1, le=1000)
+    cursor: str | None = Field(default=None, min_length=1, max_length=512)
 
 
 class WorkflowDto(BaseModel):
@@ -45,9 +126,79 @@ class CreateWorkflowResult(BaseModel):
     workflow: WorkflowDto
 
 
+class CreateWorkflowsBatchResult(BaseModel):
+    """Result wrapper for batch workflow creation."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workflows: list[WorkflowDto]
+
+
+class UpdateWorkflowPayloadResult(BaseModel):
+    """Result wrapper for a payload update, holding the workflow as stored."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workflow: WorkflowDto
+
+
+class GetWorkflowResult(BaseModel):
+    """Result wrapper for a workflow lookup."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workflow: WorkflowDto
+
+
+class GetWorkflowsResult(BaseModel):
+    """Workflows found, in the order first requested, plus the ids that were not."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workflows: list[WorkflowDto]
+    missing: list[str] = Field(default_factory=list)
+
+
 class ListWorkflowsResult(BaseModel):
-    """Result wrapper for workflow listing."""
+    """Result wrapper for workflow listing.
+
+    `total` is only filled for listings with `include_total`; on large tables
+    it is the planner's row estimate and `total_estimated` is True.
+    """
 
     model_config = ConfigDict(frozen=True)
 
     workflows: list[WorkflowDto]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_estimated: bool = False
+
+
+class ListWorkflowsJsonQuery(ListWorkflowsQuery):
+    """List workflow aggregates, rendered straight to a JSON document."""
+
+
+class ListWorkflowsJsonResult(BaseModel):
+    """Pre-encoded workflow listing.
+
+    `content` is a JSON document with the same shape as `ListWorkflowsResult`;
+    stored payloads are spliced into it without being parsed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    content: str
+
+
+class ExportWorkflowsResult(BaseModel):
+    """One export chunk.
+
+    `ndjson` holds one JSON workflow object per line, each terminated by a
+    newline; `next_cursor` continues the export and is None on the last chunk.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ndjson: str
+    count: int
+    next_cursor: str | None = None
@@ -0,0 +1,37 @@
+"""Caller session identity for the request being handled."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Protocol
+
+
+class SessionPins(Protocol):
+    """Tracks sessions that must read their own recent writes."""
+
+    def pinned_session(self) -> str | None:
+        """Return the current session's key while it is pinned, None otherwise.
+
+        Work shared between sessions (coalesced calls, cached results) may have
+        been read from a lagging replica, so a pinned session must not join it.
+        """
+
+
+_session_id: ContextVar[str | None] = ContextVar("sackmesser_session_id", default=None)
+
+
+def current_session_id() -> str | None:
+    """Return the session of the current request, or None when the caller sent none."""
+    return _session_id.get()
+
+
+@contextmanager
+def session_scope(session_id: str | None) -> Iterator[None]:
+    """Attribute work done inside the block to `session_id`."""
+    token = _session_id.set(session_id or None)
+    try:
+        yield
+    finally:
+        _session_id.reset(token)
@@ -3,10 +3,15 @@
 from importlib import import_module
 
 from sackmesser.application.use_cases.base import BaseUseCase, UseCase
-from sackmesser.application.use_cases.core import GetCapabilitiesUseCase, GetHealthUseCase
+from sackmesser.application.use_cases.core import (
+    GetBusMetricsUseCase,
+    GetCapabilitiesUseCase,
+    GetHealthUseCase,
+)
 
 __all__ = [
     "BaseUseCase",
+    "GetBusMetricsUseCase",
     "GetCapabilitiesUseCase",
     "GetHealthUseCase",
     "UseCase",
@@ -15,11 +20,22 @@ __all__ = [
 _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
     "sackmesser.application.use_cases.workflows": (
         "CreateWorkflowUseCase",
+        "CreateWorkflowsBatchUseCase",
+        "ExportWorkflowsUseCase",
+        "GetWorkflowUseCase",
+        "GetWorkflowsUseCase",
+        "ListWorkflowsJsonUseCase",
         "ListWorkflowsUseCase",
+        "SearchWorkflowsUseCase",
+        "UpdateWorkflowPayloadUseCase",
     ),
     "sackmesser.application.use_cases.cache": (
+        "DeleteCacheEntriesUseCase",
         "DeleteCacheEntryUseCase",
+        "GetCacheEntriesUseCase",
         "GetCacheEntryUseCase",
+        "GetCacheStatsUseCase",
+        "SetCacheEntriesUseCase",
         "SetCacheEntryUseCase",
     ),
 }
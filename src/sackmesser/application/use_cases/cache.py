@@ -2,15 +2,24 @@
 
 from sackmesser.application.requests.cache import (
     CacheEntryDto,
+    DeleteCacheEntriesCommand,
+    DeleteCacheEntriesResult,
     DeleteCacheEntryCommand,
     DeleteCacheEntryResult,
+    GetCacheEntriesQuery,
+    GetCacheEntriesResult,
     GetCacheEntryQuery,
     GetCacheEntryResult,
+    GetCacheStatsQuery,
+    GetCacheStatsResult,
+    SetCacheEntriesCommand,
+    SetCacheEntriesResult,
     SetCacheEntryCommand,
     SetCacheEntryResult,
 )
 from sackmesser.application.use_cases.base import BaseUseCase
-from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.domain.cache.entities import CacheEntry, CacheStats
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort, CacheStatsPort
 
 
 class SetCacheEntryUseCase(BaseUseCase[SetCacheEntryCommand, SetCacheEntryResult]):
@@ -32,13 +41,7 @@ class GetCacheEntryUseCase(BaseUseCase[GetCacheEntryQuery, GetCacheEntryResult])
 
     async def execute(self, query: GetCacheEntryQuery) -> GetCacheEntryResult:
         cache_entry = await self._repository.get(query.key)
-        return GetCacheEntryResult(
-            entry=CacheEntryDto(
-                key=cache_entry.key,
-                value=cache_entry.value,
-                found=cache_entry.value is not None,
-            )
-        )
+        return GetCacheEntryResult(entry=_to_dto(cache_entry))
 
 
 class DeleteCacheEntryUseCase(BaseUseCase[DeleteCacheEntryCommand, DeleteCacheEntryResult]):
@@ -50,3 +53,73 @@ class DeleteCacheEntryUseCase(BaseUseCase[DeleteCacheEntryCommand, DeleteCacheEn
     async def execute(self, command: DeleteCacheEntryCommand) -> DeleteCacheEntryResult:
         success = await self._repository.delete(command.key)
         return DeleteCacheEntryResult(success=success, key=command.key)
+
+
+class SetCacheEntriesUseCase(BaseUseCase[SetCacheEntriesCommand, SetCacheEntriesResult]):
+    """Write many values into cache storage at once."""
+
+    def __init__(self, repository: CacheRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, command: SetCacheEntriesCommand) -> SetCacheEntriesResult:
+        success = await self._repository.set_many(
+            [(entry.key, entry.value, entry.ttl_seconds) for entry in command.entries]
+        )
+        return SetCacheEntriesResult(
+            success=success,
+            keys=[entry.key for entry in command.entries],
+        )
+
+
+class GetCacheEntriesUseCase(BaseUseCase[GetCacheEntriesQuery, GetCacheEntriesResult]):
+    """Fetch many values from cache storage at once."""
+
+    def __init__(self, repository: CacheRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, query: GetCacheEntriesQuery) -> GetCacheEntriesResult:
+        cache_entries = await self._repository.get_many(query.keys)
+        return GetCacheEntriesResult(entries=[_to_dto(entry) for entry in cache_entries])
+
+
+class DeleteCacheEntriesUseCase(BaseUseCase[DeleteCacheEntriesCommand, DeleteCacheEntriesResult]):
+    """Delete many values from cache storage at once."""
+
+    def __init__(self, repository: CacheRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, command: DeleteCacheEntriesCommand) -> DeleteCacheEntriesResult:
+        deleted = await self._repository.delete_many(command.keys)
+        return DeleteCacheEntriesResult(deleted=deleted, keys=list(command.keys))
+
+
+class GetCacheStatsUseCase(BaseUseCase[GetCacheStatsQuery, GetCacheStatsResult]):
+    """Report counters of the in-process cache tier."""
+
+    def __init__(self, stats_port: CacheStatsPort | None) -> None:
+        self._stats_port = stats_port
+
+    async def execute(self, query: GetCacheStatsQuery) -> GetCacheStatsResult:
+        stats = CacheStats(enabled=False) if self._stats_port is None else self._stats_port.stats()
+        lookups = stats.hits + stats.misses
+        return GetCacheStatsResult(
+            enabled=stats.enabled,
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_ratio=stats.hits / lookups if lookups else 0.0,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            invalidations=stats.invalidations,
+            entries=stats.entries,
+            bytes=stats.bytes,
+            max_entries=stats.max_entries,
+            max_bytes=stats.max_bytes,
+        )
+
+
+def _to_dto(cache_entry: CacheEntry) -> CacheEntryDto:
+    return CacheEntryDto(
+        key=cache_entry.key,
+        value=cache_entry.value,
+        found=cache_entry.value is not None,
+    )
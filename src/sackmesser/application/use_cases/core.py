@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+from sackmesser.application.middleware import LatencyHistogramMiddleware
 from sackmesser.application.requests.core import (
     CapabilityDto,
+    GetBusMetricsQuery,
+    GetBusMetricsResult,
     GetCapabilitiesQuery,
     GetCapabilitiesResult,
     GetHealthQuery,
     GetHealthResult,
+    LatencyBucketDto,
+    RequestLatencyDto,
+    StatementTimingDto,
 )
 from sackmesser.application.use_cases.base import BaseUseCase
-from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort
+from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort, StatementMetricsPort
 
 
 class GetCapabilitiesUseCase(BaseUseCase[GetCapabilitiesQuery, GetCapabilitiesResult]):
@@ -43,3 +49,63 @@ class GetHealthUseCase(BaseUseCase[GetHealthQuery, GetHealthResult]):
     async def execute(self, _: GetHealthQuery) -> GetHealthResult:
         snapshot = await self._health_port.get_health()
         return GetHealthResult(status=snapshot.status, payload=snapshot.payload)
+
+
+class GetBusMetricsUseCase(BaseUseCase[GetBusMetricsQuery, GetBusMetricsResult]):
+    """Summarize latency histograms recorded by the bus middleware.
+
+    Database statement timings are appended when a `statements` port is wired.
+    """
+
+    def __init__(
+        self,
+        latency: LatencyHistogramMiddleware | None,
+        *,
+        statements: StatementMetricsPort | None = None,
+    ) -> None:
+        self._latency = latency
+        self._statements = statements
+
+    async def execute(self, _: GetBusMetricsQuery) -> GetBusMetricsResult:
+        statements = await self._statement_timings()
+        if self._latency is None:
+            return GetBusMetricsResult(enabled=False, requests=[], statements=statements)
+        return GetBusMetricsResult(
+            enabled=True,
+            requests=[
+                RequestLatencyDto(
+                    request_type=name,
+                    count=histogram.count,
+                    errors=histogram.errors,
+                    total_seconds=histogram.total_seconds,
+                    mean_seconds=histogram.total_seconds / histogram.count
+                    if histogram.count
+                    else 0.0,
+                    max_seconds=histogram.max_seconds,
+                    buckets=[
+                        LatencyBucketDto(
+                            le="+Inf" if bound == float("inf") else f"{bound:g}", count=count
+                        )
+                        for bound, count in histogram.cumulative_buckets()
+                    ],
+                )
+                for name, histogram in sorted(self._latency.histograms().items())
+            ],
+            statements=statements,
+        )
+
+    async def _statement_timings(self) -> list[StatementTimingDto]:
+        if self._statements is None:
+            return []
+        return [
+            StatementTimingDto(
+                name=timing.name,
+                calls=timing.calls,
+                errors=timing.errors,
+                rows=timing.rows,
+                total_seconds=timing.total_seconds,
+                mean_seconds=timing.total_seconds / timing.calls if timing.calls else 0.0,
+                max_seconds=timing.max_seconds,
+            )
+            for timing in await self._statements.list_statement_timings()
+        ]
@@ -2,15 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import json
+from collections.abc import Awaitable
+from datetime import UTC, datetime
+from typing import TypeVar
+
+import pydantic_core
+
+from sackmesser.application.errors import NotFoundError, ValidationError
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
     CreateWorkflowResult,
+    CreateWorkflowsBatchCommand,
+    CreateWorkflowsBatchResult,
+    ExportWorkflowsQuery,
+    ExportWorkflowsResult,
+    GetWorkflowQuery,
+    GetWorkflowResult,
+    GetWorkflowsQuery,
+    GetWorkflowsResult,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsJsonResult,
     ListWorkflowsQuery,
     ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    UpdateWorkflowPayloadResult,
     WorkflowDto,
 )
 from sackmesser.application.use_cases.base import BaseUseCase
-from sackmesser.domain.ports.workflow_ports import WorkflowRepositoryPort
+from sackmesser.domain.ports.workflow_ports import (
+    EncodedWorkflowReadPort,
+    WorkflowCountPort,
+    WorkflowIdPort,
+    WorkflowLookupPort,
+    WorkflowPayloadUpdatePort,
+    WorkflowRepositoryPort,
+    WorkflowSearchPort,
+)
+from sackmesser.domain.workflows.entities import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCount,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
+)
+
+EXACT_COUNT_BELOW = 10_000
+
+_T = TypeVar("_T")
 
 
 class CreateWorkflowUseCase(BaseUseCase[CreateWorkflowCommand, CreateWorkflowResult]):
@@ -21,32 +65,361 @@ class CreateWorkflowUseCase(BaseUseCase[CreateWorkflowCommand, CreateWorkflowRes
 
     async def execute(self, command: CreateWorkflowCommand) -> CreateWorkflowResult:
         workflow = await self._repository.create(command.title, command.payload)
-        return CreateWorkflowResult(
-            workflow=WorkflowDto(
-                id=workflow.id,
-                title=workflow.title,
-                payload=workflow.payload,
-                created_at=workflow.created_at,
+        return CreateWorkflowResult(workflow=_to_dto(workflow))
+
+
+class CreateWorkflowsBatchUseCase(
+    BaseUseCase[CreateWorkflowsBatchCommand, CreateWorkflowsBatchResult]
+):
+    """Create many workflow aggregates with one repository write."""
+
+    def __init__(self, repository: WorkflowRepositoryPort) -> None:
+        self._repository = repository
+
+    async def execute(self, command: CreateWorkflowsBatchCommand) -> CreateWorkflowsBatchResult:
+        workflows = await self._repository.create_many(
+            [(item.title, item.payload) for item in command.workflows]
+        )
+        return CreateWorkflowsBatchResult(workflows=[_to_dto(item) for item in workflows])
+
+
+class UpdateWorkflowPayloadUseCase(
+    BaseUseCase[UpdateWorkflowPayloadCommand, UpdateWorkflowPayloadResult]
+):
+    """Patch a workflow payload in storage without reading it first."""
+
+    def __init__(self, repository: WorkflowPayloadUpdatePort) -> None:
+        self._repository = repository
+
+    async def execute(self, command: UpdateWorkflowPayloadCommand) -> UpdateWorkflowPayloadResult:
+        if command.merge is None and not command.sets:
+            raise ValidationError(
+                "merge or sets is required",
+                code="empty_payload_update",
+                details={"id": command.id},
+            )
+        workflow = await self._repository.update_payload(
+            command.id,
+            merge=command.merge,
+            sets=[WorkflowPayloadSet(path=item.path, value=item.value) for item in command.sets],
+        )
+        if workflow is None:
+            raise NotFoundError(
+                f"Workflow '{command.id}' was not found",
+                code="workflow_not_found",
+                details={"id": command.id},
+            )
+        return UpdateWorkflowPayloadResult(workflow=_to_dto(workflow))
+
+
+class GetWorkflowUseCase(BaseUseCase[GetWorkflowQuery, GetWorkflowResult]):
+    """Fetch one workflow aggregate by id."""
+
+    def __init__(self, lookup: WorkflowLookupPort) -> None:
+        self._lookup = lookup
+
+    async def execute(self, query: GetWorkflowQuery) -> GetWorkflowResult:
+        workflow = await self._lookup.get(query.id)
+        if workflow is None:
+            raise NotFoundError(
+                f"Workflow '{query.id}' was not found",
+                code="workflow_not_found",
+                details={"id": query.id},
             )
+        return GetWorkflowResult(workflow=_to_dto(workflow))
+
+
+class GetWorkflowsUseCase(BaseUseCase[GetWorkflowsQuery, GetWorkflowsResult]):
+    """Fetch many workflow aggregates with one lookup; duplicate ids are read once.
+
+    Ids are matched in the lookup's canonical spelling, so differently spelled
+    ids of one workflow return it once and are never reported missing.
+    """
+
+    def __init__(self, lookup: WorkflowLookupPort) -> None:
+        self._lookup = lookup
+
+    async def execute(self, query: GetWorkflowsQuery) -> GetWorkflowsResult:
+        canonical = {
+            workflow_id: self._lookup.canonical_id(workflow_id)
+            for workflow_id in dict.fromkeys(query.ids)
+        }
+        found = {workflow.id: workflow for workflow in await self._lookup.get_many(list(canonical))}
+        return GetWorkflowsResult(
+            workflows=[
+                _to_dto(found[key])
+                for key in dict.fromkeys(canonical.values())
+                if key is not None and key in found
+            ],
+            missing=[workflow_id for workflow_id, key in canonical.items() if key not in found],
         )
 
 
 class ListWorkflowsUseCase(BaseUseCase[ListWorkflowsQuery, ListWorkflowsResult]):
-    """List workflow aggregates."""
+    """List workflow aggregates.
 
-    def __init__(self, repository: WorkflowRepositoryPort) -> None:
+    Offset paging is kept for compatibility; passing the `next_cursor` of a
+    previous page switches to keyset paging, whose cost does not grow with depth.
+    With `include_total` the page is read concurrently with a count from
+    `counter`, which is exact only below `exact_count_below` rows. With `ids`,
+    cursors holding an id the store cannot have are rejected as invalid.
+    """
+
+    def __init__(
+        self,
+        repository: WorkflowRepositoryPort,
+        *,
+        counter: WorkflowCountPort | None = None,
+        ids: WorkflowIdPort | None = None,
+        exact_count_below: int = EXACT_COUNT_BELOW,
+    ) -> None:
         self._repository = repository
+        self._counter = counter
+        self._ids = ids
+        self._exact_count_below = exact_count_below
 
     async def execute(self, query: ListWorkflowsQuery) -> ListWorkflowsResult:
-        workflows = await self._repository.list(limit=query.limit, offset=query.offset)
+        cursor = _page_cursor(query, self._ids)
+        counter = _total_counter(self._counter, query)
+        time_range = _time_range(query)
+        if cursor is None:
+            page = self._repository.list(
+                limit=query.limit, offset=query.offset, time_range=time_range
+            )
+        else:
+            page = self._repository.list_after(
+                limit=query.limit, cursor=cursor, time_range=time_range
+            )
+        workflows, total = await _with_total(page, counter, self._exact_count_below)
+
+        next_cursor = None
+        if len(workflows) == query.limit:
+            next_cursor = encode_workflow_cursor(workflows[-1])
         return ListWorkflowsResult(
-            workflows=[
-                WorkflowDto(
-                    id=item.id,
-                    title=item.title,
-                    payload=item.payload,
-                    created_at=item.created_at,
-                )
-                for item in workflows
-            ]
+            workflows=[_to_dto(item) for item in workflows],
+            next_cursor=next_cursor,
+            total=None if total is None else total.value,
+            total_estimated=total is not None and not total.exact,
         )
+
+
+class ListWorkflowsJsonUseCase(BaseUseCase[ListWorkflowsJsonQuery, ListWorkflowsJsonResult]):
+    """List workflow aggregates straight into a JSON document.
+
+    Same paging rules as `ListWorkflowsUseCase`, but payloads stay the JSON
+    text returned by the store and are spliced into the output; only the
+    scalar fields are encoded here. For pages of large payloads this avoids
+    parsing every payload and serializing it again.
+    """
+
+    def __init__(
+        self,
+        repository: EncodedWorkflowReadPort,
+        *,
+        counter: WorkflowCountPort | None = None,
+        ids: WorkflowIdPort | None = None,
+        exact_count_below: int = EXACT_COUNT_BELOW,
+    ) -> None:
+        self._repository = repository
+        self._counter = counter
+        self._ids = ids
+        self._exact_count_below = exact_count_below
+
+    async def execute(self, query: ListWorkflowsJsonQuery) -> ListWorkflowsJsonResult:
+        cursor = _page_cursor(query, self._ids)
+        counter = _total_counter(self._counter, query)
+        time_range = _time_range(query)
+        if cursor is None:
+            page = self._repository.list_encoded(
+                limit=query.limit, offset=query.offset, time_range=time_range
+            )
+        else:
+            page = self._repository.list_encoded_after(
+                limit=query.limit, cursor=cursor, time_range=time_range
+            )
+        workflows, total = await _with_total(page, counter, self._exact_count_below)
+
+        next_cursor = None
+        if len(workflows) == query.limit:
+            next_cursor = encode_workflow_cursor(workflows[-1])
+        items = ",".join(_encode_workflow(item) for item in workflows)
+        total_value = None if total is None else total.value
+        total_estimated = total is not None and not total.exact
+        return ListWorkflowsJsonResult(
+            content=(
+                f'{{"workflows":[{items}],"next_cursor":{_encode(next_cursor)},'
+                f'"total":{_encode(total_value)},"total_estimated":{_encode(total_estimated)}}}'
+            )
+        )
+
+
+class SearchWorkflowsUseCase(BaseUseCase[SearchWorkflowsQuery, ListWorkflowsResult]):
+    """Search workflow aggregates, paged with the same cursor tokens as listings."""
+
+    def __init__(
+        self, repository: WorkflowSearchPort, *, ids: WorkflowIdPort | None = None
+    ) -> None:
+        self._repository = repository
+        self._ids = ids
+
+    async def execute(self, query: SearchWorkflowsQuery) -> ListWorkflowsResult:
+        cursor = None if query.cursor is None else decode_workflow_cursor(query.cursor, self._ids)
+        workflows = await self._repository.search(
+            title=query.title,
+            payload_contains=query.payload_contains,
+            limit=query.limit,
+            cursor=cursor,
+        )
+        next_cursor = None
+        if len(workflows) == query.limit:
+            next_cursor = encode_workflow_cursor(workflows[-1])
+        return ListWorkflowsResult(
+            workflows=[_to_dto(item) for item in workflows],
+            next_cursor=next_cursor,
+        )
+
+
+class ExportWorkflowsUseCase(BaseUseCase[ExportWorkflowsQuery, ExportWorkflowsResult]):
+    """Read a full export in keyset chunks, one NDJSON line per workflow.
+
+    Each chunk is a single bounded keyset read, so exporting the whole table
+    costs the same per chunk no matter how deep the export is, unlike paging
+    with OFFSET.
+    """
+
+    def __init__(
+        self, repository: EncodedWorkflowReadPort, *, ids: WorkflowIdPort | None = None
+    ) -> None:
+        self._repository = repository
+        self._ids = ids
+
+    async def execute(self, query: ExportWorkflowsQuery) -> ExportWorkflowsResult:
+        cursor = None if query.cursor is None else decode_workflow_cursor(query.cursor, self._ids)
+        workflows = await self._repository.list_encoded_after(limit=query.limit, cursor=cursor)
+        next_cursor = None
+        if len(workflows) == query.limit:
+            next_cursor = encode_workflow_cursor(workflows[-1])
+        return ExportWorkflowsResult(
+            ndjson="".join(f"{_encode_workflow(item)}\n" for item in workflows),
+            count=len(workflows),
+            next_cursor=next_cursor,
+        )
+
+
+def _time_range(query: ListWorkflowsQuery) -> WorkflowTimeRange | None:
+    if query.created_from is None and query.created_to is None:
+        return None
+    start = _as_utc(query.created_from)
+    end = _as_utc(query.created_to)
+    if start is not None and end is not None and start >= end:
+        raise ValidationError(
+            "created_from must be earlier than created_to",
+            code="invalid_time_range",
+            details={"created_from": start.isoformat(), "created_to": end.isoformat()},
+        )
+    return WorkflowTimeRange(start=start, end=end)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _total_counter(
+    counter: WorkflowCountPort | None, query: ListWorkflowsQuery
+) -> WorkflowCountPort | None:
+    if not query.include_total:
+        return None
+    if counter is None:
+        raise ValidationError(
+            "include_total is not supported by this workflow store",
+            code="unsupported_total",
+        )
+    if query.created_from is not None or query.created_to is not None:
+        raise ValidationError(
+            "include_total cannot be combined with created_from or created_to",
+            code="unsupported_total",
+            details={"include_total": True},
+        )
+    return counter
+
+
+async def _with_total(
+    page: Awaitable[_T],
+    counter: WorkflowCountPort | None,
+    exact_count_below: int,
+) -> tuple[_T, WorkflowCount | None]:
+    if counter is None:
+        return await page, None
+    return await asyncio.gather(page, counter.count(exact_below=exact_count_below))
+
+
+def _page_cursor(query: ListWorkflowsQuery, ids: WorkflowIdPort | None) -> WorkflowCursor | None:
+    if query.cursor is None:
+        return None
+    if query.offset:
+        raise ValidationError(
+            "cursor and offset cannot be combined",
+            code="invalid_cursor",
+            details={"offset": query.offset},
+        )
+    return decode_workflow_cursor(query.cursor, ids)
+
+
+def _encode(value: object) -> str:
+    return pydantic_core.to_json(value).decode("utf-8")
+
+
+def _encode_workflow(workflow: EncodedWorkflow) -> str:
+    return (
+        f'{{"id":{_encode(workflow.id)},"title":{_encode(workflow.title)},'
+        f'"payload":{workflow.payload_json},"created_at":{_encode(workflow.created_at)}}}'
+    )
+
+
+def _to_dto(workflow: Workflow) -> WorkflowDto:
+    return WorkflowDto(
+        id=workflow.id,
+        title=workflow.title,
+        payload=workflow.payload,
+        created_at=workflow.created_at,
+    )
+
+
+def encode_workflow_cursor(workflow: Workflow | EncodedWorkflow) -> str:
+    """Encode the keyset position of `workflow` as an opaque URL-safe token."""
+    raw = json.dumps(
+        {"created_at": workflow.created_at.isoformat(), "id": workflow.id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_workflow_cursor(token: str, ids: WorkflowIdPort | None = None) -> WorkflowCursor:
+    """Decode a token produced by `encode_workflow_cursor`.
+
+    With `ids`, the id is returned in the store's canonical spelling and one
+    the store cannot have makes the cursor invalid, like a malformed token.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor = WorkflowCursor(
+            created_at=datetime.fromisoformat(data["created_at"]),
+            id=str(data["id"]),
+        )
+        workflow_id = cursor.id if ids is None else ids.canonical_id(cursor.id)
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise _invalid_cursor(token) from exc
+    if workflow_id is None:
+        raise _invalid_cursor(token)
+    return WorkflowCursor(created_at=cursor.created_at, id=workflow_id)
+
+
+def _invalid_cursor(token: str) -> ValidationError:
+    return ValidationError(
+        "Invalid workflow cursor",
+        code="invalid_cursor",
+        details={"cursor": token},
+    )
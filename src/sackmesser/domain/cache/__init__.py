@@ -1,5 +1,5 @@
 """Cache domain models."""
 
-from sackmesser.domain.cache.entities import CacheEntry
+from sackmesser.domain.cache.entities import CacheEntry, CacheStats
 
-__all__ = ["CacheEntry"]
+__all__ = ["CacheEntry", "CacheStats"]
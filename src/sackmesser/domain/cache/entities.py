@@ -11,3 +11,19 @@ class CacheEntry:
 
     key: str
     value: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of the in-process cache tier, used to size it."""
+
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_entries: int = 0
+    max_bytes: int = 0
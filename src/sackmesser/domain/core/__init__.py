@@ -1,8 +1,9 @@
 """Core domain models."""
 
-from sackmesser.domain.core.models import Capability, HealthSnapshot
+from sackmesser.domain.core.models import Capability, HealthSnapshot, StatementTiming
 
 __all__ = [
     "Capability",
     "HealthSnapshot",
+    "StatementTiming",
 ]
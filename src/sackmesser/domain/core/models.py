@@ -22,3 +22,15 @@ class HealthSnapshot:
 
     status: str
     payload: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class StatementTiming:
+    """Cumulative timing and row counts of one named database statement."""
+
+    name: str
+    calls: int
+    errors: int
+    rows: int
+    total_seconds: float
+    max_seconds: float
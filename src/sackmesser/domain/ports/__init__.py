@@ -2,16 +2,25 @@
 
 from importlib import import_module
 
-from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort
+from sackmesser.domain.ports.core_ports import CapabilityPort, HealthPort, StatementMetricsPort
 
 __all__ = [
     "CapabilityPort",
     "HealthPort",
+    "StatementMetricsPort",
 ]
 
 _OPTIONAL_EXPORTS: dict[str, tuple[str, ...]] = {
-    "sackmesser.domain.ports.workflow_ports": ("WorkflowRepositoryPort",),
-    "sackmesser.domain.ports.cache_ports": ("CacheRepositoryPort",),
+    "sackmesser.domain.ports.workflow_ports": (
+        "EncodedWorkflowReadPort",
+        "WorkflowCountPort",
+        "WorkflowIdPort",
+        "WorkflowLookupPort",
+        "WorkflowPayloadUpdatePort",
+        "WorkflowRepositoryPort",
+        "WorkflowSearchPort",
+    ),
+    "sackmesser.domain.ports.cache_ports": ("CacheRepositoryPort", "CacheStatsPort"),
 }
 
 for module_name, export_names in _OPTIONAL_EXPORTS.items():
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Protocol
 
-from sackmesser.domain.cache.entities import CacheEntry
+from sackmesser.domain.cache.entities import CacheEntry, CacheStats
 
 
 class CacheRepositoryPort(Protocol):
@@ -18,3 +19,22 @@ class CacheRepositoryPort(Protocol):
 
     async def delete(self, key: str) -> bool:
         """Delete cache key."""
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        """Set `(key, value, ttl_seconds)` entries in as few round-trips as the backend allows."""
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        """Set only the entries whose key holds no value yet; return how many were set."""
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        """Fetch cache values for keys in as few round-trips as the backend allows, in key order."""
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete cache keys in as few round-trips as the backend allows; return how many existed."""
+
+
+class CacheStatsPort(Protocol):
+    """Reports counters of the in-process cache tier."""
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of hit/miss/eviction counters."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from sackmesser.domain.core.models import Capability, HealthSnapshot
+from sackmesser.domain.core.models import Capability, HealthSnapshot, StatementTiming
 
 
 class CapabilityPort(Protocol):
@@ -19,3 +19,10 @@ class HealthPort(Protocol):
 
     async def get_health(self) -> HealthSnapshot:
         """Return service health data."""
+
+
+class StatementMetricsPort(Protocol):
+    """Provides per-statement database timings."""
+
+    async def list_statement_timings(self) -> list[StatementTiming]:
+        """Return timings for every statement run so far."""
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+import builtins
+from collections.abc import Sequence
+from typing import Any, Protocol
 
-from sackmesser.domain.workflows.entities import Workflow
+from sackmesser.domain.workflows.entities import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCount,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
+)
 
 
 class WorkflowRepositoryPort(Protocol):
@@ -13,5 +22,96 @@ class WorkflowRepositoryPort(Protocol):
     async def create(self, title: str, payload: dict[str, object]) -> Workflow:
         """Persist a workflow and return stored entity."""
 
-    async def list(self, *, limit: int, offset: int) -> list[Workflow]:
-        """List workflows in reverse creation order."""
+    async def create_many(self, items: Sequence[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        """Persist `(title, payload)` pairs in one write, returning them in input order."""
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
+        """List workflows in reverse creation order, optionally within `time_range`."""
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> builtins.list[Workflow]:
+        """List workflows strictly after `cursor` in reverse creation order."""
+
+
+class WorkflowIdPort(Protocol):
+    """Id format contract of the workflow store."""
+
+    def canonical_id(self, workflow_id: str) -> str | None:
+        """Return `workflow_id` as found workflows spell it, or None when none can have it."""
+
+
+class WorkflowLookupPort(WorkflowIdPort, Protocol):
+    """Point lookup contract for workflows by id."""
+
+    async def get(self, workflow_id: str) -> Workflow | None:
+        """Return the workflow with `workflow_id`, or None when there is none."""
+
+    async def get_many(self, workflow_ids: Sequence[str]) -> list[Workflow]:
+        """Return the workflows found for `workflow_ids` in one read, in no particular order."""
+
+
+class WorkflowPayloadUpdatePort(Protocol):
+    """In-place workflow payload update contract."""
+
+    async def update_payload(
+        self,
+        workflow_id: str,
+        *,
+        merge: dict[str, Any] | None = None,
+        sets: Sequence[WorkflowPayloadSet] = (),
+    ) -> Workflow | None:
+        """Patch the stored payload in one write and return the updated workflow.
+
+        `merge` is applied first as an RFC 7396 JSON Merge Patch, then `sets`
+        in order. Returns None when there is no workflow with `workflow_id`.
+        """
+
+
+class EncodedWorkflowReadPort(Protocol):
+    """Listing contract returning payloads as stored JSON text, never parsed."""
+
+    async def list_encoded(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[EncodedWorkflow]:
+        """List workflows in reverse creation order with raw JSON payloads."""
+
+    async def list_encoded_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> list[EncodedWorkflow]:
+        """List workflows strictly after `cursor` with raw JSON payloads."""
+
+
+class WorkflowSearchPort(Protocol):
+    """Filtered workflow lookup contract."""
+
+    async def search(
+        self,
+        *,
+        title: str | None,
+        payload_contains: dict[str, Any] | None,
+        limit: int,
+        cursor: WorkflowCursor | None,
+    ) -> list[Workflow]:
+        """List matching workflows strictly after `cursor` in reverse creation order.
+
+        `title` matches as a case-insensitive substring and `payload_contains`
+        with JSONB containment; None disables a filter.
+        """
+
+
+class WorkflowCountPort(Protocol):
+    """Total workflow count contract."""
+
+    async def count(self, *, exact_below: int) -> WorkflowCount:
+        """Count workflows, exactly when the estimated total is below `exact_below`."""
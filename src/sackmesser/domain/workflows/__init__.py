@@ -1,5 +1,19 @@
 """Workflow domain models."""
 
-from sackmesser.domain.workflows.entities import Workflow
+from sackmesser.domain.workflows.entities import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCount,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
+)
 
-__all__ = ["Workflow"]
+__all__ = [
+    "EncodedWorkflow",
+    "Workflow",
+    "WorkflowCount",
+    "WorkflowCursor",
+    "WorkflowPayloadSet",
+    "WorkflowTimeRange",
+]
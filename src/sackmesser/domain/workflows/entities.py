@@ -15,3 +15,53 @@ class Workflow:
     title: str
     payload: dict[str, Any]
     created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowCursor:
+    """Keyset position in the `(created_at, id)` descending workflow order."""
+
+    created_at: datetime
+    id: str
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowTimeRange:
+    """Half-open `[start, end)` window on workflow `created_at`; None is unbounded."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowPayloadSet:
+    """Put `value` at `path` inside a workflow payload.
+
+    Only the last path element is created when missing; a path through absent
+    or non-container values leaves the payload unchanged.
+    """
+
+    path: tuple[str, ...]
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedWorkflow:
+    """Workflow read model whose payload is the JSON text read from storage.
+
+    Used by listing paths that splice `payload_json` into a response as-is
+    instead of parsing and re-serializing it.
+    """
+
+    id: str
+    title: str
+    payload_json: str
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowCount:
+    """Number of stored workflows; `exact` is False for planner estimates."""
+
+    value: int
+    exact: bool
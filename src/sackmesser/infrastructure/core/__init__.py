@@ -2,8 +2,10 @@
 
 from sackmesser.infrastructure.core.capability_provider import ManifestCapabilityProvider
 from sackmesser.infrastructure.core.health_provider import ResourceManagerHealthProvider
+from sackmesser.infrastructure.core.memory_cache_repository import MemoryCacheRepository
 
 __all__ = [
     "ManifestCapabilityProvider",
+    "MemoryCacheRepository",
     "ResourceManagerHealthProvider",
 ]
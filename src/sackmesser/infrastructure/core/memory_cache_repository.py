@@ -0,0 +1,80 @@
+"""Process-local cache repository with TTLs and LRU eviction."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from sackmesser.domain.cache.entities import CacheEntry
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+
+
+class MemoryCacheRepository(CacheRepositoryPort):
+    """Bounded in-memory implementation of the cache port.
+
+    Used as the query cache backend when Redis is not wanted; entries are not
+    shared between processes. Entries without a TTL use `default_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1_000,
+        default_ttl_seconds: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            msg = "max_entries must be positive"
+            raise ValueError(msg)
+        self._max_entries = max_entries
+        self._default_ttl_seconds = default_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        self._put(key, value, ttl_seconds)
+        return True
+
+    async def get(self, key: str) -> CacheEntry:
+        return CacheEntry(key=key, value=self._lookup(key))
+
+    async def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        for key, value, ttl_seconds in entries:
+            self._put(key, value, ttl_seconds)
+        return True
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        added = 0
+        for key, value, ttl_seconds in entries:
+            if self._lookup(key) is None:
+                self._put(key, value, ttl_seconds)
+                added += 1
+        return added
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        return [CacheEntry(key=key, value=self._lookup(key)) for key in keys]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        return sum(self._entries.pop(key, None) is not None for key in dict.fromkeys(keys))
+
+    def _put(self, key: str, value: str, ttl_seconds: int | None) -> None:
+        ttl = self._default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries.pop(key, None)
+        self._entries[key] = (value, self._clock() + ttl)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, key: str) -> str | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
@@ -0,0 +1,40 @@
+"""Time-ordered workflow identifiers."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_counter = 0
+
+
+def uuid7(*, clock: Callable[[], int] = time.time_ns) -> uuid.UUID:
+    """Return an RFC 9562 version 7 UUID.
+
+    The top 48 bits are the Unix time in milliseconds, so keys created close
+    together land next to each other in a B-tree. The 12-bit `rand_a` field
+    is a counter seeded randomly each millisecond, which keeps UUIDs from
+    one process strictly increasing; when it overflows the timestamp is
+    advanced by a millisecond instead.
+    """
+    global _last_ms, _last_counter
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    tail = random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    with _lock:
+        unix_ms = clock() // 1_000_000
+        if unix_ms > _last_ms:
+            counter = (random_bits >> 62) & 0x7FF
+        else:
+            unix_ms = _last_ms
+            counter = _last_counter + 1
+            if counter > 0xFFF:
+                unix_ms += 1
+                counter = 0
+        _last_ms, _last_counter = unix_ms, counter
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | tail
+    return uuid.UUID(int=value)
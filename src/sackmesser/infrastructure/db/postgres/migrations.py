@@ -0,0 +1,194 @@
+"""Versioned Postgres schema migrations applied under an advisory lock."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from orchid_commons import PostgresProvider
+
+MIGRATIONS_TABLE = "sackmesser_schema_migrations"
+
+# Fixed key shared by every process that migrates this database; only the
+# holder of the transaction-scoped lock runs DDL.
+_ADVISORY_LOCK_KEY = 0x5341434B4D494752
+
+_NAME_PATTERN = re.compile(r"^[a-z0-9_]+$")
+
+_VERSION_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """One schema change, identified by `version`.
+
+    `sql` must be safe to run again (`IF NOT EXISTS`, `CREATE OR REPLACE`,
+    guarded `DO` blocks): a process that loses the race for the lock runs it
+    a second time before seeing the version recorded.
+
+    With `transactional=False`, `sql` is a single statement that cannot run in
+    a transaction block, such as `CREATE INDEX CONCURRENTLY`. It is sent on
+    its own, outside the advisory lock, and recorded once it succeeds; when
+    `only_if`, a SQL boolean expression, is false at that point, it is
+    recorded without running.
+    """
+
+    version: int
+    name: str
+    sql: str
+    transactional: bool = True
+    only_if: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.version < 1 or not _NAME_PATTERN.match(self.name):
+            msg = "migration version must be positive and name lowercase snake_case"
+            raise ValueError(msg)
+        if self.transactional and self.only_if is not None:
+            msg = "only_if is only supported on non-transactional migrations"
+            raise ValueError(msg)
+
+    @property
+    def label(self) -> str:
+        return f"{self.version:04d}_{self.name}"
+
+
+@dataclass(frozen=True, slots=True)
+class MigrationSettings:
+    """Migration policy, read from `sackmesser.migrations` in appsettings.
+
+    By default startup only checks that every migration is recorded and fails
+    otherwise; `apply_on_startup` applies pending ones instead, which suits
+    single-process development setups.
+    """
+
+    apply_on_startup: bool = False
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> MigrationSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        return cls(
+            apply_on_startup=bool(raw.get("apply_on_startup", defaults.apply_on_startup)),
+        )
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """Raised at startup while migrations are still pending."""
+
+    def __init__(self, pending: Sequence[Migration]) -> None:
+        self.pending = tuple(pending)
+        labels = ", ".join(item.label for item in self.pending)
+        super().__init__(
+            f"Database schema is out of date, pending migrations: {labels}. "
+            "Run `sackmesser migrate` first."
+        )
+
+
+class PostgresMigrator:
+    """Apply `migrations` in version order and record them in a version table.
+
+    `pending` is two small reads and takes no locks beyond catalog access, so
+    it is cheap enough for every process start. `apply` sends consecutive
+    pending migrations in one transaction that first takes a
+    transaction-scoped advisory lock, so concurrent migrators run one after
+    the other and a failing migration leaves nothing of its transaction
+    recorded. Non-transactional migrations run between those transactions,
+    in version order.
+    """
+
+    def __init__(self, provider: PostgresProvider, migrations: Sequence[Migration]) -> None:
+        versions = [item.version for item in migrations]
+        if versions != sorted(set(versions)):
+            msg = "migration versions must be unique and ascending"
+            raise ValueError(msg)
+        self._provider = provider
+        self._migrations = tuple(migrations)
+
+    async def applied_versions(self) -> set[int]:
+        """Return the versions recorded in the version table."""
+        row = await self._provider.fetchone(
+            "SELECT to_regclass($1) IS NOT NULL AS present",
+            (MIGRATIONS_TABLE,),
+        )
+        if row is None or not row.get("present"):
+            return set()
+        rows = await self._provider.fetchall(f"SELECT version FROM {MIGRATIONS_TABLE}", ())
+        return {int(item["version"]) for item in rows}
+
+    async def pending(self) -> list[Migration]:
+        """Return the migrations not recorded yet, in version order."""
+        applied = await self.applied_versions()
+        return [item for item in self._migrations if item.version not in applied]
+
+    async def check(self) -> None:
+        """Raise `SchemaOutOfDateError` unless every migration is recorded."""
+        pending = await self.pending()
+        if pending:
+            raise SchemaOutOfDateError(pending)
+
+    async def apply(self) -> list[Migration]:
+        """Apply and record pending migrations, returning the ones sent."""
+        pending = await self.pending()
+        batch: list[Migration] = []
+        for migration in pending:
+            if migration.transactional:
+                batch.append(migration)
+                continue
+            await self._apply_locked(batch)
+            batch = []
+            await self._apply_alone(migration)
+        await self._apply_locked(batch)
+        return pending
+
+    async def _apply_locked(self, batch: Sequence[Migration]) -> None:
+        if batch:
+            await self._provider.executescript(_apply_script(batch))
+
+    async def _apply_alone(self, migration: Migration) -> None:
+        run = True
+        if migration.only_if is not None:
+            row = await self._provider.fetchone(f"SELECT ({migration.only_if}) AS run", ())
+            run = row is not None and bool(row.get("run"))
+        if run:
+            await self._provider.executescript(migration.sql)
+        await self._provider.executescript(
+            advisory_locked([_VERSION_TABLE_SQL, _record_sql(migration)])
+        )
+
+
+def advisory_locked(statements: Sequence[str]) -> str:
+    """Return `statements` as one transaction holding the schema advisory lock.
+
+    Every process changing the workflow schema takes the same lock, so
+    migrations and partition upkeep from concurrently starting processes run
+    one after the other instead of racing on the catalog.
+    """
+    return "\n".join(
+        ["BEGIN;", f"SELECT pg_advisory_xact_lock({_ADVISORY_LOCK_KEY});", *statements, "COMMIT;"]
+    )
+
+
+def _apply_script(pending: Sequence[Migration]) -> str:
+    parts = [_VERSION_TABLE_SQL]
+    for migration in pending:
+        parts.append(migration.sql)
+        parts.append(_record_sql(migration))
+    return advisory_locked(parts)
+
+
+def _record_sql(migration: Migration) -> str:
+    return (
+        f"INSERT INTO {MIGRATIONS_TABLE} (version, name) "
+        f"VALUES ({migration.version}, '{migration.name}') "
+        "ON CONFLICT (version) DO NOTHING;"
+    )
@@ -0,0 +1,218 @@
+"""Range partition upkeep for the `template_workflows` table."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
+
+from orchid_commons import PostgresProvider
+
+from sackmesser.infrastructure.db.postgres.migrations import advisory_locked
+
+logger = logging.getLogger(__name__)
+
+PartitionInterval = Literal["day", "month"]
+
+_TABLE = "template_workflows"
+_NAME_PATTERN = re.compile(rf"^{_TABLE}_p(\d{{4}})(\d{{2}})(\d{{2}})?$")
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowPartitioningSettings:
+    """Partitioning of the workflow table, read from `sackmesser.workflows.partitioning`.
+
+    `premake` future partitions are kept ahead of the current one. With
+    `retain` set, partitions whose whole range is older than the `retain`
+    intervals before the current one are dropped.
+    """
+
+    enabled: bool = False
+    interval: PartitionInterval = "month"
+    premake: int = 3
+    retain: int | None = None
+    maintenance_interval_seconds: float = 3600.0
+
+    def __post_init__(self) -> None:
+        if self.interval not in ("day", "month"):
+            msg = "partitioning interval must be 'day' or 'month'"
+            raise ValueError(msg)
+        if self.premake < 1 or self.maintenance_interval_seconds <= 0:
+            msg = "partitioning premake and maintenance_interval_seconds must be positive"
+            raise ValueError(msg)
+        if self.retain is not None and self.retain < 0:
+            msg = "partitioning retain must not be negative"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> WorkflowPartitioningSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        retain = raw.get("retain", defaults.retain)
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            interval=raw.get("interval", defaults.interval),
+            premake=int(raw.get("premake", defaults.premake)),
+            retain=None if retain is None else int(retain),
+            maintenance_interval_seconds=float(
+                raw.get("maintenance_interval_seconds", defaults.maintenance_interval_seconds)
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionMaintenance:
+    """Partitions created and dropped by one maintenance run."""
+
+    created: tuple[str, ...] = ()
+    dropped: tuple[str, ...] = ()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=UTC)
+
+
+def partition_start(moment: datetime, interval: PartitionInterval) -> datetime:
+    """Return the UTC start of the partition holding `moment`."""
+    moment = moment.astimezone(UTC)
+    if interval == "day":
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def shift_partition(start: datetime, interval: PartitionInterval, steps: int) -> datetime:
+    """Return the start of the partition `steps` intervals after `start`."""
+    if interval == "day":
+        return start + timedelta(days=steps)
+    months = start.year * 12 + start.month - 1 + steps
+    return start.replace(year=months // 12, month=months % 12 + 1)
+
+
+def partition_name(start: datetime, interval: PartitionInterval) -> str:
+    """Return the table name of the partition starting at `start`."""
+    suffix = f"{start:%Y%m%d}" if interval == "day" else f"{start:%Y%m}"
+    return f"{_TABLE}_p{suffix}"
+
+
+def parse_partition_name(name: str, interval: PartitionInterval) -> datetime | None:
+    """Return the start encoded in a partition name, or None for foreign tables."""
+    match = _NAME_PATTERN.match(name)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    if (day is None) != (interval == "month"):
+        return None
+    return datetime(int(year), int(month), int(day or 1), tzinfo=UTC)
+
+
+class WorkflowPartitionMaintainer:
+    """Keep future partitions ahead of inserts and drop expired ones.
+
+    DDL runs under the schema advisory lock, so processes starting together
+    at a partition boundary do not race on `CREATE TABLE ... PARTITION OF`.
+    `start` runs one best-effort pass and then repeats it in the background;
+    a failed pass is logged, since `sackmesser migrate` runs the
+    authoritative one. Nothing is done while `template_workflows` is not a
+    partitioned table, for example when partitioning is enabled on an
+    existing plain table.
+    """
+
+    def __init__(
+        self,
+        provider: PostgresProvider,
+        settings: WorkflowPartitioningSettings,
+        *,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self._provider = provider
+        self._settings = settings
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+
+    async def maintain(self) -> PartitionMaintenance:
+        """Create missing upcoming partitions and drop those past retention."""
+        row = await self._provider.fetchone(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass($1)",
+            (_TABLE,),
+        )
+        if row is None or row.get("relkind") != "p":
+            logger.warning("%s is not a partitioned table; skipping partition upkeep", _TABLE)
+            return PartitionMaintenance()
+
+        rows = await self._provider.fetchall(
+            """
+            SELECT child.relname AS name
+            FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass($1)
+            """,
+            (_TABLE,),
+        )
+        existing = {str(item["name"]) for item in rows}
+        interval = self._settings.interval
+        current = partition_start(self._clock(), interval)
+
+        statements: list[str] = []
+        created: list[str] = []
+        for step in range(self._settings.premake + 1):
+            start = shift_partition(current, interval, step)
+            name = partition_name(start, interval)
+            if name in existing:
+                continue
+            end = shift_partition(start, interval, 1)
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}');"
+            )
+            created.append(name)
+
+        dropped: list[str] = []
+        if self._settings.retain is not None:
+            oldest_kept = shift_partition(current, interval, -self._settings.retain)
+            for name in sorted(existing):
+                partition = parse_partition_name(name, interval)
+                if partition is not None and partition < oldest_kept:
+                    statements.append(f"DROP TABLE IF EXISTS {name};")
+                    dropped.append(name)
+
+        if statements:
+            await self._provider.executescript(advisory_locked(statements))
+            logger.info(
+                "Workflow partitions: created %s, dropped %s",
+                created or "none",
+                dropped or "none",
+            )
+        return PartitionMaintenance(created=tuple(created), dropped=tuple(dropped))
+
+    async def start(self) -> None:
+        """Run one pass now, then keep maintaining in the background."""
+        if self._task is not None:
+            return
+        try:
+            await self.maintain()
+        except Exception:
+            logger.warning("Workflow partition maintenance failed at startup", exc_info=True)
+        self._task = asyncio.create_task(self._run(), name=f"{_TABLE}-partitions")
+
+    async def close(self) -> None:
+        """Stop background maintenance."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.maintenance_interval_seconds)
+            try:
+                await self.maintain()
+            except Exception:
+                logger.warning("Workflow partition maintenance failed", exc_info=True)
@@ -0,0 +1,143 @@
+"""Read-replica routing with read-your-writes stickiness."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from orchid_commons import PostgresProvider, PostgresSettings
+
+from sackmesser.application.session import current_session_id
+
+_MAX_TRACKED_SESSIONS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresReplicaSettings:
+    """Read replicas, read from `resources.postgres.read_replicas` in appsettings.
+
+    Replica pools reuse the primary's pool settings with their own DSN. After a
+    session writes, its reads stay on the primary for `sticky_seconds`, which
+    should exceed the replication lag the deployment tolerates.
+    """
+
+    dsns: tuple[str, ...] = ()
+    sticky_seconds: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.sticky_seconds < 0:
+            msg = "read_replicas sticky_seconds must not be negative"
+            raise ValueError(msg)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.dsns)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> PostgresReplicaSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        return cls(
+            dsns=tuple(str(dsn) for dsn in raw.get("dsns") or () if dsn),
+            sticky_seconds=float(raw.get("sticky_seconds", defaults.sticky_seconds)),
+        )
+
+
+async def open_replica_providers(
+    primary_options: Mapping[str, Any],
+    settings: PostgresReplicaSettings,
+) -> list[PostgresProvider]:
+    """Open one pool per replica DSN with the primary's raw pool options.
+
+    Pools are opened concurrently. If any fails, the ones that did open are
+    closed again and the first error is re-raised.
+    """
+    pool_options = {key: value for key, value in primary_options.items() if key != "read_replicas"}
+    results = await asyncio.gather(
+        *(
+            PostgresProvider.create(PostgresSettings(**{**pool_options, "dsn": dsn}))
+            for dsn in settings.dsns
+        ),
+        return_exceptions=True,
+    )
+    providers = [item for item in results if not isinstance(item, BaseException)]
+    failure = next((item for item in results if isinstance(item, BaseException)), None)
+    if failure is not None:
+        for provider in providers:
+            with contextlib.suppress(Exception):
+                await provider.close()
+        raise failure
+    return providers
+
+
+class PostgresReplicaRouter:
+    """Pick the provider for reads: a replica, or the primary after a recent write.
+
+    Sessions come from `current_session_id()`; callers without one share a
+    single anonymous session, so their writes pin every anonymous read to the
+    primary for the sticky window. Replicas are used round-robin.
+    """
+
+    def __init__(
+        self,
+        primary: PostgresProvider,
+        replicas: Sequence[PostgresProvider],
+        *,
+        sticky_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._primary = primary
+        self._replicas = tuple(replicas)
+        self._sticky_seconds = sticky_seconds
+        self._clock = clock
+        self._next_replica = itertools.cycle(self._replicas)
+        self._pinned_until: dict[str, float] = {}
+        self._written_until = 0.0
+
+    def reader(self) -> PostgresProvider:
+        """Return the provider the current session should read from."""
+        if not self._replicas:
+            return self._primary
+        if self.pinned_session() is not None:
+            return self._primary
+        return next(self._next_replica)
+
+    def pinned_session(self) -> str | None:
+        """Return the current session's key while its reads stay on the primary."""
+        if not self._replicas:
+            return None
+        key = _session_key()
+        pinned_until = self._pinned_until.get(key)
+        if pinned_until is None:
+            return None
+        if pinned_until <= self._clock():
+            self._pinned_until.pop(key, None)
+            return None
+        return key
+
+    def recently_written(self) -> bool:
+        """Return True while any session's last write may not have reached the replicas."""
+        return bool(self._replicas) and self._written_until > self._clock()
+
+    def wrote(self) -> None:
+        """Keep the current session's reads on the primary for the sticky window."""
+        if not self._replicas or self._sticky_seconds <= 0:
+            return
+        now = self._clock()
+        if len(self._pinned_until) >= _MAX_TRACKED_SESSIONS:
+            self._pinned_until = {
+                key: until for key, until in self._pinned_until.items() if until > now
+            }
+        self._pinned_until[_session_key()] = now + self._sticky_seconds
+        self._written_until = now + self._sticky_seconds
+
+
+def _session_key() -> str:
+    return current_session_id() or ""
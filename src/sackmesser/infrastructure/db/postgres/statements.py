@@ -0,0 +1,126 @@
+"""Named Postgres statements with per-statement timing and row counts."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from orchid_commons import PostgresProvider
+
+from sackmesser.domain.core.models import StatementTiming
+from sackmesser.domain.ports.core_ports import StatementMetricsPort
+
+
+class StatementStats:
+    """Running totals for one named statement."""
+
+    __slots__ = ("calls", "errors", "max_seconds", "rows", "total_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float, rows: int, *, failed: bool = False) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        if failed:
+            self.errors += 1
+
+
+class PostgresStatementRegistry(StatementMetricsPort):
+    """Run statements by name through a provider, timing each one.
+
+    SQL is built once per name by `statement` and the same text is sent on
+    every later call. The driver keys its per-connection prepared statement
+    cache on that text, so each statement is parsed and planned once per
+    pooled connection and reused after that. Names should therefore identify
+    the statement shape (which filters are present), never argument values.
+    """
+
+    def __init__(
+        self,
+        provider: PostgresProvider,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._provider = provider
+        self._clock = clock
+        self._sql: dict[str, str] = {}
+        self._stats: dict[str, StatementStats] = {}
+
+    def statement(self, name: str, build: Callable[[], str]) -> str:
+        """Return the SQL registered as `name`, registering `build()` on first use."""
+        sql = self._sql.get(name)
+        if sql is None:
+            sql = self._sql.setdefault(name, build())
+        return sql
+
+    async def fetchone(
+        self,
+        name: str,
+        sql: str,
+        args: tuple[object, ...],
+        *,
+        provider: PostgresProvider | None = None,
+    ) -> dict[str, Any] | None:
+        """Fetch at most one row for statement `name`, on `provider` when given."""
+        stats = self._stats_for(name)
+        target = provider or self._provider
+        started = self._clock()
+        try:
+            row: dict[str, Any] | None = await target.fetchone(sql, args)
+        except BaseException:
+            stats.observe(self._clock() - started, 0, failed=True)
+            raise
+        stats.observe(self._clock() - started, 0 if row is None else 1)
+        return row
+
+    async def fetchall(
+        self,
+        name: str,
+        sql: str,
+        args: tuple[object, ...],
+        *,
+        provider: PostgresProvider | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch every row for statement `name`, on `provider` when given."""
+        stats = self._stats_for(name)
+        target = provider or self._provider
+        started = self._clock()
+        try:
+            rows: list[dict[str, Any]] = await target.fetchall(sql, args)
+        except BaseException:
+            stats.observe(self._clock() - started, 0, failed=True)
+            raise
+        stats.observe(self._clock() - started, len(rows))
+        return rows
+
+    def stats(self) -> dict[str, StatementStats]:
+        """Return live statistics keyed by statement name."""
+        return dict(self._stats)
+
+    async def list_statement_timings(self) -> list[StatementTiming]:
+        return [
+            StatementTiming(
+                name=name,
+                calls=stats.calls,
+                errors=stats.errors,
+                rows=stats.rows,
+                total_seconds=stats.total_seconds,
+                max_seconds=stats.max_seconds,
+            )
+            for name, stats in sorted(self._stats.items())
+        ]
+
+    def _stats_for(self, name: str) -> StatementStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = StatementStats()
+        return stats
@@ -2,63 +2,570 @@
 
 from __future__ import annotations
 
+import builtins
 import json
 import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
+import pydantic_core
 from orchid_commons import PostgresProvider
 
-from sackmesser.domain.ports.workflow_ports import WorkflowRepositoryPort
-from sackmesser.domain.workflows.entities import Workflow
+from sackmesser.domain.ports.workflow_ports import (
+    EncodedWorkflowReadPort,
+    WorkflowCountPort,
+    WorkflowLookupPort,
+    WorkflowPayloadUpdatePort,
+    WorkflowRepositoryPort,
+    WorkflowSearchPort,
+)
+from sackmesser.domain.workflows.entities import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCount,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
+)
+from sackmesser.infrastructure.db.postgres.ids import uuid7
+from sackmesser.infrastructure.db.postgres.migrations import Migration, PostgresMigrator
+from sackmesser.infrastructure.db.postgres.replicas import PostgresReplicaRouter
+from sackmesser.infrastructure.db.postgres.statements import PostgresStatementRegistry
 
-_SCHEMA_SQL = """
+WorkflowIdFormat = Literal["uuid4", "uuid7"]
+
+# uuid4 keys are random hex text, as before; uuid7 keys are time-ordered and
+# stored as 16-byte native uuid, so inserts append to the right of the index.
+_ID_TYPES: dict[str, str] = {"uuid4": "TEXT", "uuid7": "UUID"}
+
+_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS template_workflows (
-    id TEXT PRIMARY KEY,
+    id {id_type} PRIMARY KEY,
     title TEXT NOT NULL,
-    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    payload JSONB NOT NULL DEFAULT '{{}}'::jsonb,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 """
 
+# Partition keys must be part of every unique constraint, hence the composite
+# primary key. Partitions themselves are created by WorkflowPartitionMaintainer.
+_PARTITIONED_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS template_workflows (
+    id {id_type} NOT NULL,
+    title TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+"""
+
+# Existing uuid4 hex ids cast to uuid as they are; the rewrite holds an
+# exclusive lock on the table for its duration. Only new ids are time-ordered.
+_UUID_ID_MIGRATION_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'template_workflows'
+          AND column_name = 'id'
+          AND data_type = 'text'
+    ) THEN
+        ALTER TABLE template_workflows ALTER COLUMN id TYPE uuid USING id::uuid;
+    END IF;
+END
+$$;
+"""
+
+# Title search works without pg_trgm, just unindexed, so a role that may not
+# create extensions should not fail the migration.
+_TRGM_EXTENSION_SQL = """
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE 'pg_trgm unavailable (%), title search is not indexed', SQLERRM;
+END
+$$;
+"""
+
+_TRGM_AVAILABLE = "EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+
+# Index name, definition and precondition. jsonb_path_ops only supports
+# containment, which is all search needs, and is smaller and faster than the
+# default jsonb_ops.
+_INDEXES = (
+    ("template_workflows_created_at_id_idx", "(created_at DESC, id DESC)", None),
+    ("template_workflows_payload_path_idx", "USING gin (payload jsonb_path_ops)", None),
+    ("template_workflows_title_trgm_idx", "USING gin (title gin_trgm_ops)", _TRGM_AVAILABLE),
+)
+
+# RFC 7396 JSON Merge Patch: objects merge key by key, null removes a key and
+# any other value replaces the target. plpgsql, because a SQL-language body
+# cannot refer to its own function before it exists.
+_MERGE_PATCH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION template_jsonb_merge_patch(target jsonb, patch jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+BEGIN
+    IF jsonb_typeof(patch) IS DISTINCT FROM 'object' THEN
+        RETURN patch;
+    END IF;
+    IF jsonb_typeof(target) IS DISTINCT FROM 'object' THEN
+        target := '{}'::jsonb;
+    END IF;
+    RETURN COALESCE(
+        (
+            SELECT jsonb_object_agg(merged.key, merged.value)
+            FROM (
+                SELECT kept.key, kept.value
+                FROM jsonb_each(target) AS kept
+                WHERE NOT patch ? kept.key
+                UNION ALL
+                SELECT patched.key, template_jsonb_merge_patch(target -> patched.key, patched.value)
+                FROM jsonb_each(patch) AS patched
+                WHERE jsonb_typeof(patched.value) <> 'null'
+            ) AS merged
+        ),
+        '{}'::jsonb
+    );
+END
+$$;
+"""
 
-class PostgresWorkflowRepository(WorkflowRepositoryPort):
-    """Persist workflow entities using commons PostgresProvider."""
+_COLUMNS = "id, title, payload, created_at"
+
+_GET_SQL = f"""
+SELECT {_COLUMNS}
+FROM template_workflows
+WHERE id = $1
+LIMIT 1
+"""
+
+_GET_MANY_SQL = f"""
+SELECT {_COLUMNS}
+FROM template_workflows
+WHERE id = ANY($1::{{id_type}}[])
+"""
+
+_INSERT_SQL = """
+INSERT INTO template_workflows (id, title, payload)
+VALUES ($1, $2, $3::jsonb)
+RETURNING id, title, payload, created_at
+"""
+
+_INSERT_BATCH_SQL = """
+INSERT INTO template_workflows (id, title, payload)
+SELECT batch.id, batch.title, batch.payload::jsonb
+FROM unnest($1::{id_type}[], $2::text[], $3::text[]) AS batch(id, title, payload)
+RETURNING id, title, payload, created_at
+"""
+
+# Payload as JSON text rendered by Postgres, so listings can splice it into the
+# response without decoding it into Python objects first.
+_ENCODED_COLUMNS = """
+    id,
+    title,
+    CASE WHEN jsonb_typeof(payload) = 'object' THEN payload::text ELSE '{}' END AS payload_json,
+    created_at
+"""
+
+# Planner estimate summed over the table's storage (itself, or its partitions);
+# reltuples is -1 until the first VACUUM/ANALYZE. Storage with no pages on disk
+# counts as empty rather than unanalyzed: premade future partitions stay
+# unanalyzed until rows arrive, and must not force an exact count. The exact
+# count sits in an uncorrelated subquery, which Postgres runs as an InitPlan
+# only when the CASE reaches it.
+_COUNT_SQL_TEMPLATE = """
+WITH estimate AS (
+    SELECT
+        COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint AS rows,
+        COALESCE(bool_or(c.reltuples < 0 AND pg_relation_size(c.oid) > 0), false) AS unanalyzed
+    FROM pg_class AS c
+    WHERE c.relkind <> 'p'
+      AND (
+          c.oid = '{table}'::regclass
+          OR c.oid IN (
+              SELECT inhrelid FROM pg_inherits WHERE inhparent = '{table}'::regclass
+          )
+      )
+)
+SELECT
+    CASE
+        WHEN unanalyzed OR rows < $1 THEN (SELECT count(*) FROM {table})
+        ELSE rows
+    END AS total,
+    unanalyzed OR rows < $1 AS exact
+FROM estimate
+"""
 
-    def __init__(self, provider: PostgresProvider) -> None:
+_COUNT_SQL = _COUNT_SQL_TEMPLATE.format(table="template_workflows")
+
+
+class PostgresWorkflowRepository(
+    WorkflowRepositoryPort,
+    WorkflowLookupPort,
+    WorkflowPayloadUpdatePort,
+    EncodedWorkflowReadPort,
+    WorkflowSearchPort,
+    WorkflowCountPort,
+):
+    """Persist workflow entities using commons PostgresProvider.
+
+    Queries run as named statements through `statements`, which times them;
+    pass a shared registry to read those timings elsewhere. With a `router`,
+    reads go to the replica it picks while writes stay on `provider`.
+    `id_format="uuid7"` issues time-ordered ids in a native uuid column and
+    converts an existing text id column when migrated; ids are then returned
+    in canonical hyphenated form.
+    """
+
+    def __init__(
+        self,
+        provider: PostgresProvider,
+        *,
+        partitioned: bool = False,
+        statements: PostgresStatementRegistry | None = None,
+        router: PostgresReplicaRouter | None = None,
+        id_format: WorkflowIdFormat = "uuid4",
+    ) -> None:
+        if id_format not in _ID_TYPES:
+            msg = "id_format must be 'uuid4' or 'uuid7'"
+            raise ValueError(msg)
         self._provider = provider
+        self._partitioned = partitioned
+        self._id_format = id_format
+        self._insert_batch_sql = _INSERT_BATCH_SQL.format(id_type=_ID_TYPES[id_format].lower())
+        self._get_many_sql = _GET_MANY_SQL.format(id_type=_ID_TYPES[id_format].lower())
+        self._statements = statements or PostgresStatementRegistry(provider)
+        self._router = router
+        self._migrator = PostgresMigrator(provider, self.migrations())
 
-    async def ensure_schema(self) -> None:
-        """Create required table for workflow example."""
-        await self._provider.executescript(_SCHEMA_SQL)
+    def migrations(self) -> tuple[Migration, ...]:
+        """Return the schema history of the workflow table for these settings.
 
-    async def create(self, title: str, payload: dict[str, object]) -> Workflow:
-        workflow_id = uuid.uuid4().hex
-        row = await self._provider.fetchone(
-            """
-            INSERT INTO template_workflows (id, title, payload)
-            VALUES ($1, $2, $3::jsonb)
-            RETURNING id, title, payload, created_at
-            """,
-            (workflow_id, title, json.dumps(payload)),
+        The table layout (`partitioned`, id column type) is fixed by the
+        settings in effect when version 1 is applied; an existing table is left
+        as it is. Version 3 is only registered with uuid7 ids, so switching an
+        existing deployment to uuid7 leaves it pending until migrated. Indexes
+        follow as migrations of their own, see `_index_migration`.
+        """
+        table_sql = (_PARTITIONED_TABLE_SQL if self._partitioned else _TABLE_SQL).format(
+            id_type=_ID_TYPES[self._id_format]
         )
+        migrations = [
+            Migration(1, "create_workflows", table_sql),
+            Migration(2, "jsonb_merge_patch", _MERGE_PATCH_FUNCTION_SQL),
+        ]
+        if self._id_format == "uuid7":
+            migrations.append(Migration(3, "uuid_workflow_ids", _UUID_ID_MIGRATION_SQL))
+        migrations.append(Migration(4, "pg_trgm", _TRGM_EXTENSION_SQL))
+        migrations.extend(
+            _index_migration(version, name, definition, only_if, partitioned=self._partitioned)
+            for version, (name, definition, only_if) in enumerate(_INDEXES, start=5)
+        )
+        return tuple(migrations)
+
+    async def ensure_schema(self) -> builtins.list[Migration]:
+        """Apply pending workflow migrations under the migration lock; return them."""
+        return await self._migrator.apply()
+
+    async def pending_migrations(self) -> builtins.list[Migration]:
+        """Return workflow migrations not applied to the database yet."""
+        return await self._migrator.pending()
+
+    async def check_schema(self) -> None:
+        """Fail with `SchemaOutOfDateError` while workflow migrations are pending.
+
+        Only reads the version table, so it is cheap enough for every startup.
+        """
+        await self._migrator.check()
+
+    async def create(self, title: str, payload: dict[str, object]) -> Workflow:
+        workflow_id = self._new_id()
+        try:
+            row = await self._statements.fetchone(
+                "insert",
+                _INSERT_SQL,
+                (workflow_id, title, json.dumps(payload)),
+            )
+        finally:
+            self._wrote()
         if row is None:
             msg = "Failed to insert workflow"
             raise RuntimeError(msg)
         return _to_workflow(row)
 
-    async def list(self, *, limit: int, offset: int) -> list[Workflow]:
-        rows = await self._provider.fetchall(
-            """
-            SELECT id, title, payload, created_at
-            FROM template_workflows
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
-            """,
-            (limit, offset),
+    async def create_many(self, items: Sequence[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        if not items:
+            return []
+        workflow_ids = [self._new_id() for _ in items]
+        try:
+            rows = await self._statements.fetchall(
+                "insert_batch",
+                self._insert_batch_sql,
+                (
+                    workflow_ids,
+                    [title for title, _ in items],
+                    [json.dumps(payload) for _, payload in items],
+                ),
+            )
+        finally:
+            self._wrote()
+        by_id = {str(row["id"]): row for row in rows}
+        if len(by_id) != len(workflow_ids):
+            msg = "Failed to insert workflow batch"
+            raise RuntimeError(msg)
+        return [_to_workflow(by_id[str(workflow_id)]) for workflow_id in workflow_ids]
+
+    async def get(self, workflow_id: str) -> Workflow | None:
+        lookup_ids = self._lookup_ids([workflow_id])
+        if not lookup_ids:
+            return None
+        row = await self._statements.fetchone(
+            "get", _GET_SQL, (lookup_ids[0],), provider=self._reader()
+        )
+        return None if row is None else _to_workflow(row)
+
+    async def get_many(self, workflow_ids: Sequence[str]) -> list[Workflow]:
+        lookup_ids = self._lookup_ids(workflow_ids)
+        if not lookup_ids:
+            return []
+        rows = await self._statements.fetchall(
+            "get_many", self._get_many_sql, (lookup_ids,), provider=self._reader()
         )
         return [_to_workflow(row) for row in rows]
 
+    def canonical_id(self, workflow_id: str) -> str | None:
+        if self._id_format != "uuid7":
+            return workflow_id
+        try:
+            return str(uuid.UUID(workflow_id))
+        except ValueError:
+            return None
+
+    async def update_payload(
+        self,
+        workflow_id: str,
+        *,
+        merge: dict[str, Any] | None = None,
+        sets: Sequence[WorkflowPayloadSet] = (),
+    ) -> Workflow | None:
+        lookup_ids = self._lookup_ids([workflow_id])
+        if not lookup_ids:
+            return None
+        args: builtins.list[object] = [lookup_ids[0]]
+        shape: builtins.list[str] = []
+        if merge is not None:
+            args.append(json.dumps(merge))
+            shape.append("merge")
+        for operation in sets:
+            args.extend((builtins.list(operation.path), json.dumps(operation.value)))
+        if sets:
+            shape.append(f"set*{len(sets)}")
+        name = f"update_payload[{','.join(shape)}]"
+        sql = self._statements.statement(
+            name, lambda: _update_payload_sql(merge is not None, len(sets))
+        )
+        try:
+            row = await self._statements.fetchone(name, sql, tuple(args))
+        finally:
+            self._wrote()
+        return None if row is None else _to_workflow(row)
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
+        page = _PageQuery(limit)
+        page.offset(offset)
+        page.within(time_range)
+        rows = await self._fetch_page("list", page, _COLUMNS)
+        return [_to_workflow(row) for row in rows]
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> builtins.list[Workflow]:
+        if cursor is None:
+            return await self.list(limit=limit, offset=0, time_range=time_range)
+        page = _PageQuery(limit)
+        page.after(cursor)
+        page.within(time_range)
+        rows = await self._fetch_page("list", page, _COLUMNS)
+        return [_to_workflow(row) for row in rows]
+
+    async def search(
+        self,
+        *,
+        title: str | None,
+        payload_contains: dict[str, Any] | None,
+        limit: int,
+        cursor: WorkflowCursor | None,
+    ) -> builtins.list[Workflow]:
+        # Only present filters are rendered: `$n IS NULL OR ...` guards would
+        # keep the planner from using the GIN indexes under a generic plan.
+        page = _PageQuery(limit)
+        if title is not None:
+            page.where("title", f"title ILIKE {page.bind(f'%{_escape_like(title)}%')}")
+        if payload_contains:
+            page.where("payload", f"payload @> {page.bind(json.dumps(payload_contains))}::jsonb")
+        page.after(cursor)
+        rows = await self._fetch_page("search", page, _COLUMNS)
+        return [_to_workflow(row) for row in rows]
+
+    async def count(self, *, exact_below: int) -> WorkflowCount:
+        row = await self._statements.fetchone(
+            "count", _COUNT_SQL, (exact_below,), provider=self._reader()
+        )
+        if row is None:
+            return WorkflowCount(value=0, exact=False)
+        return WorkflowCount(value=int(row["total"]), exact=bool(row["exact"]))
+
+    async def list_encoded(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> builtins.list[EncodedWorkflow]:
+        page = _PageQuery(limit)
+        page.offset(offset)
+        page.within(time_range)
+        rows = await self._fetch_page("list_encoded", page, _ENCODED_COLUMNS)
+        return [_to_encoded_workflow(row) for row in rows]
+
+    async def list_encoded_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> builtins.list[EncodedWorkflow]:
+        if cursor is None:
+            return await self.list_encoded(limit=limit, offset=0, time_range=time_range)
+        page = _PageQuery(limit)
+        page.after(cursor)
+        page.within(time_range)
+        rows = await self._fetch_page("list_encoded", page, _ENCODED_COLUMNS)
+        return [_to_encoded_workflow(row) for row in rows]
+
+    async def _fetch_page(
+        self, prefix: str, page: _PageQuery, columns: str
+    ) -> builtins.list[dict[str, Any]]:
+        name = page.name(prefix)
+        sql = self._statements.statement(name, lambda: page.sql(columns))
+        return await self._statements.fetchall(name, sql, page.params, provider=self._reader())
+
+    def _lookup_ids(self, workflow_ids: Sequence[str]) -> builtins.list[Any]:
+        """Return ids as the id column accepts them, dropping ones it cannot hold."""
+        if self._id_format != "uuid7":
+            return builtins.list(workflow_ids)
+        parsed: builtins.list[Any] = []
+        for workflow_id in workflow_ids:
+            try:
+                parsed.append(uuid.UUID(workflow_id))
+            except ValueError:
+                continue
+        return parsed
+
+    def _new_id(self) -> str | uuid.UUID:
+        return uuid7() if self._id_format == "uuid7" else uuid.uuid4().hex
+
+    def _reader(self) -> PostgresProvider | None:
+        return None if self._router is None else self._router.reader()
+
+    def _wrote(self) -> None:
+        # Also after a failed write: it may have committed before the error.
+        if self._router is not None:
+            self._router.wrote()
+
+
+class _PageQuery:
+    """Positional arguments and filters of one newest-first page; `$1` is the limit.
+
+    `shape` names the clauses present, in binding order, so pages with the same
+    shape render the same SQL and can share one statement name.
+    """
+
+    __slots__ = ("args", "conditions", "offset_ref", "shape")
+
+    def __init__(self, limit: int) -> None:
+        self.args: list[object] = [limit]
+        self.conditions: list[str] = []
+        self.offset_ref: str | None = None
+        self.shape: list[str] = []
+
+    @property
+    def params(self) -> tuple[object, ...]:
+        return tuple(self.args)
+
+    def name(self, prefix: str) -> str:
+        return f"{prefix}[{','.join(self.shape)}]" if self.shape else prefix
+
+    def bind(self, value: object) -> str:
+        self.args.append(value)
+        return f"${len(self.args)}"
+
+    def offset(self, offset: int) -> None:
+        self.offset_ref = self.bind(offset)
+        self.shape.append("offset")
+
+    def where(self, clause: str, condition: str) -> None:
+        self.conditions.append(condition)
+        self.shape.append(clause)
+
+    def after(self, cursor: WorkflowCursor | None) -> None:
+        if cursor is None:
+            return
+        created_at = self.bind(cursor.created_at)
+        workflow_id = self.bind(cursor.id)
+        # The plain created_at bound is implied by the row comparison, but
+        # partition pruning ignores row comparisons and needs it spelled out.
+        self.where(
+            "after",
+            f"(created_at, id) < ({created_at}, {workflow_id}) AND created_at <= {created_at}",
+        )
+
+    def within(self, time_range: WorkflowTimeRange | None) -> None:
+        if time_range is None:
+            return
+        if time_range.start is not None:
+            self.where("from", f"created_at >= {self.bind(time_range.start)}")
+        if time_range.end is not None:
+            self.where("to", f"created_at < {self.bind(time_range.end)}")
+
+    def sql(self, columns: str) -> str:
+        where = f"WHERE {' AND '.join(self.conditions)}" if self.conditions else ""
+        paging = "LIMIT $1" if self.offset_ref is None else f"LIMIT $1 OFFSET {self.offset_ref}"
+        return f"""
+            SELECT {columns}
+            FROM template_workflows
+            {where}
+            ORDER BY created_at DESC, id DESC
+            {paging}
+            """
+
+
+def _update_payload_sql(merge: bool, sets: int) -> str:
+    """Render one UPDATE whose new payload nests every patch step; `$1` is the id."""
+    payload = "payload"
+    position = 1
+    if merge:
+        position += 1
+        payload = f"template_jsonb_merge_patch({payload}, ${position}::jsonb)"
+    for _ in range(sets):
+        payload = f"jsonb_set({payload}, ${position + 1}::text[], ${position + 2}::jsonb, true)"
+        position += 2
+    return f"""
+        UPDATE template_workflows
+        SET payload = {payload}
+        WHERE id = $1
+        RETURNING {_COLUMNS}
+        """
+
 
 def _to_workflow(row: dict[str, Any]) -> Workflow:
     payload_raw = row.get("payload")
@@ -75,6 +582,27 @@ def _to_workflow(row: dict[str, Any]) -> Workflow:
     )
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_encoded_workflow(row: dict[str, Any]) -> EncodedWorkflow:
+    return EncodedWorkflow(
+        id=str(row["id"]),
+        title=str(row["title"]),
+        payload_json=_coerce_payload_json(row.get("payload_json")),
+        created_at=_coerce_datetime(row.get("created_at")),
+    )
+
+
+def _coerce_payload_json(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return pydantic_core.to_json(value).decode("utf-8")
+    return "{}"
+
+
 def _coerce_payload(value: Any) -> dict[str, Any]:
     if isinstance(value, dict):
         return value
@@ -92,3 +620,34 @@ def _coerce_datetime(value: Any) -> datetime:
         parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
         return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
     return datetime.now(tz=UTC)
+
+
+def _index_migration(
+    version: int,
+    name: str,
+    definition: str,
+    only_if: str | None,
+    *,
+    partitioned: bool,
+) -> Migration:
+    """Return the migration building index `name` on the workflow table.
+
+    A plain table may already hold millions of rows, so the index is built
+    with `CREATE INDEX CONCURRENTLY`, outside any transaction, and writes go on
+    during the build. A build that fails leaves an invalid index behind, which
+    `IF NOT EXISTS` then skips; drop it before migrating again. Postgres cannot
+    build indexes concurrently on a partitioned table, whose indexes are
+    created with it instead, in a transaction.
+    """
+    if not partitioned:
+        return Migration(
+            version,
+            name,
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON template_workflows {definition}",
+            transactional=False,
+            only_if=only_if,
+        )
+    sql = f"CREATE INDEX IF NOT EXISTS {name} ON template_workflows {definition};"
+    if only_if is not None:
+        sql = f"DO $$\nBEGIN\n    IF {only_if} THEN\n        {sql}\n    END IF;\nEND\n$$;"
+    return Migration(version, name, sql)
@@ -1,5 +1,9 @@
 """Redis-specific infrastructure adapters."""
 
 from sackmesser.infrastructure.db.redis.cache_repository import RedisCacheRepository
+from sackmesser.infrastructure.db.redis.local_cache import (
+    LocalCacheRepository,
+    LocalCacheSettings,
+)
 
-__all__ = ["RedisCacheRepository"]
+__all__ = ["LocalCacheRepository", "LocalCacheSettings", "RedisCacheRepository"]
@@ -2,28 +2,165 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Iterable, Mapping, Sequence
+from typing import Any, TypeVar
+
 from orchid_commons import RedisCache
 
 from sackmesser.domain.cache.entities import CacheEntry
 from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
 
+T = TypeVar("T")
+
 
 class RedisCacheRepository(CacheRepositoryPort):
-    """Adapt commons RedisCache to domain cache port."""
+    """Adapt commons RedisCache to domain cache port.
+
+    With `client`, a raw `redis.asyncio` client on the same server, every
+    command goes to it instead, with keys laid out as `<key_prefix>:<key>` like
+    the commons client and `default_ttl_seconds` for writes without a TTL.
+    Batches then cost one round-trip per `chunk_size` keys: an MGET for reads,
+    a pipeline of SETs (with NX for `add_many`) for writes and one DEL for
+    deletes.
 
-    def __init__(self, cache: RedisCache) -> None:
+    The commons client has no MGET, pipeline or SET NX API, so without `client`
+    batches send single-key commands, at most `max_in_flight` at a time across
+    all batches of this repository, and `add_many` checks for existing values
+    before writing, which a concurrent writer can still slip between.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCache,
+        *,
+        client: Any | None = None,
+        key_prefix: str | None = None,
+        default_ttl_seconds: int | None = None,
+        chunk_size: int = 500,
+        max_in_flight: int = 16,
+    ) -> None:
+        if chunk_size < 1 or max_in_flight < 1:
+            msg = "chunk_size and max_in_flight must be positive"
+            raise ValueError(msg)
         self._cache = cache
+        self._client = client
+        self._key_prefix = key_prefix
+        self._default_ttl_seconds = default_ttl_seconds
+        self._chunk_size = chunk_size
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    @classmethod
+    def from_options(cls, cache: RedisCache, options: Mapping[str, Any]) -> RedisCacheRepository:
+        """Pair `cache` with a raw client opened from `resources.redis`, when it has a URL."""
+        url = options.get("url")
+        if not url:
+            return cls(cache)
+        from redis.asyncio import Redis
+
+        ttl_seconds = options.get("default_ttl_seconds")
+        return cls(
+            cache,
+            client=Redis.from_url(str(url)),
+            key_prefix=str(options["key_prefix"]) if options.get("key_prefix") else None,
+            default_ttl_seconds=None if ttl_seconds is None else int(ttl_seconds),
+        )
 
     async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
-        return await self._cache.set(key, value, ttl_seconds=ttl_seconds)
+        if self._client is None:
+            return bool(await self._cache.set(key, value, ttl_seconds=ttl_seconds))
+        return bool(await self._client.set(self._key(key), value, ex=self._ttl(ttl_seconds)))
 
     async def get(self, key: str) -> CacheEntry:
-        value = await self._cache.get(key)
-        if isinstance(value, bytes):
-            return CacheEntry(key=key, value=value.decode("utf-8"))
-        if value is None:
-            return CacheEntry(key=key, value=None)
-        return CacheEntry(key=key, value=str(value))
+        if self._client is None:
+            return _to_entry(key, await self._cache.get(key))
+        return _to_entry(key, await self._client.get(self._key(key)))
 
     async def delete(self, key: str) -> bool:
-        return bool(await self._cache.delete(key))
+        if self._client is None:
+            return bool(await self._cache.delete(key))
+        return bool(await self._client.delete(self._key(key)))
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        if self._client is None:
+            results = await self._gather(
+                self._cache.set(key, value, ttl_seconds=ttl) for key, value, ttl in entries
+            )
+            return all(bool(result) for result in results)
+
+        stored = True
+        for chunk in _chunks(entries, self._chunk_size):
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value, ttl_seconds in chunk:
+                    pipe.set(self._key(key), value, ex=self._ttl(ttl_seconds))
+                stored = all(bool(result) for result in await pipe.execute()) and stored
+        return stored
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        if self._client is None:
+            current = await self.get_many([key for key, _value, _ttl in entries])
+            absent = [
+                entry for entry, found in zip(entries, current, strict=True) if found.value is None
+            ]
+            await self.set_many(absent)
+            return len(absent)
+
+        added = 0
+        for chunk in _chunks(entries, self._chunk_size):
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value, ttl_seconds in chunk:
+                    pipe.set(self._key(key), value, ex=self._ttl(ttl_seconds), nx=True)
+                added += sum(bool(result) for result in await pipe.execute())
+        return added
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        values: list[Any]
+        if self._client is None:
+            values = await self._gather(self._cache.get(key) for key in keys)
+        else:
+            values = []
+            for chunk in _chunks(keys, self._chunk_size):
+                values.extend(await self._client.mget([self._key(key) for key in chunk]))
+        return [_to_entry(key, value) for key, value in zip(keys, values, strict=True)]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        unique = list(dict.fromkeys(keys))
+        if self._client is None:
+            results = await self._gather(self._cache.delete(key) for key in unique)
+            return sum(int(result) for result in results)
+
+        deleted = 0
+        for chunk in _chunks(unique, self._chunk_size):
+            deleted += int(await self._client.delete(*(self._key(key) for key in chunk)))
+        return deleted
+
+    async def close(self) -> None:
+        """Release the raw client, if any; the commons client is owned by its manager."""
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def _gather(self, commands: Iterable[Awaitable[T]]) -> list[T]:
+        async def bounded(command: Awaitable[T]) -> T:
+            async with self._slots:
+                return await command
+
+        return list(await asyncio.gather(*(bounded(command) for command in commands)))
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}:{key}" if self._key_prefix else key
+
+    def _ttl(self, ttl_seconds: int | None) -> int | None:
+        return self._default_ttl_seconds if ttl_seconds is None else ttl_seconds
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterable[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _to_entry(key: str, value: object) -> CacheEntry:
+    if isinstance(value, bytes):
+        return CacheEntry(key=key, value=value.decode("utf-8"))
+    if value is None:
+        return CacheEntry(key=key, value=None)
+    return CacheEntry(key=key, value=str(value))
@@ -0,0 +1,145 @@
+"""Cross-replica invalidation of the L1 cache tier over Redis pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_INITIAL_SECONDS = 0.5
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+class RedisInvalidationChannel:
+    """Publish and receive key invalidations between replicas sharing a Redis.
+
+    Every write that goes through a replica's L1 tier is published as a JSON
+    message `{"origin": ..., "keys": [...]}`; the other replicas drop their
+    local copies when it arrives. Messages from this replica are ignored since
+    it already invalidated locally. Pub/sub is fire-and-forget, so whenever the
+    subscription is (re)established the whole local tier is cleared to cover
+    messages missed while disconnected.
+    """
+
+    def __init__(self, client: Any, *, channel: str, origin: str | None = None) -> None:
+        self._client = client
+        self._channel = channel
+        self._origin = origin or uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+
+    @classmethod
+    def from_url(cls, url: str, *, channel: str) -> RedisInvalidationChannel:
+        """Open a dedicated Redis connection for the invalidation channel."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), channel=channel)
+
+    @property
+    def channel(self) -> str:
+        return self._channel
+
+    async def publish(self, keys: Sequence[str]) -> None:
+        """Broadcast invalidated keys; failures are logged, never raised."""
+        if not keys:
+            return
+        try:
+            await self._client.publish(self._channel, encode_invalidation(self._origin, keys))
+        except Exception:
+            logger.warning("Failed to publish L1 invalidation on %s", self._channel, exc_info=True)
+
+    async def start(
+        self,
+        on_invalidate: Callable[[Sequence[str]], None],
+        on_reset: Callable[[], None],
+        *,
+        ready_timeout_seconds: float = 5.0,
+    ) -> None:
+        """Start listening in the background and wait for the first subscription."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(
+            self._listen(on_invalidate, on_reset),
+            name=f"l1-invalidation:{self._channel}",
+        )
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=ready_timeout_seconds)
+        except TimeoutError:
+            logger.warning("L1 invalidation channel %s is not subscribed yet", self._channel)
+
+    async def close(self) -> None:
+        """Stop the listener and release the dedicated connection."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self._client.aclose()
+
+    async def _listen(
+        self,
+        on_invalidate: Callable[[Sequence[str]], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        delay = _RECONNECT_INITIAL_SECONDS
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                on_reset()
+                self._subscribed.set()
+                delay = _RECONNECT_INITIAL_SECONDS
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    decoded = decode_invalidation(message.get("data"))
+                    if decoded is None:
+                        continue
+                    origin, keys = decoded
+                    if origin != self._origin:
+                        on_invalidate(keys)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "L1 invalidation channel %s disconnected; retrying in %.1fs",
+                    self._channel,
+                    delay,
+                    exc_info=True,
+                )
+            finally:
+                self._subscribed.clear()
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+
+def encode_invalidation(origin: str, keys: Sequence[str]) -> str:
+    """Encode an invalidation message."""
+    return json.dumps({"origin": origin, "keys": list(keys)}, separators=(",", ":"))
+
+
+def decode_invalidation(data: object) -> tuple[str, list[str]] | None:
+    """Decode an invalidation message, returning None for malformed payloads."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    if not isinstance(data, str):
+        return None
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    origin = payload.get("origin")
+    keys = payload.get("keys")
+    if not isinstance(origin, str) or not isinstance(keys, list):
+        return None
+    return origin, [str(key) for key in keys]
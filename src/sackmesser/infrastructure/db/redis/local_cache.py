@@ -0,0 +1,229 @@
+"""In-process L1 cache tier in front of the Redis cache repository."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sackmesser.domain.cache.entities import CacheEntry, CacheStats
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort, CacheStatsPort
+from sackmesser.infrastructure.db.redis.invalidation import RedisInvalidationChannel
+
+
+@dataclass(frozen=True, slots=True)
+class LocalCacheSettings:
+    """Sizing of the L1 tier, read from `resources.redis.l1_cache`."""
+
+    enabled: bool = False
+    max_entries: int = 10_000
+    max_bytes: int = 16 * 1024 * 1024
+    ttl_seconds: float = 5.0
+    invalidation_channel: str | None = "l1-invalidation"
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1 or self.max_bytes < 1 or self.ttl_seconds <= 0:
+            msg = "l1_cache max_entries, max_bytes and ttl_seconds must be positive"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> LocalCacheSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        channel = raw.get("invalidation_channel", defaults.invalidation_channel)
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            max_entries=int(raw.get("max_entries", defaults.max_entries)),
+            max_bytes=int(raw.get("max_bytes", defaults.max_bytes)),
+            ttl_seconds=float(raw.get("ttl_seconds", defaults.ttl_seconds)),
+            invalidation_channel=str(channel) if channel else None,
+        )
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    value: str
+    size: int
+    expires_at: float
+
+
+class LocalCacheRepository(CacheRepositoryPort, CacheStatsPort):
+    """LRU tier bounded by entry count and bytes, wrapping another cache repository.
+
+    Redis does not report the remaining TTL of a key on read, so local entries
+    live at most `ttl_seconds`; keep it below the shortest Redis TTL in use.
+    Writes and deletes made through this repository drop the local copy after
+    the backing write completes, and reads that raced with an invalidation are
+    not stored, so this process never serves a value older than its own writes.
+    With an invalidation channel, writes are also broadcast so other replicas
+    drop their copies; see `RedisInvalidationChannel`.
+    """
+
+    def __init__(
+        self,
+        inner: CacheRepositoryPort,
+        settings: LocalCacheSettings,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        channel: RedisInvalidationChannel | None = None,
+    ) -> None:
+        self._inner = inner
+        self._settings = settings
+        self._clock = clock
+        self._channel = channel
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        try:
+            return await self._inner.set(key, value, ttl_seconds)
+        finally:
+            await self._written((key,))
+
+    async def get(self, key: str) -> CacheEntry:
+        value = self._lookup(key)
+        if value is not None:
+            return CacheEntry(key=key, value=value)
+
+        generation = self._generation
+        entry = await self._inner.get(key)
+        if entry.value is not None and generation == self._generation:
+            self._store(key, entry.value)
+        return entry
+
+    async def delete(self, key: str) -> bool:
+        try:
+            return await self._inner.delete(key)
+        finally:
+            await self._written((key,))
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        try:
+            return await self._inner.set_many(entries)
+        finally:
+            await self._written([key for key, _value, _ttl in entries])
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        try:
+            return await self._inner.add_many(entries)
+        finally:
+            await self._written([key for key, _value, _ttl in entries])
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        values: dict[str, str | None] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            value = self._lookup(key)
+            if value is None:
+                missing.append(key)
+            else:
+                values[key] = value
+
+        if missing:
+            generation = self._generation
+            fetched = await self._inner.get_many(missing)
+            unchanged = generation == self._generation
+            for entry in fetched:
+                values[entry.key] = entry.value
+                if entry.value is not None and unchanged:
+                    self._store(entry.key, entry.value)
+
+        return [CacheEntry(key=key, value=values.get(key)) for key in keys]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        try:
+            return await self._inner.delete_many(keys)
+        finally:
+            await self._written(keys)
+
+    def invalidate(self, keys: Sequence[str]) -> None:
+        """Drop local copies of `keys` and discard reads still in flight."""
+        self._generation += 1
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every local entry and discard reads still in flight."""
+        self._generation += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    async def start(self) -> None:
+        """Subscribe to invalidations published by other replicas, if configured."""
+        if self._channel is not None:
+            await self._channel.start(self.invalidate, self.clear)
+
+    async def close(self) -> None:
+        """Stop listening for remote invalidations."""
+        if self._channel is not None:
+            await self._channel.close()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            enabled=True,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            max_entries=self._settings.max_entries,
+            max_bytes=self._settings.max_bytes,
+        )
+
+    async def _written(self, keys: Sequence[str]) -> None:
+        self.invalidate(keys)
+        if self._channel is not None:
+            await self._channel.publish(list(dict.fromkeys(keys)))
+
+    def _lookup(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            self._bytes -= entry.size
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def _store(self, key: str, value: str) -> None:
+        size = len(key.encode("utf-8")) + len(value.encode("utf-8"))
+        if size > self._settings.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = _LocalEntry(
+            value=value,
+            size=size,
+            expires_at=self._clock() + self._settings.ttl_seconds,
+        )
+        self._bytes += size
+
+        while len(self._entries) > self._settings.max_entries or (
+            self._bytes > self._settings.max_bytes
+        ):
+            _key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
@@ -0,0 +1,233 @@
+"""Read-through cache for workflow point lookups."""
+
+from __future__ import annotations
+
+import builtins
+import json
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Protocol
+
+import pydantic_core
+
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.domain.ports.workflow_ports import (
+    WorkflowLookupPort,
+    WorkflowPayloadUpdatePort,
+    WorkflowRepositoryPort,
+)
+from sackmesser.domain.workflows.entities import (
+    Workflow,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
+)
+
+logger = logging.getLogger(__name__)
+
+# Held by a key whose workflow may have changed without a known new value.
+_TOMBSTONE = "-"
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowCacheSettings:
+    """Lookup cache, read from `sackmesser.workflows.lookup_cache` in appsettings."""
+
+    enabled: bool = False
+    ttl_seconds: int = 300
+    tombstone_seconds: int = 30
+    namespace: str = "workflow"
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds < 1 or self.tombstone_seconds < 1:
+            msg = "lookup_cache ttl_seconds and tombstone_seconds must be positive"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> WorkflowCacheSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            ttl_seconds=int(raw.get("ttl_seconds", defaults.ttl_seconds)),
+            tombstone_seconds=int(raw.get("tombstone_seconds", defaults.tombstone_seconds)),
+            namespace=str(raw.get("namespace", defaults.namespace)),
+        )
+
+
+class _CachedWorkflowStore(
+    WorkflowRepositoryPort, WorkflowLookupPort, WorkflowPayloadUpdatePort, Protocol
+):
+    """Repository capabilities the cache sits in front of."""
+
+
+class _ReadRouting(Protocol):
+    """Replica routing of the repository's reads."""
+
+    def pinned_session(self) -> str | None: ...
+
+    def recently_written(self) -> bool: ...
+
+
+class CachedWorkflowRepository(
+    WorkflowRepositoryPort, WorkflowLookupPort, WorkflowPayloadUpdatePort
+):
+    """Serve workflow lookups from a cache store, falling back to the repository.
+
+    Created and updated workflows are written to the cache right away, so
+    their next read is a hit with the stored payload. Misses are read from the
+    repository in one `get_many` and stored; missing ids are not cached.
+    Entries are keyed by the repository's canonical id.
+
+    Misses are stored with `add_many`, which never replaces a value, so a slow
+    read cannot overwrite the entry a concurrent write stored meanwhile, in this
+    process or another. When a write's outcome is unknown (it failed, or the
+    workflow is gone) the key gets a tombstone for `tombstone_seconds` instead,
+    which reads treat as a miss and which keeps late misses out as well. With a
+    `router`, misses read from a replica are also not stored while a recent
+    write of this process may not have replicated yet. Listings pass straight
+    through. Store failures are logged and fall back to the repository.
+    """
+
+    def __init__(
+        self,
+        repository: _CachedWorkflowStore,
+        store: CacheRepositoryPort,
+        settings: WorkflowCacheSettings | None = None,
+        *,
+        router: _ReadRouting | None = None,
+    ) -> None:
+        self._repository = repository
+        self._store = store
+        self._settings = settings or WorkflowCacheSettings(enabled=True)
+        self._router = router
+
+    async def create(self, title: str, payload: dict[str, object]) -> Workflow:
+        workflow = await self._repository.create(title, payload)
+        await self._remember([workflow])
+        return workflow
+
+    async def create_many(self, items: Sequence[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        workflows = await self._repository.create_many(items)
+        await self._remember(workflows)
+        return workflows
+
+    async def update_payload(
+        self,
+        workflow_id: str,
+        *,
+        merge: dict[str, Any] | None = None,
+        sets: Sequence[WorkflowPayloadSet] = (),
+    ) -> Workflow | None:
+        stale = [key] if (key := self.canonical_id(workflow_id)) is not None else []
+        try:
+            workflow = await self._repository.update_payload(workflow_id, merge=merge, sets=sets)
+        except BaseException:
+            # The update may have committed before the error.
+            await self._bury(stale)
+            raise
+        if workflow is None:
+            await self._bury(stale)
+        elif not await self._remember([workflow]):
+            await self._bury(stale)
+        return workflow
+
+    async def get(self, workflow_id: str) -> Workflow | None:
+        found = await self._lookup([workflow_id])
+        return found[0] if found else None
+
+    async def get_many(self, workflow_ids: Sequence[str]) -> list[Workflow]:
+        return await self._lookup(workflow_ids)
+
+    def canonical_id(self, workflow_id: str) -> str | None:
+        return self._repository.canonical_id(workflow_id)
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
+        return await self._repository.list(limit=limit, offset=offset, time_range=time_range)
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> builtins.list[Workflow]:
+        return await self._repository.list_after(limit=limit, cursor=cursor, time_range=time_range)
+
+    async def _lookup(self, workflow_ids: Sequence[str]) -> builtins.list[Workflow]:
+        canonical = (self.canonical_id(item) for item in workflow_ids)
+        ids = builtins.list(dict.fromkeys(item for item in canonical if item is not None))
+        found: dict[str, Workflow] = {}
+        try:
+            entries = await self._store.get_many([self._key(item) for item in ids])
+            for workflow_id, entry in zip(ids, entries, strict=True):
+                if entry.value is not None and entry.value != _TOMBSTONE:
+                    found[workflow_id] = _decode(entry.value)
+        except Exception:
+            logger.warning("Workflow cache lookup failed", exc_info=True)
+
+        missing = [workflow_id for workflow_id in ids if workflow_id not in found]
+        if missing:
+            router = self._router
+            from_primary = router is None or router.pinned_session() is not None
+            loaded = await self._repository.get_many(missing)
+            if from_primary or router is None or not router.recently_written():
+                await self._remember(loaded, fill=True)
+            found.update((workflow.id, workflow) for workflow in loaded)
+        return [found[workflow_id] for workflow_id in ids if workflow_id in found]
+
+    async def _remember(self, workflows: Sequence[Workflow], *, fill: bool = False) -> bool:
+        if not workflows:
+            return True
+        ttl_seconds = self._settings.ttl_seconds
+        entries = [(self._key(item.id), _encode(item), ttl_seconds) for item in workflows]
+        try:
+            if fill:
+                await self._store.add_many(entries)
+            else:
+                await self._store.set_many(entries)
+        except Exception:
+            logger.warning("Workflow cache store failed", exc_info=True)
+            return False
+        return True
+
+    async def _bury(self, workflow_ids: Sequence[str]) -> None:
+        if not workflow_ids:
+            return
+        ttl_seconds = self._settings.tombstone_seconds
+        try:
+            await self._store.set_many(
+                [(self._key(item), _TOMBSTONE, ttl_seconds) for item in workflow_ids]
+            )
+        except Exception:
+            logger.warning("Workflow cache invalidation failed", exc_info=True)
+
+    def _key(self, workflow_id: str) -> str:
+        return f"{self._settings.namespace}:{workflow_id}"
+
+
+def _encode(workflow: Workflow) -> str:
+    return pydantic_core.to_json(
+        {
+            "id": workflow.id,
+            "title": workflow.title,
+            "payload": workflow.payload,
+            "created_at": workflow.created_at,
+        }
+    ).decode("utf-8")
+
+
+def _decode(value: str) -> Workflow:
+    data = json.loads(value)
+    return Workflow(
+        id=str(data["id"]),
+        title=str(data["title"]),
+        payload=dict(data["payload"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
@@ -14,6 +14,7 @@ from sackmesser.infrastructure.runtime.state import (
     RuntimeState,
     get_runtime_container,
     get_runtime_state,
+    migrate_runtime,
     reset_runtime_state_for_tests,
     resolve_environment,
     shutdown_runtime,
@@ -30,6 +31,7 @@ __all__ = [
     "get_runtime_state",
     "load_enabled_modules",
     "load_module_manifest",
+    "migrate_runtime",
     "required_resource_names",
     "reset_runtime_state_for_tests",
     "resolve_enabled_modules",
@@ -0,0 +1,88 @@
+"""Bus middleware configuration (`sackmesser.bus` in appsettings)."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from sackmesser.application.bus import CommandBus, QueryBus
+from sackmesser.application.middleware import (
+    ConcurrencyLimitMiddleware,
+    LatencyHistogramMiddleware,
+    TimeoutMiddleware,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BusSettings:
+    """Middlewares installed on both buses; per-type maps are keyed by class name.
+
+    `max_concurrency` turns a request type into a bulkhead; `max_queue` (or
+    `default_max_queue`) bounds how many requests may wait for a slot before
+    new ones are rejected as overloaded.
+    """
+
+    latency_histograms: bool = False
+    default_timeout_seconds: float | None = None
+    timeout_seconds: Mapping[str, float] = field(default_factory=dict)
+    max_concurrency: Mapping[str, int] = field(default_factory=dict)
+    max_queue: Mapping[str, int] = field(default_factory=dict)
+    default_max_queue: int | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> BusSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        default_timeout = raw.get("default_timeout_seconds")
+        default_max_queue = raw.get("default_max_queue")
+        return cls(
+            latency_histograms=bool(raw.get("latency_histograms", False)),
+            default_timeout_seconds=None if default_timeout is None else float(default_timeout),
+            timeout_seconds={
+                str(name): float(seconds)
+                for name, seconds in dict(raw.get("timeout_seconds") or {}).items()
+            },
+            max_concurrency={
+                str(name): int(limit)
+                for name, limit in dict(raw.get("max_concurrency") or {}).items()
+            },
+            max_queue={
+                str(name): int(depth) for name, depth in dict(raw.get("max_queue") or {}).items()
+            },
+            default_max_queue=None if default_max_queue is None else int(default_max_queue),
+        )
+
+
+def install_bus_middlewares(
+    settings: BusSettings,
+    *buses: CommandBus | QueryBus,
+) -> LatencyHistogramMiddleware | None:
+    """Install configured middlewares on `buses`, outermost first.
+
+    Order is latency, then timeout, then concurrency, so histograms and time
+    budgets include time spent waiting for a concurrency slot.
+    """
+    latency = LatencyHistogramMiddleware() if settings.latency_histograms else None
+    timeout = (
+        TimeoutMiddleware(
+            settings.timeout_seconds, default_seconds=settings.default_timeout_seconds
+        )
+        if settings.timeout_seconds or settings.default_timeout_seconds
+        else None
+    )
+    concurrency = (
+        ConcurrencyLimitMiddleware(
+            settings.max_concurrency,
+            max_queue=settings.max_queue,
+            default_max_queue=settings.default_max_queue,
+        )
+        if settings.max_concurrency
+        else None
+    )
+    for bus in buses:
+        for middleware in (latency, timeout, concurrency):
+            if middleware is not None:
+                bus.use(middleware)
+    return latency
@@ -2,24 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import cast
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
 
 from orchid_commons import PostgresProvider, RedisCache, ResourceManager
 from orchid_commons.config.models import AppSettings
+from pydantic import BaseModel
 
 from sackmesser.application.bus import CommandBus, QueryBus
 from sackmesser.application.handlers.core import (
+    GetBusMetricsQueryHandler,
     GetCapabilitiesQueryHandler,
     GetHealthQueryHandler,
 )
+from sackmesser.application.middleware import LatencyHistogramMiddleware
+from sackmesser.application.query_cache import QueryResultCache
 from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
     GetCapabilitiesQuery,
+    GetCapabilitiesResult,
     GetHealthQuery,
 )
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.domain.ports.core_ports import StatementMetricsPort
 from sackmesser.infrastructure.core.capability_provider import ManifestCapabilityProvider
 from sackmesser.infrastructure.core.health_provider import ResourceManagerHealthProvider
+from sackmesser.infrastructure.runtime.bus_settings import BusSettings, install_bus_middlewares
 from sackmesser.infrastructure.runtime.modules import ModuleMetadata
+from sackmesser.infrastructure.runtime.options import option_section
+from sackmesser.infrastructure.runtime.query_cache import QueryCacheSettings, build_query_cache
+from sackmesser.infrastructure.runtime.warmup import (
+    PrewarmSettings,
+    prewarm,
+    prewarm_postgres,
+    prewarm_redis,
+)
 
 
 @dataclass(slots=True)
@@ -31,6 +51,14 @@ class ApplicationContainer:
     resource_manager: ResourceManager
     command_bus: CommandBus
     query_bus: QueryBus
+    closers: list[Callable[[], Awaitable[None]]] = field(default_factory=list)
+    latency: LatencyHistogramMiddleware | None = None
+
+    async def aclose(self) -> None:
+        """Release container-owned background work, most recently added first."""
+        closers, self.closers = self.closers, []
+        for closer in reversed(closers):
+            await closer()
 
 
 async def build_container(
@@ -39,8 +67,16 @@ async def build_container(
     enabled_modules: frozenset[str],
     module_manifest: dict[str, ModuleMetadata],
     manager: ResourceManager,
+    options: Mapping[str, Any] | None = None,
 ) -> ApplicationContainer:
-    """Build app container from runtime resources + module selection."""
+    """Build app container from runtime resources + module selection.
+
+    `options` is the raw layered appsettings mapping used for sackmesser-specific
+    tuning that commons settings models do not carry. Startup work that only
+    needs open resources (schema check, partition maintenance, L1 cache
+    subscription, pool prewarming) is collected while wiring and run
+    concurrently at the end; if any of it fails the container is closed again.
+    """
     capability_port = ManifestCapabilityProvider(
         manifest=module_manifest,
         enabled_modules=enabled_modules,
@@ -49,56 +85,293 @@ async def build_container(
 
     command_bus = CommandBus()
     query_bus = QueryBus()
+    closers: list[Callable[[], Awaitable[None]]] = []
+    starters: list[Callable[[], Awaitable[None]]] = []
+    warmups: list[Callable[[], Awaitable[None]]] = []
+    prewarm_settings = PrewarmSettings.from_mapping(
+        option_section(options, "sackmesser", "startup", "prewarm")
+    )
+    latency = install_bus_middlewares(
+        BusSettings.from_mapping(option_section(options, "sackmesser", "bus")),
+        command_bus,
+        query_bus,
+    )
+    redis_options = option_section(options, "resources", "redis")
 
+    @functools.cache
+    def redis_store() -> CacheRepositoryPort:
+        # One repository, and so one raw client, for every Redis-backed cache.
+        from sackmesser.infrastructure.db.redis.cache_repository import RedisCacheRepository
+
+        repository = RedisCacheRepository.from_options(
+            cast("RedisCache", manager.get("redis")), redis_options
+        )
+        closers.append(repository.close)
+        return repository
+
+    query_cache_settings = QueryCacheSettings.from_mapping(
+        option_section(options, "sackmesser", "query_cache")
+    )
+    query_cache = build_query_cache(
+        query_cache_settings,
+        redis_store=redis_store,
+        enabled_modules=enabled_modules,
+    )
+
+    if query_cache is not None:
+        # Outside the bus middlewares, so hits skip timeouts and admission control.
+        query_bus.set_cache(query_cache)
+        command_bus.set_cache(query_cache)
+
+    _cache_query(query_cache, query_cache_settings, GetCapabilitiesQuery, GetCapabilitiesResult)
     query_bus.register(
         GetCapabilitiesQuery,
         GetCapabilitiesQueryHandler(capability_port),
     )
     query_bus.register(GetHealthQuery, GetHealthQueryHandler(health_port))
+    statement_metrics: StatementMetricsPort | None = None
 
     if "postgres" in enabled_modules:
         from sackmesser.application.handlers.workflows import (
             CreateWorkflowCommandHandler,
+            CreateWorkflowsBatchCommandHandler,
+            ExportWorkflowsQueryHandler,
+            GetWorkflowQueryHandler,
+            GetWorkflowsQueryHandler,
+            ListWorkflowsJsonQueryHandler,
             ListWorkflowsQueryHandler,
+            SearchWorkflowsQueryHandler,
+            UpdateWorkflowPayloadCommandHandler,
         )
         from sackmesser.application.requests.workflows import (
             CreateWorkflowCommand,
+            CreateWorkflowsBatchCommand,
+            ExportWorkflowsQuery,
+            GetWorkflowQuery,
+            GetWorkflowsQuery,
+            ListWorkflowsJsonQuery,
+            ListWorkflowsJsonResult,
             ListWorkflowsQuery,
+            ListWorkflowsResult,
+            SearchWorkflowsQuery,
+            UpdateWorkflowPayloadCommand,
         )
+        from sackmesser.domain.ports.workflow_ports import (
+            WorkflowLookupPort,
+            WorkflowPayloadUpdatePort,
+            WorkflowRepositoryPort,
+        )
+        from sackmesser.infrastructure.db.postgres.migrations import MigrationSettings
+        from sackmesser.infrastructure.db.postgres.partitioning import (
+            WorkflowPartitioningSettings,
+            WorkflowPartitionMaintainer,
+        )
+        from sackmesser.infrastructure.db.postgres.replicas import (
+            PostgresReplicaRouter,
+            PostgresReplicaSettings,
+            open_replica_providers,
+        )
+        from sackmesser.infrastructure.db.postgres.statements import PostgresStatementRegistry
         from sackmesser.infrastructure.db.postgres.workflow_repository import (
             PostgresWorkflowRepository,
         )
+        from sackmesser.infrastructure.db.redis.workflow_cache import (
+            CachedWorkflowRepository,
+            WorkflowCacheSettings,
+        )
 
         provider = cast("PostgresProvider", manager.get("postgres"))
-        workflow_repository = PostgresWorkflowRepository(provider)
-        await workflow_repository.ensure_schema()
+        workflow_options = option_section(options, "sackmesser", "workflows")
+        partitioning = WorkflowPartitioningSettings.from_mapping(
+            option_section(workflow_options, "partitioning")
+        )
+        postgres_options = option_section(options, "resources", "postgres")
+        replica_settings = PostgresReplicaSettings.from_mapping(
+            option_section(postgres_options, "read_replicas")
+        )
+        router: PostgresReplicaRouter | None = None
+        replicas: list[PostgresProvider] = []
+        if replica_settings.enabled:
+            replicas = await open_replica_providers(postgres_options, replica_settings)
+            closers.extend(replica.close for replica in replicas)
+            router = PostgresReplicaRouter(
+                provider,
+                replicas,
+                sticky_seconds=replica_settings.sticky_seconds,
+            )
+            # Shared results may come from a lagging replica; sessions that just
+            # wrote must not be served them.
+            query_bus.set_session_pins(router)
+            if query_cache is not None:
+                query_cache.pins = router
+        statements = PostgresStatementRegistry(provider)
+        statement_metrics = statements
+        workflow_repository = PostgresWorkflowRepository(
+            provider,
+            partitioned=partitioning.enabled,
+            statements=statements,
+            router=router,
+            id_format=workflow_options.get("id_format", "uuid4"),
+        )
+        migrations = MigrationSettings.from_mapping(
+            option_section(options, "sackmesser", "migrations")
+        )
+        maintainer: WorkflowPartitionMaintainer | None = None
+        if partitioning.enabled:
+            maintainer = WorkflowPartitionMaintainer(provider, partitioning)
+            closers.append(maintainer.close)
+
+        async def start_workflow_schema() -> None:
+            if migrations.apply_on_startup:
+                await workflow_repository.ensure_schema()
+            else:
+                await workflow_repository.check_schema()
+            if maintainer is not None:
+                await maintainer.start()
+
+        starters.append(start_workflow_schema)
+        pool_size = prewarm_settings.postgres_pool_size(postgres_options)
+        warmups.extend(
+            functools.partial(prewarm_postgres, pool, pool_size) for pool in [provider, *replicas]
+        )
+        lookup_cache = WorkflowCacheSettings.from_mapping(
+            option_section(workflow_options, "lookup_cache")
+        )
+        workflow_writer: WorkflowRepositoryPort = workflow_repository
+        workflow_lookup: WorkflowLookupPort = workflow_repository
+        workflow_updater: WorkflowPayloadUpdatePort = workflow_repository
+        if lookup_cache.enabled:
+            if "redis" not in enabled_modules:
+                msg = "workflows lookup_cache requires the redis module to be enabled"
+                raise ValueError(msg)
+            cached_repository = CachedWorkflowRepository(
+                workflow_repository,
+                redis_store(),
+                lookup_cache,
+                router=router,
+            )
+            workflow_writer = workflow_lookup = workflow_updater = cached_repository
+
+        _cache_query(
+            query_cache,
+            query_cache_settings,
+            ListWorkflowsQuery,
+            ListWorkflowsResult,
+            "workflows",
+        )
+        _cache_query(
+            query_cache,
+            query_cache_settings,
+            ListWorkflowsJsonQuery,
+            ListWorkflowsJsonResult,
+            "workflows",
+        )
+        _cache_query(
+            query_cache,
+            query_cache_settings,
+            SearchWorkflowsQuery,
+            ListWorkflowsResult,
+            "workflows",
+        )
+        if query_cache is not None:
+            query_cache.invalidate_on(CreateWorkflowCommand, "workflows")
+            query_cache.invalidate_on(CreateWorkflowsBatchCommand, "workflows")
+            query_cache.invalidate_on(UpdateWorkflowPayloadCommand, "workflows")
 
         command_bus.register(
             CreateWorkflowCommand,
-            CreateWorkflowCommandHandler(workflow_repository),
+            CreateWorkflowCommandHandler(workflow_writer),
+        )
+        command_bus.register(
+            CreateWorkflowsBatchCommand,
+            CreateWorkflowsBatchCommandHandler(workflow_writer),
+        )
+        command_bus.register(
+            UpdateWorkflowPayloadCommand,
+            UpdateWorkflowPayloadCommandHandler(workflow_updater),
         )
         query_bus.register(
             ListWorkflowsQuery,
-            ListWorkflowsQueryHandler(workflow_repository),
+            ListWorkflowsQueryHandler(
+                workflow_repository, counter=workflow_repository, ids=workflow_repository
+            ),
+            coalesce=True,
+        )
+        query_bus.register(
+            ListWorkflowsJsonQuery,
+            ListWorkflowsJsonQueryHandler(
+                workflow_repository, counter=workflow_repository, ids=workflow_repository
+            ),
+            coalesce=True,
+        )
+        query_bus.register(
+            SearchWorkflowsQuery,
+            SearchWorkflowsQueryHandler(workflow_repository, ids=workflow_repository),
+            coalesce=True,
+        )
+        query_bus.register(
+            ExportWorkflowsQuery,
+            ExportWorkflowsQueryHandler(workflow_repository, ids=workflow_repository),
+        )
+        query_bus.register(
+            GetWorkflowQuery,
+            GetWorkflowQueryHandler(workflow_lookup),
+            coalesce=True,
+        )
+        query_bus.register(
+            GetWorkflowsQuery,
+            GetWorkflowsQueryHandler(workflow_lookup),
+            coalesce=True,
         )
 
     if "redis" in enabled_modules:
         from sackmesser.application.handlers.cache import (
+            DeleteCacheEntriesCommandHandler,
             DeleteCacheEntryCommandHandler,
+            GetCacheEntriesQueryHandler,
             GetCacheEntryQueryHandler,
+            GetCacheStatsQueryHandler,
+            SetCacheEntriesCommandHandler,
             SetCacheEntryCommandHandler,
         )
         from sackmesser.application.requests.cache import (
+            DeleteCacheEntriesCommand,
             DeleteCacheEntryCommand,
+            GetCacheEntriesQuery,
             GetCacheEntryQuery,
+            GetCacheStatsQuery,
+            SetCacheEntriesCommand,
             SetCacheEntryCommand,
         )
-        from sackmesser.infrastructure.db.redis.cache_repository import (
-            RedisCacheRepository,
+        from sackmesser.infrastructure.db.redis.invalidation import RedisInvalidationChannel
+        from sackmesser.infrastructure.db.redis.local_cache import (
+            LocalCacheRepository,
+            LocalCacheSettings,
         )
 
-        redis_cache = cast("RedisCache", manager.get("redis"))
-        cache_repository = RedisCacheRepository(redis_cache)
+        cache_repository: CacheRepositoryPort = redis_store()
+        warmups.append(functools.partial(prewarm_redis, cache_repository))
+        local_cache: LocalCacheRepository | None = None
+        local_cache_settings = LocalCacheSettings.from_mapping(
+            option_section(redis_options, "l1_cache")
+        )
+        if local_cache_settings.enabled:
+            channel = None
+            if local_cache_settings.invalidation_channel and redis_options.get("url"):
+                key_prefix = redis_options.get("key_prefix")
+                channel_name = local_cache_settings.invalidation_channel
+                channel = RedisInvalidationChannel.from_url(
+                    str(redis_options["url"]),
+                    channel=f"{key_prefix}:{channel_name}" if key_prefix else channel_name,
+                )
+            local_cache = LocalCacheRepository(
+                cache_repository,
+                local_cache_settings,
+                channel=channel,
+            )
+            starters.append(local_cache.start)
+            closers.append(local_cache.close)
+            cache_repository = local_cache
 
         command_bus.register(
             SetCacheEntryCommand,
@@ -107,16 +380,107 @@ async def build_container(
         query_bus.register(
             GetCacheEntryQuery,
             GetCacheEntryQueryHandler(cache_repository),
+            coalesce=True,
         )
         command_bus.register(
             DeleteCacheEntryCommand,
             DeleteCacheEntryCommandHandler(cache_repository),
         )
+        command_bus.register(
+            SetCacheEntriesCommand,
+            SetCacheEntriesCommandHandler(cache_repository),
+        )
+        query_bus.register(
+            GetCacheEntriesQuery,
+            GetCacheEntriesQueryHandler(cache_repository),
+            coalesce=True,
+        )
+        command_bus.register(
+            DeleteCacheEntriesCommand,
+            DeleteCacheEntriesCommandHandler(cache_repository),
+        )
+        query_bus.register(GetCacheStatsQuery, GetCacheStatsQueryHandler(local_cache))
 
-    return ApplicationContainer(
+    query_bus.register(
+        GetBusMetricsQuery,
+        GetBusMetricsQueryHandler(latency, statements=statement_metrics),
+    )
+    container = ApplicationContainer(
         settings=settings,
         enabled_modules=enabled_modules,
         resource_manager=manager,
         command_bus=command_bus,
         query_bus=query_bus,
+        closers=closers,
+        latency=latency,
+    )
+    if prewarm_settings.enabled and warmups:
+        starters.append(functools.partial(prewarm, warmups, prewarm_settings))
+    try:
+        await _start_concurrently(starters)
+    except BaseException:
+        await container.aclose()
+        raise
+    return container
+
+
+async def migrate_workflow_schema(
+    provider: PostgresProvider,
+    options: Mapping[str, Any] | None = None,
+    *,
+    check: bool = False,
+) -> list[str]:
+    """Apply pending workflow migrations and return their labels.
+
+    With `check`, nothing is changed and the pending labels are returned. When
+    partitioning is enabled a maintenance pass follows, so upcoming partitions
+    exist before new processes start.
+    """
+    from sackmesser.infrastructure.db.postgres.partitioning import (
+        WorkflowPartitioningSettings,
+        WorkflowPartitionMaintainer,
     )
+    from sackmesser.infrastructure.db.postgres.workflow_repository import (
+        PostgresWorkflowRepository,
+    )
+
+    workflow_options = option_section(options, "sackmesser", "workflows")
+    partitioning = WorkflowPartitioningSettings.from_mapping(
+        option_section(workflow_options, "partitioning")
+    )
+    repository = PostgresWorkflowRepository(
+        provider,
+        partitioned=partitioning.enabled,
+        id_format=workflow_options.get("id_format", "uuid4"),
+    )
+    if check:
+        return [item.label for item in await repository.pending_migrations()]
+    applied = await repository.ensure_schema()
+    if partitioning.enabled:
+        await WorkflowPartitionMaintainer(provider, partitioning).maintain()
+    return [item.label for item in applied]
+
+
+async def _start_concurrently(starters: Sequence[Callable[[], Awaitable[None]]]) -> None:
+    """Run `starters` together; on the first failure cancel the rest and re-raise it."""
+    tasks = [asyncio.ensure_future(starter()) for starter in starters]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _cache_query(
+    query_cache: QueryResultCache | None,
+    settings: QueryCacheSettings,
+    query_type: type[BaseModel],
+    result_type: type[BaseModel],
+    *tags: str,
+) -> None:
+    """Cache `query_type` results when a TTL is configured for its class name."""
+    ttl_seconds = settings.ttl_seconds.get(query_type.__name__)
+    if query_cache is not None and ttl_seconds:
+        query_cache.cache_query(query_type, result_type, ttl_seconds=ttl_seconds, tags=tags)
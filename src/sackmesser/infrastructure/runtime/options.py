@@ -0,0 +1,47 @@
+"""Raw appsettings access for sackmesser-specific options."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+
+def load_app_options(*, config_dir: Path, env: str) -> dict[str, Any]:
+    """Load `appsettings.json` merged with `appsettings.<env>.json` as plain dicts.
+
+    Commons `load_config` only keeps the fields its models know about; options
+    consumed by sackmesser itself (e.g. `resources.redis.l1_cache`) are read
+    from the same layered files here.
+    """
+    options: dict[str, Any] = {}
+    for path in (config_dir / "appsettings.json", config_dir / f"appsettings.{env}.json"):
+        if not path.exists():
+            continue
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(payload, dict):
+            options = merge_options(options, payload)
+    return options
+
+
+def merge_options(base: Mapping[str, Any], overlay: Mapping[str, Any]) -> dict[str, Any]:
+    """Deep-merge `overlay` into `base`; nested mappings merge, other values replace."""
+    merged = dict(base)
+    for key, value in overlay.items():
+        current = merged.get(key)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged[key] = merge_options(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def option_section(options: Mapping[str, Any] | None, *path: str) -> dict[str, Any]:
+    """Return the mapping at `path` (e.g. `"resources", "redis"`), or an empty dict."""
+    current: object = options or {}
+    for key in path:
+        if not isinstance(current, Mapping):
+            return {}
+        current = current.get(key)
+    return dict(current) if isinstance(current, Mapping) else {}
@@ -0,0 +1,67 @@
+"""Query result cache configuration (`sackmesser.query_cache` in appsettings)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from sackmesser.application.query_cache import QueryResultCache
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.infrastructure.core.memory_cache_repository import MemoryCacheRepository
+
+QUERY_CACHE_BACKENDS = ("memory", "redis")
+
+
+@dataclass(frozen=True, slots=True)
+class QueryCacheSettings:
+    """Backend selection and per-query-type TTLs, keyed by query class name."""
+
+    enabled: bool = False
+    backend: str = "memory"
+    max_entries: int = 1_000
+    ttl_seconds: Mapping[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.backend not in QUERY_CACHE_BACKENDS:
+            msg = f"query_cache backend must be one of {QUERY_CACHE_BACKENDS}, got {self.backend!r}"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> QueryCacheSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        ttl_seconds = raw.get("ttl_seconds") or {}
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            backend=str(raw.get("backend", defaults.backend)),
+            max_entries=int(raw.get("max_entries", defaults.max_entries)),
+            ttl_seconds={str(name): int(ttl) for name, ttl in dict(ttl_seconds).items()},
+        )
+
+
+def build_query_cache(
+    settings: QueryCacheSettings,
+    *,
+    redis_store: Callable[[], CacheRepositoryPort],
+    enabled_modules: frozenset[str],
+) -> QueryResultCache | None:
+    """Create the query result cache for the configured backend, if enabled.
+
+    `redis_store` returns the shared Redis cache repository; it is only called
+    for the redis backend.
+    """
+    if not settings.enabled:
+        return None
+
+    store: CacheRepositoryPort
+    if settings.backend == "redis":
+        if "redis" not in enabled_modules:
+            msg = "query_cache backend 'redis' requires the redis module to be enabled"
+            raise ValueError(msg)
+        store = redis_store()
+    else:
+        store = MemoryCacheRepository(max_entries=settings.max_entries)
+    return QueryResultCache(store)
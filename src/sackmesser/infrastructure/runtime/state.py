@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
 from orchid_commons import (
+    PostgresProvider,
     ResourceManager,
     bootstrap_logging_from_app_settings,
     load_config,
 )
 from orchid_commons.config.models import AppSettings
 
-from sackmesser.infrastructure.runtime.container import ApplicationContainer, build_container
+from sackmesser.infrastructure.runtime.container import (
+    ApplicationContainer,
+    build_container,
+    migrate_workflow_schema,
+)
 from sackmesser.infrastructure.runtime.modules import (
     ModuleMetadata,
     load_enabled_modules,
@@ -22,6 +30,9 @@ from sackmesser.infrastructure.runtime.modules import (
     required_resource_names,
     resolve_enabled_modules,
 )
+from sackmesser.infrastructure.runtime.options import load_app_options
+
+logger = logging.getLogger(__name__)
 
 CONFIG_DIR = Path("config")
 DEFAULT_ENV = "development"
@@ -53,10 +64,21 @@ class RuntimeState:
     manager: ResourceManager
     container: ApplicationContainer
     environment: str
+    options: dict[str, Any] = field(default_factory=dict)
+    boot_seconds: float = 0.0
+    boot_phases: dict[str, float] = field(default_factory=dict)
 
 
 class _RuntimeHolder:
     state: RuntimeState | None = None
+    lock: asyncio.Lock | None = None
+
+
+def _runtime_lock() -> asyncio.Lock:
+    lock = _RuntimeHolder.lock
+    if lock is None:
+        lock = _RuntimeHolder.lock = asyncio.Lock()
+    return lock
 
 
 def resolve_environment(env: str | None = None) -> str:
@@ -100,13 +122,30 @@ def _resources_from_app_settings(settings: AppSettings) -> RuntimeResourceSettin
 
 
 async def startup_runtime(*, env: str | None = None) -> RuntimeState:
-    """Initialize settings, resources and container once."""
+    """Initialize settings, resources and container once.
+
+    Concurrent callers wait for the first one and share its state. Boot time
+    per phase is logged and kept on the returned state.
+    """
     existing = _RuntimeHolder.state
     if existing is not None:
         return existing
+    async with _runtime_lock():
+        existing = _RuntimeHolder.state
+        if existing is not None:
+            return existing
+        state = await _boot_runtime(env)
+        _RuntimeHolder.state = state
+        return state
+
+
+async def _boot_runtime(env: str | None) -> RuntimeState:
+    started = time.perf_counter()
+    phases: dict[str, float] = {}
 
     environment = resolve_environment(env)
     settings = load_config(config_dir=CONFIG_DIR, env=environment)
+    options = load_app_options(config_dir=CONFIG_DIR, env=environment)
     bootstrap_logging_from_app_settings(settings, env=environment)
 
     module_manifest = load_module_manifest()
@@ -115,37 +154,89 @@ async def startup_runtime(*, env: str | None = None) -> RuntimeState:
 
     resource_settings = _resources_from_app_settings(settings)
     selected_resource_settings = _filter_resource_settings(resource_settings, enabled_modules)
+    phase_started = time.perf_counter()
+    phases["config"] = phase_started - started
 
     manager = ResourceManager()
     required_resources = required_resource_names(enabled_modules)
     await manager.startup(cast(Any, selected_resource_settings), required=required_resources)
-
-    container = await build_container(
-        settings=settings,
-        enabled_modules=enabled_modules,
-        module_manifest=module_manifest,
-        manager=manager,
+    phases["resources"] = time.perf_counter() - phase_started
+    phase_started = time.perf_counter()
+
+    try:
+        container = await build_container(
+            settings=settings,
+            enabled_modules=enabled_modules,
+            module_manifest=module_manifest,
+            manager=manager,
+            options=options,
+        )
+    except BaseException:
+        await manager.close_all()
+        raise
+    phases["container"] = time.perf_counter() - phase_started
+    boot_seconds = time.perf_counter() - started
+    logger.info(
+        "Runtime ready in %.0f ms (%s)",
+        boot_seconds * 1000,
+        ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in phases.items()),
     )
 
-    state = RuntimeState(
+    return RuntimeState(
         settings=settings,
         enabled_modules=enabled_modules,
         module_manifest=module_manifest,
         manager=manager,
         container=container,
         environment=environment,
+        options=options,
+        boot_seconds=boot_seconds,
+        boot_phases=phases,
     )
-    _RuntimeHolder.state = state
-    return state
+
+
+async def migrate_runtime(*, env: str | None = None, check: bool = False) -> list[str]:
+    """Apply pending schema migrations without starting the application.
+
+    Only the postgres resource is opened. Returns the labels of the migrations
+    applied, or with `check` the ones still pending; empty when the postgres
+    module is disabled.
+    """
+    environment = resolve_environment(env)
+    settings = load_config(config_dir=CONFIG_DIR, env=environment)
+    options = load_app_options(config_dir=CONFIG_DIR, env=environment)
+    bootstrap_logging_from_app_settings(settings, env=environment)
+
+    enabled_modules = resolve_enabled_modules(load_enabled_modules(), load_module_manifest())
+    if "postgres" not in enabled_modules:
+        return []
+
+    postgres_only = frozenset({"postgres"})
+    resource_settings = _filter_resource_settings(
+        _resources_from_app_settings(settings), postgres_only
+    )
+    manager = ResourceManager()
+    await manager.startup(
+        cast(Any, resource_settings), required=required_resource_names(postgres_only)
+    )
+    try:
+        provider = cast("PostgresProvider", manager.get("postgres"))
+        return await migrate_workflow_schema(provider, options, check=check)
+    finally:
+        await manager.close_all()
 
 
 async def shutdown_runtime() -> None:
     """Shutdown resources and clear runtime holder."""
-    state = _RuntimeHolder.state
-    _RuntimeHolder.state = None
-    if state is None:
-        return
-    await state.manager.close_all()
+    async with _runtime_lock():
+        state = _RuntimeHolder.state
+        _RuntimeHolder.state = None
+        if state is None:
+            return
+        try:
+            await state.container.aclose()
+        finally:
+            await state.manager.close_all()
 
 
 def get_runtime_state() -> RuntimeState:
@@ -165,3 +256,4 @@ def get_runtime_container() -> ApplicationContainer:
 def reset_runtime_state_for_tests() -> None:
     """Reset state holder for isolated tests."""
     _RuntimeHolder.state = None
+    _RuntimeHolder.lock = None
@@ -0,0 +1,89 @@
+"""Connection pool prewarming (`sackmesser.startup.prewarm` in appsettings)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from orchid_commons import PostgresProvider
+
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+_REDIS_PROBE_KEY = "sackmesser:prewarm"
+
+
+@dataclass(frozen=True, slots=True)
+class PrewarmSettings:
+    """Pool prewarming at startup.
+
+    Each Postgres pool gets `postgres_connections` concurrent probe queries,
+    which makes it open that many connections before the first request; None
+    uses the pool's `min_pool_size`. Redis gets one round-trip. Warming is
+    best effort: failures and timeouts are logged, not raised.
+    """
+
+    enabled: bool = True
+    postgres_connections: int | None = None
+    timeout_seconds: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.postgres_connections is not None and self.postgres_connections < 1:
+            msg = "prewarm postgres_connections must be positive"
+            raise ValueError(msg)
+        if self.timeout_seconds <= 0:
+            msg = "prewarm timeout_seconds must be positive"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> PrewarmSettings:
+        """Build settings from a raw appsettings section, keeping defaults for gaps."""
+        if not raw:
+            return cls()
+        defaults = cls()
+        connections = raw.get("postgres_connections", defaults.postgres_connections)
+        return cls(
+            enabled=bool(raw.get("enabled", defaults.enabled)),
+            postgres_connections=None if connections is None else int(connections),
+            timeout_seconds=float(raw.get("timeout_seconds", defaults.timeout_seconds)),
+        )
+
+    def postgres_pool_size(self, pool_options: Mapping[str, Any]) -> int:
+        """Return how many connections to open for a pool with `pool_options`."""
+        if self.postgres_connections is not None:
+            return self.postgres_connections
+        return max(1, int(pool_options.get("min_pool_size", 1)))
+
+
+async def prewarm_postgres(provider: PostgresProvider, connections: int) -> None:
+    """Run `connections` probe queries at once so each holds its own connection."""
+    await asyncio.gather(*(provider.fetchone("SELECT 1", ()) for _ in range(connections)))
+
+
+async def prewarm_redis(cache: CacheRepositoryPort) -> None:
+    """Make one round-trip so the cache client has a connected socket."""
+    await cache.get(_REDIS_PROBE_KEY)
+
+
+async def prewarm(
+    warmups: Sequence[Callable[[], Awaitable[None]]],
+    settings: PrewarmSettings,
+) -> None:
+    """Run `warmups` concurrently within the configured timeout, logging failures."""
+    if not settings.enabled or not warmups:
+        return
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(warmup() for warmup in warmups), return_exceptions=True),
+            timeout=settings.timeout_seconds,
+        )
+    except TimeoutError:
+        logger.warning("Pool prewarming timed out after %.1fs", settings.timeout_seconds)
+        return
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Pool prewarming failed", exc_info=result)
@@ -9,21 +9,39 @@ import uvicorn
 from orchid_commons import load_config
 
 from sackmesser.adapters.mcp import run_mcp_server
-from sackmesser.infrastructure.runtime.state import resolve_environment
+from sackmesser.infrastructure.runtime.state import migrate_runtime, resolve_environment
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Orchid MCP template service")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("serve", "migrate"),
+        default="serve",
+        help="serve (default) runs the service; migrate applies pending schema migrations",
+    )
     parser.add_argument(
         "--mcp",
         action="store_true",
-        help="Run MCP server on stdio instead of HTTP API",
+        help="Run MCP server instead of HTTP API",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http"),
+        default="stdio",
+        help="MCP transport: stdio (one client) or streamable HTTP (many clients)",
     )
     parser.add_argument(
         "--reload",
         action="store_true",
         help="Enable uvicorn autoreload in API mode",
     )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="With migrate: only list pending migrations, exiting 1 if there are any",
+    )
     return parser
 
 
@@ -38,8 +56,36 @@ def run_api(reload: bool) -> None:
     )
 
 
+def run_mcp_http(reload: bool) -> None:
+    environment = resolve_environment()
+    settings = load_config(config_dir="config", env=environment)
+    uvicorn.run(
+        "sackmesser.adapters.api.main:create_mcp_http_app",
+        factory=True,
+        host=settings.service.host,
+        port=settings.service.port,
+        reload=reload,
+    )
+
+
+def run_migrate(check: bool) -> int:
+    labels = asyncio.run(migrate_runtime(check=check))
+    if not labels:
+        print("Schema is up to date")
+        return 0
+    print("Pending migrations:" if check else "Applied migrations:")
+    for label in labels:
+        print(f"  {label}")
+    return 1 if check else 0
+
+
 def main() -> None:
     args = build_parser().parse_args()
+    if args.command == "migrate":
+        raise SystemExit(run_migrate(check=args.check))
+    if args.mcp and args.transport == "http":
+        run_mcp_http(reload=args.reload)
+        return
     if args.mcp:
         asyncio.run(run_mcp_server())
         return
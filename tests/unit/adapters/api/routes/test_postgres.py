@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 from typing import Any
 
 import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
 
-from sackmesser.adapters.api.routes.postgres import create_workflow, list_workflows
-from sackmesser.adapters.api.schemas import CreateWorkflowRequest
+from sackmesser.adapters.api.error_handler import register_exception_handlers
+from sackmesser.adapters.api.responses import FastJSONResponse
+from sackmesser.adapters.api.routes.postgres import (
+    create_workflow,
+    create_workflows_batch,
+    export_workflows,
+    get_workflow,
+    get_workflows,
+    list_workflows,
+    router,
+    search_workflows,
+    update_workflow_payload,
+)
+from sackmesser.adapters.api.schemas import (
+    CreateWorkflowRequest,
+    CreateWorkflowsBatchRequest,
+    GetWorkflowsRequest,
+    SearchWorkflowsRequest,
+    UpdateWorkflowPayloadRequest,
+    WorkflowPayloadSetRequest,
+)
+from sackmesser.adapters.dependencies import get_container
 from sackmesser.application.errors import DisabledModuleError
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
     CreateWorkflowResult,
-    ListWorkflowsQuery,
+    CreateWorkflowsBatchCommand,
+    CreateWorkflowsBatchResult,
+    ExportWorkflowsQuery,
+    ExportWorkflowsResult,
+    GetWorkflowQuery,
+    GetWorkflowResult,
+    GetWorkflowsQuery,
+    GetWorkflowsResult,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsJsonResult,
     ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    UpdateWorkflowPayloadResult,
     WorkflowDto,
 )
 
@@ -23,8 +58,32 @@ class _FakeCommandBus:
     def __init__(self) -> None:
         self.calls: list[Any] = []
 
-    async def dispatch(self, command: CreateWorkflowCommand) -> CreateWorkflowResult:
+    async def dispatch(
+        self,
+        command: CreateWorkflowCommand | CreateWorkflowsBatchCommand | UpdateWorkflowPayloadCommand,
+    ) -> CreateWorkflowResult | CreateWorkflowsBatchResult | UpdateWorkflowPayloadResult:
         self.calls.append(command)
+        if isinstance(command, UpdateWorkflowPayloadCommand):
+            return UpdateWorkflowPayloadResult(
+                workflow=WorkflowDto(
+                    id=command.id,
+                    title="demo",
+                    payload=command.merge or {},
+                    created_at=datetime(2026, 1, 1, tzinfo=UTC),
+                )
+            )
+        if isinstance(command, CreateWorkflowsBatchCommand):
+            return CreateWorkflowsBatchResult(
+                workflows=[
+                    WorkflowDto(
+                        id=f"wf-{index}",
+                        title=item.title,
+                        payload=item.payload,
+                        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+                    )
+                    for index, item in enumerate(command.workflows, start=1)
+                ]
+            )
         return CreateWorkflowResult(
             workflow=WorkflowDto(
                 id="wf-1",
@@ -39,9 +98,29 @@ class _FakeQueryBus:
     def __init__(self) -> None:
         self.calls: list[Any] = []
 
-    async def dispatch(self, query: ListWorkflowsQuery) -> ListWorkflowsResult:
+    async def dispatch(
+        self,
+        query: ListWorkflowsJsonQuery
+        | SearchWorkflowsQuery
+        | ExportWorkflowsQuery
+        | GetWorkflowQuery
+        | GetWorkflowsQuery,
+    ) -> (
+        ListWorkflowsJsonResult
+        | ListWorkflowsResult
+        | ExportWorkflowsResult
+        | GetWorkflowResult
+        | GetWorkflowsResult
+    ):
         self.calls.append(query)
-        return ListWorkflowsResult(
+        if isinstance(query, ExportWorkflowsQuery):
+            chunks = {
+                None: ExportWorkflowsResult(ndjson='{"id":"wf-1"}\n', count=1, next_cursor="c1"),
+                "c1": ExportWorkflowsResult(ndjson='{"id":"wf-2"}\n', count=1, next_cursor="c2"),
+                "c2": ExportWorkflowsResult(ndjson="", count=0),
+            }
+            return chunks[query.cursor]
+        result = ListWorkflowsResult(
             workflows=[
                 WorkflowDto(
                     id="wf-1",
@@ -51,6 +130,17 @@ class _FakeQueryBus:
                 )
             ]
         )
+        if isinstance(query, SearchWorkflowsQuery):
+            return result
+        if isinstance(query, GetWorkflowQuery):
+            return GetWorkflowResult(workflow=result.workflows[0])
+        if isinstance(query, GetWorkflowsQuery):
+            return GetWorkflowsResult(workflows=result.workflows, missing=list(query.ids[1:]))
+        return ListWorkflowsJsonResult(content=result.model_dump_json())
+
+
+def _json(response: FastJSONResponse | Response) -> dict[str, Any]:
+    return json.loads(response.body)
 
 
 class _Container:
@@ -64,8 +154,10 @@ async def test_create_workflow_route_dispatches_command() -> None:
     container = _Container(enabled_modules={"core", "postgres"})
     body = CreateWorkflowRequest(title="demo", payload={"k": "v"})
 
-    payload = await create_workflow(body, container)
+    response = await create_workflow(body, container)
+    payload = _json(response)
 
+    assert response.status_code == 201
     assert payload["workflow"]["title"] == "demo"
     command = container.command_bus.calls[0]
     assert isinstance(command, CreateWorkflowCommand)
@@ -82,16 +174,55 @@ async def test_create_workflow_route_raises_if_module_disabled() -> None:
     assert exc_info.value.code == "module_disabled"
 
 
+async def test_create_workflows_batch_route_dispatches_single_command() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+    body = CreateWorkflowsBatchRequest(
+        workflows=[
+            CreateWorkflowRequest(title="one"),
+            CreateWorkflowRequest(title="two", payload={"k": "v"}),
+        ]
+    )
+
+    payload = _json(await create_workflows_batch(body, container))
+
+    assert [item["title"] for item in payload["workflows"]] == ["one", "two"]
+    assert len(container.command_bus.calls) == 1
+    command = container.command_bus.calls[0]
+    assert isinstance(command, CreateWorkflowsBatchCommand)
+    assert command.workflows[1].payload == {"k": "v"}
+
+
+async def test_create_workflows_batch_route_raises_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+    body = CreateWorkflowsBatchRequest(workflows=[CreateWorkflowRequest(title="one")])
+
+    with pytest.raises(DisabledModuleError):
+        await create_workflows_batch(body, container)
+
+
 async def test_list_workflows_route_dispatches_query() -> None:
     container = _Container(enabled_modules={"core", "postgres"})
 
-    payload = await list_workflows(container, limit=5, offset=2)
+    response = await list_workflows(container, limit=5, offset=2)
+    payload = _json(response)
 
+    assert response.media_type == "application/json"
     assert len(payload["workflows"]) == 1
     query = container.query_bus.calls[0]
-    assert isinstance(query, ListWorkflowsQuery)
+    assert isinstance(query, ListWorkflowsJsonQuery)
     assert query.limit == 5
     assert query.offset == 2
+    assert query.cursor is None
+
+
+async def test_list_workflows_route_forwards_cursor() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    await list_workflows(container, limit=5, offset=0, cursor="token", include_total=True)
+
+    query = container.query_bus.calls[0]
+    assert query.cursor == "token"
+    assert query.include_total is True
 
 
 async def test_list_workflows_route_raises_if_module_disabled() -> None:
@@ -101,3 +232,122 @@ async def test_list_workflows_route_raises_if_module_disabled() -> None:
         await list_workflows(container, limit=5, offset=0)
 
     assert exc_info.value.code == "module_disabled"
+
+
+async def test_export_workflows_route_streams_every_chunk() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    response = await export_workflows(container, batch_size=1)
+    body = "".join([chunk async for chunk in response.body_iterator])  # type: ignore[misc]
+
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in body.splitlines()] == ["wf-1", "wf-2"]
+    assert [query.cursor for query in container.query_bus.calls] == [None, "c1", "c2"]
+    assert all(query.limit == 1 for query in container.query_bus.calls)
+
+
+async def test_export_workflows_route_raises_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(DisabledModuleError):
+        await export_workflows(container)
+
+
+async def test_search_workflows_route_dispatches_query() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+    body = SearchWorkflowsRequest(title="demo", payload_contains={"k": "v"}, limit=5)
+
+    payload = _json(await search_workflows(body, container))
+
+    assert payload["workflows"][0]["title"] == "demo"
+    query = container.query_bus.calls[0]
+    assert isinstance(query, SearchWorkflowsQuery)
+    assert query.title == "demo"
+    assert query.payload_contains == {"k": "v"}
+    assert query.limit == 5
+
+
+async def test_search_workflows_route_raises_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(DisabledModuleError):
+        await search_workflows(SearchWorkflowsRequest(title="demo"), container)
+
+
+async def test_get_workflow_route_dispatches_query() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    payload = _json(await get_workflow("wf-1", container))
+
+    assert payload["workflow"]["id"] == "wf-1"
+    query = container.query_bus.calls[0]
+    assert isinstance(query, GetWorkflowQuery)
+    assert query.id == "wf-1"
+
+
+async def test_get_workflows_route_reports_missing_ids() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    payload = _json(await get_workflows(GetWorkflowsRequest(ids=["wf-1", "wf-9"]), container))
+
+    assert [item["id"] for item in payload["workflows"]] == ["wf-1"]
+    assert payload["missing"] == ["wf-9"]
+    query = container.query_bus.calls[0]
+    assert isinstance(query, GetWorkflowsQuery)
+    assert query.ids == ("wf-1", "wf-9")
+
+
+async def test_get_workflow_routes_raise_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(DisabledModuleError):
+        await get_workflow("wf-1", container)
+    with pytest.raises(DisabledModuleError):
+        await get_workflows(GetWorkflowsRequest(ids=["wf-1"]), container)
+
+
+def test_get_workflow_route_does_not_capture_fixed_paths() -> None:
+    paths = [getattr(route, "path", "") for route in router.routes]
+
+    assert paths.index("/api/v1/workflows/{workflow_id}") > paths.index("/api/v1/workflows/export")
+
+
+async def test_update_workflow_payload_route_dispatches_command() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+    body = UpdateWorkflowPayloadRequest(
+        merge={"status": "done"},
+        sets=[WorkflowPayloadSetRequest(path=["meta", "owner"], value="ops")],
+    )
+
+    payload = _json(await update_workflow_payload("wf-1", body, container))
+
+    assert payload["workflow"]["payload"] == {"status": "done"}
+    command = container.command_bus.calls[0]
+    assert isinstance(command, UpdateWorkflowPayloadCommand)
+    assert command.id == "wf-1"
+    assert command.merge == {"status": "done"}
+    assert [(item.path, item.value) for item in command.sets] == [(("meta", "owner"), "ops")]
+
+
+async def test_update_workflow_payload_route_raises_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(DisabledModuleError):
+        await update_workflow_payload("wf-1", UpdateWorkflowPayloadRequest(merge={}), container)
+
+
+@pytest.mark.parametrize("segment", ["", "k" * 201])
+def test_update_workflow_payload_route_rejects_bad_path_segments(segment: str) -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(router)
+    app.dependency_overrides[get_container] = lambda: container
+
+    with TestClient(app) as client:
+        response = client.patch(
+            "/api/v1/workflows/wf-1", json={"sets": [{"path": ["meta", segment]}]}
+        )
+
+    assert response.status_code == 422
+    assert container.command_bus.calls == []
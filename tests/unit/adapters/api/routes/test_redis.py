@@ -6,15 +6,36 @@ from typing import Any
 
 import pytest
 
-from sackmesser.adapters.api.routes.redis import delete_cache, get_cache, set_cache
-from sackmesser.adapters.api.schemas import SetCacheRequest
+from sackmesser.adapters.api.routes.redis import (
+    delete_cache,
+    delete_cache_entries,
+    get_cache,
+    get_cache_entries,
+    get_cache_stats,
+    set_cache,
+    set_cache_entries,
+)
+from sackmesser.adapters.api.schemas import (
+    CacheEntryRequest,
+    CacheKeysRequest,
+    SetCacheEntriesRequest,
+    SetCacheRequest,
+)
 from sackmesser.application.errors import DisabledModuleError, NotFoundError
 from sackmesser.application.requests.cache import (
     CacheEntryDto,
+    DeleteCacheEntriesCommand,
+    DeleteCacheEntriesResult,
     DeleteCacheEntryCommand,
     DeleteCacheEntryResult,
+    GetCacheEntriesQuery,
+    GetCacheEntriesResult,
     GetCacheEntryQuery,
     GetCacheEntryResult,
+    GetCacheStatsQuery,
+    GetCacheStatsResult,
+    SetCacheEntriesCommand,
+    SetCacheEntriesResult,
     SetCacheEntryCommand,
     SetCacheEntryResult,
 )
@@ -26,9 +47,24 @@ class _FakeCommandBus:
 
     async def dispatch(
         self,
-        command: SetCacheEntryCommand | DeleteCacheEntryCommand,
-    ) -> SetCacheEntryResult | DeleteCacheEntryResult:
+        command: SetCacheEntryCommand
+        | DeleteCacheEntryCommand
+        | SetCacheEntriesCommand
+        | DeleteCacheEntriesCommand,
+    ) -> (
+        SetCacheEntryResult
+        | DeleteCacheEntryResult
+        | SetCacheEntriesResult
+        | DeleteCacheEntriesResult
+    ):
         self.calls.append(command)
+        if isinstance(command, SetCacheEntriesCommand):
+            return SetCacheEntriesResult(
+                success=True,
+                keys=[entry.key for entry in command.entries],
+            )
+        if isinstance(command, DeleteCacheEntriesCommand):
+            return DeleteCacheEntriesResult(deleted=len(command.keys), keys=command.keys)
         if isinstance(command, SetCacheEntryCommand):
             return SetCacheEntryResult(success=True, key=command.key)
         if isinstance(command, DeleteCacheEntryCommand):
@@ -42,8 +78,31 @@ class _FakeQueryBus:
         self.found = found
         self.calls: list[Any] = []
 
-    async def dispatch(self, query: GetCacheEntryQuery) -> GetCacheEntryResult:
+    async def dispatch(
+        self, query: GetCacheEntryQuery | GetCacheEntriesQuery | GetCacheStatsQuery
+    ) -> GetCacheEntryResult | GetCacheEntriesResult | GetCacheStatsResult:
         self.calls.append(query)
+        if isinstance(query, GetCacheStatsQuery):
+            return GetCacheStatsResult(
+                enabled=True,
+                hits=3,
+                misses=1,
+                hit_ratio=0.75,
+                evictions=0,
+                expirations=0,
+                invalidations=0,
+                entries=2,
+                bytes=64,
+                max_entries=100,
+                max_bytes=1024,
+            )
+        if isinstance(query, GetCacheEntriesQuery):
+            return GetCacheEntriesResult(
+                entries=[
+                    CacheEntryDto(key=key, value="1" if self.found else None, found=self.found)
+                    for key in query.keys
+                ]
+            )
         return GetCacheEntryResult(
             entry=CacheEntryDto(
                 key=query.key,
@@ -130,3 +189,71 @@ async def test_delete_cache_route_raises_if_module_disabled() -> None:
         await delete_cache(container, key="alpha")
 
     assert exc_info.value.code == "module_disabled"
+
+
+async def test_set_cache_entries_route_dispatches_single_command() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+    body = SetCacheEntriesRequest(
+        entries=[
+            CacheEntryRequest(key="alpha", value="1", ttl_seconds=60),
+            CacheEntryRequest(key="beta", value="2"),
+        ]
+    )
+
+    payload = await set_cache_entries(body, container)
+
+    assert payload == {"success": True, "keys": ["alpha", "beta"]}
+    assert len(container.command_bus.calls) == 1
+    command = container.command_bus.calls[0]
+    assert isinstance(command, SetCacheEntriesCommand)
+    assert command.entries[0].ttl_seconds == 60
+
+
+async def test_get_cache_entries_route_reports_missing_keys_without_error() -> None:
+    container = _Container(enabled_modules={"core", "redis"}, found=False)
+
+    payload = await get_cache_entries(CacheKeysRequest(keys=["alpha", "beta"]), container)
+
+    assert [entry["found"] for entry in payload["entries"]] == [False, False]
+    query = container.query_bus.calls[0]
+    assert isinstance(query, GetCacheEntriesQuery)
+    assert query.keys == ("alpha", "beta")
+
+
+async def test_delete_cache_entries_route_dispatches_command() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+
+    payload = await delete_cache_entries(CacheKeysRequest(keys=["alpha"]), container)
+
+    assert payload == {"deleted": 1, "keys": ["alpha"]}
+    assert isinstance(container.command_bus.calls[0], DeleteCacheEntriesCommand)
+
+
+async def test_batch_cache_routes_raise_if_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+    keys = CacheKeysRequest(keys=["alpha"])
+
+    with pytest.raises(DisabledModuleError):
+        await get_cache_entries(keys, container)
+    with pytest.raises(DisabledModuleError):
+        await delete_cache_entries(keys, container)
+    with pytest.raises(DisabledModuleError):
+        await set_cache_entries(
+            SetCacheEntriesRequest(entries=[CacheEntryRequest(key="alpha", value="1")]),
+            container,
+        )
+
+
+async def test_get_cache_stats_route_returns_counters() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+
+    payload = await get_cache_stats(container)
+
+    assert payload["hits"] == 3
+    assert payload["hit_ratio"] == 0.75
+    assert isinstance(container.query_bus.calls[0], GetCacheStatsQuery)
+
+
+async def test_get_cache_stats_route_raises_if_module_disabled() -> None:
+    with pytest.raises(DisabledModuleError):
+        await get_cache_stats(_Container(enabled_modules={"core"}))
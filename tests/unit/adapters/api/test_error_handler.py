@@ -7,7 +7,7 @@ from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from sackmesser.adapters.api.error_handler import register_exception_handlers
-from sackmesser.application.errors import DisabledModuleError, NotFoundError
+from sackmesser.application.errors import DisabledModuleError, NotFoundError, OverloadedError
 
 
 def _build_app() -> FastAPI:
@@ -33,6 +33,10 @@ def _build_app() -> FastAPI:
     async def module_disabled() -> dict[str, str]:
         raise DisabledModuleError("postgres")
 
+    @app.get("/overloaded")
+    async def overloaded() -> dict[str, str]:
+        raise OverloadedError("ListWorkflowsQuery is overloaded, retry later")
+
     @app.post("/validate")
     async def validate(payload: InputPayload) -> dict[str, str]:
         return {"name": payload.name}
@@ -84,3 +88,13 @@ def test_disabled_module_error_maps_to_404() -> None:
     body = response.json()
     assert body["code"] == "module_disabled"
     assert body["details"]["module"] == "postgres"
+
+
+def test_overloaded_error_maps_to_503_with_retry_after() -> None:
+    app = _build_app()
+    with TestClient(app) as client:
+        response = client.get("/overloaded")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["code"] == "overloaded"
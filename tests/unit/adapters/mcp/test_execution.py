@@ -0,0 +1,84 @@
+"""Unit tests for MCP tool execution limits."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from sackmesser.adapters.mcp.errors import MCPToolError
+from sackmesser.adapters.mcp.execution import ToolExecutionSettings, ToolExecutor
+
+
+def test_settings_from_mapping_parses_limits() -> None:
+    settings = ToolExecutionSettings.from_mapping(
+        {
+            "max_concurrency": "4",
+            "max_queue": 8,
+            "default_timeout_seconds": 30,
+            "timeout_seconds": {"list_workflows": "5"},
+        }
+    )
+
+    assert settings.max_concurrency == 4
+    assert settings.max_queue == 8
+    assert settings.timeout_for("list_workflows") == 5.0
+    assert settings.timeout_for("cache_get") == 30.0
+    assert ToolExecutionSettings.from_mapping(None).timeout_for("cache_get") is None
+
+
+@pytest.mark.asyncio
+async def test_executor_bounds_concurrency_and_sheds_beyond_queue() -> None:
+    executor = ToolExecutor(ToolExecutionSettings(max_concurrency=1, max_queue=1))
+    release = asyncio.Event()
+
+    async def blocked() -> dict[str, Any]:
+        await release.wait()
+        return {"ok": True}
+
+    running = asyncio.create_task(executor.run("slow", blocked))
+    waiting = asyncio.create_task(executor.run("slow", blocked))
+    await asyncio.sleep(0)
+    stats = executor.stats()
+    assert (stats["in_flight"], stats["queued"]) == (1, 1)
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await executor.run("slow", blocked)
+    assert exc_info.value.code == "overloaded"
+
+    release.set()
+    assert await asyncio.gather(running, waiting) == [{"ok": True}, {"ok": True}]
+    stats = executor.stats()
+    assert (stats["in_flight"], stats["queued"], stats["rejected"]) == (0, 0, 1)
+    assert stats["peak_in_flight"] == 1
+    assert stats["tools"]["slow"]["calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_times_out_slow_tools() -> None:
+    executor = ToolExecutor(ToolExecutionSettings(timeout_seconds={"slow": 0.01}))
+
+    async def slow() -> dict[str, Any]:
+        await asyncio.sleep(1)
+        return {}
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await executor.run("slow", slow)
+
+    assert exc_info.value.code == "tool_timeout"
+    assert exc_info.value.details == {"tool": "slow", "timeout_seconds": 0.01}
+    assert executor.stats()["tools"]["slow"]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_counts_tool_failures() -> None:
+    executor = ToolExecutor()
+
+    async def boom() -> dict[str, Any]:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await executor.run("boom", boom)
+
+    assert executor.stats()["tools"]["boom"]["failures"] == 1
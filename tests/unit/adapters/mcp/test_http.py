@@ -0,0 +1,70 @@
+"""Unit tests for the streamable HTTP MCP transport."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sackmesser.adapters.mcp import http as mcp_http
+from sackmesser.adapters.mcp.http import MCPHttpSettings, mount_mcp_http
+
+
+def test_settings_from_mapping_keeps_defaults() -> None:
+    settings = MCPHttpSettings.from_mapping({"enabled": True, "stateless": True})
+
+    assert settings == MCPHttpSettings(enabled=True, path="/mcp", stateless=True)
+    assert MCPHttpSettings.from_mapping(None).enabled is False
+
+
+def test_mounted_transport_returns_503_outside_lifespan() -> None:
+    app = FastAPI()
+    mcp_app = mount_mcp_http(app, MCPHttpSettings(path="/agents/mcp"))
+
+    with TestClient(app) as client:
+        response = client.post("/agents/mcp", json={})
+
+    assert app.state.mcp_http is mcp_app
+    assert response.status_code == 503
+    assert response.json()["code"] == "mcp_unavailable"
+
+
+async def test_lifespan_routes_requests_to_session_manager(monkeypatch) -> None:
+    events: list[object] = []
+    servers: list[object] = []
+
+    class _FakeSessionManager:
+        def __init__(self, *, app: object, json_response: bool, stateless: bool) -> None:
+            events.append(("created", app, json_response, stateless))
+
+        def run(self) -> _FakeRun:
+            return _FakeRun()
+
+        async def handle_request(
+            self, scope: dict[str, object], _receive: object, _send: object
+        ) -> None:
+            events.append(("request", scope["path"]))
+
+    class _FakeRun:
+        async def __aenter__(self) -> None:
+            events.append("run")
+
+        async def __aexit__(self, *_exc: object) -> None:
+            events.append("stop")
+
+    def fake_create_mcp_server() -> object:
+        servers.append(object())
+        return servers[-1]
+
+    monkeypatch.setattr(mcp_http, "StreamableHTTPSessionManager", _FakeSessionManager)
+    monkeypatch.setattr(mcp_http, "create_mcp_server", fake_create_mcp_server)
+    mcp_app = mcp_http.MCPHttpApp(MCPHttpSettings(stateless=True))
+
+    async with mcp_app.lifespan():
+        await mcp_app({"type": "http", "path": "/mcp"}, None, None)
+
+    assert events == [
+        ("created", servers[0], False, True),
+        "run",
+        ("request", "/mcp"),
+        "stop",
+    ]
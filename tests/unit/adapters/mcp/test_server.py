@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from types import SimpleNamespace
 from typing import Any
@@ -11,7 +12,9 @@ from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
 
 from sackmesser.adapters.mcp.errors import MCPToolError
 from sackmesser.adapters.mcp.server import create_mcp_server, run_mcp_server
-from sackmesser.adapters.mcp.tools.common import ToolSpec
+from sackmesser.adapters.mcp.tools.common import EncodedToolResult, ToolSpec
+from sackmesser.application.errors import RequestTimeoutError
+from sackmesser.application.requests.workflows import ListWorkflowsQuery
 
 
 @pytest.mark.asyncio
@@ -38,6 +41,7 @@ async def test_create_mcp_server_exposes_and_executes_tools(monkeypatch) -> None
         lambda: SimpleNamespace(
             enabled_modules={"core", "postgres"},
             settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={},
         ),
     )
     monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", lambda: container)
@@ -62,6 +66,12 @@ async def test_create_mcp_server_exposes_and_executes_tools(monkeypatch) -> None
                 input_schema={},
                 handler=exploding_tool,
             ),
+            ToolSpec(
+                name="typed_tool",
+                description="typed",
+                input_schema={"type": "object", "properties": {"x": {"type": "integer"}}},
+                handler=ok_tool,
+            ),
         ],
     )
 
@@ -74,7 +84,10 @@ async def test_create_mcp_server_exposes_and_executes_tools(monkeypatch) -> None
         "ok_tool",
         "controlled_error_tool",
         "exploding_tool",
+        "typed_tool",
+        "mcp_execution_stats",
     ]
+    assert (await list_handler(ListToolsRequest())).root.tools == listed.root.tools
 
     ok_response = await call_handler(
         CallToolRequest(params=CallToolRequestParams(name="ok_tool", arguments={"x": 1}))
@@ -91,6 +104,14 @@ async def test_create_mcp_server_exposes_and_executes_tools(monkeypatch) -> None
     known_error_payload = json.loads(known_error_response.root.content[0].text)
     assert known_error_payload["error"]["code"] == "module_disabled"
 
+    invalid_response = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="typed_tool", arguments={"x": "one"}))
+    )
+    invalid_payload = json.loads(invalid_response.root.content[0].text)
+    assert invalid_payload["error"]["code"] == "invalid_arguments"
+    assert invalid_payload["error"]["details"]["errors"][0]["field"] == "x"
+    assert seen_containers == [container]
+
     unknown_response = await call_handler(
         CallToolRequest(params=CallToolRequestParams(name="missing_tool", arguments={}))
     )
@@ -105,6 +126,188 @@ async def test_create_mcp_server_exposes_and_executes_tools(monkeypatch) -> None
     assert crash_payload["error"]["details"]["exception_type"] == "RuntimeError"
 
 
+@pytest.mark.asyncio
+async def test_create_mcp_server_maps_application_errors(monkeypatch) -> None:
+    async def slow_tool(_: object, __: dict[str, Any]) -> dict[str, Any]:
+        raise RequestTimeoutError(
+            "ListWorkflowsQuery exceeded its 1s time budget",
+            details={"request_type": "ListWorkflowsQuery", "timeout_seconds": 1.0},
+        )
+
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.get_runtime_state",
+        lambda: SimpleNamespace(
+            enabled_modules={"core"},
+            settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={},
+        ),
+    )
+    monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", object)
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.load_tool_specs",
+        lambda _: [
+            ToolSpec(name="slow_tool", description="slow", input_schema={}, handler=slow_tool)
+        ],
+    )
+
+    server = create_mcp_server()
+    call_handler = server.request_handlers[CallToolRequest]
+
+    response = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="slow_tool", arguments={}))
+    )
+    payload = json.loads(response.root.content[0].text)
+
+    assert payload == {
+        "error": {
+            "code": "request_timeout",
+            "message": "ListWorkflowsQuery exceeded its 1s time budget",
+            "details": {"request_type": "ListWorkflowsQuery", "timeout_seconds": 1.0},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_server_maps_request_model_errors_to_invalid_arguments(
+    monkeypatch,
+) -> None:
+    async def list_tool(_: object, arguments: dict[str, Any]) -> dict[str, Any]:
+        ListWorkflowsQuery(created_from=arguments["created_from"])
+        return {}
+
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.get_runtime_state",
+        lambda: SimpleNamespace(
+            enabled_modules={"core"},
+            settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={},
+        ),
+    )
+    monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", object)
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.load_tool_specs",
+        lambda _: [
+            ToolSpec(name="list_tool", description="list", input_schema={}, handler=list_tool)
+        ],
+    )
+
+    server = create_mcp_server()
+    call_handler = server.request_handlers[CallToolRequest]
+
+    response = await call_handler(
+        CallToolRequest(
+            params=CallToolRequestParams(
+                name="list_tool", arguments={"created_from": "20260101T000000"}
+            )
+        )
+    )
+
+    payload = json.loads(response.root.content[0].text)
+    assert payload["error"]["code"] == "invalid_arguments"
+    assert payload["error"]["details"]["errors"][0]["field"] == "created_from"
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_server_encodes_integers_beyond_64_bits(monkeypatch) -> None:
+    async def big_int_tool(_: object, __: dict[str, Any]) -> dict[str, Any]:
+        return {"workflow": {"payload": {"n": 123456789012345678901234567890}}}
+
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.get_runtime_state",
+        lambda: SimpleNamespace(
+            enabled_modules={"core"},
+            settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={},
+        ),
+    )
+    monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", object)
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.load_tool_specs",
+        lambda _: [
+            ToolSpec(name="big_int_tool", description="big", input_schema={}, handler=big_int_tool)
+        ],
+    )
+
+    server = create_mcp_server()
+    call_handler = server.request_handlers[CallToolRequest]
+
+    response = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="big_int_tool", arguments={}))
+    )
+
+    payload = json.loads(response.root.content[0].text)
+    assert payload["workflow"]["payload"]["n"] == 123456789012345678901234567890
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_server_sends_pre_encoded_results_verbatim(monkeypatch) -> None:
+    content = '{"workflows": [{"payload": {"n": 1.50}}]}'
+
+    async def encoded_tool(_: object, __: dict[str, Any]) -> EncodedToolResult:
+        return EncodedToolResult(content=content)
+
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.get_runtime_state",
+        lambda: SimpleNamespace(
+            enabled_modules={"core"},
+            settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={},
+        ),
+    )
+    monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", object)
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.load_tool_specs",
+        lambda _: [
+            ToolSpec(name="encoded_tool", description="raw", input_schema={}, handler=encoded_tool)
+        ],
+    )
+
+    server = create_mcp_server()
+    call_handler = server.request_handlers[CallToolRequest]
+
+    response = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="encoded_tool", arguments={}))
+    )
+
+    assert response.root.content[0].text == content
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_server_applies_tool_timeouts_and_reports_stats(monkeypatch) -> None:
+    async def slow_tool(_: object, __: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(1)
+        return {}
+
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.get_runtime_state",
+        lambda: SimpleNamespace(
+            enabled_modules={"core"},
+            settings=SimpleNamespace(service=SimpleNamespace(name="demo-mcp")),
+            options={"sackmesser": {"mcp": {"timeout_seconds": {"slow_tool": 0.01}}}},
+        ),
+    )
+    monkeypatch.setattr("sackmesser.adapters.mcp.server.get_runtime_container", object)
+    monkeypatch.setattr(
+        "sackmesser.adapters.mcp.server.load_tool_specs",
+        lambda _: [
+            ToolSpec(name="slow_tool", description="slow", input_schema={}, handler=slow_tool)
+        ],
+    )
+
+    server = create_mcp_server()
+    call_handler = server.request_handlers[CallToolRequest]
+
+    timed_out = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="slow_tool", arguments={}))
+    )
+    stats = await call_handler(
+        CallToolRequest(params=CallToolRequestParams(name="mcp_execution_stats", arguments={}))
+    )
+
+    assert json.loads(timed_out.root.content[0].text)["error"]["code"] == "tool_timeout"
+    assert json.loads(stats.root.content[0].text)["tools"]["slow_tool"]["timeouts"] == 1
+
+
 @pytest.mark.asyncio
 async def test_run_mcp_server_runs_lifecycle(monkeypatch) -> None:
     events: list[object] = []
@@ -0,0 +1,65 @@
+"""Unit tests for MCP tool argument validation."""
+
+from __future__ import annotations
+
+import pytest
+from jsonschema.exceptions import SchemaError
+from pydantic import ValidationError as PydanticValidationError
+
+from sackmesser.adapters.mcp.errors import MCPToolError
+from sackmesser.adapters.mcp.validation import ToolArgumentsValidator, request_validation_error
+from sackmesser.application.requests.workflows import ListWorkflowsQuery
+
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key": {"type": "string"},
+        "ttl_seconds": {"type": "integer", "minimum": 1},
+    },
+    "required": ["key"],
+}
+
+
+def test_validator_accepts_matching_arguments() -> None:
+    ToolArgumentsValidator("cache_set", _SCHEMA).validate({"key": "alpha", "ttl_seconds": 5})
+
+
+def test_validator_reports_every_invalid_field() -> None:
+    validator = ToolArgumentsValidator("cache_set", _SCHEMA)
+
+    with pytest.raises(MCPToolError) as exc_info:
+        validator.validate({"ttl_seconds": 0})
+
+    error = exc_info.value
+    assert error.code == "invalid_arguments"
+    assert error.details["tool"] == "cache_set"
+    assert {item["field"] for item in error.details["errors"]} == {"", "ttl_seconds"}
+
+
+def test_validator_rejects_broken_schema_at_construction() -> None:
+    with pytest.raises(SchemaError):
+        ToolArgumentsValidator("broken", {"type": "not-a-type"})
+
+
+def test_validator_checks_date_time_format() -> None:
+    validator = ToolArgumentsValidator(
+        "list_workflows",
+        {"type": "object", "properties": {"since": {"type": "string", "format": "date-time"}}},
+    )
+
+    validator.validate({"since": "2026-01-01T00:00:00Z"})
+    with pytest.raises(MCPToolError) as exc_info:
+        validator.validate({"since": "not-a-date"})
+
+    assert exc_info.value.details["errors"][0]["field"] == "since"
+
+
+def test_request_validation_error_maps_to_invalid_arguments() -> None:
+    with pytest.raises(PydanticValidationError) as exc_info:
+        ListWorkflowsQuery(limit=0, created_from="20260101T000000")  # type: ignore[arg-type]
+
+    error = request_validation_error("list_workflows", exc_info.value)
+
+    assert error.code == "invalid_arguments"
+    assert error.details["tool"] == "list_workflows"
+    assert {item["field"] for item in error.details["errors"]} == {"limit", "created_from"}
@@ -5,12 +5,15 @@ from __future__ import annotations
 from typing import Any
 
 from sackmesser.adapters.mcp.tools.core import (
+    bus_metrics_tool,
     get_tool_specs,
     health_check_tool,
     list_capabilities_tool,
 )
 from sackmesser.application.requests.core import (
     CapabilityDto,
+    GetBusMetricsQuery,
+    GetBusMetricsResult,
     GetCapabilitiesQuery,
     GetCapabilitiesResult,
     GetHealthQuery,
@@ -22,8 +25,13 @@ class _FakeQueryBus:
     def __init__(self) -> None:
         self.calls: list[Any] = []
 
-    async def dispatch(self, request: Any) -> GetHealthResult | GetCapabilitiesResult:
+    async def dispatch(
+        self,
+        request: Any,
+    ) -> GetHealthResult | GetCapabilitiesResult | GetBusMetricsResult:
         self.calls.append(request)
+        if isinstance(request, GetBusMetricsQuery):
+            return GetBusMetricsResult(enabled=False, requests=[])
         if isinstance(request, GetHealthQuery):
             return GetHealthResult(status="ok", payload={"status": "ok", "checks": {}})
         if isinstance(request, GetCapabilitiesQuery):
@@ -65,10 +73,20 @@ async def test_list_capabilities_tool_returns_serialized_result() -> None:
     assert isinstance(container.query_bus.calls[0], GetCapabilitiesQuery)
 
 
+async def test_bus_metrics_tool_returns_serialized_result() -> None:
+    container = _FakeContainer()
+
+    result = await bus_metrics_tool(container, {})
+
+    assert result == {"enabled": False, "requests": [], "statements": []}
+    assert isinstance(container.query_bus.calls[0], GetBusMetricsQuery)
+
+
 def test_get_tool_specs_exposes_core_tools() -> None:
     specs = get_tool_specs()
     names = [item.name for item in specs]
 
-    assert names == ["health_check", "list_capabilities"]
+    assert names == ["health_check", "list_capabilities", "bus_metrics"]
     assert specs[0].handler is health_check_tool
     assert specs[1].handler is list_capabilities_tool
+    assert specs[2].handler is bus_metrics_tool
@@ -8,16 +8,37 @@ from typing import Any
 import pytest
 
 from sackmesser.adapters.mcp.errors import MCPToolError
+from sackmesser.adapters.mcp.tools.common import EncodedToolResult
 from sackmesser.adapters.mcp.tools.postgres import (
     create_workflow_tool,
+    create_workflows_batch_tool,
+    export_workflows_tool,
     get_tool_specs,
+    get_workflow_tool,
+    get_workflows_tool,
     list_workflows_tool,
+    search_workflows_tool,
+    update_workflow_payload_tool,
 )
+from sackmesser.adapters.mcp.validation import ToolArgumentsValidator
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
     CreateWorkflowResult,
+    CreateWorkflowsBatchCommand,
+    CreateWorkflowsBatchResult,
+    ExportWorkflowsQuery,
+    ExportWorkflowsResult,
+    GetWorkflowQuery,
+    GetWorkflowResult,
+    GetWorkflowsQuery,
+    GetWorkflowsResult,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsJsonResult,
     ListWorkflowsQuery,
     ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    UpdateWorkflowPayloadResult,
     WorkflowDto,
 )
 
@@ -26,8 +47,32 @@ class _FakeCommandBus:
     def __init__(self) -> None:
         self.calls: list[Any] = []
 
-    async def dispatch(self, command: CreateWorkflowCommand) -> CreateWorkflowResult:
+    async def dispatch(
+        self,
+        command: CreateWorkflowCommand | CreateWorkflowsBatchCommand | UpdateWorkflowPayloadCommand,
+    ) -> CreateWorkflowResult | CreateWorkflowsBatchResult | UpdateWorkflowPayloadResult:
         self.calls.append(command)
+        if isinstance(command, UpdateWorkflowPayloadCommand):
+            return UpdateWorkflowPayloadResult(
+                workflow=WorkflowDto(
+                    id=command.id,
+                    title="demo",
+                    payload=command.merge or {},
+                    created_at=datetime(2026, 1, 1, tzinfo=UTC),
+                )
+            )
+        if isinstance(command, CreateWorkflowsBatchCommand):
+            return CreateWorkflowsBatchResult(
+                workflows=[
+                    WorkflowDto(
+                        id=f"wf-{index}",
+                        title=item.title,
+                        payload=item.payload,
+                        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+                    )
+                    for index, item in enumerate(command.workflows, start=1)
+                ]
+            )
         return CreateWorkflowResult(
             workflow=WorkflowDto(
                 id="wf-1",
@@ -42,18 +87,36 @@ class _FakeQueryBus:
     def __init__(self) -> None:
         self.calls: list[Any] = []
 
-    async def dispatch(self, query: ListWorkflowsQuery) -> ListWorkflowsResult:
+    async def dispatch(
+        self,
+        query: ListWorkflowsQuery
+        | SearchWorkflowsQuery
+        | ExportWorkflowsQuery
+        | GetWorkflowQuery
+        | GetWorkflowsQuery,
+    ) -> (
+        ListWorkflowsResult
+        | ListWorkflowsJsonResult
+        | ExportWorkflowsResult
+        | GetWorkflowResult
+        | GetWorkflowsResult
+    ):
         self.calls.append(query)
-        return ListWorkflowsResult(
-            workflows=[
-                WorkflowDto(
-                    id="wf-1",
-                    title="demo",
-                    payload={},
-                    created_at=datetime(2026, 1, 1, tzinfo=UTC),
-                )
-            ]
+        if isinstance(query, ListWorkflowsJsonQuery):
+            return ListWorkflowsJsonResult(content='{"workflows":[{"id":"wf-1","payload":{}}]}')
+        if isinstance(query, ExportWorkflowsQuery):
+            return ExportWorkflowsResult(ndjson='{"id":"wf-1"}\n', count=1, next_cursor="next")
+        workflow = WorkflowDto(
+            id="wf-1",
+            title="demo",
+            payload={},
+            created_at=datetime(2026, 1, 1, tzinfo=UTC),
         )
+        if isinstance(query, GetWorkflowQuery):
+            return GetWorkflowResult(workflow=workflow)
+        if isinstance(query, GetWorkflowsQuery):
+            return GetWorkflowsResult(workflows=[workflow], missing=list(query.ids[1:]))
+        return ListWorkflowsResult(workflows=[workflow])
 
 
 class _Container:
@@ -84,16 +147,51 @@ async def test_create_workflow_tool_raises_module_disabled() -> None:
     assert exc_info.value.code == "module_disabled"
 
 
+async def test_create_workflows_batch_tool_dispatches_single_command() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await create_workflows_batch_tool(
+        container,
+        {"workflows": [{"title": "one"}, {"title": "two", "payload": {"k": "v"}}]},
+    )
+
+    assert [item["id"] for item in result["workflows"]] == ["wf-1", "wf-2"]
+    command = container.command_bus.calls[0]
+    assert isinstance(command, CreateWorkflowsBatchCommand)
+    assert command.workflows[0].payload == {}
+    assert command.workflows[1].payload == {"k": "v"}
+
+
+async def test_create_workflows_batch_tool_raises_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await create_workflows_batch_tool(container, {"workflows": [{"title": "one"}]})
+
+    assert exc_info.value.code == "module_disabled"
+
+
 async def test_list_workflows_tool_dispatches_query_with_defaults() -> None:
     container = _Container(enabled_modules={"core", "postgres"})
 
     result = await list_workflows_tool(container, {})
 
-    assert len(result["workflows"]) == 1
+    assert result == EncodedToolResult(content='{"workflows":[{"id":"wf-1","payload":{}}]}')
     query = container.query_bus.calls[0]
-    assert isinstance(query, ListWorkflowsQuery)
+    assert isinstance(query, ListWorkflowsJsonQuery)
     assert query.limit == 20
     assert query.offset == 0
+    assert query.cursor is None
+
+
+async def test_list_workflows_tool_forwards_cursor() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    await list_workflows_tool(container, {"limit": 5, "cursor": "token"})
+
+    query = container.query_bus.calls[0]
+    assert query.limit == 5
+    assert query.cursor == "token"
 
 
 async def test_list_workflows_tool_raises_module_disabled() -> None:
@@ -105,9 +203,158 @@ async def test_list_workflows_tool_raises_module_disabled() -> None:
     assert exc_info.value.code == "module_disabled"
 
 
+async def test_search_workflows_tool_dispatches_query() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await search_workflows_tool(
+        container, {"title": "nightly", "payload_contains": {"team": "ops"}}
+    )
+
+    assert len(result["workflows"]) == 1
+    query = container.query_bus.calls[0]
+    assert isinstance(query, SearchWorkflowsQuery)
+    assert query.title == "nightly"
+    assert query.payload_contains == {"team": "ops"}
+    assert query.limit == 20
+
+
+async def test_search_workflows_tool_raises_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await search_workflows_tool(container, {"title": "nightly"})
+
+    assert exc_info.value.code == "module_disabled"
+
+
+async def test_export_workflows_tool_returns_chunk_with_continuation() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await export_workflows_tool(container, {"cursor": "token"})
+
+    assert result == {"ndjson": '{"id":"wf-1"}\n', "count": 1, "next_cursor": "next"}
+    query = container.query_bus.calls[0]
+    assert isinstance(query, ExportWorkflowsQuery)
+    assert query.limit == 500
+    assert query.cursor == "token"
+
+
+async def test_export_workflows_tool_raises_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await export_workflows_tool(container, {})
+
+    assert exc_info.value.code == "module_disabled"
+
+
+async def test_get_workflow_tool_dispatches_query() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await get_workflow_tool(container, {"id": "wf-1"})
+
+    assert result["workflow"]["id"] == "wf-1"
+    query = container.query_bus.calls[0]
+    assert isinstance(query, GetWorkflowQuery)
+    assert query.id == "wf-1"
+
+
+async def test_get_workflows_tool_reports_missing_ids() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await get_workflows_tool(container, {"ids": ["wf-1", "wf-9"]})
+
+    assert [item["id"] for item in result["workflows"]] == ["wf-1"]
+    assert result["missing"] == ["wf-9"]
+    query = container.query_bus.calls[0]
+    assert isinstance(query, GetWorkflowsQuery)
+    assert query.ids == ("wf-1", "wf-9")
+
+
+async def test_get_workflow_tools_raise_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await get_workflow_tool(container, {"id": "wf-1"})
+    assert exc_info.value.code == "module_disabled"
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await get_workflows_tool(container, {"ids": ["wf-1"]})
+    assert exc_info.value.code == "module_disabled"
+
+
+async def test_update_workflow_payload_tool_dispatches_command() -> None:
+    container = _Container(enabled_modules={"core", "postgres"})
+
+    result = await update_workflow_payload_tool(
+        container,
+        {
+            "id": "wf-1",
+            "merge": {"status": "done"},
+            "sets": [{"path": ["steps", "0"], "value": {"ok": True}}],
+        },
+    )
+
+    assert result["workflow"]["payload"] == {"status": "done"}
+    command = container.command_bus.calls[0]
+    assert isinstance(command, UpdateWorkflowPayloadCommand)
+    assert command.id == "wf-1"
+    assert command.merge == {"status": "done"}
+    assert [(item.path, item.value) for item in command.sets] == [(("steps", "0"), {"ok": True})]
+
+
+async def test_update_workflow_payload_tool_raises_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    with pytest.raises(MCPToolError) as exc_info:
+        await update_workflow_payload_tool(container, {"id": "wf-1", "merge": {}})
+
+    assert exc_info.value.code == "module_disabled"
+
+
 def test_get_tool_specs_for_postgres_tools() -> None:
     specs = get_tool_specs()
 
-    assert [spec.name for spec in specs] == ["create_workflow", "list_workflows"]
+    assert [spec.name for spec in specs] == [
+        "create_workflow",
+        "create_workflows_batch",
+        "list_workflows",
+        "search_workflows",
+        "export_workflows",
+        "get_workflow",
+        "get_workflows",
+        "update_workflow_payload",
+    ]
     assert specs[0].handler is create_workflow_tool
-    assert specs[1].handler is list_workflows_tool
+    assert specs[1].handler is create_workflows_batch_tool
+    assert specs[2].handler is list_workflows_tool
+    assert specs[3].handler is search_workflows_tool
+    assert specs[4].handler is export_workflows_tool
+    assert specs[5].handler is get_workflow_tool
+    assert specs[6].handler is get_workflows_tool
+    assert specs[7].handler is update_workflow_payload_tool
+
+
+@pytest.mark.parametrize(
+    ("tool", "arguments", "field"),
+    [
+        ("create_workflow", {"title": ""}, "title"),
+        ("create_workflows_batch", {"workflows": [{"title": "x" * 201}]}, "workflows.0.title"),
+        ("list_workflows", {"created_from": "not-a-date"}, "created_from"),
+        ("list_workflows", {"cursor": ""}, "cursor"),
+        (
+            "update_workflow_payload",
+            {"id": "wf-1", "sets": [{"path": [""], "value": 1}]},
+            "sets.0.path.0",
+        ),
+    ],
+)
+def test_tool_schemas_reject_what_request_models_reject(
+    tool: str, arguments: dict[str, Any], field: str
+) -> None:
+    spec = next(spec for spec in get_tool_specs() if spec.name == tool)
+
+    with pytest.raises(MCPToolError) as exc_info:
+        ToolArgumentsValidator(spec.name, spec.input_schema).validate(arguments)
+
+    assert [error["field"] for error in exc_info.value.details["errors"]] == [field]
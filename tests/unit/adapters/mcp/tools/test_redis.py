@@ -8,17 +8,29 @@ import pytest
 
 from sackmesser.adapters.mcp.errors import MCPToolError
 from sackmesser.adapters.mcp.tools.redis import (
+    cache_delete_many_tool,
     cache_delete_tool,
+    cache_get_many_tool,
     cache_get_tool,
+    cache_set_many_tool,
     cache_set_tool,
+    cache_stats_tool,
     get_tool_specs,
 )
 from sackmesser.application.requests.cache import (
     CacheEntryDto,
+    DeleteCacheEntriesCommand,
+    DeleteCacheEntriesResult,
     DeleteCacheEntryCommand,
     DeleteCacheEntryResult,
+    GetCacheEntriesQuery,
+    GetCacheEntriesResult,
     GetCacheEntryQuery,
     GetCacheEntryResult,
+    GetCacheStatsQuery,
+    GetCacheStatsResult,
+    SetCacheEntriesCommand,
+    SetCacheEntriesResult,
     SetCacheEntryCommand,
     SetCacheEntryResult,
 )
@@ -30,9 +42,24 @@ class _FakeCommandBus:
 
     async def dispatch(
         self,
-        command: SetCacheEntryCommand | DeleteCacheEntryCommand,
-    ) -> SetCacheEntryResult | DeleteCacheEntryResult:
+        command: SetCacheEntryCommand
+        | DeleteCacheEntryCommand
+        | SetCacheEntriesCommand
+        | DeleteCacheEntriesCommand,
+    ) -> (
+        SetCacheEntryResult
+        | DeleteCacheEntryResult
+        | SetCacheEntriesResult
+        | DeleteCacheEntriesResult
+    ):
         self.calls.append(command)
+        if isinstance(command, SetCacheEntriesCommand):
+            return SetCacheEntriesResult(
+                success=True,
+                keys=[entry.key for entry in command.entries],
+            )
+        if isinstance(command, DeleteCacheEntriesCommand):
+            return DeleteCacheEntriesResult(deleted=len(command.keys), keys=command.keys)
         if isinstance(command, SetCacheEntryCommand):
             return SetCacheEntryResult(success=True, key=command.key)
         if isinstance(command, DeleteCacheEntryCommand):
@@ -47,8 +74,31 @@ class _FakeQueryBus:
         self.value = value
         self.calls: list[Any] = []
 
-    async def dispatch(self, query: GetCacheEntryQuery) -> GetCacheEntryResult:
+    async def dispatch(
+        self, query: GetCacheEntryQuery | GetCacheEntriesQuery | GetCacheStatsQuery
+    ) -> GetCacheEntryResult | GetCacheEntriesResult | GetCacheStatsResult:
         self.calls.append(query)
+        if isinstance(query, GetCacheStatsQuery):
+            return GetCacheStatsResult(
+                enabled=True,
+                hits=3,
+                misses=1,
+                hit_ratio=0.75,
+                evictions=0,
+                expirations=0,
+                invalidations=0,
+                entries=2,
+                bytes=64,
+                max_entries=100,
+                max_bytes=1024,
+            )
+        if isinstance(query, GetCacheEntriesQuery):
+            return GetCacheEntriesResult(
+                entries=[
+                    CacheEntryDto(key=key, value="1" if self.found else None, found=self.found)
+                    for key in query.keys
+                ]
+            )
         return GetCacheEntryResult(
             entry=CacheEntryDto(
                 key=query.key,
@@ -134,7 +184,82 @@ async def test_cache_delete_tool_raises_module_disabled() -> None:
 def test_get_tool_specs_for_redis_tools() -> None:
     specs = get_tool_specs()
 
-    assert [spec.name for spec in specs] == ["cache_set", "cache_get", "cache_delete"]
+    assert [spec.name for spec in specs] == [
+        "cache_set",
+        "cache_get",
+        "cache_delete",
+        "cache_set_many",
+        "cache_get_many",
+        "cache_delete_many",
+        "cache_stats",
+    ]
     assert specs[0].handler is cache_set_tool
     assert specs[1].handler is cache_get_tool
     assert specs[2].handler is cache_delete_tool
+    assert specs[3].handler is cache_set_many_tool
+    assert specs[4].handler is cache_get_many_tool
+    assert specs[5].handler is cache_delete_many_tool
+    assert specs[6].handler is cache_stats_tool
+
+
+async def test_cache_set_many_tool_dispatches_single_command() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+
+    result = await cache_set_many_tool(
+        container,
+        {"entries": [{"key": "alpha", "value": "1", "ttl_seconds": 5}, {"key": "b", "value": "2"}]},
+    )
+
+    assert result == {"success": True, "keys": ["alpha", "b"]}
+    command = container.command_bus.calls[0]
+    assert isinstance(command, SetCacheEntriesCommand)
+    assert command.entries[0].ttl_seconds == 5
+    assert command.entries[1].ttl_seconds is None
+
+
+async def test_cache_get_many_tool_returns_missing_entries() -> None:
+    container = _Container(enabled_modules={"core", "redis"}, found=False)
+
+    result = await cache_get_many_tool(container, {"keys": ["alpha", "beta"]})
+
+    assert [entry["key"] for entry in result["entries"]] == ["alpha", "beta"]
+    assert all(entry["found"] is False for entry in result["entries"])
+    assert isinstance(container.query_bus.calls[0], GetCacheEntriesQuery)
+
+
+async def test_cache_delete_many_tool_dispatches_command() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+
+    result = await cache_delete_many_tool(container, {"keys": ["alpha"]})
+
+    assert result == {"deleted": 1, "keys": ["alpha"]}
+    assert isinstance(container.command_bus.calls[0], DeleteCacheEntriesCommand)
+
+
+async def test_batch_cache_tools_raise_module_disabled() -> None:
+    container = _Container(enabled_modules={"core"})
+
+    for tool, arguments in (
+        (cache_set_many_tool, {"entries": [{"key": "a", "value": "1"}]}),
+        (cache_get_many_tool, {"keys": ["a"]}),
+        (cache_delete_many_tool, {"keys": ["a"]}),
+    ):
+        with pytest.raises(MCPToolError) as exc_info:
+            await tool(container, arguments)
+        assert exc_info.value.code == "module_disabled"
+
+
+async def test_cache_stats_tool_returns_counters() -> None:
+    container = _Container(enabled_modules={"core", "redis"})
+
+    result = await cache_stats_tool(container, {})
+
+    assert result["enabled"] is True
+    assert result["entries"] == 2
+    assert isinstance(container.query_bus.calls[0], GetCacheStatsQuery)
+
+
+async def test_cache_stats_tool_raises_module_disabled() -> None:
+    with pytest.raises(MCPToolError) as exc_info:
+        await cache_stats_tool(_Container(enabled_modules={"core"}), {})
+    assert exc_info.value.code == "module_disabled"
@@ -0,0 +1,71 @@
+"""Unit tests for shared JSON encoding."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from sackmesser.adapters.api.responses import FastJSONResponse
+from sackmesser.adapters.serialization import dumps, json_encoder
+from sackmesser.application.requests.workflows import ListWorkflowsResult, WorkflowDto
+
+
+def _result() -> ListWorkflowsResult:
+    return ListWorkflowsResult(
+        workflows=[
+            WorkflowDto(
+                id="wf-1",
+                title="demo",
+                payload={"k": [1, 2]},
+                created_at=datetime(2026, 1, 1, tzinfo=UTC),
+            )
+        ],
+        next_cursor="token",
+    )
+
+
+def test_dumps_serializes_models_like_model_dump_json() -> None:
+    result = _result()
+
+    assert json.loads(dumps(result)) == json.loads(result.model_dump_json())
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "stdlib"])
+def test_backends_agree_on_plain_data(backend: str) -> None:
+    encoder = json_encoder(backend)  # type: ignore[arg-type]
+    value = {"a": [1, "two", None], "nested": {"ok": True}, "amount": Decimal("1.5")}
+
+    decoded = json.loads(encoder(value))
+
+    assert decoded["a"] == [1, "two", None]
+    assert decoded["nested"] == {"ok": True}
+    assert decoded["amount"] in ("1.5", 1.5)
+
+
+def test_unknown_values_fall_back_to_str() -> None:
+    class _Opaque:
+        def __str__(self) -> str:
+            return "opaque"
+
+    assert json.loads(dumps({"value": _Opaque()})) == {"value": "opaque"}
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "pydantic", "stdlib"])
+def test_backends_encode_integers_beyond_64_bits(backend: str) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    encoder = json_encoder(backend)  # type: ignore[arg-type]
+    value = {"payload": {"n": 123456789012345678901234567890}}
+
+    assert json.loads(encoder(value)) == value
+
+
+def test_fast_json_response_renders_models() -> None:
+    response = FastJSONResponse(_result(), status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body)["next_cursor"] == "token"
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from sackmesser.application.bus import CommandBus, HandlerNotRegisteredError, QueryBus
+from sackmesser.application.middleware import ConcurrencyLimitMiddleware
+from sackmesser.application.session import current_session_id, session_scope
 
 
 class _EchoCommand(BaseModel):
@@ -37,3 +41,196 @@ async def test_query_bus_raises_for_unregistered_request() -> None:
 
     with pytest.raises(HandlerNotRegisteredError):
         await bus.dispatch(_EchoQuery(value="missing"))
+
+
+class _SlowHandler:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def handle(self, request: _EchoQuery) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if request.value == "boom":
+            raise ValueError("boom")
+        return request.value
+
+
+class _FrozenQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    value: str
+
+
+class _UnhashableQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    filters: dict[str, str]
+
+
+@pytest.mark.asyncio
+async def test_query_bus_coalesces_concurrent_equal_queries() -> None:
+    handler = _SlowHandler()
+    bus = QueryBus()
+    bus.register(_FrozenQuery, handler, coalesce=True)
+
+    pending = [
+        asyncio.create_task(bus.dispatch(_FrozenQuery(value=value)))
+        for value in ("a", "a", "a", "b")
+    ]
+    await asyncio.sleep(0)
+    handler.release.set()
+    results = await asyncio.gather(*pending)
+
+    assert results == ["a", "a", "a", "b"]
+    assert handler.calls == 2
+    assert await bus.dispatch(_FrozenQuery(value="a")) == "a"
+    assert handler.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_reaches_every_caller() -> None:
+    handler = _SlowHandler()
+    bus = QueryBus()
+    bus.register(_FrozenQuery, handler, coalesce=True)
+
+    pending = [asyncio.create_task(bus.dispatch(_FrozenQuery(value="boom"))) for _ in range(2)]
+    await asyncio.sleep(0)
+    handler.release.set()
+    results = await asyncio.gather(*pending, return_exceptions=True)
+
+    assert handler.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    handler = _SlowHandler()
+    bus = QueryBus()
+    bus.register(_FrozenQuery, handler, coalesce=True)
+
+    first = asyncio.create_task(bus.dispatch(_FrozenQuery(value="a")))
+    second = asyncio.create_task(bus.dispatch(_FrozenQuery(value="a")))
+    await asyncio.sleep(0)
+    first.cancel()
+    handler.release.set()
+
+    assert await second == "a"
+    assert first.cancelled()
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_one_concurrency_slot() -> None:
+    handler = _SlowHandler()
+    limits = ConcurrencyLimitMiddleware({"_FrozenQuery": 8}, max_queue={"_FrozenQuery": 64})
+    bus = QueryBus()
+    bus.use(limits)
+    bus.register(_FrozenQuery, handler, coalesce=True)
+
+    pending = [asyncio.create_task(bus.dispatch(_FrozenQuery(value="a"))) for _ in range(100)]
+    await asyncio.sleep(0)
+    handler.release.set()
+    results = await asyncio.gather(*pending, return_exceptions=True)
+
+    assert results == ["a"] * 100
+    assert handler.calls == 1
+    assert limits.bulkheads()["_FrozenQuery"].rejected == 0
+
+
+class _Pins:
+    def __init__(self, *sessions: str) -> None:
+        self.sessions = set(sessions)
+
+    def pinned_session(self) -> str | None:
+        session = current_session_id()
+        return session if session in self.sessions else None
+
+
+@pytest.mark.asyncio
+async def test_pinned_session_does_not_join_other_sessions_calls() -> None:
+    handler = _SlowHandler()
+    bus = QueryBus()
+    bus.register(_FrozenQuery, handler, coalesce=True)
+    bus.set_session_pins(_Pins("alice"))
+
+    async def dispatch_as(session: str) -> str:
+        with session_scope(session):
+            return await bus.dispatch(_FrozenQuery(value="a"))
+
+    pending = [
+        asyncio.create_task(dispatch_as(session)) for session in ("bob", "carol", "alice", "alice")
+    ]
+    await asyncio.sleep(0)
+    handler.release.set()
+    results = await asyncio.gather(*pending)
+
+    assert results == ["a"] * 4
+    assert handler.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_bypasses_unhashable_queries() -> None:
+    class _FiltersHandler:
+        async def handle(self, request: _UnhashableQuery) -> int:
+            return len(request.filters)
+
+    bus = QueryBus()
+    bus.register(_UnhashableQuery, _FiltersHandler(), coalesce=True)
+
+    assert await bus.dispatch(_UnhashableQuery(filters={"a": "1"})) == 1
+
+
+class _RecordingMiddleware:
+    def __init__(self, name: str, trace: list[str]) -> None:
+        self.name = name
+        self.trace = trace
+        self.wrapped: list[type[BaseModel]] = []
+
+    def wrap(self, request_type: type[BaseModel], handler: _EchoHandler) -> _EchoHandler:
+        self.wrapped.append(request_type)
+        middleware = self
+
+        class _Wrapped:
+            async def handle(self, request: BaseModel) -> str:
+                middleware.trace.append(f"{middleware.name}:before")
+                try:
+                    return await handler.handle(request)
+                finally:
+                    middleware.trace.append(f"{middleware.name}:after")
+
+        return _Wrapped()
+
+
+@pytest.mark.asyncio
+async def test_middlewares_run_in_installation_order() -> None:
+    trace: list[str] = []
+    bus = CommandBus()
+    bus.use(_RecordingMiddleware("outer", trace))
+    bus.use(_RecordingMiddleware("inner", trace))
+    bus.register(_EchoCommand, _EchoHandler())
+
+    assert await bus.dispatch(_EchoCommand(value="ok")) == "ok"
+    assert trace == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+
+@pytest.mark.asyncio
+async def test_use_recomposes_already_registered_handlers() -> None:
+    trace: list[str] = []
+    bus = QueryBus()
+    bus.register(_EchoQuery, _EchoHandler())
+    middleware = _RecordingMiddleware("late", trace)
+
+    bus.use(middleware)
+    await bus.dispatch(_EchoQuery(value="ok"))
+
+    assert middleware.wrapped == [_EchoQuery]
+    assert trace == ["late:before", "late:after"]
+
+
+def test_bus_without_middlewares_keeps_handler_unwrapped() -> None:
+    handler = _EchoHandler()
+    bus = CommandBus()
+    bus.register(_EchoCommand, handler)
+
+    assert bus._handlers[_EchoCommand] is handler
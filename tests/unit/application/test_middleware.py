@@ -0,0 +1,130 @@
+"""Unit tests for built-in bus middlewares."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from sackmesser.application.bus import CommandBus, QueryBus
+from sackmesser.application.errors import OverloadedError, RequestTimeoutError
+from sackmesser.application.middleware import (
+    ConcurrencyLimitMiddleware,
+    LatencyHistogram,
+    LatencyHistogramMiddleware,
+    TimeoutMiddleware,
+)
+
+
+class _SlowQuery(BaseModel):
+    delay: float = 0.0
+    fail: bool = False
+
+
+class _SlowHandler:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def handle(self, request: _SlowQuery) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(request.delay)
+            if request.fail:
+                raise ValueError("boom")
+            return "done"
+        finally:
+            self.running -= 1
+
+
+def test_latency_histogram_buckets_are_cumulative() -> None:
+    histogram = LatencyHistogram((0.01, 0.1))
+
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(3.0, failed=True)
+
+    assert histogram.count == 4
+    assert histogram.errors == 1
+    assert histogram.max_seconds == 3.0
+    assert histogram.cumulative_buckets() == [(0.01, 1), (0.1, 3), (float("inf"), 4)]
+
+
+@pytest.mark.asyncio
+async def test_latency_middleware_records_successes_and_failures() -> None:
+    latency = LatencyHistogramMiddleware()
+    bus = QueryBus()
+    bus.use(latency)
+    bus.register(_SlowQuery, _SlowHandler())
+
+    await bus.dispatch(_SlowQuery())
+    with pytest.raises(ValueError, match="boom"):
+        await bus.dispatch(_SlowQuery(fail=True))
+
+    histogram = latency.histograms()["_SlowQuery"]
+    assert histogram.count == 2
+    assert histogram.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_middleware_raises_request_timeout() -> None:
+    bus = QueryBus()
+    bus.use(TimeoutMiddleware({"_SlowQuery": 0.01}))
+    bus.register(_SlowQuery, _SlowHandler())
+
+    assert await bus.dispatch(_SlowQuery(delay=0)) == "done"
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        await bus.dispatch(_SlowQuery(delay=1))
+
+    assert exc_info.value.status_code == 504
+    assert exc_info.value.details == {"request_type": "_SlowQuery", "timeout_seconds": 0.01}
+
+
+def test_unconfigured_types_are_not_wrapped() -> None:
+    handler = _SlowHandler()
+    bus = CommandBus()
+    bus.use(TimeoutMiddleware({"Other": 1.0}))
+    bus.use(ConcurrencyLimitMiddleware({"Other": 1}))
+    bus.register(_SlowQuery, handler)
+
+    assert bus._handlers[_SlowQuery] is handler
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_caps_in_flight_handlers() -> None:
+    handler = _SlowHandler()
+    bus = QueryBus()
+    bus.use(ConcurrencyLimitMiddleware(default_limit=2))
+    bus.register(_SlowQuery, handler)
+
+    results = await asyncio.gather(*(bus.dispatch(_SlowQuery(delay=0.01)) for _ in range(6)))
+
+    assert results == ["done"] * 6
+    assert handler.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_sheds_requests_beyond_queue_depth() -> None:
+    handler = _SlowHandler()
+    limiter = ConcurrencyLimitMiddleware({"_SlowQuery": 1}, max_queue={"_SlowQuery": 1})
+    bus = QueryBus()
+    bus.use(limiter)
+    bus.register(_SlowQuery, handler)
+
+    running = asyncio.create_task(bus.dispatch(_SlowQuery(delay=0.05)))
+    waiting = asyncio.create_task(bus.dispatch(_SlowQuery(delay=0)))
+    await asyncio.sleep(0)
+    bulkhead = limiter.bulkheads()["_SlowQuery"]
+    assert (bulkhead.in_flight, bulkhead.queued) == (1, 1)
+
+    with pytest.raises(OverloadedError) as exc_info:
+        await bus.dispatch(_SlowQuery())
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.details["max_queue"] == 1
+    assert await asyncio.gather(running, waiting) == ["done", "done"]
+    assert (bulkhead.pending, bulkhead.rejected) == (0, 1)
+    assert await bus.dispatch(_SlowQuery()) == "done"
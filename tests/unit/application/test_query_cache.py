@@ -0,0 +1,234 @@
+"""Unit tests for the query result cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from sackmesser.application.bus import CommandBus, QueryBus
+from sackmesser.application.errors import OverloadedError
+from sackmesser.application.middleware import ConcurrencyLimitMiddleware
+from sackmesser.application.query_cache import QueryResultCache
+from sackmesser.application.session import current_session_id, session_scope
+from sackmesser.domain.cache import CacheEntry
+
+
+class _ListQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    limit: int
+
+
+class _ListResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[str]
+
+
+class _CreateCommand(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    item: str
+
+
+class _FakeStore:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.fail = False
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        self._check()
+        self.values[key] = value
+        self.ttls[key] = ttl_seconds
+        return True
+
+    async def get(self, key: str) -> CacheEntry:
+        self._check()
+        return CacheEntry(key=key, value=self.values.get(key))
+
+    async def delete(self, key: str) -> bool:
+        return self.values.pop(key, None) is not None
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        for key, value, ttl in entries:
+            await self.set(key, value, ttl)
+        return True
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        return [await self.get(key) for key in keys]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        return sum([await self.delete(key) for key in keys])
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("store down")
+
+
+class _Repository:
+    def __init__(self) -> None:
+        self.items: list[str] = []
+        self.list_calls = 0
+
+
+class _ListHandler:
+    def __init__(self, repository: _Repository) -> None:
+        self._repository = repository
+
+    async def handle(self, query: _ListQuery) -> _ListResult:
+        self._repository.list_calls += 1
+        return _ListResult(items=self._repository.items[: query.limit])
+
+
+class _CreateHandler:
+    def __init__(self, repository: _Repository) -> None:
+        self._repository = repository
+
+    async def handle(self, command: _CreateCommand) -> str:
+        self._repository.items.append(command.item)
+        return command.item
+
+
+def _buses(
+    store: _FakeStore, repository: _Repository
+) -> tuple[QueryResultCache, CommandBus, QueryBus]:
+    cache = QueryResultCache(store)
+    cache.cache_query(_ListQuery, _ListResult, ttl_seconds=30, tags=("items",))
+    cache.invalidate_on(_CreateCommand, "items")
+    command_bus = CommandBus()
+    query_bus = QueryBus()
+    command_bus.register(_CreateCommand, cache.wrap(_CreateCommand, _CreateHandler(repository)))
+    query_bus.register(_ListQuery, cache.wrap(_ListQuery, _ListHandler(repository)))
+    return cache, command_bus, query_bus
+
+
+async def test_repeated_queries_are_served_from_cache() -> None:
+    store = _FakeStore()
+    repository = _Repository()
+    repository.items = ["a", "b"]
+    cache, _command_bus, query_bus = _buses(store, repository)
+
+    first = await query_bus.dispatch(_ListQuery(limit=10))
+    second = await query_bus.dispatch(_ListQuery(limit=10))
+    other_page = await query_bus.dispatch(_ListQuery(limit=1))
+
+    assert first == second == _ListResult(items=["a", "b"])
+    assert other_page.items == ["a"]
+    assert repository.list_calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert 30 in store.ttls.values()
+
+
+async def test_tagged_command_invalidates_cached_pages() -> None:
+    store = _FakeStore()
+    repository = _Repository()
+    _cache, command_bus, query_bus = _buses(store, repository)
+
+    assert (await query_bus.dispatch(_ListQuery(limit=10))).items == []
+    await command_bus.dispatch(_CreateCommand(item="new"))
+    refreshed = await query_bus.dispatch(_ListQuery(limit=10))
+
+    assert refreshed.items == ["new"]
+    assert repository.list_calls == 2
+
+
+async def test_store_failures_fall_back_to_handler() -> None:
+    store = _FakeStore()
+    store.fail = True
+    repository = _Repository()
+    repository.items = ["a"]
+    cache, command_bus, query_bus = _buses(store, repository)
+
+    assert (await query_bus.dispatch(_ListQuery(limit=10))).items == ["a"]
+    assert await command_bus.dispatch(_CreateCommand(item="b")) == "b"
+    assert cache.misses == 1
+
+
+async def test_undecodable_cached_value_is_recomputed() -> None:
+    store = _FakeStore()
+    repository = _Repository()
+    _cache, _command_bus, query_bus = _buses(store, repository)
+    await query_bus.dispatch(_ListQuery(limit=10))
+    for key in store.values:
+        if ":tag:" not in key:
+            store.values[key] = "{not json"
+
+    result = await query_bus.dispatch(_ListQuery(limit=10))
+
+    assert result.items == []
+    assert repository.list_calls == 2
+
+
+class _Pins:
+    def pinned_session(self) -> str | None:
+        session = current_session_id()
+        return session if session == "writer" else None
+
+
+async def test_pinned_sessions_bypass_cached_results() -> None:
+    store = _FakeStore()
+    repository = _Repository()
+    cache, _command_bus, query_bus = _buses(store, repository)
+    cache.pins = _Pins()
+
+    with session_scope("reader"):
+        assert (await query_bus.dispatch(_ListQuery(limit=10))).items == []
+    # Written without the bus, as a replica that has not caught up would not see it.
+    repository.items.append("fresh")
+    with session_scope("writer"):
+        assert (await query_bus.dispatch(_ListQuery(limit=10))).items == ["fresh"]
+    with session_scope("reader"):
+        assert (await query_bus.dispatch(_ListQuery(limit=10))).items == []
+
+    assert repository.list_calls == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+class _GatedListHandler(_ListHandler):
+    def __init__(self, repository: _Repository) -> None:
+        super().__init__(repository)
+        self.gate = asyncio.Event()
+
+    async def handle(self, query: _ListQuery) -> _ListResult:
+        if query.limit == 1:
+            await self.gate.wait()
+        return await super().handle(query)
+
+
+async def test_bus_cache_serves_hits_without_taking_a_concurrency_slot() -> None:
+    repository = _Repository()
+    repository.items = ["a"]
+    cache = QueryResultCache(_FakeStore())
+    cache.cache_query(_ListQuery, _ListResult, ttl_seconds=30)
+    limits = ConcurrencyLimitMiddleware({"_ListQuery": 1}, max_queue={"_ListQuery": 0})
+    handler = _GatedListHandler(repository)
+    query_bus = QueryBus()
+    query_bus.use(limits)
+    query_bus.set_cache(cache)
+    query_bus.register(_ListQuery, handler)
+    await query_bus.dispatch(_ListQuery(limit=10))
+
+    # The only slot is held by a miss, so a second miss is shed while a hit is served.
+    holder = asyncio.create_task(query_bus.dispatch(_ListQuery(limit=1)))
+    await asyncio.sleep(0)
+    with pytest.raises(OverloadedError):
+        await query_bus.dispatch(_ListQuery(limit=2))
+    assert (await query_bus.dispatch(_ListQuery(limit=10))).items == ["a"]
+    handler.gate.set()
+    await holder
+
+    assert limits.bulkheads()["_ListQuery"].rejected == 1
+    assert (cache.hits, repository.list_calls) == (1, 2)
+
+
+def test_wrap_leaves_unregistered_handlers_untouched() -> None:
+    cache = QueryResultCache(_FakeStore())
+    handler = _ListHandler(_Repository())
+
+    assert cache.wrap(_ListQuery, handler) is handler
+    with pytest.raises(ValueError, match="must be positive"):
+        cache.cache_query(_ListQuery, _ListResult, ttl_seconds=0)
@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
-from sackmesser.application.requests.core import GetCapabilitiesQuery, GetHealthQuery
-from sackmesser.application.use_cases.core import GetCapabilitiesUseCase, GetHealthUseCase
-from sackmesser.domain.core import Capability, HealthSnapshot
+import pytest
+
+from sackmesser.application.middleware import LatencyHistogramMiddleware
+from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
+    GetCapabilitiesQuery,
+    GetHealthQuery,
+)
+from sackmesser.application.use_cases.core import (
+    GetBusMetricsUseCase,
+    GetCapabilitiesUseCase,
+    GetHealthUseCase,
+)
+from sackmesser.domain.core import Capability, HealthSnapshot, StatementTiming
 
 
 class _FakeCapabilityPort:
@@ -25,6 +36,20 @@ class _FakeCapabilityPort:
         ]
 
 
+class _FakeStatementMetricsPort:
+    async def list_statement_timings(self) -> list[StatementTiming]:
+        return [
+            StatementTiming(
+                name="insert",
+                calls=4,
+                errors=1,
+                rows=3,
+                total_seconds=0.2,
+                max_seconds=0.1,
+            )
+        ]
+
+
 class _FakeHealthPort:
     async def get_health(self) -> HealthSnapshot:
         return HealthSnapshot(status="ok", payload={"status": "ok", "checks": {}})
@@ -42,3 +67,41 @@ async def test_get_health_use_case_returns_snapshot() -> None:
     result = await use_case.execute(GetHealthQuery())
     assert result.status == "ok"
     assert result.payload["status"] == "ok"
+
+
+async def test_get_bus_metrics_use_case_summarizes_histograms() -> None:
+    latency = LatencyHistogramMiddleware(buckets=(0.1,))
+    latency.wrap(GetHealthQuery, _FakeHealthPort())
+    histogram = latency.histograms()["GetHealthQuery"]
+    histogram.observe(0.05)
+    histogram.observe(0.25, failed=True)
+
+    result = await GetBusMetricsUseCase(latency).execute(GetBusMetricsQuery())
+
+    assert result.enabled is True
+    [entry] = result.requests
+    assert entry.request_type == "GetHealthQuery"
+    assert entry.count == 2
+    assert entry.errors == 1
+    assert entry.mean_seconds == pytest.approx(0.15)
+    assert [(bucket.le, bucket.count) for bucket in entry.buckets] == [("0.1", 1), ("+Inf", 2)]
+
+
+async def test_get_bus_metrics_use_case_reports_disabled() -> None:
+    result = await GetBusMetricsUseCase(None).execute(GetBusMetricsQuery())
+
+    assert result.enabled is False
+    assert result.requests == []
+
+
+async def test_get_bus_metrics_use_case_includes_statement_timings() -> None:
+    result = await GetBusMetricsUseCase(
+        None,
+        statements=_FakeStatementMetricsPort(),
+    ).execute(GetBusMetricsQuery())
+
+    assert result.enabled is False
+    [statement] = result.statements
+    assert statement.name == "insert"
+    assert statement.rows == 3
+    assert statement.mean_seconds == pytest.approx(0.05)
@@ -6,13 +6,15 @@ from datetime import UTC, datetime
 
 from sackmesser.application.handlers.workflows import (
     CreateWorkflowCommandHandler,
+    CreateWorkflowsBatchCommandHandler,
     ListWorkflowsQueryHandler,
 )
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
+    CreateWorkflowsBatchCommand,
     ListWorkflowsQuery,
 )
-from sackmesser.domain.workflows import Workflow
+from sackmesser.domain.workflows import Workflow, WorkflowTimeRange
 
 
 class _FakeWorkflowRepository:
@@ -29,7 +31,12 @@ class _FakeWorkflowRepository:
         self._items.append(workflow)
         return workflow
 
-    async def list(self, *, limit: int, offset: int) -> list[Workflow]:
+    async def create_many(self, items: list[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        return [await self.create(title, payload) for title, payload in items]
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
         return self._items[offset : offset + limit]
 
 
@@ -44,6 +51,18 @@ async def test_create_workflow_command_handler() -> None:
     assert result.workflow.payload["kind"] == "smoke"
 
 
+async def test_create_workflows_batch_command_handler() -> None:
+    repository = _FakeWorkflowRepository()
+    handler = CreateWorkflowsBatchCommandHandler(repository)
+
+    result = await handler.handle(
+        CreateWorkflowsBatchCommand(
+            workflows=[CreateWorkflowCommand(title="one"), CreateWorkflowCommand(title="two")]
+        )
+    )
+    assert [item.id for item in result.workflows] == ["wf-1", "wf-2"]
+
+
 async def test_list_workflows_query_handler() -> None:
     repository = _FakeWorkflowRepository()
     await repository.create("one", {})
@@ -2,32 +2,175 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta
 
-from sackmesser.application.requests.workflows import CreateWorkflowCommand, ListWorkflowsQuery
+import pytest
+
+from sackmesser.application.errors import NotFoundError, ValidationError
+from sackmesser.application.requests.workflows import (
+    CreateWorkflowCommand,
+    CreateWorkflowsBatchCommand,
+    ExportWorkflowsQuery,
+    GetWorkflowQuery,
+    GetWorkflowsQuery,
+    ListWorkflowsJsonQuery,
+    ListWorkflowsQuery,
+    ListWorkflowsResult,
+    SearchWorkflowsQuery,
+    UpdateWorkflowPayloadCommand,
+    WorkflowPayloadSetOperation,
+)
 from sackmesser.application.use_cases.workflows import (
+    CreateWorkflowsBatchUseCase,
     CreateWorkflowUseCase,
+    ExportWorkflowsUseCase,
+    GetWorkflowsUseCase,
+    GetWorkflowUseCase,
+    ListWorkflowsJsonUseCase,
     ListWorkflowsUseCase,
+    SearchWorkflowsUseCase,
+    UpdateWorkflowPayloadUseCase,
+    decode_workflow_cursor,
+    encode_workflow_cursor,
+)
+from sackmesser.domain.workflows import (
+    EncodedWorkflow,
+    Workflow,
+    WorkflowCount,
+    WorkflowCursor,
+    WorkflowPayloadSet,
+    WorkflowTimeRange,
 )
-from sackmesser.domain.workflows import Workflow
 
 
 class _FakeWorkflowRepository:
     def __init__(self) -> None:
         self._items: list[Workflow] = []
+        self.get_many_calls: list[list[str]] = []
+        self.update_calls: list[
+            tuple[str, dict[str, object] | None, list[WorkflowPayloadSet]]
+        ] = []
 
     async def create(self, title: str, payload: dict[str, object]) -> Workflow:
         workflow = Workflow(
             id=f"wf-{len(self._items)+1}",
             title=title,
             payload=dict(payload),
-            created_at=datetime.now(tz=UTC),
+            created_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=len(self._items)),
         )
         self._items.append(workflow)
         return workflow
 
-    async def list(self, *, limit: int, offset: int) -> list[Workflow]:
-        return self._items[offset : offset + limit]
+    async def create_many(self, items: list[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        return [await self.create(title, payload) for title, payload in items]
+
+    async def get(self, workflow_id: str) -> Workflow | None:
+        return next((item for item in self._items if item.id == workflow_id), None)
+
+    async def get_many(self, workflow_ids: list[str]) -> list[Workflow]:
+        self.get_many_calls.append(list(workflow_ids))
+        return [item for item in reversed(self._items) if item.id in workflow_ids]
+
+    def canonical_id(self, workflow_id: str) -> str | None:
+        return workflow_id.lower() if workflow_id.startswith(("wf-", "WF-")) else None
+
+    async def update_payload(
+        self,
+        workflow_id: str,
+        *,
+        merge: dict[str, object] | None = None,
+        sets: list[WorkflowPayloadSet] | tuple[WorkflowPayloadSet, ...] = (),
+    ) -> Workflow | None:
+        self.update_calls.append((workflow_id, merge, list(sets)))
+        current = await self.get(workflow_id)
+        if current is None:
+            return None
+        payload = {**current.payload, **(merge or {})}
+        updated = Workflow(
+            id=current.id,
+            title=current.title,
+            payload=payload,
+            created_at=current.created_at,
+        )
+        self._items[self._items.index(current)] = updated
+        return updated
+
+    def _ordered(self, time_range: WorkflowTimeRange | None = None) -> list[Workflow]:
+        items = sorted(self._items, key=lambda item: (item.created_at, item.id), reverse=True)
+        if time_range is not None:
+            items = [
+                item
+                for item in items
+                if (time_range.start is None or item.created_at >= time_range.start)
+                and (time_range.end is None or item.created_at < time_range.end)
+            ]
+        return items
+
+    async def list(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[Workflow]:
+        return self._ordered(time_range)[offset : offset + limit]
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> list[Workflow]:
+        items = self._ordered(time_range)
+        if cursor is not None:
+            items = [
+                item
+                for item in items
+                if (item.created_at, item.id) < (cursor.created_at, cursor.id)
+            ]
+        return items[:limit]
+
+    async def count(self, *, exact_below: int) -> WorkflowCount:
+        return WorkflowCount(value=len(self._items), exact=len(self._items) < exact_below)
+
+    async def search(
+        self,
+        *,
+        title: str | None,
+        payload_contains: dict[str, object] | None,
+        limit: int,
+        cursor: WorkflowCursor | None,
+    ) -> list[Workflow]:
+        items = [
+            item
+            for item in await self.list_after(limit=len(self._items), cursor=cursor)
+            if (title is None or title.lower() in item.title.lower())
+            and all(item.payload.get(key) == value for key, value in (payload_contains or {}).items())
+        ]
+        return items[:limit]
+
+    async def list_encoded(
+        self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+    ) -> list[EncodedWorkflow]:
+        items = await self.list(limit=limit, offset=offset, time_range=time_range)
+        return [_encoded(item) for item in items]
+
+    async def list_encoded_after(
+        self,
+        *,
+        limit: int,
+        cursor: WorkflowCursor | None,
+        time_range: WorkflowTimeRange | None = None,
+    ) -> list[EncodedWorkflow]:
+        items = await self.list_after(limit=limit, cursor=cursor, time_range=time_range)
+        return [_encoded(item) for item in items]
+
+
+def _encoded(workflow: Workflow) -> EncodedWorkflow:
+    return EncodedWorkflow(
+        id=workflow.id,
+        title=workflow.title,
+        payload_json=json.dumps(workflow.payload),
+        created_at=workflow.created_at,
+    )
 
 
 async def test_create_workflow_use_case() -> None:
@@ -41,6 +184,108 @@ async def test_create_workflow_use_case() -> None:
     assert result.workflow.payload["kind"] == "smoke"
 
 
+async def test_create_workflows_batch_use_case() -> None:
+    repository = _FakeWorkflowRepository()
+    use_case = CreateWorkflowsBatchUseCase(repository)
+
+    result = await use_case.execute(
+        CreateWorkflowsBatchCommand(
+            workflows=[
+                CreateWorkflowCommand(title="one"),
+                CreateWorkflowCommand(title="two", payload={"kind": "smoke"}),
+            ]
+        )
+    )
+
+    assert [item.title for item in result.workflows] == ["one", "two"]
+    assert result.workflows[1].payload == {"kind": "smoke"}
+
+
+async def test_get_workflow_use_case() -> None:
+    repository = _FakeWorkflowRepository()
+    created = await repository.create("demo", {"k": "v"})
+
+    result = await GetWorkflowUseCase(repository).execute(GetWorkflowQuery(id=created.id))
+
+    assert result.workflow.id == created.id
+    assert result.workflow.payload == {"k": "v"}
+
+
+async def test_get_workflow_use_case_raises_not_found() -> None:
+    use_case = GetWorkflowUseCase(_FakeWorkflowRepository())
+
+    with pytest.raises(NotFoundError) as exc_info:
+        await use_case.execute(GetWorkflowQuery(id="wf-404"))
+
+    assert exc_info.value.code == "workflow_not_found"
+    assert exc_info.value.details == {"id": "wf-404"}
+
+
+async def test_get_workflows_use_case_keeps_request_order_and_reports_missing() -> None:
+    repository = _FakeWorkflowRepository()
+    for title in ("a", "b", "c"):
+        await repository.create(title, {})
+
+    result = await GetWorkflowsUseCase(repository).execute(
+        GetWorkflowsQuery(ids=("wf-1", "wf-404", "wf-3", "wf-1"))
+    )
+
+    assert [item.id for item in result.workflows] == ["wf-1", "wf-3"]
+    assert result.missing == ["wf-404"]
+    assert repository.get_many_calls == [["wf-1", "wf-404", "wf-3"]]
+
+
+async def test_get_workflows_use_case_matches_ids_in_canonical_spelling() -> None:
+    repository = _FakeWorkflowRepository()
+    await repository.create("a", {})
+
+    result = await GetWorkflowsUseCase(repository).execute(
+        GetWorkflowsQuery(ids=("WF-1", "wf-1", "bogus"))
+    )
+
+    assert [item.id for item in result.workflows] == ["wf-1"]
+    assert result.missing == ["bogus"]
+
+
+async def test_update_workflow_payload_use_case_passes_patch_to_repository() -> None:
+    repository = _FakeWorkflowRepository()
+    created = await repository.create("demo", {"status": "new"})
+
+    result = await UpdateWorkflowPayloadUseCase(repository).execute(
+        UpdateWorkflowPayloadCommand(
+            id=created.id,
+            merge={"status": "done"},
+            sets=(WorkflowPayloadSetOperation(path=("meta", "owner"), value="ops"),),
+        )
+    )
+
+    assert result.workflow.payload == {"status": "done"}
+    assert repository.update_calls == [
+        (created.id, {"status": "done"}, [WorkflowPayloadSet(path=("meta", "owner"), value="ops")])
+    ]
+
+
+async def test_update_workflow_payload_use_case_rejects_empty_patch() -> None:
+    repository = _FakeWorkflowRepository()
+
+    with pytest.raises(ValidationError) as exc_info:
+        await UpdateWorkflowPayloadUseCase(repository).execute(
+            UpdateWorkflowPayloadCommand(id="wf-1")
+        )
+
+    assert exc_info.value.code == "empty_payload_update"
+    assert repository.update_calls == []
+
+
+async def test_update_workflow_payload_use_case_raises_not_found() -> None:
+    use_case = UpdateWorkflowPayloadUseCase(_FakeWorkflowRepository())
+
+    with pytest.raises(NotFoundError) as exc_info:
+        await use_case.execute(UpdateWorkflowPayloadCommand(id="wf-404", merge={"k": 1}))
+
+    assert exc_info.value.code == "workflow_not_found"
+
+
 async def test_list_workflows_use_case() -> None:
     repository = _FakeWorkflowRepository()
     await repository.create("one", {})
@@ -49,3 +294,216 @@ async def test_list_workflows_use_case() -> None:
     use_case = ListWorkflowsUseCase(repository)
     result = await use_case.execute(ListWorkflowsQuery(limit=10, offset=0))
     assert len(result.workflows) == 2
+
+
+async def test_list_workflows_use_case_pages_with_cursor() -> None:
+    repository = _FakeWorkflowRepository()
+    for title in ("one", "two", "three"):
+        await repository.create(title, {})
+    use_case = ListWorkflowsUseCase(repository)
+
+    first = await use_case.execute(ListWorkflowsQuery(limit=2))
+    assert [item.title for item in first.workflows] == ["three", "two"]
+    assert first.next_cursor is not None
+
+    second = await use_case.execute(ListWorkflowsQuery(limit=2, cursor=first.next_cursor))
+    assert [item.title for item in second.workflows] == ["one"]
+    assert second.next_cursor is None
+
+
+def test_workflow_cursor_round_trips() -> None:
+    workflow = Workflow(
+        id="wf-9",
+        title="demo",
+        payload={},
+        created_at=datetime(2026, 1, 1, 12, 30, tzinfo=UTC),
+    )
+
+    cursor = decode_workflow_cursor(encode_workflow_cursor(workflow))
+
+    assert cursor == WorkflowCursor(created_at=workflow.created_at, id="wf-9")
+
+
+async def test_list_workflows_use_case_rejects_invalid_cursor() -> None:
+    use_case = ListWorkflowsUseCase(_FakeWorkflowRepository())
+
+    with pytest.raises(ValidationError) as exc_info:
+        await use_case.execute(ListWorkflowsQuery(cursor="not-a-cursor"))
+
+    assert exc_info.value.code == "invalid_cursor"
+
+
+async def test_cursor_ids_the_store_cannot_have_are_invalid() -> None:
+    repository = _FakeWorkflowRepository()
+    await repository.create("one", {})
+    created_at = datetime(2026, 1, 1, 0, 1, tzinfo=UTC)
+    foreign = Workflow(id="not-a-workflow-id", title="x", payload={}, created_at=created_at)
+    upper = Workflow(id="WF-2", title="x", payload={}, created_at=created_at)
+
+    cursor = encode_workflow_cursor(foreign)
+
+    with pytest.raises(ValidationError) as listing:
+        await ListWorkflowsUseCase(repository, ids=repository).execute(
+            ListWorkflowsQuery(cursor=cursor)
+        )
+    with pytest.raises(ValidationError) as export:
+        await ExportWorkflowsUseCase(repository, ids=repository).execute(
+            ExportWorkflowsQuery(cursor=cursor)
+        )
+
+    assert listing.value.code == export.value.code == "invalid_cursor"
+
+    assert decode_workflow_cursor(encode_workflow_cursor(upper), repository).id == "wf-2"
+    assert decode_workflow_cursor(encode_workflow_cursor(foreign)).id == "not-a-workflow-id"
+
+
+async def test_list_workflows_use_case_rejects_cursor_with_offset() -> None:
+    repository = _FakeWorkflowRepository()
+    workflow = await repository.create("one", {})
+    use_case = ListWorkflowsUseCase(repository)
+
+    with pytest.raises(ValidationError, match="cannot be combined"):
+        await use_case.execute(
+            ListWorkflowsQuery(offset=5, cursor=encode_workflow_cursor(workflow))
+        )
+
+
+async def test_list_workflows_json_use_case_matches_structured_listing() -> None:
+    repository = _FakeWorkflowRepository()
+    await repository.create("one", {"nested": {"n": [1, 2]}})
+    await repository.create('two "quoted"', {"text": "\u00e9"})
+    await repository.create("three", {})
+
+    for query in (
+        ListWorkflowsQuery(limit=2),
+        ListWorkflowsQuery(limit=10, offset=1),
+    ):
+        expected = await ListWorkflowsUseCase(repository).execute(query)
+        result = await ListWorkflowsJsonUseCase(repository).execute(
+            ListWorkflowsJsonQuery(**query.model_dump())
+        )
+
+        assert json.loads(result.content) == json.loads(expected.model_dump_json())
+        assert ListWorkflowsResult.model_validate_json(result.content) == expected
+
+
+async def test_list_workflows_json_use_case_rejects_cursor_with_offset() -> None:
+    repository = _FakeWorkflowRepository()
+    workflow = await repository.create("one", {})
+
+    with pytest.raises(ValidationError, match="cannot be combined"):
+        await ListWorkflowsJsonUseCase(repository).execute(
+            ListWorkflowsJsonQuery(offset=5, cursor=encode_workflow_cursor(workflow))
+        )
+
+
+async def test_export_workflows_use_case_walks_every_row_in_chunks() -> None:
+    repository = _FakeWorkflowRepository()
+    for index in range(5):
+        await repository.create(f"wf {index}", {"n": index})
+    use_case = ExportWorkflowsUseCase(repository)
+
+    lines: list[str] = []
+    cursor: str | None = None
+    chunks = 0
+    while True:
+        chunk = await use_case.execute(ExportWorkflowsQuery(limit=2, cursor=cursor))
+        chunks += 1
+        assert chunk.count == len(chunk.ndjson.splitlines())
+        lines.extend(chunk.ndjson.splitlines())
+        cursor = chunk.next_cursor
+        if cursor is None:
+            break
+
+    assert chunks == 3
+    rows = [json.loads(line) for line in lines]
+    assert [row["title"] for row in rows] == [f"wf {index}" for index in range(4, -1, -1)]
+    assert rows[0]["payload"] == {"n": 4}
+
+
+async def test_search_workflows_use_case_filters_and_pages() -> None:
+    repository = _FakeWorkflowRepository()
+    await repository.create("Nightly report", {"team": "ops"})
+    await repository.create("nightly cleanup", {"team": "data"})
+    await repository.create("Weekly report", {"team": "ops"})
+    await repository.create("NIGHTLY backfill", {"team": "ops"})
+    use_case = SearchWorkflowsUseCase(repository)
+
+    first = await use_case.execute(
+        SearchWorkflowsQuery(title="nightly", payload_contains={"team": "ops"}, limit=1)
+    )
+    second = await use_case.execute(
+        SearchWorkflowsQuery(
+            title="nightly", payload_contains={"team": "ops"}, limit=1, cursor=first.next_cursor
+        )
+    )
+
+    assert [item.title for item in first.workflows] == ["NIGHTLY backfill"]
+    assert [item.title for item in second.workflows] == ["Nightly report"]
+    assert second.next_cursor is not None
+
+
+async def test_list_workflows_use_cases_include_total_when_asked() -> None:
+    repository = _FakeWorkflowRepository()
+    for title in ("one", "two", "three"):
+        await repository.create(title, {})
+
+    exact = await ListWorkflowsUseCase(repository, counter=repository).execute(
+        ListWorkflowsQuery(limit=1, include_total=True)
+    )
+    estimated = await ListWorkflowsUseCase(
+        repository, counter=repository, exact_count_below=2
+    ).execute(ListWorkflowsQuery(limit=1, include_total=True))
+    spliced = await ListWorkflowsJsonUseCase(repository, counter=repository).execute(
+        ListWorkflowsJsonQuery(limit=1, include_total=True)
+    )
+    plain = await ListWorkflowsUseCase(repository, counter=repository).execute(
+        ListWorkflowsQuery(limit=1)
+    )
+
+    assert (exact.total, exact.total_estimated) == (3, False)
+    assert (estimated.total, estimated.total_estimated) == (3, True)
+    assert json.loads(spliced.content) == json.loads(exact.model_dump_json())
+    assert plain.total is None
+
+
+async def test_list_workflows_use_case_rejects_total_without_counter() -> None:
+    use_case = ListWorkflowsUseCase(_FakeWorkflowRepository())
+
+    with pytest.raises(ValidationError) as exc_info:
+        await use_case.execute(ListWorkflowsQuery(include_total=True))
+
+    assert exc_info.value.code == "unsupported_total"
+
+
+@pytest.mark.parametrize("use_case_type", [ListWorkflowsUseCase, ListWorkflowsJsonUseCase])
+async def test_list_workflows_use_cases_reject_total_within_time_range(
+    use_case_type: type[ListWorkflowsUseCase] | type[ListWorkflowsJsonUseCase],
+) -> None:
+    repository = _FakeWorkflowRepository()
+    use_case = use_case_type(repository, counter=repository)  # type: ignore[arg-type]
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    with pytest.raises(ValidationError) as exc_info:
+        await use_case.execute(ListWorkflowsJsonQuery(include_total=True, created_from=start))
+
+    assert exc_info.value.code == "unsupported_total"
+
+
+async def test_list_workflows_use_case_bounds_listing_in_time() -> None:
+    repository = _FakeWorkflowRepository()
+    for title in ("one", "two", "three", "four"):
+        await repository.create(title, {})
+    use_case = ListWorkflowsUseCase(repository)
+    start = datetime(2026, 1, 1, 0, 1, tzinfo=UTC)
+
+    result = await use_case.execute(
+        ListWorkflowsQuery(created_from=start, created_to=start + timedelta(minutes=2))
+    )
+    naive = await use_case.execute(ListWorkflowsQuery(created_from=start.replace(tzinfo=None)))
+
+    assert [item.title for item in result.workflows] == ["three", "two"]
+    assert [item.title for item in naive.workflows] == ["four", "three", "two"]
+    with pytest.raises(ValidationError) as exc_info:
+        await use_case.execute(ListWorkflowsQuery(created_from=start, created_to=start))
+    assert exc_info.value.code == "invalid_time_range"
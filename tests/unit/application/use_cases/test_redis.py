@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from sackmesser.application.handlers.cache import (
+    DeleteCacheEntriesCommandHandler,
     DeleteCacheEntryCommandHandler,
+    GetCacheEntriesQueryHandler,
     GetCacheEntryQueryHandler,
+    SetCacheEntriesCommandHandler,
     SetCacheEntryCommandHandler,
 )
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
     DeleteCacheEntryCommand,
+    GetCacheEntriesQuery,
     GetCacheEntryQuery,
+    SetCacheEntriesCommand,
     SetCacheEntryCommand,
 )
 from sackmesser.domain.cache import CacheEntry
@@ -30,6 +36,17 @@ class _FakeCacheRepository:
     async def delete(self, key: str) -> bool:
         return self._store.pop(key, None) is not None
 
+    async def set_many(self, entries: list[tuple[str, str, int | None]]) -> bool:
+        for key, value, _ttl in entries:
+            self._store[key] = value
+        return True
+
+    async def get_many(self, keys: list[str]) -> list[CacheEntry]:
+        return [CacheEntry(key=key, value=self._store.get(key)) for key in keys]
+
+    async def delete_many(self, keys: list[str]) -> int:
+        return sum(self._store.pop(key, None) is not None for key in keys)
+
 
 async def test_set_and_get_cache_handlers() -> None:
     repository = _FakeCacheRepository()
@@ -54,3 +71,20 @@ async def test_delete_cache_handler() -> None:
         DeleteCacheEntryCommand(key="alpha")
     )
     assert result.success is True
+
+
+async def test_batch_cache_handlers() -> None:
+    repository = _FakeCacheRepository()
+
+    await SetCacheEntriesCommandHandler(repository).handle(
+        SetCacheEntriesCommand(entries=[SetCacheEntryCommand(key="alpha", value="1")])
+    )
+    got = await GetCacheEntriesQueryHandler(repository).handle(
+        GetCacheEntriesQuery(keys=("alpha",))
+    )
+    deleted = await DeleteCacheEntriesCommandHandler(repository).handle(
+        DeleteCacheEntriesCommand(keys=["alpha"])
+    )
+
+    assert got.entries[0].value == "1"
+    assert deleted.deleted == 1
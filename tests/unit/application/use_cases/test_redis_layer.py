@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
     DeleteCacheEntryCommand,
+    GetCacheEntriesQuery,
     GetCacheEntryQuery,
+    GetCacheStatsQuery,
+    SetCacheEntriesCommand,
     SetCacheEntryCommand,
 )
 from sackmesser.application.use_cases.cache import (
+    DeleteCacheEntriesUseCase,
     DeleteCacheEntryUseCase,
+    GetCacheEntriesUseCase,
     GetCacheEntryUseCase,
+    GetCacheStatsUseCase,
+    SetCacheEntriesUseCase,
     SetCacheEntryUseCase,
 )
-from sackmesser.domain.cache import CacheEntry
+from sackmesser.domain.cache import CacheEntry, CacheStats
 
 
 class _FakeCacheRepository:
@@ -30,6 +38,17 @@ class _FakeCacheRepository:
     async def delete(self, key: str) -> bool:
         return self._store.pop(key, None) is not None
 
+    async def set_many(self, entries: list[tuple[str, str, int | None]]) -> bool:
+        for key, value, _ttl in entries:
+            self._store[key] = value
+        return True
+
+    async def get_many(self, keys: list[str]) -> list[CacheEntry]:
+        return [CacheEntry(key=key, value=self._store.get(key)) for key in keys]
+
+    async def delete_many(self, keys: list[str]) -> int:
+        return sum(self._store.pop(key, None) is not None for key in keys)
+
 
 async def test_set_and_get_cache_use_cases() -> None:
     repository = _FakeCacheRepository()
@@ -50,3 +69,47 @@ async def test_delete_cache_use_case() -> None:
 
     result = await DeleteCacheEntryUseCase(repository).execute(DeleteCacheEntryCommand(key="alpha"))
     assert result.success is True
+
+
+async def test_batch_cache_use_cases() -> None:
+    repository = _FakeCacheRepository()
+
+    set_result = await SetCacheEntriesUseCase(repository).execute(
+        SetCacheEntriesCommand(
+            entries=[
+                SetCacheEntryCommand(key="alpha", value="1"),
+                SetCacheEntryCommand(key="beta", value="2", ttl_seconds=5),
+            ]
+        )
+    )
+    get_result = await GetCacheEntriesUseCase(repository).execute(
+        GetCacheEntriesQuery(keys=("beta", "missing", "alpha"))
+    )
+    delete_result = await DeleteCacheEntriesUseCase(repository).execute(
+        DeleteCacheEntriesCommand(keys=["alpha", "missing"])
+    )
+
+    assert set_result.success is True
+    assert set_result.keys == ["alpha", "beta"]
+    assert [(item.key, item.value, item.found) for item in get_result.entries] == [
+        ("beta", "2", True),
+        ("missing", None, False),
+        ("alpha", "1", True),
+    ]
+    assert delete_result.deleted == 1
+    assert delete_result.keys == ["alpha", "missing"]
+
+
+async def test_get_cache_stats_use_case_reports_hit_ratio() -> None:
+    class _StatsPort:
+        def stats(self) -> CacheStats:
+            return CacheStats(enabled=True, hits=3, misses=1, entries=2, max_entries=10)
+
+    result = await GetCacheStatsUseCase(_StatsPort()).execute(GetCacheStatsQuery())
+    disabled = await GetCacheStatsUseCase(None).execute(GetCacheStatsQuery())
+
+    assert result.enabled is True
+    assert result.hit_ratio == 0.75
+    assert result.entries == 2
+    assert disabled.enabled is False
+    assert disabled.hit_ratio == 0.0
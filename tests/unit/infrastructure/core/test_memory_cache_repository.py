@@ -0,0 +1,56 @@
+"""Unit tests for the in-memory cache repository."""
+
+from __future__ import annotations
+
+from sackmesser.infrastructure.core.memory_cache_repository import MemoryCacheRepository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    repository = MemoryCacheRepository(default_ttl_seconds=60, clock=clock)
+
+    await repository.set("short", "1", ttl_seconds=5)
+    await repository.set("default", "2")
+    clock.now = 5.0
+
+    assert (await repository.get("short")).value is None
+    assert (await repository.get("default")).value == "2"
+
+
+async def test_evicts_least_recently_used_entries() -> None:
+    repository = MemoryCacheRepository(max_entries=2)
+
+    await repository.set_many([("a", "1", None), ("b", "2", None)])
+    await repository.get("a")
+    await repository.set("c", "3")
+
+    assert [entry.value for entry in await repository.get_many(["a", "b", "c"])] == ["1", None, "3"]
+
+
+async def test_delete_many_counts_existing_keys() -> None:
+    repository = MemoryCacheRepository()
+    await repository.set("a", "1")
+
+    assert await repository.delete_many(["a", "a", "missing"]) == 1
+    assert await repository.delete("a") is False
+
+
+async def test_add_many_keeps_live_values_and_fills_expired_ones() -> None:
+    clock = _Clock()
+    repository = MemoryCacheRepository(clock=clock)
+    await repository.set("live", "1")
+    await repository.set("expired", "2", ttl_seconds=5)
+    clock.now = 5.0
+
+    added = await repository.add_many([("live", "10", None), ("expired", "20", None)])
+
+    assert added == 1
+    assert [entry.value for entry in await repository.get_many(["live", "expired"])] == ["1", "20"]
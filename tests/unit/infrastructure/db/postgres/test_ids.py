@@ -0,0 +1,21 @@
+"""Unit tests for time-ordered workflow identifiers."""
+
+from __future__ import annotations
+
+from sackmesser.infrastructure.db.postgres.ids import uuid7
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    value = uuid7(clock=lambda: 1_767_225_600_123_456_789)
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert value.int >> 80 == 1_767_225_600_123
+
+
+def test_uuid7_is_strictly_increasing_within_one_millisecond() -> None:
+    values = [uuid7(clock=lambda: 1_900_000_000_000_000_000) for _ in range(5_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert values[-1].int >> 80 > values[0].int >> 80
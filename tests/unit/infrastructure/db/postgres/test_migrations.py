@@ -0,0 +1,116 @@
+"""Unit tests for versioned Postgres schema migrations."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sackmesser.infrastructure.db.postgres.migrations import (
+    MIGRATIONS_TABLE,
+    Migration,
+    MigrationSettings,
+    PostgresMigrator,
+    SchemaOutOfDateError,
+)
+
+
+class _FakePostgresProvider:
+    def __init__(self, applied: set[int] | None = None) -> None:
+        self.applied = applied
+        self.scripts: list[str] = []
+        self.queries: list[str] = []
+
+    async def fetchone(self, query: str, args: tuple[object, ...]) -> dict[str, Any] | None:
+        self.queries.append(query)
+        if "to_regclass" not in query:
+            return {"run": "true" in query}
+        assert args == (MIGRATIONS_TABLE,)
+        return {"present": self.applied is not None}
+
+    async def fetchall(self, query: str, args: tuple[object, ...]) -> list[dict[str, Any]]:
+        self.queries.append(query)
+        return [{"version": version} for version in sorted(self.applied or ())]
+
+    async def executescript(self, sql: str) -> None:
+        self.scripts.append(sql)
+
+
+_MIGRATIONS = (
+    Migration(1, "create_things", "CREATE TABLE IF NOT EXISTS things ();"),
+    Migration(2, "index_things", "CREATE INDEX IF NOT EXISTS things_idx ON things (id);"),
+)
+
+
+async def test_apply_sends_pending_migrations_in_one_locked_transaction() -> None:
+    provider = _FakePostgresProvider(applied={1})
+    migrator = PostgresMigrator(provider, _MIGRATIONS)  # type: ignore[arg-type]
+
+    applied = await migrator.apply()
+
+    assert [item.label for item in applied] == ["0002_index_things"]
+    [script] = provider.scripts
+    assert script.startswith("BEGIN;\nSELECT pg_advisory_xact_lock(")
+    assert script.rstrip().endswith("COMMIT;")
+    assert "things_idx" in script
+    assert "CREATE TABLE IF NOT EXISTS things ();" not in script
+    assert (
+        f"INSERT INTO {MIGRATIONS_TABLE} (version, name) VALUES (2, 'index_things') "
+        "ON CONFLICT (version) DO NOTHING;"
+    ) in script
+
+
+async def test_apply_runs_non_transactional_migrations_alone_in_version_order() -> None:
+    provider = _FakePostgresProvider()
+    migrations = (
+        *_MIGRATIONS,
+        Migration(3, "build_idx", "CREATE INDEX CONCURRENTLY a", transactional=False),
+        Migration(4, "skipped_idx", "CREATE INDEX CONCURRENTLY b", False, only_if="false"),
+        Migration(5, "comment_things", "COMMENT ON TABLE things IS 'x';"),
+    )
+
+    applied = await PostgresMigrator(provider, migrations).apply()  # type: ignore[arg-type]
+
+    assert [item.version for item in applied] == [1, 2, 3, 4, 5]
+    first, build, record_build, record_skipped, last = provider.scripts
+    assert "things_idx" in first and "(2, 'index_things')" in first
+    assert build == "CREATE INDEX CONCURRENTLY a"
+    assert record_build.startswith("BEGIN;") and "(3, 'build_idx')" in record_build
+    assert "(4, 'skipped_idx')" in record_skipped
+    assert "COMMENT ON TABLE things" in last
+    assert provider.queries[-1] == "SELECT (false) AS run"
+    with pytest.raises(ValueError, match="non-transactional"):
+        Migration(6, "guarded", "SELECT 1;", only_if="true")
+
+
+async def test_apply_on_fresh_database_creates_version_table() -> None:
+    provider = _FakePostgresProvider()
+    migrator = PostgresMigrator(provider, _MIGRATIONS)  # type: ignore[arg-type]
+
+    applied = await migrator.apply()
+
+    assert [item.version for item in applied] == [1, 2]
+    assert f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE}" in provider.scripts[0]
+    assert len(provider.queries) == 1
+
+
+async def test_check_only_reads_versions() -> None:
+    current = _FakePostgresProvider(applied={1, 2})
+    behind = _FakePostgresProvider(applied={1})
+
+    await PostgresMigrator(current, _MIGRATIONS).check()  # type: ignore[arg-type]
+    with pytest.raises(SchemaOutOfDateError, match="0002_index_things") as exc_info:
+        await PostgresMigrator(behind, _MIGRATIONS).check()  # type: ignore[arg-type]
+
+    assert [item.version for item in exc_info.value.pending] == [2]
+    assert current.scripts == behind.scripts == []
+    assert await PostgresMigrator(current, _MIGRATIONS).apply() == []  # type: ignore[arg-type]
+
+
+def test_migrations_must_be_well_formed() -> None:
+    with pytest.raises(ValueError, match="unique and ascending"):
+        PostgresMigrator(object(), (_MIGRATIONS[1], _MIGRATIONS[0]))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="snake_case"):
+        Migration(3, "Drop Things'", "")
+    assert MigrationSettings.from_mapping({"apply_on_startup": True}).apply_on_startup is True
+    assert MigrationSettings.from_mapping(None).apply_on_startup is False
@@ -0,0 +1,145 @@
+"""Unit tests for workflow table partition upkeep."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from sackmesser.infrastructure.db.postgres.partitioning import (
+    WorkflowPartitioningSettings,
+    WorkflowPartitionMaintainer,
+    parse_partition_name,
+    partition_name,
+    partition_start,
+    shift_partition,
+)
+
+
+class _FakePostgresProvider:
+    def __init__(self, *, relkind: str | None = "p", partitions: list[str] | None = None) -> None:
+        self.relkind = relkind
+        self.partitions = partitions or []
+        self.scripts: list[str] = []
+        self.fail = False
+
+    async def fetchone(self, query: str, args: tuple[object, ...]) -> dict[str, Any] | None:
+        return None if self.relkind is None else {"relkind": self.relkind}
+
+    async def fetchall(self, query: str, args: tuple[object, ...]) -> list[dict[str, Any]]:
+        return [{"name": name} for name in self.partitions]
+
+    async def executescript(self, sql: str) -> None:
+        self.scripts.append(sql)
+        if self.fail:
+            raise RuntimeError('duplicate key value violates unique constraint "pg_type_typname"')
+
+
+def _clock() -> datetime:
+    return datetime(2026, 11, 15, 13, 30, tzinfo=UTC)
+
+
+def test_settings_from_mapping_keeps_defaults_and_validates() -> None:
+    settings = WorkflowPartitioningSettings.from_mapping({"enabled": True, "retain": "6"})
+
+    assert settings.enabled is True
+    assert settings.interval == "month"
+    assert settings.retain == 6
+    with pytest.raises(ValueError, match="interval"):
+        WorkflowPartitioningSettings.from_mapping({"interval": "year"})
+
+
+def test_partition_calendar_helpers() -> None:
+    start = partition_start(_clock(), "month")
+
+    assert start == datetime(2026, 11, 1, tzinfo=UTC)
+    assert shift_partition(start, "month", 2) == datetime(2027, 1, 1, tzinfo=UTC)
+    assert shift_partition(start, "month", -11) == datetime(2025, 12, 1, tzinfo=UTC)
+    assert partition_name(start, "month") == "template_workflows_p202611"
+    assert partition_name(partition_start(_clock(), "day"), "day") == (
+        "template_workflows_p20261115"
+    )
+    assert parse_partition_name("template_workflows_p202611", "month") == start
+    assert parse_partition_name("template_workflows_p20261115", "month") is None
+    assert parse_partition_name("template_workflows_default", "month") is None
+
+
+async def test_maintain_creates_missing_partitions_and_drops_expired() -> None:
+    provider = _FakePostgresProvider(
+        partitions=[
+            "template_workflows_p202608",
+            "template_workflows_p202609",
+            "template_workflows_p202611",
+            "template_workflows_archive",
+        ]
+    )
+    maintainer = WorkflowPartitionMaintainer(
+        provider,  # type: ignore[arg-type]
+        WorkflowPartitioningSettings(enabled=True, premake=2, retain=1),
+        clock=_clock,
+    )
+
+    result = await maintainer.maintain()
+
+    assert result.created == ("template_workflows_p202612", "template_workflows_p202701")
+    assert result.dropped == ("template_workflows_p202608", "template_workflows_p202609")
+    script = provider.scripts[0]
+    assert (
+        "CREATE TABLE IF NOT EXISTS template_workflows_p202612 PARTITION OF template_workflows "
+        "FOR VALUES FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00');"
+    ) in script
+    assert "DROP TABLE IF EXISTS template_workflows_p202608;" in script
+    assert "template_workflows_archive" not in script
+    assert script.startswith("BEGIN;\nSELECT pg_advisory_xact_lock(")
+    assert script.endswith("COMMIT;")
+
+
+async def test_maintain_skips_unpartitioned_table() -> None:
+    provider = _FakePostgresProvider(relkind="r")
+    maintainer = WorkflowPartitionMaintainer(
+        provider,  # type: ignore[arg-type]
+        WorkflowPartitioningSettings(enabled=True),
+        clock=_clock,
+    )
+
+    result = await maintainer.maintain()
+
+    assert result.created == ()
+    assert provider.scripts == []
+
+
+async def test_start_runs_a_pass_and_close_stops_background_task() -> None:
+    provider = _FakePostgresProvider()
+    maintainer = WorkflowPartitionMaintainer(
+        provider,  # type: ignore[arg-type]
+        WorkflowPartitioningSettings(enabled=True, premake=1),
+        clock=_clock,
+    )
+
+    await maintainer.start()
+    await maintainer.close()
+
+    assert len(provider.scripts) == 1
+    assert "template_workflows_p202612" in provider.scripts[0]
+
+
+async def test_start_logs_a_failed_pass_and_keeps_maintaining(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    provider = _FakePostgresProvider()
+    provider.fail = True
+    maintainer = WorkflowPartitionMaintainer(
+        provider,  # type: ignore[arg-type]
+        WorkflowPartitioningSettings(enabled=True, premake=1),
+        clock=_clock,
+    )
+
+    await maintainer.start()
+    try:
+        assert maintainer._task is not None
+    finally:
+        await maintainer.close()
+
+    assert len(provider.scripts) == 1
+    assert "maintenance failed at startup" in caplog.text
@@ -0,0 +1,169 @@
+"""Unit tests for read-replica routing."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sackmesser.application.session import session_scope
+from sackmesser.infrastructure.db.postgres import replicas as replicas_module
+from sackmesser.infrastructure.db.postgres.replicas import (
+    PostgresReplicaRouter,
+    PostgresReplicaSettings,
+    open_replica_providers,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_settings_from_mapping_reads_dsns_and_window() -> None:
+    settings = PostgresReplicaSettings.from_mapping(
+        {"dsns": ["postgresql://replica-a", ""], "sticky_seconds": "2.5"}
+    )
+
+    assert settings.enabled is True
+    assert settings.dsns == ("postgresql://replica-a",)
+    assert settings.sticky_seconds == 2.5
+    assert PostgresReplicaSettings.from_mapping(None).enabled is False
+    with pytest.raises(ValueError, match="sticky_seconds"):
+        PostgresReplicaSettings(sticky_seconds=-1)
+
+
+def test_reader_round_robins_replicas() -> None:
+    router = PostgresReplicaRouter("primary", ["a", "b"])  # type: ignore[arg-type, list-item]
+
+    assert [router.reader() for _ in range(3)] == ["a", "b", "a"]
+
+
+def test_write_pins_only_the_writing_session_until_window_ends() -> None:
+    clock = _Clock()
+    router = PostgresReplicaRouter(
+        "primary",  # type: ignore[arg-type]
+        ["replica"],  # type: ignore[list-item]
+        sticky_seconds=5.0,
+        clock=clock,
+    )
+
+    with session_scope("alice"):
+        router.wrote()
+        assert router.reader() == "primary"
+    with session_scope("bob"):
+        assert router.reader() == "replica"
+    assert router.reader() == "replica"
+
+    clock.now += 5.0
+    with session_scope("alice"):
+        assert router.reader() == "replica"
+
+
+def test_pinned_session_reports_writers_within_window() -> None:
+    clock = _Clock()
+    router = PostgresReplicaRouter(
+        "primary",  # type: ignore[arg-type]
+        ["replica"],  # type: ignore[list-item]
+        sticky_seconds=5.0,
+        clock=clock,
+    )
+
+    with session_scope("alice"):
+        router.wrote()
+        assert router.pinned_session() == "alice"
+    with session_scope("bob"):
+        assert router.pinned_session() is None
+
+    clock.now += 5.0
+    with session_scope("alice"):
+        assert router.pinned_session() is None
+
+
+def test_recently_written_covers_every_session_within_window() -> None:
+    clock = _Clock()
+    router = PostgresReplicaRouter(
+        "primary",  # type: ignore[arg-type]
+        ["replica"],  # type: ignore[list-item]
+        sticky_seconds=5.0,
+        clock=clock,
+    )
+
+    assert router.recently_written() is False
+    with session_scope("alice"):
+        router.wrote()
+    with session_scope("bob"):
+        assert router.recently_written() is True
+
+    clock.now += 5.0
+    assert router.recently_written() is False
+
+
+def test_anonymous_callers_share_one_session() -> None:
+    router = PostgresReplicaRouter("primary", ["replica"])  # type: ignore[arg-type, list-item]
+
+    router.wrote()
+
+    assert router.reader() == "primary"
+    with session_scope("alice"):
+        assert router.reader() == "replica"
+
+
+async def test_open_replica_providers_reuses_primary_pool_options(monkeypatch) -> None:
+    created: list[dict[str, Any]] = []
+
+    class _Settings:
+        def __init__(self, **fields: Any) -> None:
+            self.fields = fields
+
+    class _Provider:
+        @classmethod
+        async def create(cls, settings: _Settings) -> _Provider:
+            created.append(settings.fields)
+            return cls()
+
+    monkeypatch.setattr(replicas_module, "PostgresSettings", _Settings)
+    monkeypatch.setattr(replicas_module, "PostgresProvider", _Provider)
+
+    providers = await open_replica_providers(
+        {"dsn": "postgresql://primary", "max_pool_size": 4, "read_replicas": {"dsns": []}},
+        PostgresReplicaSettings(dsns=("postgresql://replica",)),
+    )
+
+    assert len(providers) == 1
+    assert created == [{"dsn": "postgresql://replica", "max_pool_size": 4}]
+
+
+async def test_open_replica_providers_closes_opened_pools_when_one_fails(monkeypatch) -> None:
+    closed: list[str] = []
+
+    class _Settings:
+        def __init__(self, **fields: Any) -> None:
+            self.dsn = fields["dsn"]
+
+    class _Provider:
+        def __init__(self, dsn: str) -> None:
+            self.dsn = dsn
+
+        @classmethod
+        async def create(cls, settings: _Settings) -> _Provider:
+            if settings.dsn.endswith("down"):
+                raise ConnectionError(settings.dsn)
+            return cls(settings.dsn)
+
+        async def close(self) -> None:
+            closed.append(self.dsn)
+
+    monkeypatch.setattr(replicas_module, "PostgresSettings", _Settings)
+    monkeypatch.setattr(replicas_module, "PostgresProvider", _Provider)
+
+    with pytest.raises(ConnectionError, match="replica-down"):
+        await open_replica_providers(
+            {"dsn": "postgresql://primary"},
+            PostgresReplicaSettings(dsns=("postgresql://replica-a", "postgresql://replica-down")),
+        )
+
+    assert closed == ["postgresql://replica-a"]
@@ -0,0 +1,82 @@
+"""Unit tests for the named Postgres statement registry."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sackmesser.infrastructure.db.postgres.statements import PostgresStatementRegistry
+
+
+class _FakePostgresProvider:
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = [{"id": "a"}, {"id": "b"}]
+        self.fail = False
+        self.calls: list[str] = []
+
+    async def fetchone(self, query: str, args: tuple[object, ...]) -> dict[str, Any] | None:
+        self.calls.append(query)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self, query: str, args: tuple[object, ...]) -> list[dict[str, Any]]:
+        self.calls.append(query)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.rows
+
+
+class _StepClock:
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def test_statement_builds_sql_once_per_name() -> None:
+    registry = PostgresStatementRegistry(_FakePostgresProvider())  # type: ignore[arg-type]
+    builds: list[str] = []
+
+    def build() -> str:
+        builds.append("built")
+        return "SELECT 1"
+
+    first = registry.statement("probe", build)
+    second = registry.statement("probe", build)
+
+    assert first is second
+    assert builds == ["built"]
+
+
+async def test_fetches_record_calls_rows_and_latency() -> None:
+    provider = _FakePostgresProvider()
+    registry = PostgresStatementRegistry(provider, clock=_StepClock(0.5))  # type: ignore[arg-type]
+
+    await registry.fetchall("list", "SELECT id", ())
+    await registry.fetchall("list", "SELECT id", ())
+    provider.rows = []
+    await registry.fetchone("insert", "INSERT", ())
+
+    stats = registry.stats()
+    assert (stats["list"].calls, stats["list"].rows) == (2, 4)
+    assert stats["list"].total_seconds == pytest.approx(1.0)
+    assert (stats["insert"].calls, stats["insert"].rows) == (1, 0)
+    timings = await registry.list_statement_timings()
+    assert [timing.name for timing in timings] == ["insert", "list"]
+
+
+async def test_failed_statement_counts_error_and_reraises() -> None:
+    provider = _FakePostgresProvider()
+    provider.fail = True
+    registry = PostgresStatementRegistry(provider)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await registry.fetchall("list", "SELECT id", ())
+
+    stats = registry.stats()["list"]
+    assert (stats.calls, stats.errors, stats.rows) == (1, 1, 0)
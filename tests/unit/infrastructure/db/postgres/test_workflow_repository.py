@@ -8,6 +8,10 @@ from typing import Any
 
 import pytest
 
+from sackmesser.domain.workflows import WorkflowCursor, WorkflowPayloadSet, WorkflowTimeRange
+from sackmesser.infrastructure.db.postgres.migrations import SchemaOutOfDateError
+from sackmesser.infrastructure.db.postgres.replicas import PostgresReplicaRouter
+from sackmesser.infrastructure.db.postgres.statements import PostgresStatementRegistry
 from sackmesser.infrastructure.db.postgres.workflow_repository import PostgresWorkflowRepository
 
 
@@ -37,8 +41,35 @@ async def test_ensure_schema_executes_create_table_script() -> None:
 
     await repository.ensure_schema()
 
-    assert len(provider.executescript_calls) == 1
-    assert "CREATE TABLE IF NOT EXISTS template_workflows" in provider.executescript_calls[0]
+    script, *index_calls = provider.executescript_calls
+    assert "CREATE TABLE IF NOT EXISTS template_workflows" in script
+    assert "FUNCTION template_jsonb_merge_patch" in script
+    assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in script
+    assert "CREATE INDEX" not in script
+    # Each index is built concurrently on its own, then recorded; the fake
+    # reports pg_trgm missing, so the title index is only recorded.
+    assert index_calls[0] == (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS template_workflows_created_at_id_idx "
+        "ON template_workflows (created_at DESC, id DESC)"
+    )
+    assert "(5, 'template_workflows_created_at_id_idx')" in index_calls[1]
+    assert "gin (payload jsonb_path_ops)" in index_calls[2]
+    assert "(7, 'template_workflows_title_trgm_idx')" in index_calls[4]
+    assert len(index_calls) == 5
+    assert "extname = 'pg_trgm'" in provider.fetchone_calls[-1][0]
+
+
+async def test_ensure_schema_creates_partitioned_table_when_enabled() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider, partitioned=True)  # type: ignore[arg-type]
+
+    await repository.ensure_schema()
+
+    [script] = provider.executescript_calls
+    assert "PARTITION BY RANGE (created_at)" in script
+    assert "PRIMARY KEY (id, created_at)" in script
+    assert "CREATE INDEX IF NOT EXISTS template_workflows_created_at_id_idx" in script
+    assert "CONCURRENTLY" not in script
 
 
 async def test_create_persists_and_maps_workflow(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -113,3 +144,391 @@ async def test_list_maps_multiple_row_shapes() -> None:
     query, args = provider.fetchall_calls[0]
     assert "SELECT id, title, payload, created_at" in query
     assert args == (10, 0)
+
+
+async def test_list_after_uses_keyset_predicate() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    await repository.list_after(limit=5, cursor=WorkflowCursor(created_at=created_at, id="wf-1"))
+
+    query, args = provider.fetchall_calls[0]
+    assert "WHERE (created_at, id) < ($2, $3)" in query
+    assert "OFFSET" not in query
+    assert args == (5, created_at, "wf-1")
+
+
+async def test_list_after_bounds_time_range_for_partition_pruning() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    cursor_at = datetime(2026, 3, 1, tzinfo=UTC)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    await repository.list_after(
+        limit=5,
+        cursor=WorkflowCursor(created_at=cursor_at, id="wf-1"),
+        time_range=WorkflowTimeRange(start=start),
+    )
+    await repository.list(limit=5, offset=10, time_range=WorkflowTimeRange(end=cursor_at))
+
+    query, args = provider.fetchall_calls[0]
+    assert "(created_at, id) < ($2, $3) AND created_at <= $2" in query
+    assert "created_at >= $4" in query
+    assert args == (5, cursor_at, "wf-1", start)
+    query, args = provider.fetchall_calls[1]
+    assert "LIMIT $1 OFFSET $2" in query
+    assert "WHERE created_at < $3" in query
+    assert args == (5, 10, cursor_at)
+
+
+async def test_list_after_without_cursor_reads_first_page() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    await repository.list_after(limit=5, cursor=None)
+
+    query, args = provider.fetchall_calls[0]
+    assert "ORDER BY created_at DESC, id DESC" in query
+    assert args == (5, 0)
+
+
+async def test_list_encoded_keeps_payload_as_json_text() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchall_result = [
+        {
+            "id": "wf-1",
+            "title": "one",
+            "payload_json": '{"a": 1}',
+            "created_at": datetime(2026, 1, 1, tzinfo=UTC),
+        },
+        {
+            "id": "wf-2",
+            "title": "two",
+            "payload_json": {"b": 2},
+            "created_at": "2026-01-02T00:00:00Z",
+        },
+    ]
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    workflows = await repository.list_encoded(limit=10, offset=0)
+
+    assert [item.payload_json for item in workflows] == ['{"a": 1}', '{"b":2}']
+    assert workflows[1].created_at == datetime(2026, 1, 2, tzinfo=UTC)
+    query, args = provider.fetchall_calls[0]
+    assert "payload::text" in query
+    assert args == (10, 0)
+
+
+async def test_list_encoded_after_uses_keyset_predicate() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    await repository.list_encoded_after(
+        limit=5, cursor=WorkflowCursor(created_at=created_at, id="wf-1")
+    )
+
+    query, args = provider.fetchall_calls[0]
+    assert "WHERE (created_at, id) < ($2, $3)" in query
+    assert args == (5, created_at, "wf-1")
+
+
+async def test_search_renders_only_requested_filters() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    await repository.search(
+        title="50%_off\\",
+        payload_contains={"team": "ops"},
+        limit=5,
+        cursor=WorkflowCursor(created_at=created_at, id="wf-1"),
+    )
+    await repository.search(title=None, payload_contains=None, limit=5, cursor=None)
+
+    query, args = provider.fetchall_calls[0]
+    assert "title ILIKE $2" in query
+    assert "payload @> $3::jsonb" in query
+    assert "(created_at, id) < ($4, $5)" in query
+    assert args == (5, "%50\\%\\_off\\\\%", '{"team": "ops"}', created_at, "wf-1")
+    query, args = provider.fetchall_calls[1]
+    assert "WHERE" not in query
+    assert args == (5,)
+
+
+async def test_count_maps_estimate_or_exact_total() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchone_result = {"total": 123_456, "exact": False}
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    count = await repository.count(exact_below=10_000)
+
+    assert (count.value, count.exact) == (123_456, False)
+    query, args = provider.fetchone_calls[0]
+    assert "reltuples" in query
+    assert "count(*)" in query
+    assert args == (10_000,)
+
+
+async def test_count_only_falls_back_for_unanalyzed_storage_with_rows() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchone_result = {"total": 50_000, "exact": False}
+    repository = PostgresWorkflowRepository(provider, partitioned=True)  # type: ignore[arg-type]
+
+    await repository.count(exact_below=10_000)
+
+    # Premade partitions keep reltuples = -1 until rows arrive; only storage
+    # with pages on disk may force the exact count.
+    query, _args = provider.fetchone_calls[0]
+    assert "c.reltuples < 0 AND pg_relation_size(c.oid) > 0" in query
+
+
+async def test_create_many_inserts_batch_in_one_statement(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchall_result = [
+        {"id": "id-2", "title": "two", "payload": "{}", "created_at": "2026-01-01T00:00:00Z"},
+        {"id": "id-1", "title": "one", "payload": {"a": 1}, "created_at": "2026-01-01T00:00:00Z"},
+    ]
+    ids = iter(["id-1", "id-2"])
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.postgres.workflow_repository.uuid.uuid4",
+        lambda: SimpleNamespace(hex=next(ids)),
+    )
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    workflows = await repository.create_many([("one", {"a": 1}), ("two", {})])
+
+    assert [item.id for item in workflows] == ["id-1", "id-2"]
+    assert len(provider.fetchall_calls) == 1
+    query, args = provider.fetchall_calls[0]
+    assert "unnest($1::text[], $2::text[], $3::text[])" in query
+    assert args == (["id-1", "id-2"], ["one", "two"], ['{"a": 1}', "{}"])
+
+
+async def test_create_many_skips_empty_batch() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    assert await repository.create_many([]) == []
+    assert provider.fetchall_calls == []
+
+
+async def test_create_many_raises_when_rows_are_missing() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchall_result = []
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="Failed to insert workflow batch"):
+        await repository.create_many([("one", {})])
+
+
+async def test_queries_run_as_named_statements_per_shape() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchall_result = [{"id": "wf-1", "title": "a", "payload": {}, "created_at": None}]
+    statements = PostgresStatementRegistry(provider)  # type: ignore[arg-type]
+    repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        statements=statements,
+    )
+    cursor = WorkflowCursor(created_at=datetime(2026, 1, 1, tzinfo=UTC), id="wf-9")
+
+    await repository.list(limit=5, offset=0)
+    await repository.list(limit=5, offset=10)
+    await repository.list_after(limit=5, cursor=cursor)
+    await repository.search(title="a", payload_contains=None, limit=5, cursor=None)
+
+    assert provider.fetchall_calls[0][0] is provider.fetchall_calls[1][0]
+    stats = statements.stats()
+    assert sorted(stats) == ["list[after]", "list[offset]", "search[title]"]
+    assert (stats["list[offset]"].calls, stats["list[offset]"].rows) == (2, 2)
+
+
+async def test_reads_use_replica_until_a_write_pins_the_primary() -> None:
+    primary = _FakePostgresProvider()
+    primary.fetchone_result = {"id": "wf-1", "title": "a", "payload": {}, "created_at": None}
+    replica = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(
+        primary,  # type: ignore[arg-type]
+        router=PostgresReplicaRouter(primary, [replica]),  # type: ignore[list-item]
+    )
+
+    await repository.list(limit=5, offset=0)
+    await repository.create("demo", {})
+    await repository.search(title="a", payload_contains=None, limit=5, cursor=None)
+
+    assert len(replica.fetchall_calls) == 1
+    assert len(primary.fetchone_calls) == 1
+    assert "ILIKE" in primary.fetchall_calls[0][0]
+
+
+async def test_uuid7_ids_use_native_uuid_column_and_migrate_text_ids() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        id_format="uuid7",
+    )
+
+    await repository.ensure_schema()
+    with pytest.raises(RuntimeError, match="Failed to insert workflow batch"):
+        await repository.create_many([("one", {})])
+
+    script = provider.executescript_calls[0]
+    assert "id UUID PRIMARY KEY" in script
+    assert "ALTER COLUMN id TYPE uuid USING id::uuid" in script
+    query, args = provider.fetchall_calls[0]
+    assert "unnest($1::uuid[], $2::text[], $3::text[])" in query
+    [workflow_id] = args[0]  # type: ignore[misc]
+    assert workflow_id.version == 7
+    with pytest.raises(ValueError, match="id_format"):
+        PostgresWorkflowRepository(provider, id_format="serial")  # type: ignore[arg-type]
+
+
+async def test_get_and_get_many_read_by_primary_key() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchone_result = {
+        "id": "wf-1",
+        "title": "demo",
+        "payload": {},
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+    provider.fetchall_result = [provider.fetchone_result]
+    repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+
+    workflow = await repository.get("wf-1")
+    workflows = await repository.get_many(["wf-1", "wf-2"])
+
+    assert workflow is not None
+    assert workflow.id == "wf-1"
+    assert [item.id for item in workflows] == ["wf-1"]
+    query, args = provider.fetchone_calls[0]
+    assert "WHERE id = $1" in query
+    assert args == ("wf-1",)
+    query, args = provider.fetchall_calls[0]
+    assert "WHERE id = ANY($1::text[])" in query
+    assert args == (["wf-1", "wf-2"],)
+
+
+async def test_uuid7_lookups_skip_ids_that_are_not_uuids() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        id_format="uuid7",
+    )
+    workflow_id = "01890a5d-ac96-774b-bcce-b302099a8057"
+
+    assert await repository.get("wf-1") is None
+    assert await repository.get_many(["wf-1"]) == []
+    await repository.get_many(["wf-1", workflow_id])
+
+    assert provider.fetchone_calls == []
+    [(query, args)] = provider.fetchall_calls
+    assert "ANY($1::uuid[])" in query
+    assert [str(item) for item in args[0]] == [workflow_id]  # type: ignore[attr-defined]
+
+
+def test_canonical_id_follows_the_id_format() -> None:
+    provider = _FakePostgresProvider()
+    uuid4_repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    uuid7_repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        id_format="uuid7",
+    )
+    workflow_id = "01890a5d-ac96-774b-bcce-b302099a8057"
+
+    assert uuid4_repository.canonical_id("ABC") == "ABC"
+    assert uuid7_repository.canonical_id(workflow_id.upper()) == workflow_id
+    assert uuid7_repository.canonical_id(workflow_id.replace("-", "")) == workflow_id
+    assert uuid7_repository.canonical_id("wf-1") is None
+
+
+async def test_update_payload_patches_in_one_statement_per_shape() -> None:
+    provider = _FakePostgresProvider()
+    provider.fetchone_result = {
+        "id": "wf-1",
+        "title": "demo",
+        "payload": {"status": "done", "meta": {"owner": "ops"}},
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+    statements = PostgresStatementRegistry(provider)  # type: ignore[arg-type]
+    repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        statements=statements,
+    )
+
+    workflow = await repository.update_payload(
+        "wf-1",
+        merge={"status": "done", "draft": None},
+        sets=[
+            WorkflowPayloadSet(path=("meta", "owner"), value="ops"),
+            WorkflowPayloadSet(path=("steps", "0"), value=None),
+        ],
+    )
+    await repository.update_payload("wf-2", sets=[WorkflowPayloadSet(path=("k",), value=1)])
+
+    assert workflow is not None
+    assert workflow.payload == {"status": "done", "meta": {"owner": "ops"}}
+    query, args = provider.fetchone_calls[0]
+    assert "UPDATE template_workflows" in query
+    assert (
+        "SET payload = jsonb_set(jsonb_set(template_jsonb_merge_patch(payload, $2::jsonb), "
+        "$3::text[], $4::jsonb, true), $5::text[], $6::jsonb, true)"
+    ) in query
+    assert "WHERE id = $1" in query
+    assert args == (
+        "wf-1",
+        '{"status": "done", "draft": null}',
+        ["meta", "owner"],
+        '"ops"',
+        ["steps", "0"],
+        "null",
+    )
+    query, args = provider.fetchone_calls[1]
+    assert "SET payload = jsonb_set(payload, $2::text[], $3::jsonb, true)" in query
+    assert args == ("wf-2", ["k"], "1")
+    assert [timing.name for timing in await statements.list_statement_timings()] == [
+        "update_payload[merge,set*2]",
+        "update_payload[set*1]",
+    ]
+
+
+async def test_update_payload_returns_none_for_unknown_or_invalid_ids() -> None:
+    provider = _FakePostgresProvider()
+    repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        id_format="uuid7",
+    )
+
+    assert await repository.update_payload("not-a-uuid", merge={"k": 1}) is None
+    assert provider.fetchone_calls == []
+    assert (
+        await repository.update_payload("01890a5d-ac96-774b-bcce-b302099a8057", merge={"k": 1})
+        is None
+    )
+    assert len(provider.fetchone_calls) == 1
+
+
+async def test_migrations_record_schema_history_per_id_format() -> None:
+    provider = _FakePostgresProvider()
+    uuid4_repository = PostgresWorkflowRepository(provider)  # type: ignore[arg-type]
+    uuid7_repository = PostgresWorkflowRepository(
+        provider,  # type: ignore[arg-type]
+        id_format="uuid7",
+    )
+
+    labels = [
+        "0001_create_workflows",
+        "0002_jsonb_merge_patch",
+        "0004_pg_trgm",
+        "0005_template_workflows_created_at_id_idx",
+        "0006_template_workflows_payload_path_idx",
+        "0007_template_workflows_title_trgm_idx",
+    ]
+    assert [item.label for item in uuid4_repository.migrations()] == labels
+    assert [item.label for item in uuid7_repository.migrations()][2] == "0003_uuid_workflow_ids"
+    assert [item.label for item in await uuid4_repository.pending_migrations()] == labels
+    with pytest.raises(SchemaOutOfDateError):
+        await uuid4_repository.check_schema()
+    assert provider.executescript_calls == []
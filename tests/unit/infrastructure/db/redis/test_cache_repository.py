@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 from sackmesser.infrastructure.db.redis.cache_repository import RedisCacheRepository
 
 
@@ -27,6 +30,79 @@ class _FakeRedisCache:
         return self.delete_return
 
 
+class _FakePipeline:
+    def __init__(self, client: _FakeRedisClient) -> None:
+        self._client = client
+        self._commands: list[tuple[str, str, int | None, bool]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def set(
+        self, key: str, value: str, ex: int | None = None, *, nx: bool = False
+    ) -> _FakePipeline:
+        self._commands.append((key, value, ex, nx))
+        return self
+
+    async def execute(self) -> list[bool | None]:
+        self._client.round_trips.append(("pipeline", len(self._commands)))
+        results: list[bool | None] = []
+        for key, value, ex, nx in self._commands:
+            if nx and key in self._client.store:
+                results.append(None)
+                continue
+            self._client.store[key] = value
+            self._client.set_calls.append((key, value, ex))
+            results.append(True)
+        return results
+
+
+class _FakeRedisClient:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.set_calls: list[tuple[str, str, int | None]] = []
+        self.round_trips: list[tuple[str, int]] = []
+        self.closed = False
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        assert transaction is False
+        return _FakePipeline(self)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.round_trips.append(("set", 1))
+        self.set_calls.append((key, value, ex))
+        self.store[key] = value
+        return True
+
+    async def get(self, key: str) -> Any:
+        self.round_trips.append(("get", 1))
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        self.round_trips.append(("mget", len(keys)))
+        return [self.store.get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        self.round_trips.append(("delete", len(keys)))
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _client_repository(client: _FakeRedisClient, **kwargs: Any) -> RedisCacheRepository:
+    return RedisCacheRepository(
+        _FakeRedisCache(),  # type: ignore[arg-type]
+        client=client,
+        key_prefix="svc",
+        default_ttl_seconds=3600,
+        **kwargs,
+    )
+
+
 async def test_set_delegates_to_cache() -> None:
     cache = _FakeRedisCache()
     repository = RedisCacheRepository(cache)  # type: ignore[arg-type]
@@ -80,3 +156,129 @@ async def test_delete_casts_result_to_bool() -> None:
     assert first is False
     assert second is True
     assert cache.delete_calls == ["alpha", "alpha"]
+
+
+async def test_set_many_writes_every_entry_with_ttl() -> None:
+    cache = _FakeRedisCache()
+    repository = RedisCacheRepository(cache)  # type: ignore[arg-type]
+
+    result = await repository.set_many([("alpha", "1", 30), ("beta", "2", None)])
+
+    assert result is True
+    assert cache.set_calls == [("alpha", "1", 30), ("beta", "2", None)]
+
+
+async def test_get_many_preserves_key_order() -> None:
+    cache = _FakeRedisCache()
+    cache.store.update({"alpha": b"1", "gamma": 3})
+    repository = RedisCacheRepository(cache)  # type: ignore[arg-type]
+
+    entries = await repository.get_many(["gamma", "missing", "alpha"])
+
+    assert [(entry.key, entry.value) for entry in entries] == [
+        ("gamma", "3"),
+        ("missing", None),
+        ("alpha", "1"),
+    ]
+
+
+async def test_delete_many_counts_deleted_keys_once() -> None:
+    cache = _FakeRedisCache()
+    repository = RedisCacheRepository(cache)  # type: ignore[arg-type]
+
+    deleted = await repository.delete_many(["alpha", "beta", "alpha"])
+
+    assert deleted == 2
+    assert cache.delete_calls == ["alpha", "beta"]
+
+
+async def test_batches_keep_at_most_max_in_flight_commands() -> None:
+    class _SlowCache(_FakeRedisCache):
+        def __init__(self) -> None:
+            super().__init__()
+            self.active = 0
+            self.peak = 0
+
+        async def get(self, key: str) -> object:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+            return await super().get(key)
+
+    cache = _SlowCache()
+    repository = RedisCacheRepository(cache, max_in_flight=4)  # type: ignore[arg-type]
+
+    entries = await repository.get_many([f"key-{index}" for index in range(100)])
+
+    assert len(entries) == 100
+    assert cache.peak == 4
+
+
+async def test_client_batches_use_one_round_trip_per_chunk() -> None:
+    client = _FakeRedisClient()
+    repository = _client_repository(client, chunk_size=500)
+    keys = [f"key-{index}" for index in range(1000)]
+
+    assert await repository.set_many([(key, key, None) for key in keys]) is True
+    entries = await repository.get_many(keys)
+    deleted = await repository.delete_many([*keys, keys[0]])
+
+    assert [entry.value for entry in entries] == keys
+    assert deleted == 1000
+    assert client.round_trips == [
+        ("pipeline", 500),
+        ("pipeline", 500),
+        ("mget", 500),
+        ("mget", 500),
+        ("delete", 500),
+        ("delete", 500),
+    ]
+    assert client.set_calls[0] == ("svc:key-0", "key-0", 3600)
+
+
+async def test_client_commands_prefix_keys_and_keep_explicit_ttls() -> None:
+    client = _FakeRedisClient()
+    repository = _client_repository(client)
+
+    assert await repository.set("alpha", "1", ttl_seconds=30) is True
+    assert (await repository.get("alpha")).value == "1"
+    assert await repository.delete("alpha") is True
+    assert await repository.get_many([]) == []
+    await repository.close()
+
+    assert client.set_calls == [("svc:alpha", "1", 30)]
+    assert client.store == {}
+    assert client.closed is True
+
+
+def test_from_options_without_url_keeps_commons_client() -> None:
+    repository = RedisCacheRepository.from_options(
+        _FakeRedisCache(),  # type: ignore[arg-type]
+        {"key_prefix": "svc"},
+    )
+
+    assert repository._client is None
+
+
+async def test_client_add_many_sets_only_absent_keys() -> None:
+    client = _FakeRedisClient()
+    client.store["svc:alpha"] = "1"
+    repository = _client_repository(client)
+
+    added = await repository.add_many([("alpha", "10", None), ("beta", "2", 30)])
+
+    assert added == 1
+    assert client.store == {"svc:alpha": "1", "svc:beta": "2"}
+    assert client.round_trips == [("pipeline", 2)]
+
+
+async def test_add_many_without_client_skips_keys_with_values() -> None:
+    cache = _FakeRedisCache()
+    cache.store["alpha"] = "1"
+    repository = RedisCacheRepository(cache)  # type: ignore[arg-type]
+
+    added = await repository.add_many([("alpha", "10", None), ("beta", "2", 30)])
+
+    assert added == 1
+    assert cache.set_calls == [("beta", "2", 30)]
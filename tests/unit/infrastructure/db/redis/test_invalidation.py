@@ -0,0 +1,114 @@
+"""Unit tests for the L1 cache invalidation channel."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+
+from sackmesser.infrastructure.db.redis.invalidation import (
+    RedisInvalidationChannel,
+    decode_invalidation,
+    encode_invalidation,
+)
+
+
+class _FakePubSub:
+    def __init__(self, messages: asyncio.Queue[dict[str, object]]) -> None:
+        self.messages = messages
+        self.subscribed: list[str] = []
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribed.append(channel)
+
+    async def listen(self) -> AsyncIterator[dict[str, object]]:
+        while True:
+            message = await self.messages.get()
+            if message.get("type") == "error":
+                raise ConnectionError("lost connection")
+            yield message
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue[dict[str, object]] = asyncio.Queue()
+        self.published: list[tuple[str, str]] = []
+        self.pubsubs: list[_FakePubSub] = []
+        self.closed = False
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 1
+
+    def pubsub(self) -> _FakePubSub:
+        pubsub = _FakePubSub(self.messages)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_encode_and_decode_round_trip() -> None:
+    message = encode_invalidation("replica-a", ["alpha", "beta"])
+
+    assert decode_invalidation(message) == ("replica-a", ["alpha", "beta"])
+    assert decode_invalidation(message.encode("utf-8")) == ("replica-a", ["alpha", "beta"])
+    assert decode_invalidation("not-json") is None
+    assert decode_invalidation('{"origin": 1, "keys": []}') is None
+    assert decode_invalidation(None) is None
+
+
+async def test_publish_tags_message_with_origin() -> None:
+    client = _FakeRedis()
+    channel = RedisInvalidationChannel(client, channel="svc:l1", origin="replica-a")
+
+    await channel.publish(["alpha"])
+    await channel.publish([])
+
+    assert client.published == [("svc:l1", encode_invalidation("replica-a", ["alpha"]))]
+
+
+async def test_listener_applies_remote_invalidations_only() -> None:
+    client = _FakeRedis()
+    channel = RedisInvalidationChannel(client, channel="svc:l1", origin="replica-a")
+    invalidated: list[Sequence[str]] = []
+    resets: list[None] = []
+
+    await channel.start(invalidated.append, lambda: resets.append(None))
+    for data in (
+        encode_invalidation("replica-a", ["own"]),
+        "garbage",
+        encode_invalidation("replica-b", ["alpha", "beta"]),
+    ):
+        client.messages.put_nowait({"type": "message", "data": data})
+    client.messages.put_nowait({"type": "subscribe", "data": 1})
+    await asyncio.sleep(0.01)
+    await channel.close()
+
+    assert client.pubsubs[0].subscribed == ["svc:l1"]
+    assert invalidated == [["alpha", "beta"]]
+    assert len(resets) == 1
+    assert client.pubsubs[0].closed is True
+    assert client.closed is True
+
+
+async def test_listener_resets_local_tier_after_reconnect(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.redis.invalidation._RECONNECT_INITIAL_SECONDS",
+        0,
+    )
+    client = _FakeRedis()
+    channel = RedisInvalidationChannel(client, channel="svc:l1", origin="replica-a")
+    resets: list[None] = []
+
+    await channel.start(lambda keys: None, lambda: resets.append(None))
+    client.messages.put_nowait({"type": "error"})
+    await asyncio.sleep(0.01)
+    await channel.close()
+
+    assert len(client.pubsubs) == 2
+    assert len(resets) == 2
@@ -0,0 +1,274 @@
+"""Unit tests for the in-process L1 cache tier."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from sackmesser.domain.cache import CacheEntry
+from sackmesser.infrastructure.db.redis.local_cache import (
+    LocalCacheRepository,
+    LocalCacheSettings,
+)
+
+
+class _FakeCacheRepository:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.get_calls: list[str] = []
+        self.get_many_calls: list[list[str]] = []
+        self.release_get: asyncio.Event | None = None
+
+    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+        self.store[key] = value
+        return True
+
+    async def get(self, key: str) -> CacheEntry:
+        self.get_calls.append(key)
+        value = self.store.get(key)
+        if self.release_get is not None:
+            await self.release_get.wait()
+        return CacheEntry(key=key, value=value)
+
+    async def delete(self, key: str) -> bool:
+        return self.store.pop(key, None) is not None
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        for key, value, _ttl in entries:
+            self.store[key] = value
+        return True
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        absent = [entry for entry in entries if entry[0] not in self.store]
+        await self.set_many(absent)
+        return len(absent)
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        self.get_many_calls.append(list(keys))
+        return [CacheEntry(key=key, value=self.store.get(key)) for key in keys]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+class _FakeChannel:
+    def __init__(self) -> None:
+        self.published: list[list[str]] = []
+        self.started_with: tuple[object, object] | None = None
+        self.closed = False
+
+    async def publish(self, keys: Sequence[str]) -> None:
+        self.published.append(list(keys))
+
+    async def start(self, on_invalidate: object, on_reset: object) -> None:
+        self.started_with = (on_invalidate, on_reset)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _repository(
+    inner: _FakeCacheRepository,
+    *,
+    clock: _Clock | None = None,
+    **settings: object,
+) -> LocalCacheRepository:
+    return LocalCacheRepository(
+        inner,
+        LocalCacheSettings(enabled=True, **settings),  # type: ignore[arg-type]
+        clock=clock or _Clock(),
+    )
+
+
+async def test_get_serves_repeated_reads_from_memory() -> None:
+    inner = _FakeCacheRepository()
+    inner.store["alpha"] = "1"
+    repository = _repository(inner)
+
+    first = await repository.get("alpha")
+    second = await repository.get("alpha")
+
+    assert first.value == second.value == "1"
+    assert inner.get_calls == ["alpha"]
+    stats = repository.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+async def test_get_does_not_cache_missing_keys() -> None:
+    inner = _FakeCacheRepository()
+    repository = _repository(inner)
+
+    await repository.get("missing")
+    await repository.get("missing")
+
+    assert inner.get_calls == ["missing", "missing"]
+    assert repository.stats().entries == 0
+
+
+async def test_entries_expire_after_local_ttl() -> None:
+    inner = _FakeCacheRepository()
+    inner.store["alpha"] = "1"
+    clock = _Clock()
+    repository = _repository(inner, clock=clock, ttl_seconds=5.0)
+
+    await repository.get("alpha")
+    clock.now += 5.0
+    await repository.get("alpha")
+
+    assert inner.get_calls == ["alpha", "alpha"]
+    assert repository.stats().expirations == 1
+
+
+async def test_evicts_least_recently_used_entry_by_count() -> None:
+    inner = _FakeCacheRepository()
+    inner.store.update({"a": "1", "b": "2", "c": "3"})
+    repository = _repository(inner, max_entries=2)
+
+    await repository.get("a")
+    await repository.get("b")
+    await repository.get("a")
+    await repository.get("c")
+
+    stats = repository.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    await repository.get("a")
+    assert inner.get_calls == ["a", "b", "c"]
+
+
+async def test_evicts_by_bytes_and_skips_oversized_values() -> None:
+    inner = _FakeCacheRepository()
+    inner.store.update({"a": "x" * 10, "b": "y" * 10, "big": "z" * 100})
+    repository = _repository(inner, max_bytes=20)
+
+    await repository.get("a")
+    await repository.get("b")
+    await repository.get("big")
+
+    stats = repository.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 1
+    assert stats.bytes == 11
+
+
+async def test_set_and_delete_invalidate_local_copy() -> None:
+    inner = _FakeCacheRepository()
+    inner.store["alpha"] = "1"
+    repository = _repository(inner)
+
+    await repository.get("alpha")
+    await repository.set("alpha", "2")
+    assert (await repository.get("alpha")).value == "2"
+
+    await repository.delete("alpha")
+    assert (await repository.get("alpha")).value is None
+    assert repository.stats().invalidations == 2
+
+
+async def test_read_racing_with_write_is_not_stored() -> None:
+    inner = _FakeCacheRepository()
+    inner.store["alpha"] = "old"
+    inner.release_get = asyncio.Event()
+    repository = _repository(inner)
+
+    pending_read = asyncio.create_task(repository.get("alpha"))
+    await asyncio.sleep(0)
+    await repository.set("alpha", "new")
+    inner.release_get.set()
+    stale = await pending_read
+
+    assert stale.value == "old"
+    assert repository.stats().entries == 0
+    assert (await repository.get("alpha")).value == "new"
+
+
+async def test_get_many_fetches_only_local_misses() -> None:
+    inner = _FakeCacheRepository()
+    inner.store.update({"a": "1", "b": "2"})
+    repository = _repository(inner)
+
+    await repository.get("a")
+    entries = await repository.get_many(["b", "a", "missing", "b"])
+
+    assert [(entry.key, entry.value) for entry in entries] == [
+        ("b", "2"),
+        ("a", "1"),
+        ("missing", None),
+        ("b", "2"),
+    ]
+    assert inner.get_many_calls == [["b", "missing"]]
+
+
+async def test_batch_writes_invalidate_local_copies() -> None:
+    inner = _FakeCacheRepository()
+    inner.store.update({"a": "1", "b": "2"})
+    repository = _repository(inner)
+    await repository.get_many(["a", "b"])
+
+    await repository.set_many([("a", "10", None)])
+    await repository.delete_many(["b"])
+
+    assert [entry.value for entry in await repository.get_many(["a", "b"])] == ["10", None]
+
+    assert await repository.add_many([("a", "11", None), ("b", "20", None)]) == 1
+    assert [entry.value for entry in await repository.get_many(["a", "b"])] == ["10", "20"]
+
+
+async def test_writes_are_published_to_invalidation_channel() -> None:
+    inner = _FakeCacheRepository()
+    channel = _FakeChannel()
+    repository = LocalCacheRepository(
+        inner,
+        LocalCacheSettings(enabled=True),
+        channel=channel,  # type: ignore[arg-type]
+    )
+
+    await repository.start()
+    await repository.set("alpha", "1")
+    await repository.delete_many(["alpha", "beta", "alpha"])
+    await repository.close()
+
+    assert channel.started_with == (repository.invalidate, repository.clear)
+    assert channel.published == [["alpha"], ["alpha", "beta"]]
+    assert channel.closed is True
+
+
+async def test_remote_invalidation_and_reset_drop_local_entries() -> None:
+    inner = _FakeCacheRepository()
+    inner.store.update({"a": "1", "b": "2"})
+    repository = _repository(inner)
+    await repository.get_many(["a", "b"])
+
+    repository.invalidate(["a"])
+    assert repository.stats().entries == 1
+    repository.clear()
+    assert repository.stats().entries == 0
+    assert repository.stats().bytes == 0
+
+
+def test_settings_from_mapping_uses_defaults_for_missing_fields() -> None:
+    settings = LocalCacheSettings.from_mapping({"enabled": True, "max_entries": 50})
+
+    assert settings.enabled is True
+    assert settings.max_entries == 50
+    assert settings.max_bytes == LocalCacheSettings().max_bytes
+    assert settings.invalidation_channel == "l1-invalidation"
+    assert LocalCacheSettings.from_mapping(None).enabled is False
+    assert (
+        LocalCacheSettings.from_mapping({"invalidation_channel": None}).invalidation_channel is None
+    )
+
+
+def test_settings_reject_non_positive_limits() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        LocalCacheSettings(max_entries=0)
@@ -0,0 +1,253 @@
+"""Unit tests for the workflow lookup cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from sackmesser.domain.cache.entities import CacheEntry
+from sackmesser.domain.workflows import Workflow, WorkflowPayloadSet
+from sackmesser.infrastructure.db.redis.workflow_cache import (
+    CachedWorkflowRepository,
+    WorkflowCacheSettings,
+)
+
+
+class _FakeWorkflowRepository:
+    def __init__(self) -> None:
+        self.items: dict[str, Workflow] = {}
+        self.get_many_calls: list[list[str]] = []
+
+    async def create(self, title: str, payload: dict[str, object]) -> Workflow:
+        workflow = Workflow(
+            id=f"wf-{len(self.items) + 1}",
+            title=title,
+            payload=dict(payload),
+            created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        self.items[workflow.id] = workflow
+        return workflow
+
+    async def create_many(self, items: Sequence[tuple[str, dict[str, object]]]) -> list[Workflow]:
+        return [await self.create(title, payload) for title, payload in items]
+
+    async def get_many(self, workflow_ids: Sequence[str]) -> list[Workflow]:
+        self.get_many_calls.append(list(workflow_ids))
+        return [self.items[item] for item in workflow_ids if item in self.items]
+
+    def canonical_id(self, workflow_id: str) -> str | None:
+        return workflow_id.lower() if workflow_id.startswith(("wf-", "WF-")) else None
+
+    async def update_payload(
+        self,
+        workflow_id: str,
+        *,
+        merge: dict[str, object] | None = None,
+        sets: Sequence[WorkflowPayloadSet] = (),
+    ) -> Workflow | None:
+        current = self.items.get(workflow_id)
+        if current is None:
+            return None
+        updated = Workflow(
+            id=current.id,
+            title=current.title,
+            payload={**current.payload, **(merge or {})},
+            created_at=current.created_at,
+        )
+        self.items[workflow_id] = updated
+        return updated
+
+
+class _FakeCacheStore:
+    def __init__(self, *, broken: bool = False) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.broken = broken
+
+    async def set_many(self, entries: Sequence[tuple[str, str, int | None]]) -> bool:
+        if self.broken:
+            raise ConnectionError("redis down")
+        for key, value, ttl_seconds in entries:
+            self.values[key] = value
+            self.ttls[key] = ttl_seconds
+        return True
+
+    async def add_many(self, entries: Sequence[tuple[str, str, int | None]]) -> int:
+        absent = [entry for entry in entries if entry[0] not in self.values]
+        await self.set_many(absent)
+        return len(absent)
+
+    async def get_many(self, keys: Sequence[str]) -> list[CacheEntry]:
+        if self.broken:
+            raise ConnectionError("redis down")
+        return [CacheEntry(key=key, value=self.values.get(key)) for key in keys]
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        if self.broken:
+            raise ConnectionError("redis down")
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+
+class _Router:
+    def __init__(self, *, pinned: bool = False, written: bool = False) -> None:
+        self.pinned = pinned
+        self.written = written
+
+    def pinned_session(self) -> str | None:
+        return "alice" if self.pinned else None
+
+    def recently_written(self) -> bool:
+        return self.written
+
+
+def _cached(
+    repository: _FakeWorkflowRepository,
+    store: _FakeCacheStore,
+    router: _Router | None = None,
+) -> CachedWorkflowRepository:
+    return CachedWorkflowRepository(
+        repository,  # type: ignore[arg-type]
+        store,  # type: ignore[arg-type]
+        WorkflowCacheSettings(enabled=True, ttl_seconds=60),
+        router=router,
+    )
+
+
+async def test_created_workflows_are_served_from_cache() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    cached = _cached(repository, store)
+
+    created = await cached.create("demo", {"k": "v"})
+    workflow = await cached.get(created.id)
+
+    assert workflow == created
+    assert repository.get_many_calls == []
+    assert store.ttls == {"workflow:wf-1": 60}
+
+
+async def test_misses_are_read_once_and_stored() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    cached = _cached(repository, store)
+    await repository.create_many([("a", {}), ("b", {"n": 1})])
+
+    first = await cached.get_many(["wf-2", "wf-9", "wf-1", "wf-2"])
+    second = await cached.get_many(["wf-1", "wf-2"])
+
+    assert [item.id for item in first] == ["wf-2", "wf-1"]
+    assert second == [repository.items["wf-1"], repository.items["wf-2"]]
+    assert repository.get_many_calls == [["wf-2", "wf-9", "wf-1"]]
+    assert "workflow:wf-9" not in store.values
+
+
+async def test_lookups_match_ids_in_canonical_spelling() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    cached = _cached(repository, store)
+    created = await cached.create("demo", {})
+    await repository.create("other", {})
+
+    assert await cached.get("WF-1") == created
+    assert [item.id for item in await cached.get_many(["WF-2", "wf-2", "bogus"])] == ["wf-2"]
+    assert repository.get_many_calls == [["wf-2"]]
+    assert set(store.values) == {"workflow:wf-1", "workflow:wf-2"}
+
+
+async def test_replica_misses_are_not_stored_while_a_write_may_lag() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    router = _Router(written=True)
+    cached = _cached(repository, store, router)
+    await repository.create("demo", {})
+
+    assert await cached.get("wf-1") is not None
+    assert store.values == {}
+
+    router.pinned = True
+    assert await cached.get("wf-1") is not None
+    assert set(store.values) == {"workflow:wf-1"}
+
+
+async def test_store_failures_fall_back_to_repository() -> None:
+    repository = _FakeWorkflowRepository()
+    cached = _cached(repository, _FakeCacheStore(broken=True))
+
+    created = await cached.create("demo", {})
+
+    assert await cached.get(created.id) == created
+    assert await cached.get("wf-404") is None
+
+
+async def test_payload_updates_refresh_the_cached_workflow() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    cached = _cached(repository, store)
+    created = await cached.create("demo", {"status": "new"})
+
+    updated = await cached.update_payload(created.id, merge={"status": "done"})
+    workflow = await cached.get(created.id)
+
+    assert updated is not None
+    assert workflow == updated
+    assert workflow.payload == {"status": "done"}
+    assert repository.get_many_calls == []
+
+
+async def test_updates_of_unknown_workflows_tombstone_the_cache_entry() -> None:
+    repository = _FakeWorkflowRepository()
+    store = _FakeCacheStore()
+    store.values["workflow:wf-9"] = "stale"
+    cached = _cached(repository, store)
+
+    assert await cached.update_payload("WF-9", merge={"k": 1}) is None
+    assert store.values == {"workflow:wf-9": "-"}
+    assert store.ttls["workflow:wf-9"] == 30
+
+    repository.items["wf-9"] = Workflow(
+        id="wf-9", title="late", payload={}, created_at=datetime(2026, 1, 1, tzinfo=UTC)
+    )
+    assert await cached.get("wf-9") == repository.items["wf-9"]
+    assert store.values == {"workflow:wf-9": "-"}
+
+
+async def test_slow_miss_does_not_overwrite_a_concurrent_update() -> None:
+    class _SlowReadRepository(_FakeWorkflowRepository):
+        def __init__(self) -> None:
+            super().__init__()
+            self.read = asyncio.Event()
+            self.release = asyncio.Event()
+
+        async def get_many(self, workflow_ids: Sequence[str]) -> list[Workflow]:
+            rows = await super().get_many(workflow_ids)
+            self.read.set()
+            await self.release.wait()
+            return rows
+
+    repository = _SlowReadRepository()
+    store = _FakeCacheStore()
+    cached = _cached(repository, store)
+    created = await repository.create("demo", {"v": 1})
+
+    slow_read = asyncio.create_task(cached.get(created.id))
+    await repository.read.wait()
+    updated = await cached.update_payload(created.id, merge={"v": 2})
+    repository.release.set()
+    stale = await slow_read
+
+    assert stale is not None
+    assert stale.payload == {"v": 1}
+    assert await cached.get(created.id) == updated
+    assert updated is not None
+    assert updated.payload == {"v": 2}
+
+
+def test_settings_reject_non_positive_ttl() -> None:
+    assert WorkflowCacheSettings.from_mapping({"enabled": True}).ttl_seconds == 300
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        WorkflowCacheSettings.from_mapping({"ttl_seconds": 0})
+    with pytest.raises(ValueError, match="tombstone_seconds"):
+        WorkflowCacheSettings.from_mapping({"tombstone_seconds": 0})
@@ -0,0 +1,47 @@
+"""Unit tests for bus middleware configuration."""
+
+from __future__ import annotations
+
+from sackmesser.application.bus import CommandBus, QueryBus
+from sackmesser.infrastructure.runtime.bus_settings import BusSettings, install_bus_middlewares
+
+
+def test_settings_from_mapping_parses_per_type_maps() -> None:
+    settings = BusSettings.from_mapping(
+        {
+            "latency_histograms": True,
+            "default_timeout_seconds": "5",
+            "timeout_seconds": {"ListWorkflowsQuery": "1.5"},
+            "max_concurrency": {"CreateWorkflowsBatchCommand": "4"},
+            "max_queue": {"CreateWorkflowsBatchCommand": "8"},
+            "default_max_queue": 64,
+        }
+    )
+
+    assert settings.latency_histograms is True
+    assert settings.default_timeout_seconds == 5.0
+    assert settings.timeout_seconds == {"ListWorkflowsQuery": 1.5}
+    assert settings.max_concurrency == {"CreateWorkflowsBatchCommand": 4}
+    assert settings.max_queue == {"CreateWorkflowsBatchCommand": 8}
+    assert settings.default_max_queue == 64
+    assert BusSettings.from_mapping(None) == BusSettings()
+
+
+def test_install_bus_middlewares_skips_unconfigured_features() -> None:
+    command_bus, query_bus = CommandBus(), QueryBus()
+
+    assert install_bus_middlewares(BusSettings(), command_bus, query_bus) is None
+    assert command_bus._middlewares == []
+    assert query_bus._middlewares == []
+
+
+def test_install_bus_middlewares_shares_latency_between_buses() -> None:
+    command_bus, query_bus = CommandBus(), QueryBus()
+    settings = BusSettings(latency_histograms=True, timeout_seconds={"X": 1.0})
+
+    latency = install_bus_middlewares(settings, command_bus, query_bus)
+
+    assert latency is not None
+    assert command_bus._middlewares[0] is latency
+    assert query_bus._middlewares[0] is latency
+    assert len(query_bus._middlewares) == 2
@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from types import SimpleNamespace
 from typing import ClassVar
 
+import pytest
+
 from sackmesser.application.requests.cache import (
+    DeleteCacheEntriesCommand,
     DeleteCacheEntryCommand,
+    GetCacheEntriesQuery,
     GetCacheEntryQuery,
+    GetCacheStatsQuery,
+    SetCacheEntriesCommand,
     SetCacheEntryCommand,
 )
-from sackmesser.application.requests.core import GetCapabilitiesQuery, GetHealthQuery
+from sackmesser.application.requests.core import (
+    GetBusMetricsQuery,
+    GetCapabilitiesQuery,
+    GetHealthQuery,
+)
 from sackmesser.application.requests.workflows import (
     CreateWorkflowCommand,
+    CreateWorkflowsBatchCommand,
     ListWorkflowsQuery,
 )
 from sackmesser.domain.cache import CacheEntry
-from sackmesser.domain.workflows import Workflow
+from sackmesser.domain.workflows import Workflow, WorkflowTimeRange
 from sackmesser.infrastructure.runtime.container import build_container
 from sackmesser.infrastructure.runtime.modules import ModuleMetadata
 
@@ -83,15 +95,29 @@ async def test_build_container_registers_postgres_and_redis_handlers(monkeypatch
     class _FakePostgresWorkflowRepository:
         instances: ClassVar[list[_FakePostgresWorkflowRepository]] = []
 
-        def __init__(self, provider: object) -> None:
+        def __init__(
+            self,
+            provider: object,
+            *,
+            partitioned: bool = False,
+            statements: object | None = None,
+            router: object | None = None,
+            id_format: str = "uuid4",
+        ) -> None:
             self.provider = provider
+            self.partitioned = partitioned
+            self.statements = statements
             self.ensure_schema_called = False
+            self.check_schema_called = False
             self.items: list[Workflow] = []
             self.__class__.instances.append(self)
 
         async def ensure_schema(self) -> None:
             self.ensure_schema_called = True
 
+        async def check_schema(self) -> None:
+            self.check_schema_called = True
+
         async def create(self, title: str, payload: dict[str, object]) -> Workflow:
             workflow = Workflow(
                 id=f"wf-{len(self.items)+1}",
@@ -102,7 +128,14 @@ async def test_build_container_registers_postgres_and_redis_handlers(monkeypatch
             self.items.append(workflow)
             return workflow
 
-        async def list(self, *, limit: int, offset: int) -> list[Workflow]:
+        async def create_many(
+            self, items: list[tuple[str, dict[str, object]]]
+        ) -> list[Workflow]:
+            return [await self.create(title, payload) for title, payload in items]
+
+        async def list(
+            self, *, limit: int, offset: int, time_range: WorkflowTimeRange | None = None
+        ) -> list[Workflow]:
             return self.items[offset : offset + limit]
 
     class _FakeRedisCacheRepository:
@@ -110,6 +143,13 @@ async def test_build_container_registers_postgres_and_redis_handlers(monkeypatch
             self.cache = cache
             self.store: dict[str, str] = {}
 
+        @classmethod
+        def from_options(cls, cache: object, _options: object) -> _FakeRedisCacheRepository:
+            return cls(cache)
+
+        async def close(self) -> None:
+            return None
+
         async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
             del ttl_seconds
             self.store[key] = value
@@ -121,6 +161,17 @@ async def test_build_container_registers_postgres_and_redis_handlers(monkeypatch
         async def delete(self, key: str) -> bool:
             return self.store.pop(key, None) is not None
 
+        async def set_many(self, entries: list[tuple[str, str, int | None]]) -> bool:
+            for key, value, _ttl in entries:
+                self.store[key] = value
+            return True
+
+        async def get_many(self, keys: list[str]) -> list[CacheEntry]:
+            return [CacheEntry(key=key, value=self.store.get(key)) for key in keys]
+
+        async def delete_many(self, keys: list[str]) -> int:
+            return sum(self.store.pop(key, None) is not None for key in keys)
+
     monkeypatch.setattr(
         "sackmesser.infrastructure.db.postgres.workflow_repository.PostgresWorkflowRepository",
         _FakePostgresWorkflowRepository,
@@ -144,18 +195,229 @@ async def test_build_container_registers_postgres_and_redis_handlers(monkeypatch
     created = await container.command_bus.dispatch(
         CreateWorkflowCommand(title="demo", payload={"kind": "smoke"})
     )
+    batch = await container.command_bus.dispatch(
+        CreateWorkflowsBatchCommand(workflows=[CreateWorkflowCommand(title="bulk")])
+    )
     listed = await container.query_bus.dispatch(ListWorkflowsQuery(limit=10, offset=0))
     set_result = await container.command_bus.dispatch(
         SetCacheEntryCommand(key="alpha", value="1")
     )
     got = await container.query_bus.dispatch(GetCacheEntryQuery(key="alpha"))
     deleted = await container.command_bus.dispatch(DeleteCacheEntryCommand(key="alpha"))
+    await container.command_bus.dispatch(
+        SetCacheEntriesCommand(entries=[SetCacheEntryCommand(key="beta", value="2")])
+    )
+    got_many = await container.query_bus.dispatch(GetCacheEntriesQuery(keys=("beta",)))
+    deleted_many = await container.command_bus.dispatch(DeleteCacheEntriesCommand(keys=["beta"]))
+    stats = await container.query_bus.dispatch(GetCacheStatsQuery())
 
     assert created.workflow.title == "demo"
-    assert len(listed.workflows) == 1
+    assert [item.title for item in batch.workflows] == ["bulk"]
+    assert len(listed.workflows) == 2
     assert set_result.success is True
     assert got.entry.value == "1"
     assert deleted.success is True
+    assert got_many.entries[0].value == "2"
+    assert deleted_many.deleted == 1
+    assert stats.enabled is False
     assert manager.get_calls == ["postgres", "redis"]
     assert _FakePostgresWorkflowRepository.instances[0].provider is postgres_provider
-    assert _FakePostgresWorkflowRepository.instances[0].ensure_schema_called is True
+    assert _FakePostgresWorkflowRepository.instances[0].check_schema_called is True
+    assert _FakePostgresWorkflowRepository.instances[0].ensure_schema_called is False
+    metrics = await container.query_bus.dispatch(GetBusMetricsQuery())
+    assert metrics.statements == []
+    assert _FakePostgresWorkflowRepository.instances[0].statements is not None
+
+
+async def test_build_container_wraps_redis_repository_with_local_cache(monkeypatch) -> None:
+    class _FakeRedisCacheRepository:
+        def __init__(self, cache: object) -> None:
+            self.get_calls: list[str] = []
+
+        @classmethod
+        def from_options(cls, cache: object, _options: object) -> _FakeRedisCacheRepository:
+            return cls(cache)
+
+        async def close(self) -> None:
+            return None
+
+        async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> bool:
+            return True
+
+        async def get(self, key: str) -> CacheEntry:
+            self.get_calls.append(key)
+            return CacheEntry(key=key, value="1")
+
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.redis.cache_repository.RedisCacheRepository",
+        _FakeRedisCacheRepository,
+    )
+
+    container = await build_container(
+        settings=SimpleNamespace(service=SimpleNamespace(name="svc")),
+        enabled_modules=frozenset({"core", "redis"}),
+        module_manifest=_manifest(),
+        manager=_FakeManager(providers={"redis": object()}),
+        options={"resources": {"redis": {"l1_cache": {"enabled": True, "max_entries": 8}}}},
+    )
+
+    await container.query_bus.dispatch(GetCacheEntryQuery(key="alpha"))
+    await container.query_bus.dispatch(GetCacheEntryQuery(key="alpha"))
+    stats = await container.query_bus.dispatch(GetCacheStatsQuery())
+
+    assert stats.enabled is True
+    assert (stats.hits, stats.misses, stats.max_entries) == (1, 1, 8)
+    assert stats.hit_ratio == 0.5
+    assert len(container.closers) == 2
+    await container.aclose()
+    assert container.closers == []
+
+
+async def test_build_container_caches_capabilities_when_query_cache_enabled(monkeypatch) -> None:
+    calls: list[None] = []
+
+    class _CountingCapabilityProvider:
+        def __init__(self, **_kwargs: object) -> None:
+            pass
+
+        async def list_capabilities(self) -> list[object]:
+            calls.append(None)
+            return []
+
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.container.ManifestCapabilityProvider",
+        _CountingCapabilityProvider,
+    )
+
+    container = await build_container(
+        settings=SimpleNamespace(service=SimpleNamespace(name="svc")),
+        enabled_modules=frozenset({"core"}),
+        module_manifest=_manifest(),
+        manager=_FakeManager(),
+        options={
+            "sackmesser": {
+                "query_cache": {
+                    "enabled": True,
+                    "backend": "memory",
+                    "ttl_seconds": {"GetCapabilitiesQuery": 60},
+                }
+            }
+        },
+    )
+
+    await container.query_bus.dispatch(GetCapabilitiesQuery())
+    await container.query_bus.dispatch(GetCapabilitiesQuery())
+
+    assert len(calls) == 1
+
+
+async def test_build_container_installs_bus_middlewares_from_options() -> None:
+    container = await build_container(
+        settings=SimpleNamespace(service=SimpleNamespace(name="svc")),
+        enabled_modules=frozenset({"core"}),
+        module_manifest=_manifest(),
+        manager=_FakeManager(),
+        options={"sackmesser": {"bus": {"latency_histograms": True}}},
+    )
+
+    await container.query_bus.dispatch(GetHealthQuery())
+    metrics = await container.query_bus.dispatch(GetBusMetricsQuery())
+
+    assert container.latency is not None
+    assert metrics.enabled is True
+    assert {entry.request_type: entry.count for entry in metrics.requests}["GetHealthQuery"] == 1
+
+
+async def test_build_container_runs_startup_concurrently_and_closes_on_failure(
+    monkeypatch,
+) -> None:
+    events: list[str] = []
+    prewarmed = asyncio.Event()
+
+    class _FailingRepository:
+        def __init__(self, provider: object, **_kwargs: object) -> None:
+            pass
+
+        async def check_schema(self) -> None:
+            # Only completes if prewarming runs alongside the schema check.
+            await asyncio.wait_for(prewarmed.wait(), timeout=1)
+            events.append("schema checked")
+            raise RuntimeError("schema out of date")
+
+    class _RedisProvider:
+        async def get(self, key: str) -> None:
+            events.append(f"prewarmed {key}")
+            prewarmed.set()
+
+    async def stalled_start(self: object) -> None:
+        events.append("l1 subscribing")
+        await asyncio.sleep(10)
+
+    async def recorded_close(self: object) -> None:
+        events.append("l1 closed")
+
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.postgres.workflow_repository.PostgresWorkflowRepository",
+        _FailingRepository,
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.redis.local_cache.LocalCacheRepository.start",
+        stalled_start,
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.redis.local_cache.LocalCacheRepository.close",
+        recorded_close,
+    )
+
+    with pytest.raises(RuntimeError, match="schema out of date"):
+        await build_container(
+            settings=SimpleNamespace(service=SimpleNamespace(name="svc")),
+            enabled_modules=frozenset({"core", "postgres", "redis"}),
+            module_manifest=_manifest(),
+            manager=_FakeManager(providers={"postgres": object(), "redis": _RedisProvider()}),
+            options={"resources": {"redis": {"l1_cache": {"enabled": True}}}},
+        )
+
+    assert set(events[:2]) == {"l1 subscribing", "prewarmed sackmesser:prewarm"}
+    assert events[2:] == ["schema checked", "l1 closed"]
+
+
+async def test_build_container_keeps_pinned_sessions_out_of_shared_reads(monkeypatch) -> None:
+    routers: list[object] = []
+
+    class _Repository:
+        def __init__(self, provider: object, *, router: object | None = None, **_: object) -> None:
+            routers.append(router)
+
+        async def check_schema(self) -> None:
+            return None
+
+    class _Replica:
+        async def close(self) -> None:
+            return None
+
+    async def open_replicas(_options: object, _settings: object) -> list[object]:
+        return [_Replica()]
+
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.postgres.workflow_repository.PostgresWorkflowRepository",
+        _Repository,
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.db.postgres.replicas.open_replica_providers", open_replicas
+    )
+
+    container = await build_container(
+        settings=SimpleNamespace(service=SimpleNamespace(name="svc")),
+        enabled_modules=frozenset({"core", "postgres"}),
+        module_manifest=_manifest(),
+        manager=_FakeManager(providers={"postgres": object()}),
+        options={
+            "resources": {"postgres": {"read_replicas": {"dsns": ["postgresql://replica"]}}},
+            "sackmesser": {"startup": {"prewarm": {"enabled": False}}},
+        },
+    )
+
+    [router] = routers
+    assert router is not None
+    assert container.query_bus._session_pins is router
@@ -0,0 +1,50 @@
+"""Unit tests for raw appsettings option helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from sackmesser.infrastructure.runtime.options import (
+    load_app_options,
+    merge_options,
+    option_section,
+)
+
+
+def test_load_app_options_merges_environment_overlay(tmp_path: Path) -> None:
+    (tmp_path / "appsettings.json").write_text(
+        json.dumps(
+            {"resources": {"redis": {"url": "redis://base", "l1_cache": {"enabled": False}}}}
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / "appsettings.staging.json").write_text(
+        json.dumps({"resources": {"redis": {"l1_cache": {"enabled": True}}}}),
+        encoding="utf-8",
+    )
+
+    options = load_app_options(config_dir=tmp_path, env="staging")
+
+    assert options["resources"]["redis"] == {
+        "url": "redis://base",
+        "l1_cache": {"enabled": True},
+    }
+
+
+def test_load_app_options_tolerates_missing_files(tmp_path: Path) -> None:
+    assert load_app_options(config_dir=tmp_path, env="missing") == {}
+
+
+def test_merge_options_replaces_non_mapping_values() -> None:
+    merged = merge_options({"a": {"b": 1}, "c": [1]}, {"a": 2, "c": [2]})
+
+    assert merged == {"a": 2, "c": [2]}
+
+
+def test_option_section_returns_empty_dict_for_missing_path() -> None:
+    options = {"resources": {"redis": {"l1_cache": {"enabled": True}}}}
+
+    assert option_section(options, "resources", "redis", "l1_cache") == {"enabled": True}
+    assert option_section(options, "resources", "postgres") == {}
+    assert option_section(None, "resources") == {}
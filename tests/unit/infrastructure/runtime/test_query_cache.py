@@ -0,0 +1,52 @@
+"""Unit tests for query cache configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+from sackmesser.application.query_cache import QueryResultCache
+from sackmesser.domain.ports.cache_ports import CacheRepositoryPort
+from sackmesser.infrastructure.runtime.query_cache import QueryCacheSettings, build_query_cache
+
+
+def _unexpected_redis_store() -> CacheRepositoryPort:
+    raise AssertionError("unexpected redis store lookup")
+
+
+def test_settings_from_mapping_parses_ttls() -> None:
+    settings = QueryCacheSettings.from_mapping(
+        {"enabled": True, "backend": "redis", "ttl_seconds": {"ListWorkflowsQuery": "30"}}
+    )
+
+    assert settings.enabled is True
+    assert settings.backend == "redis"
+    assert settings.ttl_seconds == {"ListWorkflowsQuery": 30}
+    assert QueryCacheSettings.from_mapping(None).enabled is False
+
+
+def test_settings_reject_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="backend"):
+        QueryCacheSettings(backend="memcached")
+
+
+def test_build_query_cache_respects_enabled_flag_and_backend() -> None:
+    redis_store = _unexpected_redis_store
+
+    assert (
+        build_query_cache(
+            QueryCacheSettings(), redis_store=redis_store, enabled_modules=frozenset()
+        )
+        is None
+    )
+    memory = build_query_cache(
+        QueryCacheSettings(enabled=True),
+        redis_store=redis_store,
+        enabled_modules=frozenset({"core"}),
+    )
+    assert isinstance(memory, QueryResultCache)
+    with pytest.raises(ValueError, match="requires the redis module"):
+        build_query_cache(
+            QueryCacheSettings(enabled=True, backend="redis"),
+            redis_store=redis_store,
+            enabled_modules=frozenset({"core"}),
+        )
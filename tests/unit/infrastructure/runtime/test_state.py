@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -157,7 +158,12 @@ async def test_startup_runtime_bootstraps_state_and_reuses_cached_state(
         build_container_calls.append(kwargs)
         return container
 
+    options = {"resources": {"redis": {"l1_cache": {"enabled": True}}}}
     monkeypatch.setattr("sackmesser.infrastructure.runtime.state.load_config", fake_load_config)
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_app_options",
+        lambda *, config_dir, env: options,
+    )
     monkeypatch.setattr(
         "sackmesser.infrastructure.runtime.state.bootstrap_logging_from_app_settings",
         fake_bootstrap,
@@ -211,6 +217,8 @@ async def test_startup_runtime_bootstraps_state_and_reuses_cached_state(
     assert build_container_calls[0]["enabled_modules"] == frozenset({"core", "postgres", "blob"})
     assert build_container_calls[0]["module_manifest"] is manifest
     assert build_container_calls[0]["manager"] is manager
+    assert build_container_calls[0]["options"] is options
+    assert result.options is options
 
     assert runtime_state.get_runtime_state() is result
     assert runtime_state.get_runtime_container() is container
@@ -221,19 +229,29 @@ async def test_startup_runtime_bootstraps_state_and_reuses_cached_state(
     assert len(manager.startup_calls) == 1
 
 
+class _FakeContainer:
+    def __init__(self) -> None:
+        self.aclose_calls = 0
+
+    async def aclose(self) -> None:
+        self.aclose_calls += 1
+
+
 async def test_shutdown_runtime_closes_manager_and_clears_state() -> None:
     manager = _FakeManager()
+    container = _FakeContainer()
     runtime_state._RuntimeHolder.state = runtime_state.RuntimeState(
         settings=SimpleNamespace(),
         enabled_modules=frozenset({"core"}),
         module_manifest={},
         manager=manager,
-        container=SimpleNamespace(),
+        container=container,
         environment="test",
     )
 
     await runtime_state.shutdown_runtime()
 
+    assert container.aclose_calls == 1
     assert manager.close_all_calls == 1
     assert runtime_state._RuntimeHolder.state is None
 
@@ -261,3 +279,151 @@ def test_reset_runtime_state_for_tests_clears_state() -> None:
     runtime_state.reset_runtime_state_for_tests()
 
     assert runtime_state._RuntimeHolder.state is None
+
+
+async def test_migrate_runtime_opens_only_postgres(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = SimpleNamespace(
+        resources=SimpleNamespace(
+            sqlite=None,
+            postgres="pg",
+            redis="redis",
+            mongodb=None,
+            rabbitmq=None,
+            qdrant=None,
+            minio="minio",
+            r2=None,
+            multi_bucket=None,
+        )
+    )
+    options = {"sackmesser": {"workflows": {"id_format": "uuid7"}}}
+    provider = object()
+    migrate_calls: list[tuple[object, object, bool]] = []
+
+    class _PostgresManager(_FakeManager):
+        def get(self, name: str) -> object:
+            assert name == "postgres"
+            return provider
+
+    manager = _PostgresManager()
+
+    async def fake_migrate(provider: object, options: object, *, check: bool) -> list[str]:
+        migrate_calls.append((provider, options, check))
+        return ["0003_uuid_workflow_ids"]
+
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_config", lambda **_: settings
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_app_options", lambda **_: options
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.bootstrap_logging_from_app_settings",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_module_manifest", _manifest
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_enabled_modules",
+        lambda: {"postgres", "redis", "blob"},
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.resolve_enabled_modules",
+        lambda selected, loaded_manifest: frozenset({"core", *selected}),
+    )
+    monkeypatch.setattr("sackmesser.infrastructure.runtime.state.ResourceManager", lambda: manager)
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.migrate_workflow_schema", fake_migrate
+    )
+
+    labels = await runtime_state.migrate_runtime(env="production", check=True)
+
+    assert labels == ["0003_uuid_workflow_ids"]
+    assert migrate_calls == [(provider, options, True)]
+    [(resource_settings, required)] = manager.startup_calls
+    assert required == ["postgres"]
+    assert isinstance(resource_settings, runtime_state.RuntimeResourceSettings)
+    assert resource_settings.postgres == "pg"
+    assert resource_settings.redis is None
+    assert resource_settings.minio is None
+    assert manager.close_all_calls == 1
+    assert runtime_state._RuntimeHolder.state is None
+
+
+def _patch_boot(monkeypatch: pytest.MonkeyPatch, manager: _FakeManager, build_container) -> None:
+    settings = SimpleNamespace(
+        resources=SimpleNamespace(
+            sqlite=None,
+            postgres="pg",
+            redis=None,
+            mongodb=None,
+            rabbitmq=None,
+            qdrant=None,
+            minio=None,
+            r2=None,
+            multi_bucket=None,
+        )
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_config", lambda **_: settings
+    )
+    monkeypatch.setattr("sackmesser.infrastructure.runtime.state.load_app_options", lambda **_: {})
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.bootstrap_logging_from_app_settings",
+        lambda *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_module_manifest", _manifest
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.load_enabled_modules", lambda: {"postgres"}
+    )
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.resolve_enabled_modules",
+        lambda selected, loaded_manifest: frozenset({"core", *selected}),
+    )
+    monkeypatch.setattr("sackmesser.infrastructure.runtime.state.ResourceManager", lambda: manager)
+    monkeypatch.setattr(
+        "sackmesser.infrastructure.runtime.state.build_container", build_container
+    )
+
+
+async def test_startup_runtime_builds_once_for_concurrent_callers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = _FakeManager()
+    build_calls = 0
+
+    async def fake_build_container(**_kwargs: object) -> object:
+        nonlocal build_calls
+        build_calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(name="container")
+
+    _patch_boot(monkeypatch, manager, fake_build_container)
+
+    results = await asyncio.gather(*(runtime_state.startup_runtime() for _ in range(5)))
+
+    assert build_calls == 1
+    assert len(manager.startup_calls) == 1
+    assert all(result is results[0] for result in results)
+    assert set(results[0].boot_phases) == {"config", "resources", "container"}
+    assert results[0].boot_phases["container"] >= 0.01
+    assert results[0].boot_seconds >= sum(results[0].boot_phases.values())
+
+
+async def test_startup_runtime_closes_resources_when_container_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = _FakeManager()
+
+    async def failing_build_container(**_kwargs: object) -> object:
+        raise RuntimeError("schema out of date")
+
+    _patch_boot(monkeypatch, manager, failing_build_container)
+
+    with pytest.raises(RuntimeError, match="schema out of date"):
+        await runtime_state.startup_runtime()
+
+    assert manager.close_all_calls == 1
+    assert runtime_state._RuntimeHolder.state is None
@@ -0,0 +1,96 @@
+"""Unit tests for connection pool prewarming."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from sackmesser.infrastructure.runtime.warmup import (
+    PrewarmSettings,
+    prewarm,
+    prewarm_postgres,
+    prewarm_redis,
+)
+
+
+class _Provider:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def fetchone(self, sql: str, args: tuple[object, ...]) -> dict[str, int]:
+        assert sql == "SELECT 1"
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        return {"?column?": 1}
+
+
+class _Cache:
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    async def get(self, key: str) -> None:
+        self.keys.append(key)
+
+
+def test_settings_from_mapping_keeps_defaults_and_validates() -> None:
+    assert PrewarmSettings.from_mapping(None) == PrewarmSettings()
+    settings = PrewarmSettings.from_mapping({"postgres_connections": "3"})
+    assert settings == PrewarmSettings(enabled=True, postgres_connections=3)
+
+    with pytest.raises(ValueError, match="postgres_connections"):
+        PrewarmSettings(postgres_connections=0)
+    with pytest.raises(ValueError, match="timeout_seconds"):
+        PrewarmSettings(timeout_seconds=0)
+
+
+def test_postgres_pool_size_defaults_to_min_pool_size() -> None:
+    assert PrewarmSettings().postgres_pool_size({"min_pool_size": 4}) == 4
+    assert PrewarmSettings().postgres_pool_size({}) == 1
+    assert PrewarmSettings(postgres_connections=2).postgres_pool_size({"min_pool_size": 4}) == 2
+
+
+async def test_prewarm_postgres_holds_connections_concurrently() -> None:
+    provider = _Provider()
+
+    await prewarm_postgres(provider, 3)  # type: ignore[arg-type]
+
+    assert provider.peak == 3
+
+
+async def test_prewarm_runs_warmups_and_logs_failures(caplog: pytest.LogCaptureFixture) -> None:
+    cache = _Cache()
+
+    async def failing() -> None:
+        raise ConnectionError("replica down")
+
+    with caplog.at_level(logging.WARNING):
+        await prewarm([lambda: prewarm_redis(cache), failing], PrewarmSettings())  # type: ignore[arg-type]
+
+    assert cache.keys == ["sackmesser:prewarm"]
+    assert "Pool prewarming failed" in caplog.text
+
+
+async def test_prewarm_gives_up_after_timeout(caplog: pytest.LogCaptureFixture) -> None:
+    async def stuck() -> None:
+        await asyncio.sleep(10)
+
+    with caplog.at_level(logging.WARNING):
+        await prewarm([stuck], PrewarmSettings(timeout_seconds=0.01))
+
+    assert "timed out" in caplog.text
+
+
+async def test_prewarm_skips_when_disabled() -> None:
+    calls: list[str] = []
+
+    async def warmup() -> None:
+        calls.append("called")
+
+    await prewarm([warmup], PrewarmSettings(enabled=False))
+
+    assert calls == []
@@ -17,12 +17,17 @@ def test_build_parser_handles_known_flags() -> None:
 
     default_args = parser.parse_args([])
     mcp_args = parser.parse_args(["--mcp"])
+    http_args = parser.parse_args(["--mcp", "--transport", "http"])
     reload_args = parser.parse_args(["--reload"])
 
     assert default_args.mcp is False
     assert default_args.reload is False
     assert mcp_args.mcp is True
+    assert mcp_args.transport == "stdio"
+    assert http_args.transport == "http"
     assert reload_args.reload is True
+    assert default_args.command == "serve"
+    assert parser.parse_args(["migrate", "--check"]).check is True
 
 
 def test_run_api_uses_resolved_environment_and_uvicorn(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -64,7 +69,9 @@ def test_main_runs_mcp_branch(monkeypatch: pytest.MonkeyPatch) -> None:
 
     class _FakeParser:
         def parse_args(self) -> Namespace:
-            return Namespace(mcp=True, reload=False)
+            return Namespace(
+                command="serve", mcp=True, transport="stdio", reload=False, check=False
+            )
 
     async def fake_run_mcp_server() -> None:
         events.append("mcp_server")
@@ -90,7 +97,9 @@ def test_main_runs_api_branch(monkeypatch: pytest.MonkeyPatch) -> None:
 
     class _FakeParser:
         def parse_args(self) -> Namespace:
-            return Namespace(mcp=False, reload=True)
+            return Namespace(
+                command="serve", mcp=False, transport="stdio", reload=True, check=False
+            )
 
     monkeypatch.setattr("sackmesser.main.build_parser", lambda: _FakeParser())
     monkeypatch.setattr("sackmesser.main.run_api", lambda reload: events.append(f"api:{reload}"))
@@ -104,6 +113,43 @@ def test_main_runs_api_branch(monkeypatch: pytest.MonkeyPatch) -> None:
     assert events == ["api:True"]
 
 
+def test_main_runs_mcp_http_branch(monkeypatch: pytest.MonkeyPatch) -> None:
+    uvicorn_calls: list[dict[str, object]] = []
+
+    class _FakeParser:
+        def parse_args(self) -> Namespace:
+            return Namespace(command="serve", mcp=True, transport="http", reload=False, check=False)
+
+    monkeypatch.setattr("sackmesser.main.build_parser", lambda: _FakeParser())
+    monkeypatch.setattr("sackmesser.main.resolve_environment", lambda: "test")
+    monkeypatch.setattr(
+        "sackmesser.main.load_config",
+        lambda **_: SimpleNamespace(
+            service=SimpleNamespace(host="127.0.0.1", port=9090),
+        ),
+    )
+    monkeypatch.setattr(
+        "sackmesser.main.uvicorn.run",
+        lambda app, **kwargs: uvicorn_calls.append({"app": app, **kwargs}),
+    )
+    monkeypatch.setattr(
+        "sackmesser.main.asyncio.run",
+        lambda coro: pytest.fail("stdio MCP server must not run in http mode"),
+    )
+
+    main_module.main()
+
+    assert uvicorn_calls == [
+        {
+            "app": "sackmesser.adapters.api.main:create_mcp_http_app",
+            "factory": True,
+            "host": "127.0.0.1",
+            "port": 9090,
+            "reload": False,
+        }
+    ]
+
+
 def test_main_module_entrypoint_executes_main_guard(monkeypatch: pytest.MonkeyPatch) -> None:
     events: list[str] = []
 
@@ -116,3 +162,30 @@ def test_main_module_entrypoint_executes_main_guard(monkeypatch: pytest.MonkeyPa
     runpy.run_path(main_module.__file__, run_name="__main__")
 
     assert events == ["mcp_server"]
+
+
+def test_main_runs_migrate_and_exits_with_check_status(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    calls: list[bool] = []
+
+    class _FakeParser:
+        def parse_args(self) -> Namespace:
+            return Namespace(
+                command="migrate", mcp=False, transport="stdio", reload=False, check=True
+            )
+
+    async def fake_migrate_runtime(*, check: bool) -> list[str]:
+        calls.append(check)
+        return ["0002_jsonb_merge_patch"]
+
+    monkeypatch.setattr("sackmesser.main.build_parser", lambda: _FakeParser())
+    monkeypatch.setattr("sackmesser.main.migrate_runtime", fake_migrate_runtime)
+    monkeypatch.setattr("sackmesser.main.run_api", lambda reload: pytest.fail("must not serve"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        main_module.main()
+
+    assert exc_info.value.code == 1
+    assert calls == [True]
+    assert "0002_jsonb_merge_patch" in capsys.readouterr().out